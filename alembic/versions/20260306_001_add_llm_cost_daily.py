@@ -0,0 +1,57 @@
+"""Add llm_cost_daily rollup table and backfill it from llm_run
+
+Revision ID: 20260306_001
+Revises: 20260305_001
+Create Date: 2026-03-06
+
+The cost dashboard summed every llm_run row in its window in Python.
+llm_cost_daily holds one row per UTC day and artifact_type, incremented
+when a run starts and when it completes (LLMExecutionLogger). Existing
+runs are rolled up here; ops/scripts/backfill_cost_rollup.py rebuilds any
+range.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260306_001'
+down_revision: Union[str, None] = '20260305_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'llm_cost_daily',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('artifact_type', sa.Text(), nullable=False, server_default=''),
+        sa.Column('run_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('error_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('input_tokens', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('output_tokens', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('cost_usd', sa.DECIMAL(14, 6), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('day', 'artifact_type'),
+        comment='Daily LLM cost rollup for the cost dashboard',
+    )
+
+    op.execute("""
+        INSERT INTO llm_cost_daily
+            (day, artifact_type, run_count, error_count, input_tokens, output_tokens, cost_usd)
+        SELECT
+            date(timezone('UTC', started_at)),
+            COALESCE(artifact_type, ''),
+            count(*),
+            sum(CASE WHEN status = 'FAILED' THEN 1 ELSE 0 END),
+            COALESCE(sum(input_tokens), 0),
+            COALESCE(sum(output_tokens), 0),
+            COALESCE(sum(cost_usd), 0)
+        FROM llm_run
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('llm_cost_daily')
@@ -0,0 +1,106 @@
+"""Add project_document_status snapshot table and invalidation triggers
+
+Revision ID: 20260307_001
+Revises: 20260306_001
+Create Date: 2026-03-07
+
+The sidebar and project tree derived every document status on each call
+from all active document types and all latest project documents.
+project_document_status holds the derived list per project. Triggers on
+documents and document_types clear it (and bump its generation) in the
+writing transaction; DocumentStatusService rebuilds it on the next read.
+Snapshots start empty and are built on first read.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '20260307_001'
+down_revision: Union[str, None] = '20260306_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INVALIDATE_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION invalidate_project_document_status(pid uuid)
+    RETURNS void AS $$
+    BEGIN
+        INSERT INTO project_document_status (project_id, generation)
+        VALUES (pid, 1)
+        ON CONFLICT (project_id) DO UPDATE
+            SET generation = project_document_status.generation + 1,
+                etag = NULL,
+                statuses = NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION documents_invalidate_status()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.space_type = 'project' THEN
+            PERFORM invalidate_project_document_status(OLD.space_id);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.space_type = 'project'
+           AND (TG_OP = 'INSERT' OR NEW.space_id IS DISTINCT FROM OLD.space_id
+                OR OLD.space_type <> 'project') THEN
+            PERFORM invalidate_project_document_status(NEW.space_id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION document_types_invalidate_status()
+    RETURNS trigger AS $$
+    BEGIN
+        UPDATE project_document_status
+            SET generation = generation + 1, etag = NULL, statuses = NULL;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS documents_invalidate_status ON documents",
+    """
+    CREATE TRIGGER documents_invalidate_status
+        AFTER INSERT OR DELETE OR UPDATE OF
+            doc_type_id, space_type, space_id, is_latest, is_stale, accepted_at, rejected_at
+        ON documents
+        FOR EACH ROW EXECUTE FUNCTION documents_invalidate_status()
+    """,
+    "DROP TRIGGER IF EXISTS document_types_invalidate_status ON document_types",
+    """
+    CREATE TRIGGER document_types_invalidate_status
+        AFTER INSERT OR UPDATE OR DELETE ON document_types
+        FOR EACH STATEMENT EXECUTE FUNCTION document_types_invalidate_status()
+    """,
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'project_document_status',
+        sa.Column('project_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('generation', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('etag', sa.String(64), nullable=True),
+        sa.Column('statuses', postgresql.JSONB(), nullable=True),
+        sa.Column('computed_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint('project_id'),
+        comment='Materialized sidebar document statuses per project (ADR-007)',
+    )
+
+    for statement in INVALIDATE_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS document_types_invalidate_status ON document_types")
+    op.execute("DROP TRIGGER IF EXISTS documents_invalidate_status ON documents")
+    op.execute("DROP FUNCTION IF EXISTS document_types_invalidate_status()")
+    op.execute("DROP FUNCTION IF EXISTS documents_invalidate_status()")
+    op.execute("DROP FUNCTION IF EXISTS invalidate_project_document_status(uuid)")
+    op.drop_table('project_document_status')
@@ -0,0 +1,31 @@
+"""Add idx_documents_staleness for set-based staleness propagation
+
+Revision ID: 20260308_001
+Revises: 20260307_001
+Create Date: 2026-03-08
+
+StalenessService marks downstream documents stale with one UPDATE per
+batch of source saves, filtered by space_id, doc_type_id, is_latest and
+lifecycle_state. This index covers that predicate.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20260308_001'
+down_revision: Union[str, None] = '20260307_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_documents_staleness',
+        'documents',
+        ['space_id', 'doc_type_id', 'is_latest', 'lifecycle_state'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_documents_staleness', table_name='documents')
@@ -0,0 +1,40 @@
+"""Add idx_documents_child_instance as the conflict target for child upserts
+
+Revision ID: 20260309_001
+Revises: 20260308_001
+Create Date: 2026-03-09
+
+PlanExecutor writes all child documents of a parent with one
+INSERT ... ON CONFLICT (parent_document_id, doc_type_id, instance_id)
+DO UPDATE. ON CONFLICT needs a unique index on those columns. Partial on
+is_latest so superseded children keep their history rows.
+
+doc_type_id is part of the key: instance_id is only unique within a child
+doc type, and children of different types under one parent may share one.
+The old per-child upsert matched on parent and instance_id, so existing
+data has at most one latest row per key.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20260309_001'
+down_revision: Union[str, None] = '20260308_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_documents_child_instance',
+        'documents',
+        ['parent_document_id', 'doc_type_id', 'instance_id'],
+        unique=True,
+        postgresql_where=sa.text('is_latest = true'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_documents_child_instance', table_name='documents')
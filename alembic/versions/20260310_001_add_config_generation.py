@@ -0,0 +1,47 @@
+"""Add config_generation and workflow_executions.workflow_version
+
+Revision ID: 20260310_001
+Revises: 20260309_001
+Create Date: 2026-03-10
+
+config_generation holds one row whose generation is bumped (with a
+NOTIFY on combine_config_changed) whenever combine-config is committed or
+an active release changes. Each worker listens for it, or polls the row,
+and reloads only the changed plans and packages.
+
+workflow_executions.workflow_version pins the plan version an execution
+started on, so a reload does not switch a running execution to a new
+version. Existing executions have NULL and follow the active version.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20260310_001'
+down_revision: Union[str, None] = '20260309_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'config_generation',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('generation', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('reason', sa.String(255), nullable=True),
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=True,
+                  server_default=sa.text('now()')),
+    )
+    op.execute("INSERT INTO config_generation (id, generation) VALUES (1, 0)")
+
+    op.add_column(
+        'workflow_executions',
+        sa.Column('workflow_version', sa.String(50), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('workflow_executions', 'workflow_version')
+    op.drop_table('config_generation')
@@ -0,0 +1,55 @@
+"""Add llm_ledger_entries.seq and idx_ledger_thread_type_seq
+
+Revision ID: 20260311_001
+Revises: 20260310_001
+Create Date: 2026-03-11
+
+ThreadManager loads conversation history as a window of the newest
+conversation_turn entries after the latest conversation_summary
+checkpoint. seq gives the ledger a total append order (created_at ties
+within a transaction), and the index on (thread_id, payload->>'type', seq)
+serves those reads without scanning the whole thread.
+
+Existing entries are numbered in created_at order.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20260311_001'
+down_revision: Union[str, None] = '20260310_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('llm_ledger_entries', sa.Column('seq', sa.BigInteger(), nullable=True))
+    op.execute(
+        """
+        UPDATE llm_ledger_entries e
+        SET seq = o.rn
+        FROM (
+            SELECT id, row_number() OVER (ORDER BY created_at, id) AS rn
+            FROM llm_ledger_entries
+        ) o
+        WHERE e.id = o.id
+        """
+    )
+    op.execute("ALTER TABLE llm_ledger_entries ALTER COLUMN seq SET NOT NULL")
+    op.execute("ALTER TABLE llm_ledger_entries ALTER COLUMN seq ADD GENERATED BY DEFAULT AS IDENTITY")
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('llm_ledger_entries', 'seq'), "
+        "COALESCE(MAX(seq), 0) + 1, false) FROM llm_ledger_entries"
+    )
+    op.create_index(
+        'idx_ledger_thread_type_seq',
+        'llm_ledger_entries',
+        ['thread_id', sa.text("(payload ->> 'type')"), 'seq'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_ledger_thread_type_seq', table_name='llm_ledger_entries')
+    op.drop_column('llm_ledger_entries', 'seq')
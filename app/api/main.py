@@ -21,6 +21,8 @@ from starlette.middleware.sessions import SessionMiddleware  # noqa: E402
 
 from app.core.config import settings  # noqa: E402
 from app.core.database import init_database  # noqa: E402
+from app.core.warmup import run_warmup  # noqa: E402
+from app.core.config_sync import get_config_sync  # noqa: E402
 
 # Import API dependencies
 from app.core.dependencies import set_startup_time  # noqa: E402
@@ -92,6 +94,16 @@ async def lifespan(app: FastAPI):
         logger.error(f"Database initialization failed: {e}")
         raise
 
+    # Load config-backed registries (plans, packages, mechanical ops,
+    # schemas) concurrently in worker threads. The server does not accept
+    # requests until the lifespan startup returns, so no request sees a
+    # partially loaded registry.
+    await run_warmup()
+
+    # Follow config changes made through other workers (LISTEN/NOTIFY
+    # with a polling fallback)
+    await get_config_sync().start()
+
     # Set up signal handler to close SSE connections before uvicorn waits
     original_sigint = signal.getsignal(signal.SIGINT)
     original_sigterm = signal.getsignal(signal.SIGTERM)
@@ -125,6 +137,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down The Combine API...")
 
+    await get_config_sync().stop()
+
     # Close SSE connections gracefully (backup, in case signal didn't fire)
     try:
         from app.api.v1.routers.production import shutdown_sse_connections
@@ -185,11 +199,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Custom middleware (last added = first executed)
+# Custom middleware (last added = first executed), all pure ASGI.
+# Request IDs are assigned before the body checks so rejections carry them;
+# BodySize reads the body once (bounded) and SecretIngress scans that copy.
 app.add_middleware(log_middleware.LoggingMiddleware)
-app.add_middleware(request_id.RequestIDMiddleware)
-app.add_middleware(body_size.BodySizeMiddleware)
 app.add_middleware(secret_ingress.SecretIngressMiddleware)  # GOV-SEC-T0-002: Gate 1
+app.add_middleware(body_size.BodySizeMiddleware)
+app.add_middleware(request_id.RequestIDMiddleware)
 app.add_middleware(error_handling.ErrorHandlingMiddleware)
 
 # Add SessionMiddleware to your FastAPI app
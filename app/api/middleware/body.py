@@ -0,0 +1,91 @@
+"""
+Shared request body buffer for pure ASGI middleware.
+
+The body-size check and the secret scan both need the whole request body.
+The first middleware to ask reads it from the ASGI receive channel and
+stores it in the scope; later middleware reuse that copy, and the endpoint
+receives it through a replaying receive callable.
+"""
+
+from typing import Optional, Tuple
+
+from starlette.requests import ClientDisconnect
+from starlette.types import Message, Receive, Scope
+
+# Scope key holding the buffered body
+BODY_SCOPE_KEY = "combine.body"
+
+
+class BodyTooLarge(Exception):
+    """Raised when a body exceeds the read limit (nothing is buffered)."""
+
+    def __init__(self, size: int):
+        super().__init__(f"Request body exceeds limit ({size} bytes read)")
+        self.size = size
+
+
+def get_header(scope: Scope, name: bytes) -> Optional[str]:
+    """First value of a request header (name lower-case), or None."""
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+async def read_body(
+    scope: Scope,
+    receive: Receive,
+    limit: Optional[int] = None,
+) -> Tuple[bytes, Receive]:
+    """
+    Read the request body once and return it with a replaying receive.
+
+    Args:
+        scope: ASGI HTTP scope (the body is cached in it)
+        receive: Downstream receive callable
+        limit: Stop reading and raise BodyTooLarge past this many bytes
+
+    Returns:
+        (body, receive) - pass the returned receive to the next app
+
+    Raises:
+        BodyTooLarge: If the body is longer than limit
+        ClientDisconnect: If the client disconnects mid-body
+    """
+    body = scope.get(BODY_SCOPE_KEY)
+    if body is None:
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise ClientDisconnect()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if limit is not None and size > limit:
+                raise BodyTooLarge(size)
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        body = b"".join(chunks)
+        scope[BODY_SCOPE_KEY] = body
+        return body, _replay(body, receive)
+
+    # Already buffered upstream: receive already replays it
+    if limit is not None and len(body) > limit:
+        raise BodyTooLarge(len(body))
+    return body, receive
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    sent = False
+
+    async def replay() -> Message:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # After the body, pass through (e.g., http.disconnect for streaming)
+        return await receive()
+
+    return replay
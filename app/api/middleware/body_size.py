@@ -4,51 +4,68 @@ Request body size limiting middleware.
 Prevents memory exhaustion from large payloads.
 """
 
-from fastapi import HTTPException, Request
-from starlette.middleware.base import BaseHTTPMiddleware
 import logging
 
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.api.middleware.body import BodyTooLarge, get_header, read_body
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Methods whose bodies are checked (and buffered for later middleware)
+BODY_METHODS = frozenset(("POST", "PUT", "PATCH"))
+
 
-class BodySizeMiddleware(BaseHTTPMiddleware):
+class BodySizeMiddleware:
     """
     Middleware to enforce maximum request body size.
-    
-    Prevents memory exhaustion from large payloads.
+
+    Pure ASGI: rejects on Content-Length before reading anything, otherwise
+    stops reading as soon as the limit is passed. The accepted body is
+    buffered once and shared with SecretIngressMiddleware and the endpoint.
     """
-    
-    async def dispatch(self, request: Request, call_next):
-        """Check request body size before processing."""
-        # Only check POST/PUT/PATCH requests
-        if request.method in ["POST", "PUT", "PATCH"]:
-            # Read body
-            body = await request.body()
-            
-            # Get max size (default 10MB if not configured)
-            max_size = getattr(settings, 'MAX_REQUEST_BODY_SIZE', 10 * 1024 * 1024)
-            
-            # Check size
-            if len(body) > max_size:
-                request_id = getattr(request.state, "request_id", "unknown")
-                logger.warning(
-                    f"[{request_id}] Request body too large: {len(body)} bytes "
-                    f"(max: {max_size})"
-                )
-                raise HTTPException(
-                    status_code=413,
-                    detail={
-                        "error": "payload_too_large",
-                        "message": f"Request body exceeds maximum size of {max_size} bytes",
-                        "request_id": request_id
-                    }
-                )
-            
-            # Store body for later access (since we've already read it)
-            request._body = body
-        
-        # Process request
-        response = await call_next(request)
-        return response
\ No newline at end of file
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in BODY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        # Get max size (default 10MB if not configured)
+        max_size = getattr(settings, 'MAX_REQUEST_BODY_SIZE', 10 * 1024 * 1024)
+
+        declared = get_header(scope, b"content-length")
+        try:
+            size = int(declared) if declared is not None else None
+        except ValueError:
+            size = None
+
+        if size is None or size <= max_size:
+            try:
+                _, receive = await read_body(scope, receive, limit=max_size)
+            except BodyTooLarge as e:
+                size = e.size
+            else:
+                await self.app(scope, receive, send)
+                return
+
+        request_id = scope.get("state", {}).get("request_id", "unknown")
+        logger.warning(
+            f"[{request_id}] Request body too large: {size} bytes "
+            f"(max: {max_size})"
+        )
+        response = JSONResponse(
+            status_code=413,
+            content={
+                "detail": {
+                    "error": "payload_too_large",
+                    "message": f"Request body exceeds maximum size of {max_size} bytes",
+                    "request_id": request_id,
+                }
+            },
+        )
+        await response(scope, receive, send)
@@ -6,8 +6,9 @@ Provides request/response logging and performance tracking.
 
 import logging
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +33,7 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """
     Middleware to log all HTTP requests and responses.
     
@@ -41,40 +42,50 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     - Response status code
     - Request duration
     """
-    
-    async def dispatch(self, request: Request, call_next):
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log details."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.time()
-        
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+
         # Log request
         logger.info(
-            f"Request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
+            f"Request: {method} {path} "
+            f"from {client[0] if client else 'unknown'}"
         )
-        
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate duration up to the response headers
+                duration_ms = (time.time() - start_time) * 1000
+
+                # Log response
+                logger.info(
+                    f"Response: {message['status']} "
+                    f"({duration_ms:.2f}ms) "
+                    f"for {method} {path}"
+                )
+
+                # Add timing header
+                MutableHeaders(scope=message)["X-Process-Time"] = f"{duration_ms:.2f}ms"
+            await send(message)
+
         # Process request
         try:
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-            
-            # Log response
-            logger.info(
-                f"Response: {response.status_code} "
-                f"({duration_ms:.2f}ms) "
-                f"for {request.method} {request.url.path}"
-            )
-            
-            # Add timing header
-            response.headers["X-Process-Time"] = f"{duration_ms:.2f}ms"
-            
-            return response
-            
+            await self.app(scope, receive, send_with_timing)
         except Exception as e:
             duration_ms = (time.time() - start_time) * 1000
             logger.error(
-                f"Error processing request: {request.method} {request.url.path} "
+                f"Error processing request: {method} {path} "
                 f"({duration_ms:.2f}ms): {e}",
                 exc_info=True
             )
@@ -4,11 +4,15 @@ Request ID and Correlation ID Middleware.
 Generates/extracts unique identifiers for request tracing.
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from uuid import uuid4
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.middleware.body import get_header
+
+
+class RequestIDMiddleware:
     """
     Middleware to generate/extract request IDs and correlation IDs.
     
@@ -21,23 +25,32 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     
     Both stored in request.state as strings for downstream use.
     """
-    
-    async def dispatch(self, request: Request, call_next):
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract or generate request ID
-        request_id = request.headers.get("X-Request-ID") or str(uuid4())
-        
+        request_id = get_header(scope, b"x-request-id") or str(uuid4())
+
         # Extract correlation ID, or default to request_id
-        correlation_id = request.headers.get("X-Correlation-ID") or request_id
-        
-        # Store as strings (consistent types)
-        request.state.request_id = request_id
-        request.state.correlation_id = correlation_id
-        
-        # Call next middleware/endpoint
-        response = await call_next(request)
-        
-        # Add headers to response for client tracing
-        response.headers["X-Request-ID"] = request_id
-        response.headers["X-Correlation-ID"] = correlation_id
-        
-        return response
\ No newline at end of file
+        correlation_id = get_header(scope, b"x-correlation-id") or request_id
+
+        # Store as strings (consistent types); request.state reads scope["state"]
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        state["correlation_id"] = correlation_id
+
+        async def send_with_ids(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add headers to response for client tracing
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Correlation-ID"] = correlation_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_ids)
@@ -6,17 +6,41 @@ BEFORE any logging persistence. If secret detected, rejects with HTTP 422
 and logs only redacted metadata.
 
 This is Gate 1 of the dual-gate architecture.
+
+Scanning is size-tiered so a large upload never stalls the event loop:
+- inline: bodies up to SECRET_SCAN_INLINE_MAX_BYTES, scanned directly
+- pool: larger bodies, scanned in a bounded thread pool
+- stream: JSON/text bodies from SECRET_SCAN_STREAM_MIN_BYTES, scanned
+  incrementally in chunks (StreamScanner), never decoded whole
+Scan time is recorded per tier in the metrics collector and per request
+in request.state.secret_scan_ms.
 """
 
+import asyncio
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 from urllib.parse import parse_qs
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
-
-from app.core.secret_detector import scan_text, scan_dict, redact_for_logging, ScanResult
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.api.middleware.body import get_header, read_body
+from app.core.config import (
+    SECRET_SCAN_INLINE_MAX_BYTES,
+    SECRET_SCAN_STREAM_MIN_BYTES,
+    SECRET_SCAN_WORKERS,
+)
+from app.core.secret_detector import (
+    ScanResult,
+    StreamScanner,
+    redact_for_logging,
+    scan_dict,
+    scan_text,
+)
+from app.observability.metrics import get_metrics_collector
 
 logger = logging.getLogger(__name__)
 
@@ -30,74 +54,135 @@ _SKIP_PATHS = frozenset([
 ])
 
 
-class SecretIngressMiddleware(BaseHTTPMiddleware):
+def scan_body(body: bytes, content_type: str) -> ScanResult:
+    """
+    Content-type-aware scan of a raw request body.
+
+    - JSON bodies: parse and scan dict values
+    - Form-encoded bodies: URL-decode values before scanning
+    - Multipart: not scanned (caught at the orchestrator gate)
+    - Other: try JSON, then raw text
+    """
+    body_text = body.decode("utf-8", errors="replace")
+
+    if "application/x-www-form-urlencoded" in content_type:
+        # URL-decode form values before scanning
+        form_values = parse_qs(body_text, keep_blank_values=True)
+        form_dict = {k: v[0] if len(v) == 1 else v for k, v in form_values.items()}
+        return scan_dict(form_dict)
+    if "multipart/form-data" in content_type:
+        # Skip multipart (file uploads) — too complex to parse here,
+        # and secrets in files are caught at the orchestrator gate
+        return ScanResult("CLEAN", None, 0.0)
+
+    # JSON (declared or sniffed): scan dict values, else raw text
+    try:
+        body_json = json.loads(body_text)
+    except (json.JSONDecodeError, ValueError):
+        return scan_text(body_text)
+    if isinstance(body_json, dict):
+        return scan_dict(body_json)
+    return scan_text(body_text)
+
+
+# Scan tiers
+INLINE = "inline"
+POOL = "pool"
+STREAM = "stream"
+
+# Bytes fed to StreamScanner between yields to the event loop
+STREAM_CHUNK_BYTES = 16 * 1024
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=SECRET_SCAN_WORKERS, thread_name_prefix="secret-scan"
+        )
+    return _executor
+
+
+def scan_tier(size: int, content_type: str) -> str:
+    """Pick the scan tier for a body of size bytes."""
+    if size <= SECRET_SCAN_INLINE_MAX_BYTES or "multipart/form-data" in content_type:
+        return INLINE
+    # Form values must be URL-decoded as a whole
+    if size >= SECRET_SCAN_STREAM_MIN_BYTES and "application/x-www-form-urlencoded" not in content_type:
+        return STREAM
+    return POOL
+
+
+async def scan_body_stream(body: bytes, chunk_size: int = STREAM_CHUNK_BYTES) -> ScanResult:
+    """Scan body incrementally, yielding to the event loop between chunks."""
+    scanner = StreamScanner()
+    view = memoryview(body)
+    for start in range(0, len(body), chunk_size):
+        if scanner.feed(view[start:start + chunk_size]) is not None:
+            break
+        await asyncio.sleep(0)
+    return scanner.finish()
+
+
+async def scan_body_tiered(body: bytes, content_type: str) -> Tuple[ScanResult, str]:
+    """Scan body with the tier for its size; returns (result, tier)."""
+    tier = scan_tier(len(body), content_type)
+    if tier == INLINE:
+        return scan_body(body, content_type), tier
+    if tier == STREAM:
+        return await scan_body_stream(body), tier
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(_get_executor(), scan_body, body, content_type)
+    return result, tier
+
+
+class SecretIngressMiddleware:
     """
     Gate 1: HTTP ingress secret detection.
 
     Scans POST/PUT/PATCH request bodies for secret material.
     Rejects with 422 if detected. Never persists rejected payloads.
+
+    Pure ASGI: the body is read once into the shared buffer (reusing the
+    copy BodySizeMiddleware already read) and replayed to the endpoint.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Only scan mutating requests with bodies
-        if request.method not in ("POST", "PUT", "PATCH"):
-            return await call_next(request)
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT", "PATCH"):
+            await self.app(scope, receive, send)
+            return
 
         # Skip non-API paths
-        path = request.url.path
+        path = scope["path"]
         if any(path.startswith(skip) for skip in _SKIP_PATHS):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        # Read body (may already be cached by BodySizeMiddleware)
-        body = await request.body()
+        # Read body (may already be buffered by BodySizeMiddleware)
+        body, receive = await read_body(scope, receive)
         if not body:
-            return await call_next(request)
-
-        request_id = getattr(request.state, "request_id", "unknown")
-
-        # Decode body text
-        try:
-            body_text = body.decode("utf-8", errors="replace")
-        except Exception:
-            return await call_next(request)
-
-        # Content-type-aware scanning:
-        # - JSON bodies: parse and scan dict values
-        # - Form-encoded bodies: URL-decode values before scanning
-        # - Other: scan raw text
-        content_type = request.headers.get("content-type", "")
-        scan_result: ScanResult
-
-        if "application/json" in content_type:
-            try:
-                body_json = json.loads(body_text)
-                if isinstance(body_json, dict):
-                    scan_result = scan_dict(body_json)
-                else:
-                    scan_result = scan_text(body_text)
-            except (json.JSONDecodeError, ValueError):
-                scan_result = scan_text(body_text)
-        elif "application/x-www-form-urlencoded" in content_type:
-            # URL-decode form values before scanning
-            form_values = parse_qs(body_text, keep_blank_values=True)
-            form_dict = {k: v[0] if len(v) == 1 else v for k, v in form_values.items()}
-            scan_result = scan_dict(form_dict)
-        elif "multipart/form-data" in content_type:
-            # Skip multipart (file uploads) — too complex to parse here,
-            # and secrets in files are caught at the orchestrator gate
-            scan_result = ScanResult("CLEAN", None, 0.0)
-        else:
-            # Fallback: try JSON, then raw text
-            try:
-                body_json = json.loads(body_text)
-                if isinstance(body_json, dict):
-                    scan_result = scan_dict(body_json)
-                else:
-                    scan_result = scan_text(body_text)
-            except (json.JSONDecodeError, ValueError):
-                scan_result = scan_text(body_text)
-
-        if scan_result.verdict == "SECRET_DETECTED":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        request_id = state.get("request_id", "unknown")
+
+        start = time.perf_counter()
+        scan_result, tier = await scan_body_tiered(body, get_header(scope, b"content-type") or "")
+        duration_ms = (time.perf_counter() - start) * 1000
+        detected = scan_result.verdict == "SECRET_DETECTED"
+
+        state["secret_scan_ms"] = duration_ms
+        get_metrics_collector().record_secret_scan(tier, duration_ms, len(body), detected)
+        logger.debug(f"[{request_id}] Secret scan ({tier}, {len(body)} bytes): {duration_ms:.2f}ms")
+
+        if detected:
             # Log redacted metadata only — never the payload
             audit = redact_for_logging(scan_result, request_id)
             logger.warning(
@@ -107,7 +192,7 @@ class SecretIngressMiddleware(BaseHTTPMiddleware):
             )
 
             # Reject — do not persist, do not create workflow instance
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=422,
                 content={
                     "error": "secret_detected",
@@ -117,6 +202,8 @@ class SecretIngressMiddleware(BaseHTTPMiddleware):
                     "detector_version": scan_result.detector_version,
                 },
             )
+            await response(scope, receive, send)
+            return
 
         # Clean — proceed normally
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -8,6 +8,8 @@ from app.api.models.role import Role
 from app.api.models.role_task import RoleTask
 from app.api.models.document_type import DocumentType
 from app.api.models.document import Document
+from app.api.models.project_document_status import ProjectDocumentStatus
+from app.api.models.config_generation import ConfigGeneration
 from app.api.models.document_relation import DocumentRelation, RelationType
 from app.api.models.schema_artifact import SchemaArtifact
 from app.api.models.fragment_artifact import FragmentArtifact, FragmentBinding
@@ -28,6 +30,8 @@ __all__ = [
     'RoleTask',
     'DocumentType',
     'Document',
+    'ProjectDocumentStatus',
+    'ConfigGeneration',
     'DocumentRelation',
     'RelationType',
     'SchemaArtifact',
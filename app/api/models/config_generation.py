@@ -0,0 +1,47 @@
+"""
+Config Generation Model - cluster-wide combine-config change counter.
+
+A single row whose generation is bumped whenever an admin commits to
+combine-config or changes an active release. The bump sends a NOTIFY on
+CONFIG_CHANNEL; every worker's ConfigSyncWorker (app/core/config_sync.py)
+listens for it, or polls the row, and reloads its local config caches.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+from sqlalchemy.orm import Mapped
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ConfigGeneration(Base):
+    """Cluster-wide config generation (one row, id = 1)."""
+
+    __tablename__ = "config_generation"
+
+    id: Mapped[int] = Column(Integer, primary_key=True, default=1)
+
+    generation: Mapped[int] = Column(
+        BigInteger,
+        nullable=False,
+        server_default="0",
+        doc="Incremented on every config change"
+    )
+
+    reason: Mapped[Optional[str]] = Column(
+        String(255),
+        nullable=True,
+        doc="What triggered the last bump (e.g., commit message)"
+    )
+
+    changed_at: Mapped[Optional[datetime]] = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<ConfigGeneration gen={self.generation}>"
@@ -16,12 +16,18 @@ from sqlalchemy import (
     ForeignKey, Index
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB, TSVECTOR
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy.orm import deferred, relationship, Mapped
 from sqlalchemy.sql import func
 
 from app.core.database import Base
 
 
+def compute_revision_hash(content: Any) -> str:
+    """SHA-256 of canonical JSON content (Document.revision_hash)."""
+    content_str = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(content_str.encode()).hexdigest()
+
+
 class Document(Base):
     """
     Document model - the primary artifact in The Combine.
@@ -145,11 +151,13 @@ class Document(Base):
         doc="Short description, can be AI-generated"
     )
     
-    content: Mapped[Dict[str, Any]] = Column(
+    # Deferred: list and status queries select full rows and would otherwise
+    # pull every document body. Readers opt in with undefer(Document.content).
+    content: Mapped[Dict[str, Any]] = deferred(Column(
         JSONB,
         nullable=False,
         doc="The actual document data as JSON"
-    )
+    ))
     
     # =========================================================================
     # STATUS
@@ -268,11 +276,11 @@ class Document(Base):
     # SEARCH
     # =========================================================================
     
-    search_vector: Mapped[Optional[str]] = Column(
+    search_vector: Mapped[Optional[str]] = deferred(Column(
         TSVECTOR,
         nullable=True,
         doc="Full-text search vector"
-    )
+    ))
     
     # =========================================================================
     # RELATIONSHIPS
@@ -336,6 +344,20 @@ class Document(Base):
             "accepted_at", "rejected_at",
             postgresql_where=(is_latest == True)
         ),
+
+        # Staleness propagation UPDATE (ADR-036)
+        Index(
+            "idx_documents_staleness",
+            "space_id", "doc_type_id", "is_latest", "lifecycle_state"
+        ),
+
+        # Conflict target for the bulk child upsert (ADR-011-Part-2)
+        Index(
+            "idx_documents_child_instance",
+            "parent_document_id", "doc_type_id", "instance_id",
+            unique=True,
+            postgresql_where=(is_latest == True)
+        ),
     )
     
     # =========================================================================
@@ -344,8 +366,7 @@ class Document(Base):
     
     def compute_revision_hash(self) -> str:
         """Compute SHA-256 hash of content for immutability verification."""
-        content_str = json.dumps(self.content, sort_keys=True, default=str)
-        return hashlib.sha256(content_str.encode()).hexdigest()
+        return compute_revision_hash(self.content)
     
     def update_revision_hash(self) -> None:
         """Update the revision hash based on current content."""
@@ -12,8 +12,8 @@ from typing import Optional, Dict
 from uuid import UUID
 
 from sqlalchemy import (
-    Column, String, Integer, Text, DateTime,
-    ForeignKey, UniqueConstraint
+    BigInteger, Column, String, Integer, Text, DateTime,
+    ForeignKey, Identity, Index, UniqueConstraint, text
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped
@@ -151,6 +151,8 @@ class LLMLedgerEntryModel(Base):
         primary_key=True,
         server_default=func.gen_random_uuid(),
     )
+    # Append order (created_at can tie within a transaction)
+    seq: Mapped[int] = Column(BigInteger, Identity(), nullable=False)
     
     # Associations
     thread_id: Mapped[UUID] = Column(
@@ -165,7 +167,7 @@ class LLMLedgerEntryModel(Base):
     )
     
     # Content
-    entry_type: Mapped[str] = Column(String(50), nullable=False)  # prompt|response|parse_report|mutation_report|error
+    entry_type: Mapped[str] = Column(String(50), nullable=False)  # prompt|response|parse_report|mutation_report|error|summary
     payload: Mapped[Dict] = Column(JSONB, nullable=False)
     payload_hash: Mapped[Optional[str]] = Column(String(64), nullable=True)  # SHA256
     
@@ -180,5 +182,13 @@ class LLMLedgerEntryModel(Base):
     thread = relationship("LLMThreadModel", back_populates="ledger_entries")
     work_item = relationship("LLMWorkItemModel", back_populates="ledger_entries")
     
+    # Conversation history reads entries of one payload type, newest first
+    __table_args__ = (
+        Index(
+            "idx_ledger_thread_type_seq",
+            "thread_id", text("(payload ->> 'type')"), "seq",
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<LLMLedgerEntry {self.id} type={self.entry_type}>"
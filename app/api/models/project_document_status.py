@@ -0,0 +1,140 @@
+"""
+Project Document Status Model - materialized sidebar snapshot (ADR-007).
+
+One row per project holding the derived DocumentStatus list for its
+sidebar. Database triggers bump the row's generation and clear the
+snapshot whenever a project document is saved, accepted, rejected or
+marked stale, or a document type changes, in the same transaction as the
+write. DocumentStatusService rebuilds a cleared snapshot on the next read.
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional
+from uuid import UUID
+
+from sqlalchemy import DDL, BigInteger, Column, DateTime, String, event
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+from sqlalchemy.orm import Mapped, deferred
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ProjectDocumentStatus(Base):
+    """
+    Materialized document-status snapshot for one project.
+
+    statuses is NULL when the snapshot has been invalidated and not yet
+    rebuilt. generation increases on every invalidation, so a rebuild that
+    raced a write can be discarded (see DocumentStatusService).
+    """
+
+    __tablename__ = "project_document_status"
+
+    project_id: Mapped[UUID] = Column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        doc="documents.space_id of the project"
+    )
+
+    generation: Mapped[int] = Column(
+        BigInteger,
+        nullable=False,
+        server_default="0",
+        doc="Incremented by the invalidation triggers"
+    )
+
+    etag: Mapped[Optional[str]] = Column(
+        String(64),
+        nullable=True,
+        doc="Hash of statuses; NULL while invalidated"
+    )
+
+    # Deferred: the freshness check reads generation and etag only.
+    statuses: Mapped[Optional[List[Any]]] = deferred(Column(
+        JSONB,
+        nullable=True,
+        doc="DocumentStatus.to_dict() list in display order"
+    ))
+
+    computed_at: Mapped[Optional[datetime]] = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProjectDocumentStatus {self.project_id} gen={self.generation}>"
+
+
+# =============================================================================
+# INVALIDATION TRIGGERS
+# =============================================================================
+# Mirrors migration 20260307_001 so databases built with create_all
+# (init_database, tests) invalidate snapshots the same way.
+
+# One statement per string: asyncpg prepares each statement and rejects
+# multi-statement strings.
+INVALIDATE_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION invalidate_project_document_status(pid uuid)
+    RETURNS void AS $$
+    BEGIN
+        INSERT INTO project_document_status (project_id, generation)
+        VALUES (pid, 1)
+        ON CONFLICT (project_id) DO UPDATE
+            SET generation = project_document_status.generation + 1,
+                etag = NULL,
+                statuses = NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION documents_invalidate_status()
+    RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.space_type = 'project' THEN
+            PERFORM invalidate_project_document_status(OLD.space_id);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.space_type = 'project'
+           AND (TG_OP = 'INSERT' OR NEW.space_id IS DISTINCT FROM OLD.space_id
+                OR OLD.space_type <> 'project') THEN
+            PERFORM invalidate_project_document_status(NEW.space_id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION document_types_invalidate_status()
+    RETURNS trigger AS $$
+    BEGIN
+        UPDATE project_document_status
+            SET generation = generation + 1, etag = NULL, statuses = NULL;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS documents_invalidate_status ON documents",
+    # Only columns the status derivation reads; content edits do not invalidate.
+    """
+    CREATE TRIGGER documents_invalidate_status
+        AFTER INSERT OR DELETE OR UPDATE OF
+            doc_type_id, space_type, space_id, is_latest, is_stale, accepted_at, rejected_at
+        ON documents
+        FOR EACH ROW EXECUTE FUNCTION documents_invalidate_status()
+    """,
+    "DROP TRIGGER IF EXISTS document_types_invalidate_status ON document_types",
+    """
+    CREATE TRIGGER document_types_invalidate_status
+        AFTER INSERT OR UPDATE OR DELETE ON document_types
+        FOR EACH STATEMENT EXECUTE FUNCTION document_types_invalidate_status()
+    """,
+)
+
+for _statement in INVALIDATE_DDL:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
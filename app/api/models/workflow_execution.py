@@ -6,6 +6,7 @@ Minimal persistence for Document Workflow Engine (ADR-039).
 
 from sqlalchemy import Column, String, Text, Boolean, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import deferred
 
 from app.core.database import Base
 
@@ -26,6 +27,8 @@ class WorkflowExecution(Base):
     document_id = Column(String(255), nullable=True)
     document_type = Column(String(100), nullable=True)
     workflow_id = Column(String(100), nullable=True)
+    # Plan version pinned at start (NULL for executions started before pinning)
+    workflow_version = Column(String(50), nullable=True)
 
     # Project reference (for interrupt querying and production line status)
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id', ondelete='CASCADE'), nullable=True)
@@ -37,8 +40,10 @@ class WorkflowExecution(Base):
     current_node_id = Column(String(100), nullable=False)
     status = Column(String(20), nullable=False, default='running')
     
-    # Execution history
-    execution_log = Column(JSONB, nullable=False, default=list)
+    # Execution history. execution_log and context_state grow with every
+    # node and are deferred so list queries stay small; readers of the full
+    # state opt in with undefer(...).
+    execution_log = deferred(Column(JSONB, nullable=False, default=list))
     retry_counts = Column(JSONB, nullable=False, default=dict)
     
     # Outcomes
@@ -56,7 +61,7 @@ class WorkflowExecution(Base):
     thread_id = Column(String(36), nullable=True)
     
     # Context state (ADR-040)
-    context_state = Column(JSONB, nullable=True)
+    context_state = deferred(Column(JSONB, nullable=True))
     
     def to_dict(self):
         return {
@@ -64,6 +69,7 @@ class WorkflowExecution(Base):
             "document_id": self.document_id,
             "document_type": self.document_type,
             "workflow_id": self.workflow_id,
+            "workflow_version": self.workflow_version,
             "project_id": str(self.project_id) if self.project_id else None,
             "user_id": str(self.user_id) if self.user_id else None,
             "current_node_id": self.current_node_id,
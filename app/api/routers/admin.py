@@ -15,7 +15,6 @@ import logging
 from app.core.database import get_db
 from app.domain.repositories.postgres_llm_log_repository import PostgresLLMLogRepository
 from app.domain.services.llm_execution_logger import LLMExecutionLogger
-from anthropic import Anthropic
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -302,6 +301,8 @@ async def replay_llm_run(
         await db.commit()
         
         # 9. Execute LLM call
+        from anthropic import Anthropic
+
         anthropic_client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
         
         system_prompt = inputs.get("system_prompt", "")
@@ -135,6 +135,7 @@ class DocumentBuildResponse(BaseModel):
 class MarkStaleRequest(BaseModel):
     """Request to mark a document as stale."""
     project_id: str
+    transitive: bool = False  # Also mark dependents of dependents
 
 
 class MarkStaleResponse(BaseModel):
@@ -279,7 +280,7 @@ async def mark_stale_command(
     logger.info(f"[Phase7] Mark-stale command: doc_type={doc_type_id}, project={request.project_id}, task={task_id}")
     
     doc_service = DocumentService(db)
-    staleness_service = StalenessService(db)
+    staleness_service = StalenessService(db, transitive=request.transitive)
     
     # Get the document
     document = await doc_service.get_latest(
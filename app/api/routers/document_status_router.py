@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +21,7 @@ from app.api.models.document import Document
 from app.api.models.document_type import DocumentType
 from app.api.services.document_status_service import (
     document_status_service,
+    etag_matches,
 )
 
 router = APIRouter(tags=["documents"])
@@ -99,21 +100,38 @@ class RejectDocumentResponse(BaseModel):
     - **subtitle**: Contextual hint (e.g., "Needs acceptance (PM)")
     - **can_*** flags: Action enablement for UI buttons
     - **missing_inputs**: List of blocking dependencies (when blocked)
-    """
+    
+    Responses carry an ETag. Send it back in If-None-Match to get
+    304 Not Modified while the statuses are unchanged.
+    """,
+    responses={304: {"description": "Statuses unchanged since the given ETag"}},
 )
 async def get_project_document_statuses(
     project_id: UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ) -> ProjectDocumentStatusesResponse:
     """Get all document statuses for a project."""
     
-    statuses = await document_status_service.get_project_document_statuses(db, project_id)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etag = await document_status_service.get_project_etag(db, project_id)
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": f'"{etag}"', "Cache-Control": "no-cache"},
+            )
+    
+    snapshot = await document_status_service.get_project_snapshot(db, project_id)
+    response.headers["ETag"] = f'"{snapshot.etag}"'
+    response.headers["Cache-Control"] = "no-cache"
     
     return ProjectDocumentStatusesResponse(
         project_id=str(project_id),
         documents=[
             DocumentStatusResponse(**s.to_dict())
-            for s in statuses
+            for s in snapshot.statuses
         ]
     )
 
@@ -3,11 +3,13 @@ Health check endpoint for The Combine API.
 Alternative version with separate liveness and readiness probes.
 """
 from fastapi import APIRouter, Depends, status, Response
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from app.core.database import get_db
+from app.core.warmup import RUNNING, get_warmup_state
 
 router = APIRouter(tags=["health"])
 logger = logging.getLogger(__name__)
@@ -28,15 +30,28 @@ async def readiness_check(response: Response, db: AsyncSession = Depends(get_db)
     """
     Readiness check - confirms app AND database are ready.
     Use this for container readiness probes.
+    
+    While the startup warm-up is still loading registries, reports
+    not_ready so traffic is held until caches are hot.
     """
+    warmup = get_warmup_state().status
     try:
         # Test database connectivity
         result = await db.execute(text("SELECT 1"))
         result.scalar()
         
+        if warmup == RUNNING:
+            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            return {
+                "status": "not_ready",
+                "database": "connected",
+                "warmup": warmup,
+            }
+        
         return {
             "status": "ready",
-            "database": "connected"
+            "database": "connected",
+            "warmup": warmup,
         }
     except Exception as e:
         logger.error(f"Readiness check failed: {e}", exc_info=True)
@@ -48,6 +63,84 @@ async def readiness_check(response: Response, db: AsyncSession = Depends(get_db)
         }
 
 
+@router.get("/health/warmup", status_code=status.HTTP_200_OK)
+async def warmup_check(response: Response):
+    """
+    Startup warm-up progress - per-registry status, item counts and timings.
+    Returns 503 until every registry loader has finished.
+    Does NOT check database.
+    """
+    state = get_warmup_state()
+    if not state.complete:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return state.to_dict()
+
+
+@router.get("/health/config-cache", status_code=status.HTTP_200_OK)
+async def config_cache_check():
+    """
+    Config cache metrics - per-artifact-kind hits, misses, evictions,
+    invalidations, entry count and bytes held, the local config generation
+    and the cross-worker sync state. Does NOT check database.
+    """
+    from app.config.package_loader import get_package_loader
+    from app.core.config_sync import get_config_sync
+
+    loader = get_package_loader()
+    return {
+        "generation": loader.generation,
+        "caches": loader.cache_stats(),
+        "sync": get_config_sync().to_dict(),
+    }
+
+
+@router.get("/health/secret-scan", status_code=status.HTTP_200_OK)
+async def secret_scan_check():
+    """
+    HTTP ingress secret scan metrics - per-tier (inline, pool, stream) scan
+    count, detections, bytes scanned and average/max scan time.
+    Does NOT check database.
+    """
+    from app.observability.metrics import get_metrics_collector
+
+    scans = get_metrics_collector().get_secret_scan_metrics()
+    return {"tiers": {tier: sm.to_dict() for tier, sm in scans.items()}}
+
+
+@router.get("/health/spans", status_code=status.HTTP_200_OK)
+async def spans_check(limit: int = 200):
+    """
+    PlanExecutor hot-path spans (TRACING_MODE=collect) - per-span count and
+    average duration, plus the most recent spans as OTLP/JSON.
+    Does NOT check database.
+    """
+    from app.observability.tracing import InMemorySpanCollector, SpanHistogram, get_tracer
+
+    tracer = get_tracer()
+    collector = tracer.processor(InMemorySpanCollector)
+    histogram = tracer.processor(SpanHistogram)
+    return {
+        "enabled": tracer.enabled,
+        "summary": histogram.snapshot() if histogram else [],
+        "otlp": collector.to_otlp(limit=limit) if collector else None,
+    }
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """
+    Prometheus scrape endpoint - span duration histograms per PlanExecutor
+    phase. Empty unless TRACING_MODE=collect.
+    """
+    from app.observability.tracing import SpanHistogram, get_tracer
+
+    histogram = get_tracer().processor(SpanHistogram)
+    return PlainTextResponse(
+        histogram.render() if histogram else "",
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @router.get("/health/detailed", status_code=status.HTTP_200_OK)
 async def detailed_health_check(response: Response, db: AsyncSession = Depends(get_db)):
     """
@@ -3,22 +3,42 @@ Configuration Validator for Governance Guardrails.
 
 Per ADR-044 WS-044-08, this service prevents known failure modes
 by validating configuration artifacts before they can be committed or activated.
+
+Validation is split into units so that full-config runs stay fast:
+
+- Package rules that depend only on a package's own files are cached by
+  the content hash of its release directory.
+- Shared references (roles, templates, PGC fragments) are resolved once
+  per run through a ReferenceIndex, however many packages use them.
+- Releases are independent, so validate_config() and
+  validate_all_active_packages() can load them in a process pool
+  (CONFIG_VALIDATION_WORKERS, or max_workers).
+
+CI entry point: python ops/scripts/validate_config.py
 """
 
+import copy
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import yaml
 
+from app.config.artifact_cache import ArtifactCache
 from app.config.package_loader import (
     PackageLoader,
     get_package_loader,
     PackageNotFoundError,
     VersionNotFoundError,
 )
+from app.config.package_model import DocumentTypePackage
+
+# libyaml's parser when available (same results, several times faster)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +95,87 @@ class ValidationReport:
             self.valid = False
 
 
+@dataclass
+class ValidationTiming:
+    """Timing report for a full-config validation run."""
+    total_seconds: float
+    workers: int
+    references_resolved: int
+    package_cache_hits: int
+    # "doc_type_id:version" -> seconds spent on that release
+    releases: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_seconds": round(self.total_seconds, 4),
+            "workers": self.workers,
+            "references_resolved": self.references_resolved,
+            "package_cache_hits": self.package_cache_hits,
+            "releases": {key: round(seconds, 4) for key, seconds in self.releases.items()},
+        }
+
+
+class ReferenceIndex:
+    """
+    Shared artifact lookups for one validation run.
+
+    Each role, template and PGC fragment is looked up in the loader once,
+    however many packages reference it.
+    """
+
+    def __init__(self, loader: PackageLoader):
+        self._loader = loader
+        self._found: Dict[Tuple[str, str, str], bool] = {}
+        self._pgc_fragments: Optional[Set[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._found)
+
+    def has_role(self, role_id: str, version: str) -> bool:
+        return self._resolve("role", role_id, version)
+
+    def has_template(self, template_id: str, version: str) -> bool:
+        return self._resolve("template", template_id, version)
+
+    def has_pgc_fragment(self, fragment_id: str) -> bool:
+        if self._pgc_fragments is None:
+            self._pgc_fragments = set(self._loader.list_pgc())
+        return fragment_id in self._pgc_fragments
+
+    def _resolve(self, kind: str, artifact_id: str, version: str) -> bool:
+        key = (kind, artifact_id, version)
+        found = self._found.get(key)
+        if found is None:
+            get = self._loader.get_role if kind == "role" else self._loader.get_template
+            try:
+                get(artifact_id, version)
+                found = True
+            except (PackageNotFoundError, VersionNotFoundError):
+                found = False
+            self._found[key] = found
+        return found
+
+
+@dataclass
+class _PackageCheck:
+    """Findings that depend only on a package's own files (cacheable)."""
+    report: ValidationReport
+    manifest: Optional[Dict[str, Any]] = None
+    # Standalone PGC fragment the package needs, checked against the index
+    pgc_fragment_id: Optional[str] = None
+
+
+@dataclass
+class _ReleaseCheck:
+    """One release loaded for validation (the unit run in worker processes)."""
+    doc_type_id: str
+    version: str
+    package: Optional[DocumentTypePackage]
+    report: ValidationReport
+    package_check: Optional[_PackageCheck]
+    seconds: float
+
+
 class ConfigValidator:
     """
     Validates configuration artifacts for governance compliance.
@@ -95,22 +196,50 @@ class ConfigValidator:
             loader: Optional PackageLoader instance.
         """
         self._loader = loader or get_package_loader()
+        # Package rule results, revalidated against file content on every get
+        self._package_checks = ArtifactCache("package_check", ttl_seconds=0)
 
     # =========================================================================
     # Package Validation
     # =========================================================================
 
-    def validate_package(self, package_path: Path) -> ValidationReport:
+    def validate_package(
+        self,
+        package_path: Path,
+        references: Optional[ReferenceIndex] = None,
+    ) -> ValidationReport:
         """
         Validate a Document Type Package.
 
         Args:
             package_path: Path to the package release directory
+            references: Reference index to share across packages (one is
+                created if not given)
 
         Returns:
             ValidationReport with all findings
         """
+        if references is None:
+            references = ReferenceIndex(self._loader)
+        check = self._check_package(package_path)
+        report = copy.deepcopy(check.report)
+        if check.manifest is not None:
+            self._validate_shared_references(check, package_path, report, references)
+        return report
+
+    def _check_package(self, package_path: Path) -> _PackageCheck:
+        """Run the package's own rules, reusing the result while its files are unchanged."""
+        key = str(package_path)
+        check = self._package_checks.get(key)
+        if check is None:
+            check = self._run_package_rules(package_path)
+            if package_path.is_dir():
+                self._package_checks.put(key, check, package_path)
+        return check
+
+    def _run_package_rules(self, package_path: Path) -> _PackageCheck:
         report = ValidationReport(valid=True)
+        check = _PackageCheck(report=report)
 
         manifest_path = package_path / "package.yaml"
         if not manifest_path.exists():
@@ -119,27 +248,27 @@ class ConfigValidator:
                 message="Package manifest (package.yaml) not found",
                 file_path=str(package_path),
             )
-            return report
+            return check
 
         try:
             with open(manifest_path, "r") as f:
-                manifest = yaml.safe_load(f)
+                manifest = yaml.load(f, Loader=_YamlLoader)
         except yaml.YAMLError as e:
             report.add_error(
                 rule_id="MANIFEST_INVALID_YAML",
                 message=f"Invalid YAML in package.yaml: {e}",
                 file_path=str(manifest_path),
             )
-            return report
+            return check
 
-        # Run all validation rules
+        # Run the rules that need only this package's files
+        check.manifest = manifest
         self._validate_required_fields(manifest, manifest_path, report)
         self._validate_creation_mode(manifest, manifest_path, report)
-        self._validate_pgc_requirement(manifest, package_path, report)
+        check.pgc_fragment_id = self._validate_pgc_requirement(manifest, package_path, report)
         self._validate_artifact_references(manifest, package_path, report)
-        self._validate_shared_references(manifest, report)
 
-        return report
+        return check
 
     def _validate_required_fields(
         self,
@@ -191,7 +320,7 @@ class ConfigValidator:
         manifest: Dict[str, Any],
         package_path: Path,
         report: ValidationReport,
-    ) -> None:
+    ) -> Optional[str]:
         """
         Validate PGC requirement for authority level.
 
@@ -200,6 +329,10 @@ class ConfigValidator:
         PGC can be satisfied by either:
         1. An embedded pgc_context artifact in the package
         2. A standalone PGC fragment at prompts/pgc/{doc_type_id}.v1/
+
+        Returns:
+            The standalone fragment ID the package relies on (checked by
+            _validate_shared_references), or None
         """
         authority_level = manifest.get("authority_level", "")
         creation_mode = manifest.get("creation_mode", "")
@@ -207,13 +340,13 @@ class ConfigValidator:
 
         # PGC is only required for LLM-generated documents
         if creation_mode != "llm_generated":
-            return
+            return None
 
         # Descriptive and Prescriptive documents require PGC
         requires_pgc = authority_level in ("descriptive", "prescriptive")
 
         if not requires_pgc:
-            return
+            return None
 
         # Check if PGC context artifact is defined in package
         artifacts = manifest.get("artifacts", {})
@@ -228,19 +361,23 @@ class ConfigValidator:
                     message=f"PGC context file not found: {pgc_context}",
                     file_path=str(pgc_path),
                 )
-            return  # PGC is defined in package, validation complete
+            return None  # PGC is defined in package, validation complete
 
-        # Check for standalone PGC fragment
+        # Standalone PGC fragment, resolved with the shared references
         # Convention: prompts/pgc/{doc_type_id}.v1/releases/{version}/pgc.prompt.txt
-        if self._loader and doc_type_id:
-            pgc_fragment_id = f"{doc_type_id}.v1"
-            pgc_fragments = self._loader.list_pgc()
+        return f"{doc_type_id}.v1"
 
-            if pgc_fragment_id in pgc_fragments:
-                # Standalone PGC fragment exists - requirement satisfied
-                return
+    def _report_missing_pgc(
+        self,
+        manifest: Dict[str, Any],
+        package_path: Path,
+        report: ValidationReport,
+    ) -> None:
+        """Report a PGC requirement that no package artifact or fragment satisfies."""
+        authority_level = manifest.get("authority_level", "")
+        creation_mode = manifest.get("creation_mode", "")
+        doc_type_id = manifest.get("doc_type_id", "")
 
-        # No PGC found - report error
         report.add_error(
             rule_id="PGC_REQUIRED",
             message=f"Documents with authority_level='{authority_level}' require PGC context. "
@@ -286,10 +423,19 @@ class ConfigValidator:
 
     def _validate_shared_references(
         self,
-        manifest: Dict[str, Any],
+        check: _PackageCheck,
+        package_path: Path,
         report: ValidationReport,
+        references: ReferenceIndex,
     ) -> None:
         """Validate shared artifact references resolve."""
+        manifest = check.manifest
+
+        # Standalone PGC fragment required by _validate_pgc_requirement
+        if check.pgc_fragment_id is not None:
+            if not (manifest.get("doc_type_id") and references.has_pgc_fragment(check.pgc_fragment_id)):
+                self._report_missing_pgc(manifest, package_path, report)
+
         # Validate role prompt reference
         role_ref = manifest.get("role_prompt_ref")
         if role_ref:
@@ -305,9 +451,7 @@ class ConfigValidator:
                 parts = role_ref.split(":")
                 role_id = parts[2]
                 version = parts[3]
-                try:
-                    self._loader.get_role(role_id, version)
-                except (PackageNotFoundError, VersionNotFoundError):
+                if not references.has_role(role_id, version):
                     report.add_error(
                         rule_id="ROLE_NOT_FOUND",
                         message=f"Referenced role not found: {role_id} v{version}",
@@ -329,9 +473,7 @@ class ConfigValidator:
                 parts = template_ref.split(":")
                 template_id = parts[2]
                 version = parts[3]
-                try:
-                    self._loader.get_template(template_id, version)
-                except (PackageNotFoundError, VersionNotFoundError):
+                if not references.has_template(template_id, version):
                     report.add_error(
                         rule_id="TEMPLATE_NOT_FOUND",
                         message=f"Referenced template not found: {template_id} v{version}",
@@ -357,6 +499,7 @@ class ConfigValidator:
         self,
         doc_type_id: str,
         version: str,
+        references: Optional[ReferenceIndex] = None,
     ) -> ValidationReport:
         """
         Validate that a release can be activated.
@@ -368,13 +511,32 @@ class ConfigValidator:
         Args:
             doc_type_id: Document type to activate
             version: Version to activate
+            references: Reference index to share across packages (one is
+                created if not given)
 
         Returns:
             ValidationReport with all findings
         """
+        if references is None:
+            references = ReferenceIndex(self._loader)
+        check = self._check_release(doc_type_id, version)
+        self._validate_release_dependencies(
+            check, self._loader.get_active_releases().document_types, references
+        )
+        return check.report
+
+    def _check_release(
+        self,
+        doc_type_id: str,
+        version: str,
+        package_rules: bool = False,
+    ) -> _ReleaseCheck:
+        """Load a release (and optionally run its package rules)."""
+        start = time.perf_counter()
         report = ValidationReport(valid=True)
+        package = None
+        package_check = None
 
-        # Load the package
         try:
             package = self._loader.get_document_type(doc_type_id, version)
         except PackageNotFoundError:
@@ -383,20 +545,42 @@ class ConfigValidator:
                 message=f"Document type not found: {doc_type_id}",
                 details={"doc_type_id": doc_type_id, "version": version},
             )
-            return report
         except VersionNotFoundError:
             report.add_error(
                 rule_id="VERSION_NOT_FOUND",
                 message=f"Version not found: {version} for {doc_type_id}",
                 details={"doc_type_id": doc_type_id, "version": version},
             )
-            return report
 
-        # Validate required inputs have active releases
-        active = self._loader.get_active_releases()
+        if package is not None and package_rules:
+            release_path = self._loader.config_path / "document_types" / doc_type_id / "releases" / version
+            package_check = self._check_package(release_path)
+
+        return _ReleaseCheck(
+            doc_type_id=doc_type_id,
+            version=version,
+            package=package,
+            report=report,
+            package_check=package_check,
+            seconds=time.perf_counter() - start,
+        )
+
+    def _validate_release_dependencies(
+        self,
+        check: _ReleaseCheck,
+        active_document_types: Dict[str, str],
+        references: ReferenceIndex,
+    ) -> None:
+        """Add required-input and shared-reference findings for a loaded release."""
+        package = check.package
+        if package is None:
+            return
+        report = check.report
+        doc_type_id = check.doc_type_id
 
+        # Validate required inputs have active releases
         for required_input in package.required_inputs:
-            if required_input not in active.document_types:
+            if required_input not in active_document_types:
                 report.add_error(
                     rule_id="REQUIRED_INPUT_NOT_ACTIVE",
                     message=f"Required input '{required_input}' has no active release. "
@@ -413,9 +597,7 @@ class ConfigValidator:
             if len(parts) == 4:
                 role_id = parts[2]
                 role_version = parts[3]
-                try:
-                    self._loader.get_role(role_id, role_version)
-                except (PackageNotFoundError, VersionNotFoundError):
+                if not references.has_role(role_id, role_version):
                     report.add_error(
                         rule_id="ROLE_NOT_FOUND",
                         message=f"Referenced role not found: {role_id} v{role_version}",
@@ -428,37 +610,109 @@ class ConfigValidator:
             if len(parts) == 4:
                 template_id = parts[2]
                 template_version = parts[3]
-                try:
-                    self._loader.get_template(template_id, template_version)
-                except (PackageNotFoundError, VersionNotFoundError):
+                if not references.has_template(template_id, template_version):
                     report.add_error(
                         rule_id="TEMPLATE_NOT_FOUND",
                         message=f"Referenced template not found: {template_id} v{template_version}",
                         details={"template_ref": package.template_ref},
                     )
 
-        return report
-
-    def validate_all_active_packages(self) -> ValidationReport:
+    def validate_all_active_packages(self, max_workers: Optional[int] = None) -> ValidationReport:
         """
         Validate all currently active packages.
 
+        Args:
+            max_workers: Load releases in this many worker processes
+                (defaults to CONFIG_VALIDATION_WORKERS; 1 runs in-process)
+
         Returns:
             ValidationReport with all findings across active packages
         """
-        report = ValidationReport(valid=True)
+        report, _ = self._validate_active(package_rules=False, max_workers=max_workers)
+        return report
 
-        active = self._loader.get_active_releases()
+    def validate_config(
+        self,
+        max_workers: Optional[int] = None,
+    ) -> Tuple[ValidationReport, ValidationTiming]:
+        """
+        Validate every active package: package rules and activation checks.
 
-        for doc_type_id, version in active.document_types.items():
-            pkg_report = self.validate_activation(doc_type_id, version)
-            if not pkg_report.valid:
-                for error in pkg_report.errors:
-                    # Add context about which package
-                    error.message = f"[{doc_type_id}] {error.message}"
-                report.merge(pkg_report)
+        Args:
+            max_workers: Validate releases in this many worker processes
+                (defaults to CONFIG_VALIDATION_WORKERS; 1 runs in-process)
 
-        return report
+        Returns:
+            (report, timing) - findings are prefixed with their doc_type_id
+        """
+        return self._validate_active(package_rules=True, max_workers=max_workers)
+
+    def _validate_active(
+        self,
+        package_rules: bool,
+        max_workers: Optional[int],
+    ) -> Tuple[ValidationReport, ValidationTiming]:
+        start = time.perf_counter()
+        if max_workers is None:
+            from app.core.config import CONFIG_VALIDATION_WORKERS
+            max_workers = CONFIG_VALIDATION_WORKERS
+
+        active = self._loader.get_active_releases().document_types
+        releases = list(active.items())
+        workers = max(1, min(max_workers, len(releases)))
+        hits_before = self._package_checks.stats().hits
+
+        if workers > 1:
+            config_path = str(self._loader.config_path)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                checks = list(pool.map(
+                    _check_release_in_worker,
+                    [config_path] * len(releases),
+                    [doc_type_id for doc_type_id, _ in releases],
+                    [version for _, version in releases],
+                    [package_rules] * len(releases),
+                ))
+            # Workers keep their own caches
+            cache_hits = 0
+        else:
+            checks = [
+                self._check_release(doc_type_id, version, package_rules)
+                for doc_type_id, version in releases
+            ]
+            cache_hits = self._package_checks.stats().hits - hits_before
+
+        # Shared references are resolved once for all releases
+        references = ReferenceIndex(self._loader)
+        report = ValidationReport(valid=True)
+        for check in checks:
+            release_report = check.report
+            if check.package_check is not None:
+                package_report = copy.deepcopy(check.package_check.report)
+                if check.package_check.manifest is not None:
+                    release_path = (
+                        self._loader.config_path / "document_types" / check.doc_type_id
+                        / "releases" / check.version
+                    )
+                    self._validate_shared_references(
+                        check.package_check, release_path, package_report, references
+                    )
+                release_report.merge(package_report)
+            self._validate_release_dependencies(check, active, references)
+
+            if not release_report.valid:
+                for error in release_report.errors:
+                    # Add context about which package
+                    error.message = f"[{check.doc_type_id}] {error.message}"
+            report.merge(release_report)
+
+        timing = ValidationTiming(
+            total_seconds=time.perf_counter() - start,
+            workers=workers,
+            references_resolved=len(references),
+            package_cache_hits=cache_hits,
+            releases={f"{c.doc_type_id}:{c.version}": c.seconds for c in checks},
+        )
+        return report, timing
 
     # =========================================================================
     # Schema Compatibility Validation
@@ -569,3 +823,21 @@ def reset_config_validator() -> None:
     """Reset the singleton (for testing)."""
     global _validator
     _validator = None
+
+
+# Per-process validators for worker processes, keyed by config path
+_worker_validators: Dict[str, ConfigValidator] = {}
+
+
+def _check_release_in_worker(
+    config_path: str,
+    doc_type_id: str,
+    version: str,
+    package_rules: bool,
+) -> _ReleaseCheck:
+    """Load (and rule-check) one release in a worker process."""
+    validator = _worker_validators.get(config_path)
+    if validator is None:
+        validator = ConfigValidator(PackageLoader(Path(config_path)))
+        _worker_validators[config_path] = validator
+    return validator._check_release(doc_type_id, version, package_rules)
@@ -1,7 +1,8 @@
 """Cost dashboard service.
 
 Provides combined cost data from workflow telemetry and document builds.
-Used by both the API and web routes.
+Used by both the API and web routes. Document build costs come from the
+llm_cost_daily rollup rather than individual llm_run rows.
 """
 
 import logging
@@ -9,10 +10,9 @@ from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
-from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.models.llm_logging import LLMRun
+from app.domain.services.llm_cost_rollup import get_document_daily_costs
 from app.llm import TelemetryService
 
 logger = logging.getLogger(__name__)
@@ -62,30 +62,15 @@ async def get_cost_dashboard_data(
             daily_totals[day_str]["calls"] += summary.call_count
             daily_totals[day_str]["errors"] += summary.error_count
 
-    # Get document build costs from llm_run table (unless filtered to workflows only)
+    # Document build costs from the daily rollup (unless filtered to workflows only)
     if source != "workflows":
-        query = select(LLMRun).where(
-            and_(
-                LLMRun.artifact_type.isnot(None),
-                LLMRun.started_at >= datetime.combine(start_date, datetime.min.time()),
-            )
-        )
-
-        result = await db.execute(query)
-        runs = result.scalars().all()
-
-        for run in runs:
-            if run.started_at:
-                day_str = run.started_at.strftime("%Y-%m-%d")
-                cost = float(run.cost_usd or 0)
-                daily_totals[day_str]["cost"] += cost
-                daily_totals[day_str]["document_cost"] += cost
-                daily_totals[day_str]["tokens"] += (run.input_tokens or 0) + (
-                    run.output_tokens or 0
-                )
-                daily_totals[day_str]["calls"] += 1
-                if run.status == "FAILED":
-                    daily_totals[day_str]["errors"] += 1
+        document_days = await get_document_daily_costs(db, start_date)
+        for day_str, day in document_days.items():
+            daily_totals[day_str]["cost"] += day["cost"]
+            daily_totals[day_str]["document_cost"] += day["cost"]
+            daily_totals[day_str]["tokens"] += day["tokens"]
+            daily_totals[day_str]["calls"] += day["calls"]
+            daily_totals[day_str]["errors"] += day["errors"]
 
     from app.api.services.service_pure import aggregate_daily_costs
 
@@ -68,15 +68,22 @@ async def get_dashboard_summary(
             "source_label": "Workflow",
         })
 
-    # Get document builds
+    # Get document builds (only the columns the dashboard shows; run_metadata
+    # and error text stay in the database)
     query = (
-        select(LLMRun)
+        select(
+            LLMRun.id,
+            LLMRun.artifact_type,
+            LLMRun.project_id,
+            LLMRun.status,
+            LLMRun.started_at,
+        )
         .where(LLMRun.artifact_type.isnot(None))
         .order_by(desc(LLMRun.started_at))
         .limit(20)
     )
     result = await db.execute(query)
-    llm_runs = result.scalars().all()
+    llm_runs = result.all()
 
     for run in llm_runs:
         executions.append({
@@ -14,7 +14,8 @@ import logging
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.api.models.document import Document
 from app.api.models.document_relation import DocumentRelation, RelationType
@@ -161,6 +162,9 @@ class DocumentService:
         
         await self.db.commit()
         await self.db.refresh(doc)
+        # refresh() expires the deferred content column; it was just written,
+        # so restore it without another round trip.
+        set_committed_value(doc, "content", content)
         
         logger.info(f"Created document: {doc.id} ({doc_type_id} v{version})")
         return doc
@@ -175,7 +179,11 @@ class DocumentService:
         include_relations: bool = False
     ) -> Optional[Document]:
         """Get document by ID."""
-        query = select(Document).where(Document.id == document_id)
+        query = (
+            select(Document)
+            .options(undefer(Document.content))
+            .where(Document.id == document_id)
+        )
         
         if include_relations:
             query = query.options(
@@ -195,6 +203,7 @@ class DocumentService:
         """Get the latest version of a document type in a space."""
         query = (
             select(Document)
+            .options(undefer(Document.content))
             .where(Document.space_type == space_type)
             .where(Document.space_id == space_id)
             .where(Document.doc_type_id == doc_type_id)
@@ -434,8 +443,10 @@ class DocumentService:
         if status == "active":
             doc.is_stale = False
         
+        content = doc.content
         await self.db.commit()
         await self.db.refresh(doc)
+        set_committed_value(doc, "content", content)
         return doc
     
     # =========================================================================
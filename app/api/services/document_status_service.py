@@ -2,22 +2,32 @@
 Document Status Service - ADR-007 Implementation
 
 Derives document readiness and acceptance states for sidebar display.
-All status is computed, never stored - prevents drift.
+Status is always derived from documents and document types. The derived
+list for a project is materialized in project_document_status, which
+database triggers clear whenever an input to the derivation changes, so a
+snapshot is either current or absent - it cannot drift.
 
 Key principle: The system never tells the user what to think.
 It only tells them what's safe, what's risky, and what's missing.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from threading import Lock
 from typing import Optional, List, Dict, Any
 from uuid import UUID
+import hashlib
+import json
 import logging
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
 
 from app.api.models.document import Document
 from app.api.models.document_type import DocumentType
+from app.api.models.project_document_status import ProjectDocumentStatus
 
 logger = logging.getLogger(__name__)
 
@@ -109,18 +119,234 @@ class DocumentStatus:
             "display_order": self.display_order,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DocumentStatus":
+        """Inverse of to_dict (used to read materialized snapshots)."""
+        document_id = data.get("document_id")
+        return cls(
+            doc_type_id=data["doc_type_id"],
+            document_id=UUID(document_id) if document_id else None,
+            title=data["title"],
+            icon=data["icon"],
+            readiness=data["readiness"],
+            acceptance_state=data.get("acceptance_state"),
+            subtitle=data.get("subtitle"),
+            can_build=data["can_build"],
+            can_rebuild=data["can_rebuild"],
+            can_accept=data["can_accept"],
+            can_reject=data["can_reject"],
+            can_use_as_input=data["can_use_as_input"],
+            missing_inputs=list(data.get("missing_inputs") or []),
+            display_order=data.get("display_order", 0),
+        )
+
+
+@dataclass(frozen=True)
+class ProjectStatusSnapshot:
+    """
+    Materialized document statuses for one project.
+
+    etag changes exactly when the serialized statuses change, so it can be
+    used as an HTTP entity tag. generation identifies the database row
+    version the snapshot was read from or built against.
+    """
+    project_id: UUID
+    generation: int
+    etag: str
+    statuses: List[DocumentStatus]
+
+
+def compute_status_etag(payload: List[Dict[str, Any]]) -> str:
+    """Entity tag for a serialized status list.
+
+    Pure function - no I/O, no side effects.
+    """
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """True if an If-None-Match header value matches an entity tag.
+
+    Accepts weak (W/"...") and strong tags, comma-separated lists and "*".
+    """
+    if not if_none_match or not etag:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
+
 
 # =============================================================================
 # SERVICE
 # =============================================================================
 
+# Snapshots kept in process memory (one per project, LRU)
+SNAPSHOT_CACHE_SIZE = 1024
+
+
 class DocumentStatusService:
     """
     Service for deriving document status for sidebar display.
     
-    All status is derived from current state - never stored.
-    This ensures status always reflects reality.
+    All status is derived from current state. get_project_snapshot serves
+    the derived list from process memory or the project_document_status
+    row and only derives it again after a trigger has invalidated it.
     """
+
+    def __init__(self, cache_size: int = SNAPSHOT_CACHE_SIZE):
+        self._snapshots: "OrderedDict[UUID, ProjectStatusSnapshot]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = Lock()
+
+    # =========================================================================
+    # MATERIALIZED SNAPSHOT
+    # =========================================================================
+
+    async def get_project_etag(
+        self,
+        db: AsyncSession,
+        project_id: UUID
+    ) -> Optional[str]:
+        """
+        Entity tag of the project's current snapshot.
+
+        A single-row read of two small columns; None if the snapshot has
+        been invalidated or never built.
+        """
+        result = await db.execute(
+            select(ProjectDocumentStatus.etag)
+            .where(ProjectDocumentStatus.project_id == project_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_project_snapshot(
+        self,
+        db: AsyncSession,
+        project_id: UUID
+    ) -> ProjectStatusSnapshot:
+        """
+        Get the materialized document statuses for a project.
+
+        Reads the snapshot row's generation and etag. If process memory
+        holds that version it is returned as is; otherwise the stored
+        statuses are read, or derived and stored when the row has been
+        invalidated. A derivation that raced a write is returned but not
+        stored (the write bumped the generation).
+
+        Args:
+            db: Database session
+            project_id: Project UUID
+
+        Returns:
+            ProjectStatusSnapshot
+        """
+        result = await db.execute(
+            select(ProjectDocumentStatus.generation, ProjectDocumentStatus.etag)
+            .where(ProjectDocumentStatus.project_id == project_id)
+        )
+        row = result.one_or_none()
+
+        if row is not None and row.etag is not None:
+            cached = self._get_cached(project_id)
+            if cached and cached.generation == row.generation and cached.etag == row.etag:
+                return cached
+
+            result = await db.execute(
+                select(ProjectDocumentStatus.statuses)
+                .where(ProjectDocumentStatus.project_id == project_id)
+                .where(ProjectDocumentStatus.generation == row.generation)
+            )
+            payload = result.scalar_one_or_none()
+            if payload is not None:
+                snapshot = ProjectStatusSnapshot(
+                    project_id=project_id,
+                    generation=row.generation,
+                    etag=row.etag,
+                    statuses=[DocumentStatus.from_dict(item) for item in payload],
+                )
+                self._remember(snapshot)
+                return snapshot
+
+        generation = row.generation if row is not None else 0
+        statuses = await self.get_project_document_statuses(db, project_id)
+        payload = [status.to_dict() for status in statuses]
+        snapshot = ProjectStatusSnapshot(
+            project_id=project_id,
+            generation=generation,
+            etag=compute_status_etag(payload),
+            statuses=statuses,
+        )
+
+        if await self._store_snapshot(db, snapshot, payload, existing=row is not None):
+            self._remember(snapshot)
+        return snapshot
+
+    async def _store_snapshot(
+        self,
+        db: AsyncSession,
+        snapshot: ProjectStatusSnapshot,
+        payload: List[Dict[str, Any]],
+        existing: bool
+    ) -> bool:
+        """
+        Store a derived snapshot unless its row changed since it was read.
+
+        Returns:
+            True if the snapshot was stored
+        """
+        values = {
+            "etag": snapshot.etag,
+            "statuses": payload,
+            "computed_at": func.now(),
+        }
+        if existing:
+            stmt = (
+                update(ProjectDocumentStatus)
+                .where(ProjectDocumentStatus.project_id == snapshot.project_id)
+                .where(ProjectDocumentStatus.generation == snapshot.generation)
+                .values(**values)
+            )
+        else:
+            stmt = (
+                insert(ProjectDocumentStatus)
+                .values(project_id=snapshot.project_id, generation=0, **values)
+                .on_conflict_do_nothing(index_elements=["project_id"])
+            )
+        result = await db.execute(stmt)
+        stored = result.rowcount == 1
+        if not stored:
+            logger.debug(f"[STATUS] Snapshot for {snapshot.project_id} superseded by a write")
+        return stored
+
+    def _get_cached(self, project_id: UUID) -> Optional[ProjectStatusSnapshot]:
+        with self._lock:
+            snapshot = self._snapshots.get(project_id)
+            if snapshot is not None:
+                self._snapshots.move_to_end(project_id)
+            return snapshot
+
+    def _remember(self, snapshot: ProjectStatusSnapshot) -> None:
+        with self._lock:
+            self._snapshots[snapshot.project_id] = snapshot
+            self._snapshots.move_to_end(snapshot.project_id)
+            if len(self._snapshots) > self._cache_size:
+                self._snapshots.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop snapshots held in process memory."""
+        with self._lock:
+            self._snapshots.clear()
+
+    # =========================================================================
+    # DERIVATION ENTRY POINTS
+    # =========================================================================
     
     async def get_project_document_statuses(
         self,
@@ -188,6 +414,13 @@ class DocumentStatusService:
         Returns:
             DocumentStatus or None if doc_type not found
         """
+        # Project-scoped types are in the project's snapshot
+        if space_type == "project":
+            snapshot = await self.get_project_snapshot(db, space_id)
+            for status in snapshot.statuses:
+                if status.doc_type_id == doc_type_id:
+                    return status
+
         # Get document type
         doc_type = await self._get_document_type(db, doc_type_id)
         if not doc_type:
@@ -11,7 +11,7 @@ import subprocess
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +114,16 @@ class GitService:
         if not self.config_path.exists():
             raise GitServiceError(f"Config directory does not exist: {self.config_path}")
 
+        self._release_index = None
+
+    @property
+    def release_index(self):
+        """The ReleaseIndex for this repository (created on first use)."""
+        if self._release_index is None:
+            from app.api.services.release_index import ReleaseIndex
+            self._release_index = ReleaseIndex(self)
+        return self._release_index
+
     def _prefix_path(self, path: str) -> str:
         """Add combine-config prefix to a path if not already prefixed."""
         if path.startswith(self.config_prefix + "/") or path.startswith(self.config_prefix + "\\"):
@@ -132,6 +142,8 @@ class GitService:
         *args: str,
         capture_output: bool = True,
         check: bool = True,
+        input: Optional[Union[str, bytes]] = None,
+        text: bool = True,
     ) -> subprocess.CompletedProcess:
         """
         Run a Git command.
@@ -140,6 +152,8 @@ class GitService:
             *args: Git command arguments
             capture_output: Capture stdout/stderr
             check: Raise exception on non-zero exit
+            input: Data for the command's stdin
+            text: Decode stdin/stdout as text (False for bytes)
 
         Returns:
             CompletedProcess result
@@ -151,7 +165,8 @@ class GitService:
                 cmd,
                 cwd=self.repo_path,
                 capture_output=capture_output,
-                text=True,
+                text=text,
+                input=input,
                 check=check,
                 env={
                     **os.environ,
@@ -464,6 +479,16 @@ class GitService:
         # Create commit
         self._run_git("commit", "-m", full_message)
 
+        # Other workers reload their config caches (see config_sync)
+        from app.core.config_sync import signal_config_changed
+        signal_config_changed(message.strip().splitlines()[0])
+
+        # Index release changes now rather than on the next release query
+        try:
+            self.release_index.refresh()
+        except Exception as e:
+            logger.warning(f"Release index not updated after commit: {e}")
+
         # Get commit info
         return self.get_commit("HEAD")
 
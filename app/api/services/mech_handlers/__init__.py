@@ -10,6 +10,7 @@ from app.api.services.mech_handlers.base import (
     MechResult,
     ExecutionContext,
     MechHandlerError,
+    OperationConfigError,
 )
 
 # Import registry first - handlers use @register_handler decorator
@@ -32,6 +33,13 @@ from app.api.services.mech_handlers.router import RouterHandler
 from app.api.services.mech_handlers.validator import ValidatorHandler
 from app.api.services.mech_handlers.spawner import SpawnerHandler
 
+from app.api.services.mech_handlers.compiled import (
+    CompiledOperation,
+    CompiledPipeline,
+    PipelineResult,
+    compile_operation,
+    fuse_operations,
+)
 from app.api.services.mech_handlers.executor import (
     execute_operation,
     execute_operation_by_ref,
@@ -42,6 +50,7 @@ __all__ = [
     "MechResult",
     "ExecutionContext",
     "MechHandlerError",
+    "OperationConfigError",
     "ExtractorHandler",
     "MergerHandler",
     "EntryHandler",
@@ -54,6 +63,11 @@ __all__ = [
     "get_handler",
     "register_handler",
     "HANDLER_REGISTRY",
+    "CompiledOperation",
+    "CompiledPipeline",
+    "PipelineResult",
+    "compile_operation",
+    "fuse_operations",
     "execute_operation",
     "execute_operation_by_ref",
 ]
@@ -35,6 +35,14 @@ class RoutingUnmatchedError(MechHandlerError):
     pass
 
 
+class OperationConfigError(MechHandlerError):
+    """Operation definition cannot be compiled (bad type or config)."""
+
+    def __init__(self, message: str, error_code: str = "config_error"):
+        super().__init__(message)
+        self.error_code = error_code
+
+
 @dataclass
 class ExecutionContext:
     """
@@ -177,6 +185,10 @@ class MechHandler(ABC):
     # Operation type this handler handles
     operation_type: str = "unknown"
 
+    # Pure handlers only transform their inputs (no I/O, no operator
+    # interaction), so consecutive pure operations can be fused.
+    pure: bool = True
+
     @abstractmethod
     async def execute(
         self,
@@ -208,3 +220,18 @@ class MechHandler(ABC):
             List of validation error messages (empty if valid)
         """
         return []
+
+    def prepare_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Precompute anything execute() would otherwise derive per call.
+
+        Called once when an operation is compiled. Override in subclasses
+        to build lookup tables; the default returns the config unchanged.
+
+        Args:
+            config: Validated operation configuration
+
+        Returns:
+            Configuration passed to every execute() call
+        """
+        return config
@@ -0,0 +1,234 @@
+"""
+Compiled Mechanical Operations.
+
+Per ADR-047, operation definitions are static YAML. Compiling an operation
+resolves its handler, validates and prepares its config and compiles its
+JSONPaths exactly once, producing an immutable object that can be executed
+many times. Consecutive pure operations can additionally be fused into a
+single pipeline that threads one input through every stage.
+"""
+
+import copy
+import logging
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.api.services.mech_handlers.base import (
+    ExecutionContext,
+    MechHandler,
+    MechResult,
+    OperationConfigError,
+    TransformError,
+)
+from app.api.services.mech_handlers.jsonpath_cache import (
+    CompiledPath,
+    compile_operation_paths,
+)
+from app.api.services.mech_handlers.registry import get_handler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompiledOperation:
+    """
+    An operation definition compiled for repeated execution.
+
+    Attributes:
+        op_id: Operation identifier
+        version: Operation version
+        op_type: Operation type (handler key)
+        handler: Resolved handler instance
+        config: Prepared, read-only config passed to the handler
+        paths: JSONPaths referenced by the config, compiled
+    """
+    op_id: str
+    version: str
+    op_type: str
+    handler: MechHandler = field(repr=False)
+    config: Mapping[str, Any] = field(repr=False)
+    paths: Mapping[str, CompiledPath] = field(default_factory=dict, repr=False)
+
+    @property
+    def pure(self) -> bool:
+        """True if the operation can be fused into a pipeline."""
+        return self.handler.pure
+
+    async def execute(
+        self,
+        inputs: Dict[str, Any],
+        workflow_id: Optional[str] = None,
+        node_id: Optional[str] = None,
+    ) -> MechResult:
+        """Execute the operation against inputs."""
+        context = ExecutionContext(
+            inputs=inputs,
+            workflow_id=workflow_id,
+            node_id=node_id,
+        )
+        try:
+            return await self.handler.execute(self.config, context)
+        except Exception as e:
+            logger.exception(f"Operation {self.op_id} failed with exception: {e}")
+            return MechResult.fail(
+                error=str(e),
+                error_code="execution_error",
+            )
+
+
+def compile_operation(
+    operation: Dict[str, Any],
+    validate: bool = True,
+) -> CompiledOperation:
+    """
+    Compile an operation definition.
+
+    Args:
+        operation: Operation definition with 'type' and 'config' keys and an
+            'id' (or 'op_id') and optional 'version'
+        validate: Run the handler's validate_config and fail on errors or
+            invalid JSONPaths (ad-hoc definitions skip this and keep the
+            handlers' own per-call error reporting)
+
+    Returns:
+        CompiledOperation
+
+    Raises:
+        OperationConfigError: Missing type, unknown handler, invalid config
+            or invalid JSONPath
+    """
+    op_type = operation.get("type")
+    op_id = operation.get("id") or operation.get("op_id") or "unknown"
+    version = str(operation.get("version", ""))
+
+    if not op_type:
+        raise OperationConfigError(f"Operation {op_id} has no type")
+
+    handler = get_handler(op_type)
+    if not handler:
+        raise OperationConfigError(
+            f"No handler registered for type '{op_type}'",
+            error_code="handler_not_found",
+        )
+
+    config = copy.deepcopy(operation.get("config") or {})
+
+    if validate:
+        errors = handler.validate_config(config)
+        if errors:
+            raise OperationConfigError(
+                f"Invalid config for operation {op_id}: {'; '.join(errors)}"
+            )
+
+    try:
+        paths = compile_operation_paths(config)
+    except TransformError as e:
+        if validate:
+            raise OperationConfigError(f"Operation {op_id}: {e}")
+        paths = {}
+
+    # Handlers read op_id from config (e.g. entry operations)
+    prepared = handler.prepare_config({**config, "op_id": op_id})
+
+    return CompiledOperation(
+        op_id=op_id,
+        version=version,
+        op_type=op_type,
+        handler=handler,
+        config=MappingProxyType(prepared),
+        paths=MappingProxyType(paths),
+    )
+
+
+@dataclass(frozen=True)
+class PipelineResult:
+    """
+    Result of running a fused pipeline.
+
+    Attributes:
+        result: Result of the last stage that ran
+        outputs: Output of each stage that succeeded, in order
+        failed_op: op_id of the stage that failed, if any
+    """
+    result: MechResult
+    outputs: Tuple[Dict[str, Any], ...] = ()
+    failed_op: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.failed_op is None and self.result.success
+
+
+@dataclass(frozen=True)
+class CompiledPipeline:
+    """
+    Consecutive pure operations fused into a single pass.
+
+    Each stage receives the shared inputs with ``carry`` replaced by the
+    previous stage's output, so e.g. a pinner and an exclusion filter both
+    operating on ``document`` run back to back without re-dispatch.
+    """
+    stages: Tuple[CompiledOperation, ...]
+    carry: str
+
+    @property
+    def op_ids(self) -> Tuple[str, ...]:
+        return tuple(stage.op_id for stage in self.stages)
+
+    async def run(
+        self,
+        inputs: Dict[str, Any],
+        workflow_id: Optional[str] = None,
+        node_id: Optional[str] = None,
+    ) -> PipelineResult:
+        """Run every stage in order, stopping at the first failure.
+
+        A stage that succeeds without output is treated as a failure so
+        callers can fall back, matching the per-operation call sites.
+        """
+        current = dict(inputs)
+        outputs: List[Dict[str, Any]] = []
+        result = MechResult.ok(output=current.get(self.carry))
+
+        for stage in self.stages:
+            result = await stage.execute(current, workflow_id=workflow_id, node_id=node_id)
+            if not result.success or not result.output:
+                return PipelineResult(
+                    result=result,
+                    outputs=tuple(outputs),
+                    failed_op=stage.op_id,
+                )
+            outputs.append(result.output)
+            current[self.carry] = result.output
+
+        return PipelineResult(result=result, outputs=tuple(outputs))
+
+
+def fuse_operations(
+    operations: Sequence[CompiledOperation],
+    carry: str,
+) -> CompiledPipeline:
+    """
+    Fuse consecutive pure operations into a pipeline.
+
+    Args:
+        operations: Compiled operations, in execution order
+        carry: Input name that each stage's output replaces for the next
+
+    Returns:
+        CompiledPipeline
+
+    Raises:
+        OperationConfigError: No operations, or an operation is not pure
+    """
+    if not operations:
+        raise OperationConfigError("Cannot fuse an empty operation list")
+
+    impure = [op.op_id for op in operations if not op.pure]
+    if impure:
+        raise OperationConfigError(
+            f"Operations with side effects cannot be fused: {', '.join(impure)}"
+        )
+
+    return CompiledPipeline(stages=tuple(operations), carry=carry)
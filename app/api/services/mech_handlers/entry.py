@@ -30,6 +30,7 @@ class EntryHandler(MechHandler):
     """
 
     operation_type = "entry"
+    pure = False
 
     async def execute(
         self,
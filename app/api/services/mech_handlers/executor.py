@@ -6,19 +6,22 @@ This is the glue between operation definitions (YAML) and handlers (Python).
 """
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from app.api.services.mech_handlers.base import (
-    ExecutionContext,
     MechResult,
+    OperationConfigError,
+)
+from app.api.services.mech_handlers.compiled import (
+    CompiledOperation,
+    compile_operation,
 )
-from app.api.services.mech_handlers.registry import get_handler
 
 logger = logging.getLogger(__name__)
 
 
 async def execute_operation(
-    operation: Dict[str, Any],
+    operation: Union[CompiledOperation, Dict[str, Any]],
     inputs: Dict[str, Any],
     workflow_id: Optional[str] = None,
     node_id: Optional[str] = None,
@@ -27,12 +30,13 @@ async def execute_operation(
     Execute a mechanical operation.
 
     This is the main entry point for running mechanical operations.
-    It looks up the appropriate handler based on operation type and
-    dispatches execution.
+    Compiled operations (see MechanicalOpsService.get_compiled_operation)
+    dispatch straight to their resolved handler; raw definitions are
+    compiled for this call only.
 
     Args:
-        operation: The operation definition (loaded from YAML)
-            Must contain 'type' and 'config' keys
+        operation: A CompiledOperation, or the operation definition
+            (loaded from YAML) containing 'type' and 'config' keys
         inputs: Input data keyed by reference name
             e.g., {"source_document": {...}, "qa_result": {...}}
         workflow_id: Optional workflow ID for context
@@ -56,46 +60,26 @@ async def execute_operation(
         >>> result.output
         {"summary": "Build a widget"}
     """
-    op_type = operation.get("type")
-    op_id = operation.get("id", "unknown")
-    config = operation.get("config", {})
+    if not isinstance(operation, CompiledOperation):
+        try:
+            operation = compile_operation(operation, validate=False)
+        except OperationConfigError as e:
+            return MechResult.fail(
+                error=str(e),
+                error_code=e.error_code,
+            )
 
-    if not op_type:
-        return MechResult.fail(
-            error=f"Operation {op_id} has no type",
-            error_code="config_error",
-        )
+    op_id = operation.op_id
 
-    # Get the handler for this operation type
-    handler = get_handler(op_type)
-    if not handler:
-        return MechResult.fail(
-            error=f"No handler registered for type '{op_type}'",
-            error_code="handler_not_found",
-        )
+    logger.info(f"Executing operation {op_id} (type={operation.op_type})")
 
-    # Build execution context
-    context = ExecutionContext(
-        inputs=inputs,
+    result = await operation.execute(
+        inputs,
         workflow_id=workflow_id,
         node_id=node_id,
     )
-
-    # Add op_id to config so handlers can access it
-    config_with_id = {**config, "op_id": op_id}
-
-    logger.info(f"Executing operation {op_id} (type={op_type})")
-
-    try:
-        result = await handler.execute(config_with_id, context)
-        logger.info(f"Operation {op_id} completed: success={result.success}, outcome={result.outcome}")
-        return result
-    except Exception as e:
-        logger.exception(f"Operation {op_id} failed with exception: {e}")
-        return MechResult.fail(
-            error=str(e),
-            error_code="execution_error",
-        )
+    logger.info(f"Operation {op_id} completed: success={result.success}, outcome={result.outcome}")
+    return result
 
 
 async def execute_operation_by_ref(
@@ -8,9 +8,6 @@ fields from documents.
 import logging
 from typing import Any, Dict, List
 
-from jsonpath_ng import parse as jsonpath_parse
-from jsonpath_ng.exceptions import JsonPathParserError
-
 from app.api.services.mech_handlers.base import (
     MechHandler,
     MechResult,
@@ -18,6 +15,7 @@ from app.api.services.mech_handlers.base import (
     TransformError,
     InputMissingError,
 )
+from app.api.services.mech_handlers.jsonpath_cache import compile_jsonpath
 from app.api.services.mech_handlers.registry import register_handler
 
 logger = logging.getLogger(__name__)
@@ -30,7 +28,8 @@ logger = logging.getLogger(__name__)
 def extract_jsonpath(source: Dict[str, Any], path: str) -> Any:
     """Extract a value from a dict using JSONPath.
 
-    Pure function — no I/O, no side effects.
+    Pure function — no I/O, no side effects. Expressions are compiled
+    once and cached (see jsonpath_cache).
 
     Args:
         source: Source document dict
@@ -42,20 +41,15 @@ def extract_jsonpath(source: Dict[str, Any], path: str) -> Any:
     Raises:
         TransformError: If JSONPath expression is invalid
     """
-    try:
-        jsonpath_expr = jsonpath_parse(path)
-    except JsonPathParserError as e:
-        raise TransformError(f"Invalid JSONPath '{path}': {e}")
-
-    matches = jsonpath_expr.find(source)
+    matches = compile_jsonpath(path).find(source)
 
     if not matches:
         return None
 
     if len(matches) == 1:
-        return matches[0].value
+        return matches[0]
 
-    return [match.value for match in matches]
+    return matches
 
 
 def extract_fields(source: Dict[str, Any], field_paths: list) -> Dict[str, Any]:
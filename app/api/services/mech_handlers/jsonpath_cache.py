@@ -0,0 +1,169 @@
+"""
+Compiled JSONPath expressions for mechanical operations.
+
+Per ADR-047, extractors, routers and validators address document fields
+with JSONPath. jsonpath-ng parsing is PLY-based and expensive, while the
+set of paths is fixed by the operation definitions in combine-config/.
+Paths are therefore compiled once and reused.
+
+Simple dotted paths (``$``, ``$.a.b``, ``$.items[0].id``) are resolved by a
+direct dict/list walk that never touches jsonpath-ng. Everything else
+(wildcards, filters, slices, quoted fields) falls back to a parsed
+jsonpath-ng expression, parsed exactly once per distinct path string.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from jsonpath_ng import parse as jsonpath_parse
+from jsonpath_ng.exceptions import JSONPathError
+
+from app.api.services.mech_handlers.base import TransformError
+
+
+# Maximum number of distinct path strings kept compiled per process.
+JSONPATH_CACHE_SIZE = 1024
+
+# Config keys whose string values are JSONPath expressions.
+JSONPATH_CONFIG_KEYS = frozenset({"path", "from", "to"})
+
+_SIMPLE_PATH_RE = re.compile(r"^\$((?:\.[A-Za-z_][A-Za-z0-9_]*|\[\d+\])*)$")
+_SIMPLE_STEP_RE = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[(\d+)\]")
+
+Step = Union[str, int]
+
+
+def parse_simple_path(path: str) -> Optional[Tuple[Step, ...]]:
+    """Split a simple JSONPath into field/index steps.
+
+    Pure function — no I/O, no side effects.
+
+    Args:
+        path: JSONPath expression
+
+    Returns:
+        Tuple of steps (str for fields, int for indexes), or None if the
+        path needs the full jsonpath-ng engine
+    """
+    match = _SIMPLE_PATH_RE.match(path.strip())
+    if not match:
+        return None
+
+    steps: List[Step] = []
+    for field_name, index in _SIMPLE_STEP_RE.findall(match.group(1)):
+        steps.append(int(index) if index else field_name)
+    return tuple(steps)
+
+
+class CompiledPath:
+    """
+    A JSONPath expression compiled for repeated evaluation.
+
+    Immutable after construction; safe to share across executions.
+    """
+
+    __slots__ = ("path", "steps", "_expr")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.steps = parse_simple_path(path)
+        self._expr = None
+
+        if self.steps is None:
+            try:
+                self._expr = jsonpath_parse(path)
+            except JSONPathError as e:
+                raise TransformError(f"Invalid JSONPath '{path}': {e}")
+
+    @property
+    def is_simple(self) -> bool:
+        """True if evaluation bypasses jsonpath-ng."""
+        return self.steps is not None
+
+    def find(self, source: Any) -> List[Any]:
+        """Return the values of all matches, in document order."""
+        if self.steps is None:
+            return [match.value for match in self._expr.find(source)]
+
+        current = source
+        for step in self.steps:
+            if isinstance(step, int):
+                if not isinstance(current, (list, tuple, str)) or step >= len(current):
+                    return []
+                current = current[step]
+            else:
+                if not isinstance(current, dict) or step not in current:
+                    return []
+                current = current[step]
+        return [current]
+
+    def first(self, source: Any) -> Any:
+        """Return the first match value, or None."""
+        values = self.find(source)
+        return values[0] if values else None
+
+    def __repr__(self) -> str:
+        mode = "simple" if self.steps is not None else "jsonpath"
+        return f"CompiledPath({self.path!r}, {mode})"
+
+
+@lru_cache(maxsize=JSONPATH_CACHE_SIZE)
+def compile_jsonpath(path: str) -> CompiledPath:
+    """Compile a JSONPath expression, reusing prior compilations.
+
+    Args:
+        path: JSONPath expression
+
+    Returns:
+        CompiledPath for the expression
+
+    Raises:
+        TransformError: If the JSONPath expression is invalid
+    """
+    return CompiledPath(path)
+
+
+def collect_jsonpaths(config: Any) -> List[str]:
+    """Collect every JSONPath string referenced by an operation config.
+
+    Pure function — no I/O, no side effects. Walks nested dicts/lists and
+    returns values of ``path``/``from``/``to`` keys that start with ``$``.
+
+    Args:
+        config: Operation config (as loaded from YAML)
+
+    Returns:
+        Unique paths in first-seen order
+    """
+    found: List[str] = []
+    _collect_into(config, found)
+    return found
+
+
+def _collect_into(node: Any, found: List[str]) -> None:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in JSONPATH_CONFIG_KEYS and isinstance(value, str) and value.startswith("$"):
+                if value not in found:
+                    found.append(value)
+            else:
+                _collect_into(value, found)
+    elif isinstance(node, list):
+        for item in node:
+            _collect_into(item, found)
+
+
+def compile_operation_paths(config: Dict[str, Any]) -> Dict[str, CompiledPath]:
+    """Compile and validate every JSONPath in an operation config.
+
+    Args:
+        config: Operation config (as loaded from YAML)
+
+    Returns:
+        Dict of path string -> CompiledPath
+
+    Raises:
+        TransformError: If any path is invalid
+    """
+    return {path: compile_jsonpath(path) for path in collect_jsonpaths(config)}
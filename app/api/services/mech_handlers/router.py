@@ -10,14 +10,13 @@ import logging
 import uuid
 from typing import Any, Dict, List
 
-from jsonpath_ng import parse as jsonpath_parse
-from jsonpath_ng.exceptions import JsonPathParserError
-
 from app.api.services.mech_handlers.base import (
     MechHandler,
     MechResult,
     ExecutionContext,
+    TransformError,
 )
+from app.api.services.mech_handlers.jsonpath_cache import compile_jsonpath
 from app.api.services.mech_handlers.registry import register_handler
 
 logger = logging.getLogger(__name__)
@@ -51,11 +50,10 @@ def extract_classification(
             output_key = field_spec.get("as")
             if path and output_key:
                 try:
-                    jsonpath_expr = jsonpath_parse(path)
-                    matches = jsonpath_expr.find(intake)
+                    matches = compile_jsonpath(path).find(intake)
                     if matches:
-                        classification[output_key] = matches[0].value
-                except JsonPathParserError:
+                        classification[output_key] = matches[0]
+                except TransformError:
                     pass
     else:
         for key in ["project_type", "artifact_type", "audience", "classification", "confidence"]:
@@ -278,3 +276,20 @@ class RouterHandler(MechHandler):
                     errors.append(f"routes[{i}].pow_ref is required")
 
         return errors
+
+    def prepare_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Precompute the route table: match values normalized to lists."""
+        if not isinstance(config.get("routes"), list):
+            return config
+
+        routes = []
+        for route in config["routes"]:
+            if not isinstance(route, dict) or not isinstance(route.get("match"), dict):
+                routes.append(route)
+                continue
+            match = {
+                field: values if isinstance(values, list) else [values]
+                for field, values in route["match"].items()
+            }
+            routes.append({**route, "match": match})
+        return {**config, "routes": routes}
@@ -131,6 +131,7 @@ class SpawnerHandler(MechHandler):
     """
 
     operation_type = "spawner"
+    pure = False
 
     async def execute(
         self,
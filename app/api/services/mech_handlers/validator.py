@@ -8,14 +8,13 @@ that have side effects (like spawning a POW).
 import logging
 from typing import Any, Dict, List
 
-from jsonpath_ng import parse as jsonpath_parse
-from jsonpath_ng.exceptions import JsonPathParserError
-
 from app.api.services.mech_handlers.base import (
     MechHandler,
     MechResult,
     ExecutionContext,
+    TransformError,
 )
+from app.api.services.mech_handlers.jsonpath_cache import compile_jsonpath
 from app.api.services.mech_handlers.registry import register_handler
 
 logger = logging.getLogger(__name__)
@@ -92,11 +91,10 @@ def validate_field(
     # Extract value using JSONPath
     value = None
     try:
-        jsonpath_expr = jsonpath_parse(path)
-        matches = jsonpath_expr.find(data)
+        matches = compile_jsonpath(path).find(data)
         if matches:
-            value = matches[0].value
-    except JsonPathParserError:
+            value = matches[0]
+    except TransformError:
         return {"code": "invalid_path", "message": f"Invalid path: {path}"}
 
     if check == "required":
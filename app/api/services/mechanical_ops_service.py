@@ -8,10 +8,21 @@ Per ADR-047, this service provides access to Mechanical Operation types
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import yaml
 
+from app.api.services.mech_handlers.base import OperationConfigError, TransformError
+from app.api.services.mech_handlers.compiled import (
+    CompiledOperation,
+    CompiledPipeline,
+    compile_operation,
+    fuse_operations,
+)
+from app.api.services.mech_handlers.jsonpath_cache import (
+    CompiledPath,
+    compile_operation_paths,
+)
 from app.config.package_loader import (
     PackageLoader,
     PackageLoaderError,
@@ -53,6 +64,8 @@ class MechanicalOperation:
     description: str
     config: Dict[str, Any]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # JSONPath expressions in config, compiled and validated at load time
+    compiled_paths: Dict[str, CompiledPath] = field(default_factory=dict, repr=False)
 
 
 class MechanicalOpsService:
@@ -74,6 +87,12 @@ class MechanicalOpsService:
         self._types_cache: Optional[Dict[str, OperationType]] = None
         self._categories_cache: Optional[Dict[str, OperationCategory]] = None
 
+        # Compiled operations/pipelines, valid for one loader generation
+        self._compiled_generation: Optional[int] = None
+        self._active_versions_cache: Optional[Dict[str, str]] = None
+        self._compiled_cache: Dict[Tuple[str, str], CompiledOperation] = {}
+        self._pipeline_cache: Dict[Tuple[Tuple[str, ...], str], CompiledPipeline] = {}
+
     def _get_registry_path(self) -> Path:
         """Get the path to the operation type registry."""
         return self._loader.config_path / "mechanical_ops" / "_registry" / "types.yaml"
@@ -210,20 +229,7 @@ class MechanicalOpsService:
         if not ops_dir.exists():
             return []
 
-        active = self._loader.get_active_releases()
-        active_mech_ops = getattr(active, "mechanical_ops", {}) or {}
-
-        # Also check raw dict if attribute doesn't exist
-        if not active_mech_ops:
-            try:
-                import json
-                active_path = self._loader.config_path / "_active" / "active_releases.json"
-                if active_path.exists():
-                    with open(active_path, "r", encoding="utf-8") as f:
-                        active_data = json.load(f)
-                        active_mech_ops = active_data.get("mechanical_ops", {})
-            except Exception:
-                pass
+        active_mech_ops = self._read_active_versions()
 
         summaries = []
         for op_dir in sorted(ops_dir.iterdir()):
@@ -276,6 +282,25 @@ class MechanicalOpsService:
 
         return summaries
 
+    def _read_active_versions(self) -> Dict[str, str]:
+        """Read active mechanical op versions (op_id -> version)."""
+        active = self._loader.get_active_releases()
+        active_mech_ops = getattr(active, "mechanical_ops", {}) or {}
+
+        # Fallback to raw JSON if attribute doesn't exist
+        if not active_mech_ops:
+            try:
+                import json
+                active_path = self._loader.config_path / "_active" / "active_releases.json"
+                if active_path.exists():
+                    with open(active_path, "r", encoding="utf-8") as f:
+                        active_data = json.load(f)
+                        active_mech_ops = active_data.get("mechanical_ops", {})
+            except Exception:
+                pass
+
+        return active_mech_ops
+
     def _load_operation(self, op_id: str, version: str) -> MechanicalOperation:
         """
         Load an operation instance from disk.
@@ -289,6 +314,7 @@ class MechanicalOpsService:
 
         Raises:
             PackageNotFoundError: Operation not found
+            PackageLoaderError: Operation YAML or one of its JSONPaths is invalid
         """
         op_path = (
             self._loader.config_path / "mechanical_ops" / op_id /
@@ -304,14 +330,24 @@ class MechanicalOpsService:
         except yaml.YAMLError as e:
             raise PackageLoaderError(f"Failed to parse operation {op_id}: {e}")
 
+        config = data.get("config", {})
+
+        # Compile every JSONPath once so handlers hit the shared cache and
+        # malformed paths fail here rather than mid-workflow.
+        try:
+            compiled_paths = compile_operation_paths(config)
+        except TransformError as e:
+            raise PackageLoaderError(f"Invalid operation {op_id} v{version}: {e}")
+
         return MechanicalOperation(
             id=data.get("id", op_id),
             version=data.get("version", version),
             type=data.get("type", "unknown"),
             name=data.get("name", op_id),
             description=data.get("description", ""),
-            config=data.get("config", {}),
+            config=config,
             metadata=data.get("metadata", {}),
+            compiled_paths=compiled_paths,
         )
 
     def get_operation(
@@ -335,22 +371,7 @@ class MechanicalOpsService:
         self._ensure_types_loaded()
 
         if version is None:
-            active = self._loader.get_active_releases()
-            active_mech_ops = getattr(active, "mechanical_ops", {}) or {}
-
-            # Fallback to raw JSON
-            if not active_mech_ops:
-                try:
-                    import json
-                    active_path = self._loader.config_path / "_active" / "active_releases.json"
-                    if active_path.exists():
-                        with open(active_path, "r", encoding="utf-8") as f:
-                            active_data = json.load(f)
-                            active_mech_ops = active_data.get("mechanical_ops", {})
-                except Exception:
-                    pass
-
-            version = active_mech_ops.get(op_id)
+            version = self._read_active_versions().get(op_id)
             if not version:
                 raise PackageNotFoundError(f"No active version for operation: {op_id}")
 
@@ -372,6 +393,123 @@ class MechanicalOpsService:
             "metadata": op.metadata,
         }
 
+    # =========================================================================
+    # Compiled Operations (execution path)
+    # =========================================================================
+
+    def _check_compiled_generation(self) -> None:
+        """Drop compiled objects if the loader reloaded config since they were built."""
+        generation = getattr(self._loader, "generation", 0)
+        if generation != self._compiled_generation:
+            self._active_versions_cache = None
+            self._compiled_cache.clear()
+            self._pipeline_cache.clear()
+            self._compiled_generation = generation
+
+    def get_compiled_operation(
+        self,
+        op_id: str,
+        version: Optional[str] = None,
+    ) -> CompiledOperation:
+        """
+        Get an operation compiled for execution.
+
+        The operation is loaded, validated and compiled once, then served
+        from cache until config is reloaded (see invalidate_cache).
+
+        Args:
+            op_id: Operation identifier
+            version: Specific version or None for active version
+
+        Returns:
+            CompiledOperation
+
+        Raises:
+            PackageNotFoundError: Operation not found
+            PackageLoaderError: Operation definition fails validation
+        """
+        self._check_compiled_generation()
+
+        if version is None:
+            if self._active_versions_cache is None:
+                self._active_versions_cache = dict(self._read_active_versions())
+            version = self._active_versions_cache.get(op_id)
+            if not version:
+                raise PackageNotFoundError(f"No active version for operation: {op_id}")
+
+        key = (op_id, version)
+        compiled = self._compiled_cache.get(key)
+        if compiled is None:
+            op = self._load_operation(op_id, version)
+            try:
+                compiled = compile_operation({
+                    "id": op.id,
+                    "version": op.version,
+                    "type": op.type,
+                    "config": op.config,
+                })
+            except OperationConfigError as e:
+                raise PackageLoaderError(f"Invalid operation {op_id} v{version}: {e}")
+            self._compiled_cache[key] = compiled
+
+        return compiled
+
+    def get_compiled_pipeline(
+        self,
+        op_ids: Sequence[str],
+        carry: str,
+    ) -> CompiledPipeline:
+        """
+        Get active operations fused into a single pipeline.
+
+        Args:
+            op_ids: Operation identifiers, in execution order (all pure)
+            carry: Input name each stage's output replaces for the next
+
+        Returns:
+            CompiledPipeline
+
+        Raises:
+            PackageNotFoundError: An operation was not found
+            PackageLoaderError: An operation is invalid or not pure
+        """
+        self._check_compiled_generation()
+
+        key = (tuple(op_ids), carry)
+        pipeline = self._pipeline_cache.get(key)
+        if pipeline is None:
+            operations = [self.get_compiled_operation(op_id) for op_id in op_ids]
+            try:
+                pipeline = fuse_operations(operations, carry=carry)
+            except OperationConfigError as e:
+                raise PackageLoaderError(str(e))
+            self._pipeline_cache[key] = pipeline
+
+        return pipeline
+
+    def compile_active_operations(self) -> int:
+        """
+        Compile every active operation ahead of first use (startup warm-up).
+
+        Operations that fail to load are logged and skipped; they raise
+        again, with full detail, when an executor asks for them.
+
+        Returns:
+            Number of operations compiled
+        """
+        self._check_compiled_generation()
+        if self._active_versions_cache is None:
+            self._active_versions_cache = dict(self._read_active_versions())
+
+        compiled = 0
+        for op_id in self._active_versions_cache:
+            try:
+                self.get_compiled_operation(op_id)
+                compiled += 1
+            except PackageLoaderError as e:
+                logger.warning(f"Could not compile operation {op_id}: {e}")
+        return compiled
+
     # =========================================================================
     # Cache Management
     # =========================================================================
@@ -380,6 +518,7 @@ class MechanicalOpsService:
         """Invalidate cached data."""
         self._types_cache = None
         self._categories_cache = None
+        self._compiled_generation = None
 
 
 # Module-level singleton
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.api.models.document import Document
 from app.api.models.document_type import DocumentType
@@ -300,7 +301,7 @@ async def get_production_tracks(db: AsyncSession, project_id: str) -> List[Dict[
             continue
 
         child_result = await db.execute(
-            select(Document).where(
+            select(Document).options(undefer(Document.content)).where(
                 Document.parent_document_id == parent_doc.id,
                 Document.doc_type_id == child_doc_type,
                 Document.is_latest == True,
@@ -4,6 +4,7 @@ Project service for web UI - Document-centric version.
 
 from sqlalchemy import select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 from typing import Optional, List, Dict, Any
 
 # Import existing models
@@ -238,6 +239,7 @@ class ProjectService:
         # Look for architecture_spec document first, then project_discovery
         arch_query = (
             select(Document)
+            .options(undefer(Document.content))
             .where(Document.space_type == 'project')
             .where(Document.space_id == project.id)
             .where(Document.doc_type_id == 'architecture_spec')
@@ -250,6 +252,7 @@ class ProjectService:
         if not architecture:
             discovery_query = (
                 select(Document)
+                .options(undefer(Document.content))
                 .where(Document.space_type == 'project')
                 .where(Document.space_id == project.id)
                 .where(Document.doc_type_id == 'project_discovery')
@@ -9,6 +9,7 @@ from typing import Any, Dict, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.api.models.workflow_execution import WorkflowExecution
 
@@ -31,7 +32,12 @@ async def get_qa_coverage(
     """
     # Get workflow execution
     result = await db.execute(
-        select(WorkflowExecution).where(WorkflowExecution.execution_id == execution_id)
+        select(WorkflowExecution)
+        .options(
+            undefer(WorkflowExecution.context_state),
+            undefer(WorkflowExecution.execution_log),
+        )
+        .where(WorkflowExecution.execution_id == execution_id)
     )
     execution = result.scalar_one_or_none()
 
@@ -0,0 +1,491 @@
+"""
+Append-only release index for combine-config.
+
+ReleaseService used to derive release facts by walking git on every
+request: a `git log` of active_releases.json plus a `git show` per commit
+for the history, and a `git log` per version for its commit info. The
+release index records those facts once, as JSON lines in the repository's
+git directory (so it is never committed):
+
+- committed: a commit touched document_types/{id}/releases/{version};
+  content_hash is the git tree id of that release directory
+- activated / rolled_back / deactivated: a commit changed a document
+  type's entry in _active/active_releases.json; content_hash is the tree
+  id of the version that became active
+- head: the last commit indexed
+
+Lookups are dict and list operations over indexes built as lines are read.
+refresh() keeps the index current: GitService.commit calls it, and queries
+call it too, so commits made outside the app (git CLI, pull) are picked up.
+It costs one stat of .git/logs/HEAD while HEAD has not moved; otherwise it
+scans only the commits since the last indexed head with a fixed number of
+git calls (log, cat-file), or rebuilds if history was rewritten. Processes
+sharing the checkout coordinate through a lock file (POSIX only) and pick
+up each other's appended lines.
+
+Rebuild from scratch with: python ops/scripts/rebuild_release_index.py
+
+Usage:
+    index = get_git_service().release_index
+    index.history("project_discovery", limit=20)     # newest first
+    index.version_commit("project_discovery", "1.4.0")
+    index.rollback_targets("project_discovery")
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking is per process only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_RELEASES_PATH = "_active/active_releases.json"
+
+# Index location inside the git directory
+INDEX_FILE = Path("combine") / "release_index.jsonl"
+
+# Events that make a version the active one
+ACTIVATION_EVENTS = ("activated", "rolled_back")
+
+_RELEASE_PATH_RE = re.compile(r"^document_types/([^/]+)/releases/([^/]+)/")
+_LOG_FORMAT = "%x00%H|%h|%an|%aI|%s"
+
+
+@dataclass(frozen=True)
+class ReleaseIndexEntry:
+    """One release fact."""
+    event: str  # committed, activated, rolled_back, deactivated
+    doc_type_id: str
+    version: str
+    commit_hash: str
+    commit_date: datetime
+    author: str = ""
+    message: str = ""
+    previous_version: Optional[str] = None
+    content_hash: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["commit_date"] = self.commit_date.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ReleaseIndexEntry":
+        return cls(
+            event=data["event"],
+            doc_type_id=data["doc_type_id"],
+            version=data["version"],
+            commit_hash=data["commit_hash"],
+            commit_date=datetime.fromisoformat(data["commit_date"]),
+            author=data.get("author", ""),
+            message=data.get("message", ""),
+            previous_version=data.get("previous_version"),
+            content_hash=data.get("content_hash"),
+        )
+
+
+def _resolve_git_dir(repo_path: Path) -> Path:
+    """The repository's git directory (.git, or where a .git file points)."""
+    dot_git = repo_path / ".git"
+    if dot_git.is_file():
+        content = dot_git.read_text(encoding="utf-8").strip()
+        if content.startswith("gitdir:"):
+            return (repo_path / content[len("gitdir:"):].strip()).resolve()
+    return dot_git
+
+
+def _parse_batch(output: bytes) -> List[Optional[bytes]]:
+    """Contents from `git cat-file --batch` output (None for missing objects)."""
+    contents: List[Optional[bytes]] = []
+    pos = 0
+    while pos < len(output):
+        end = output.index(b"\n", pos)
+        header = output[pos:end].split()
+        pos = end + 1
+        if header[-1] == b"missing":
+            contents.append(None)
+            continue
+        size = int(header[2])
+        contents.append(output[pos:pos + size])
+        pos += size + 1
+    return contents
+
+
+class ReleaseIndex:
+    """Release history and per-version facts for one repository."""
+
+    def __init__(self, git_service, path: Optional[Path] = None):
+        """
+        Args:
+            git_service: GitService for the repository
+            path: Index file (default: <git dir>/combine/release_index.jsonl)
+        """
+        self._git = git_service
+        git_dir = _resolve_git_dir(git_service.repo_path)
+        self.path = Path(path) if path else git_dir / INDEX_FILE
+        self._reflog = git_dir / "logs" / "HEAD"
+        self._lock = threading.RLock()
+        self._head: Optional[str] = None
+        self._active: Dict[str, str] = {}
+        self._events: List[ReleaseIndexEntry] = []
+        self._events_by_doc_type: Dict[str, List[ReleaseIndexEntry]] = {}
+        self._versions: Dict[Tuple[str, str], ReleaseIndexEntry] = {}
+        self._released: Set[Tuple[str, str]] = set()
+        # doc_type_id -> versions in order of last activation (dict as ordered set)
+        self._activation_order: Dict[str, Dict[str, None]] = {}
+        # How much of which file has been read
+        self._file_id: Optional[int] = None
+        self._offset = 0
+        # Reflog size at the last refresh (-1: never refreshed)
+        self._reflog_size: Optional[int] = -1
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def history(
+        self,
+        doc_type_id: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[ReleaseIndexEntry]:
+        """Activation events, newest first."""
+        self.refresh()
+        if doc_type_id is None:
+            events = self._events
+        else:
+            events = self._events_by_doc_type.get(doc_type_id, [])
+        return events[-limit:][::-1] if limit > 0 else []
+
+    def version_commit(self, doc_type_id: str, version: str) -> Optional[ReleaseIndexEntry]:
+        """The latest commit touching a release directory, or None."""
+        self.refresh()
+        return self._versions.get((doc_type_id, version))
+
+    def active_version(self, doc_type_id: str) -> Optional[str]:
+        """Active version as of the last indexed commit."""
+        self.refresh()
+        return self._active.get(doc_type_id)
+
+    def was_released(self, doc_type_id: str, version: str) -> bool:
+        """Whether a version has ever been the active one."""
+        self.refresh()
+        return (doc_type_id, version) in self._released
+
+    def rollback_targets(self, doc_type_id: str) -> List[str]:
+        """Previously active versions, most recently active first."""
+        self.refresh()
+        current = self._active.get(doc_type_id)
+        order = self._activation_order.get(doc_type_id, {})
+        return [version for version in reversed(order) if version != current]
+
+    @property
+    def head(self) -> Optional[str]:
+        """The last indexed commit."""
+        return self._head
+
+    def __len__(self) -> int:
+        return len(self._events) + len(self._versions)
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def refresh(self) -> int:
+        """
+        Index commits made since the last refresh.
+
+        Returns:
+            Number of entries added (from git or from other processes)
+        """
+        with self._lock:
+            reflog_size = self._reflog_size_now()
+            if reflog_size is not None and reflog_size == self._reflog_size:
+                return 0
+            with self._file_lock():
+                added = self._read_new_lines()
+                head = self._rev_parse_head()
+                if head != self._head:
+                    if self._head and self._is_ancestor(self._head, head):
+                        added += self._append(
+                            self._scan(f"{self._head}..{head}", dict(self._active)), head
+                        )
+                    else:
+                        added += self._rewrite(head)
+            self._reflog_size = reflog_size
+            return added
+
+    def rebuild(self) -> int:
+        """
+        Rebuild the index from the full git history.
+
+        Returns:
+            Number of entries written
+        """
+        with self._lock:
+            with self._file_lock():
+                written = self._rewrite(self._rev_parse_head())
+            self._reflog_size = self._reflog_size_now()
+            return written
+
+    # =========================================================================
+    # Internals: index file
+    # =========================================================================
+
+    def _clear(self) -> None:
+        self._head = None
+        self._active = {}
+        self._events = []
+        self._events_by_doc_type = {}
+        self._versions = {}
+        self._released = set()
+        self._activation_order = {}
+        self._file_id = None
+        self._offset = 0
+        self._reflog_size = -1
+
+    def _apply(self, data: Dict[str, Any]) -> None:
+        event = data.get("event")
+        if event == "head":
+            self._head = data["commit_hash"]
+            return
+        entry = ReleaseIndexEntry.from_dict(data)
+        key = (entry.doc_type_id, entry.version)
+        if event == "committed":
+            self._versions[key] = entry
+            return
+        self._events.append(entry)
+        self._events_by_doc_type.setdefault(entry.doc_type_id, []).append(entry)
+        if event == "deactivated":
+            self._active.pop(entry.doc_type_id, None)
+        elif event in ACTIVATION_EVENTS:
+            self._active[entry.doc_type_id] = entry.version
+            self._released.add(key)
+            order = self._activation_order.setdefault(entry.doc_type_id, {})
+            order.pop(entry.version, None)
+            order[entry.version] = None
+
+    def _read_new_lines(self) -> int:
+        """Apply lines appended since the last read (by any process)."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            if self._file_id is not None:
+                self._clear()
+            return 0
+        if st.st_ino != self._file_id or st.st_size < self._offset:
+            # Rewritten by a rebuild: start over
+            self._clear()
+            self._file_id = st.st_ino
+        if st.st_size == self._offset:
+            return 0
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        complete = data.rfind(b"\n") + 1
+        applied = 0
+        for line in data[:complete].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._apply(json.loads(line))
+                applied += 1
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping malformed release index line: {e}")
+        self._offset += complete
+        return applied
+
+    def _append(self, entries: List[ReleaseIndexEntry], head: str) -> int:
+        records = [entry.to_dict() for entry in entries]
+        records.append({"event": "head", "commit_hash": head})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+        for record in records:
+            self._apply(record)
+        st = os.stat(self.path)
+        self._file_id = st.st_ino
+        self._offset = st.st_size
+        return len(entries)
+
+    def _rewrite(self, head: str) -> int:
+        entries = self._scan(head, {})
+        records = [entry.to_dict() for entry in entries]
+        records.append({"event": "head", "commit_hash": head})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+        os.replace(tmp, self.path)
+
+        self._clear()
+        for record in records:
+            self._apply(record)
+        st = os.stat(self.path)
+        self._file_id = st.st_ino
+        self._offset = st.st_size
+        logger.info(f"Release index rebuilt at {head[:7]}: {len(entries)} entries")
+        return len(entries)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_name(self.path.name + ".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _reflog_size_now(self) -> Optional[int]:
+        """Size of the HEAD reflog (None if reflogs are off: always ask git)."""
+        try:
+            return os.stat(self._reflog).st_size
+        except FileNotFoundError:
+            return None
+
+    # =========================================================================
+    # Internals: git
+    # =========================================================================
+
+    def _rev_parse_head(self) -> str:
+        return self._git._run_git("rev-parse", "HEAD").stdout.strip()
+
+    def _is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        result = self._git._run_git(
+            "merge-base", "--is-ancestor", ancestor, descendant, check=False
+        )
+        return result.returncode == 0
+
+    def _scan(self, rev_range: str, active: Dict[str, str]) -> List[ReleaseIndexEntry]:
+        """
+        Release entries for the commits in rev_range, oldest first.
+
+        Args:
+            rev_range: Commits to scan (e.g. "HEAD" or "<old>..<new>")
+            active: Active versions before the first commit (updated in place)
+        """
+        prefix = self._git.config_prefix
+        result = self._git._run_git(
+            "log", "--reverse", f"--format={_LOG_FORMAT}", "--name-only", rev_range,
+            "--", f"{prefix}/document_types", f"{prefix}/{ACTIVE_RELEASES_PATH}",
+        )
+
+        commits = []
+        for record in result.stdout.split("\x00")[1:]:
+            lines = record.split("\n")
+            parts = lines[0].split("|", 4)
+            if len(parts) < 5:
+                continue
+            paths = [self._git._strip_prefix(line) for line in lines[1:] if line]
+            releases = sorted({
+                match.groups() for match in map(_RELEASE_PATH_RE.match, paths) if match
+            })
+            commits.append((parts, releases, ACTIVE_RELEASES_PATH in paths))
+
+        # active_releases.json at every commit that changed it, in one call
+        active_specs = [
+            f"{parts[0]}:{prefix}/{ACTIVE_RELEASES_PATH}"
+            for parts, _, changes_active in commits if changes_active
+        ]
+        contents = iter(self._cat_file(active_specs))
+
+        # (commit parts, event, doc_type_id, version, previous_version)
+        facts = []
+        for parts, releases, changes_active in commits:
+            for doc_type_id, version in releases:
+                facts.append((parts, "committed", doc_type_id, version, None))
+            if changes_active:
+                facts.extend(
+                    (parts, event, doc_type_id, version, previous)
+                    for event, doc_type_id, version, previous
+                    in self._diff_active(next(contents), active, parts[4])
+                )
+
+        # Tree ids of every release directory involved, in one call
+        tree_specs = [
+            f"{parts[0]}:{prefix}/document_types/{doc_type_id}/releases/{version}"
+            for parts, _, doc_type_id, version, _ in facts
+        ]
+        trees = self._tree_ids(tree_specs)
+
+        return [
+            ReleaseIndexEntry(
+                event=event,
+                doc_type_id=doc_type_id,
+                version=version,
+                commit_hash=parts[0],
+                commit_date=datetime.fromisoformat(parts[3]),
+                author=parts[2],
+                message=parts[4],
+                previous_version=previous,
+                content_hash=tree,
+            )
+            for (parts, event, doc_type_id, version, previous), tree in zip(facts, trees)
+        ]
+
+    @staticmethod
+    def _diff_active(
+        content: Optional[bytes],
+        active: Dict[str, str],
+        message: str,
+    ) -> List[Tuple[str, str, str, Optional[str]]]:
+        """Activation events between active and one active_releases.json."""
+        if not content:
+            return []
+        try:
+            current = json.loads(content).get("document_types", {})
+        except (ValueError, AttributeError):
+            return []
+
+        events = []
+        for doc_type_id, version in current.items():
+            previous = active.get(doc_type_id)
+            if previous != version:
+                if previous is not None and "rollback" in message.lower():
+                    event = "rolled_back"
+                else:
+                    event = "activated"
+                events.append((event, doc_type_id, version, previous))
+        for doc_type_id, version in active.items():
+            if doc_type_id not in current:
+                events.append(("deactivated", doc_type_id, version, version))
+
+        active.clear()
+        active.update(current)
+        return events
+
+    def _cat_file(self, specs: List[str]) -> List[Optional[bytes]]:
+        if not specs:
+            return []
+        result = self._git._run_git(
+            "cat-file", "--batch", input="".join(f"{spec}\n" for spec in specs).encode(),
+            text=False,
+        )
+        return _parse_batch(result.stdout)
+
+    def _tree_ids(self, specs: List[str]) -> List[Optional[str]]:
+        if not specs:
+            return []
+        result = self._git._run_git(
+            "cat-file", "--batch-check", input="".join(f"{spec}\n" for spec in specs),
+        )
+        ids = []
+        for line in result.stdout.splitlines():
+            fields = line.split()
+            ids.append(fields[0] if fields[-1] != "missing" else None)
+        return ids
@@ -6,9 +6,11 @@ Per ADR-044 WS-044-07, this service handles:
 - Instantaneous rollback via pointer change
 - Audit trail for release changes
 - Immutability enforcement for released versions
+
+History, version commits and immutability are answered from the release
+index (release_index.py) rather than by walking git per request.
 """
 
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -19,6 +21,7 @@ from app.api.services.git_service import (
     GitService,
     get_git_service,
 )
+from app.api.services.release_index import ReleaseIndex
 from app.api.services.config_validator import (
     ConfigValidator,
     ValidationReport,
@@ -111,10 +114,12 @@ class ReleaseService:
         git_service: Optional[GitService] = None,
         validator: Optional[ConfigValidator] = None,
         loader: Optional[PackageLoader] = None,
+        index: Optional[ReleaseIndex] = None,
     ):
         self._git = git_service or get_git_service()
         self._validator = validator or get_config_validator()
         self._loader = loader or get_package_loader()
+        self._index = index or self._git.release_index
 
     # =========================================================================
     # Release Information
@@ -339,89 +344,41 @@ class ReleaseService:
         """
         Get release history (audit trail).
 
-        Parses Git commit history for active_releases.json to build
-        an audit trail of all release changes.
+        Activation, rollback and deactivation events recorded in the
+        release index from the commits to active_releases.json.
 
         Args:
             doc_type_id: Filter by document type (optional)
             limit: Maximum entries to return
 
         Returns:
-            List of ReleaseHistoryEntry sorted by date (newest first)
+            List of ReleaseHistoryEntry, newest first
         """
-        # Get commit history for active_releases.json
-        commits = self._git.get_commit_history(
-            path="_active/active_releases.json",
-            limit=limit * 2,  # Get extra in case of filtering
-        )
+        return [
+            ReleaseHistoryEntry(
+                doc_type_id=entry.doc_type_id,
+                action=entry.event,
+                version=entry.version,
+                previous_version=entry.previous_version,
+                commit_hash=entry.commit_hash,
+                commit_date=entry.commit_date,
+                author=entry.author,
+                message=entry.message,
+            )
+            for entry in self._index.history(doc_type_id=doc_type_id, limit=limit)
+        ]
 
-        history = []
-        previous_active: Dict[str, str] = {}
+    def get_rollback_targets(self, doc_type_id: str) -> List[str]:
+        """
+        Versions that were previously active, most recently active first.
 
-        # Process commits in reverse chronological order
-        for commit in reversed(commits):
-            # Get active_releases.json content at this commit
-            content = self._git.get_file_content(
-                "_active/active_releases.json",
-                ref=commit.commit_hash,
-            )
-            if not content:
-                continue
-
-            try:
-                data = json.loads(content)
-                current_active = data.get("document_types", {})
-            except json.JSONDecodeError:
-                continue
-
-            # Find changes from previous state
-            for dt_id, version in current_active.items():
-                if doc_type_id and dt_id != doc_type_id:
-                    continue
-
-                prev_version = previous_active.get(dt_id)
-
-                if prev_version != version:
-                    # Determine action type
-                    if prev_version is None:
-                        action = "activated"
-                    elif "rollback" in commit.message.lower():
-                        action = "rolled_back"
-                    else:
-                        action = "activated"
-
-                    history.append(ReleaseHistoryEntry(
-                        doc_type_id=dt_id,
-                        action=action,
-                        version=version,
-                        previous_version=prev_version,
-                        commit_hash=commit.commit_hash,
-                        commit_date=commit.date,
-                        author=commit.author,
-                        message=commit.message,
-                    ))
-
-            # Check for deactivations
-            for dt_id, version in previous_active.items():
-                if doc_type_id and dt_id != doc_type_id:
-                    continue
-                if dt_id not in current_active:
-                    history.append(ReleaseHistoryEntry(
-                        doc_type_id=dt_id,
-                        action="deactivated",
-                        version=version,
-                        previous_version=version,
-                        commit_hash=commit.commit_hash,
-                        commit_date=commit.date,
-                        author=commit.author,
-                        message=commit.message,
-                    ))
-
-            previous_active = current_active
-
-        # Sort by date (newest first) and limit
-        history.sort(key=lambda e: e.commit_date, reverse=True)
-        return history[:limit]
+        Args:
+            doc_type_id: Document type identifier
+
+        Returns:
+            Version strings (excluding the active version)
+        """
+        return self._index.rollback_targets(doc_type_id)
 
     # =========================================================================
     # Immutability Enforcement
@@ -437,7 +394,8 @@ class ReleaseService:
 
         Per ADR-044: Released artifacts are immutable (no edits to released versions).
 
-        A version is immutable if it is currently active.
+        A version is immutable if it is currently active or has been
+        active at any point (a rollback target must stay as released).
 
         Args:
             doc_type_id: Document type identifier
@@ -447,7 +405,9 @@ class ReleaseService:
             True if version is immutable, False if editable
         """
         active = self._loader.get_active_releases()
-        return active.document_types.get(doc_type_id) == version
+        if active.document_types.get(doc_type_id) == version:
+            return True
+        return self._index.was_released(doc_type_id, version)
 
     def enforce_immutability(
         self,
@@ -481,20 +441,17 @@ class ReleaseService:
         doc_type_id: str,
         version: str,
     ) -> Optional[Dict[str, Any]]:
-        """Get commit info for a specific version."""
-        # Get commits affecting this package
-        path = f"document_types/{doc_type_id}/releases/{version}"
-        commits = self._git.get_commit_history(path=path, limit=1)
-
-        if commits:
-            commit = commits[0]
-            return {
-                "commit_hash": commit.commit_hash,
-                "commit_date": commit.date,
-                "author": commit.author,
-                "message": commit.message,
-            }
-        return None
+        """Get commit info for a specific version (latest commit to its package)."""
+        entry = self._index.version_commit(doc_type_id, version)
+        if entry is None:
+            return None
+        return {
+            "commit_hash": entry.commit_hash,
+            "commit_date": entry.commit_date,
+            "author": entry.author,
+            "message": entry.message,
+            "content_hash": entry.content_hash,
+        }
 
 
 # Module-level singleton
@@ -14,6 +14,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.models.schema_artifact import SchemaArtifact
 
 
+def _invalidate_render_plans() -> None:
+    """Drop cached render plans: their bundle hash follows the latest accepted schemas."""
+    # Local import: the render model builder imports this module
+    from app.domain.services.render_model_builder import invalidate_render_plans
+    invalidate_render_plans()
+
+
 class SchemaNotFoundError(Exception):
     """Raised when a schema artifact is not found."""
     pass
@@ -85,6 +92,7 @@ class SchemaRegistryService:
         self.db.add(artifact)
         await self.db.commit()
         await self.db.refresh(artifact)
+        _invalidate_render_plans()
         
         return artifact
     
@@ -200,6 +208,7 @@ class SchemaRegistryService:
         artifact.status = new_status
         await self.db.commit()
         await self.db.refresh(artifact)
+        _invalidate_render_plans()
         
         return artifact
     
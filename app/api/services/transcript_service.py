@@ -2,14 +2,20 @@
 
 Provides LLM conversation transcript data for workflow executions.
 Used by both the API and web routes.
+
+A transcript page is loaded in a fixed number of queries regardless of how
+many runs or refs it has: runs, then input refs, output refs and content
+for the page's runs with IN lists. Content bodies larger than the inline
+limit are returned as a prefix plus a content_id; the rest can be fetched
+in ranges with get_transcript_content().
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select
+from sqlalchemy import exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.models.project import Project
@@ -25,17 +31,19 @@ logger = logging.getLogger(__name__)
 # Default display timezone
 DISPLAY_TZ = ZoneInfo("America/New_York")
 
+CONTENT_REF_PREFIX = "db://llm_content/"
+
+# Runs per batch when streaming a transcript
+STREAM_BATCH_SIZE = 10
 
-async def _resolve_content_ref(db: AsyncSession, content_ref: str) -> Optional[str]:
-    """Resolve a content_ref like 'db://llm_content/{uuid}' to actual content."""
-    if not content_ref or not content_ref.startswith("db://llm_content/"):
+
+def _parse_content_ref(content_ref: Optional[str]) -> Optional[UUID]:
+    """Extract the llm_content id from a 'db://llm_content/{uuid}' ref."""
+    if not content_ref or not content_ref.startswith(CONTENT_REF_PREFIX):
         return None
     try:
-        content_id = UUID(content_ref.replace("db://llm_content/", ""))
-        result = await db.execute(select(LLMContent).where(LLMContent.id == content_id))
-        content = result.scalar_one_or_none()
-        return content.content_text if content else None
-    except Exception:
+        return UUID(content_ref[len(CONTENT_REF_PREFIX):])
+    except ValueError:
         return None
 
 
@@ -43,88 +51,121 @@ async def _get_project_name(db: AsyncSession, project_id: Optional[UUID]) -> Opt
     """Get project name from ID."""
     if not project_id:
         return None
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-    return project.name if project else None
+    result = await db.execute(select(Project.name).where(Project.id == project_id))
+    return result.scalar_one_or_none()
 
 
-async def _get_llm_run_inputs(db: AsyncSession, run_id: UUID) -> List[Dict[str, Any]]:
-    """Get LLM run inputs with resolved content."""
-    result = await db.execute(
-        select(LLMRunInputRef).where(LLMRunInputRef.llm_run_id == run_id)
-    )
-    inputs = []
-    for ref in result.scalars().all():
-        content = await _resolve_content_ref(db, ref.content_ref)
-        inputs.append({
-            "kind": ref.kind,
-            "content": content,
-            "size": len(content.encode("utf-8")) if content else 0,
-            "redacted": ref.content_redacted,
-        })
-    return inputs
-
-
-async def _get_llm_run_outputs(db: AsyncSession, run_id: UUID) -> List[Dict[str, Any]]:
-    """Get LLM run outputs with resolved content."""
+async def _load_refs(
+    db: AsyncSession,
+    ref_model,
+    run_ids: List[UUID],
+) -> Dict[UUID, list]:
+    """Load input or output refs for many runs in one query, grouped by run."""
+    grouped: Dict[UUID, list] = {run_id: [] for run_id in run_ids}
+    if not run_ids:
+        return grouped
     result = await db.execute(
-        select(LLMRunOutputRef).where(LLMRunOutputRef.llm_run_id == run_id)
+        select(ref_model)
+        .where(ref_model.llm_run_id.in_(run_ids))
+        .order_by(ref_model.llm_run_id, ref_model.created_at)
     )
-    outputs = []
     for ref in result.scalars().all():
-        content = await _resolve_content_ref(db, ref.content_ref)
-        outputs.append({
-            "kind": ref.kind,
-            "content": content,
-            "size": len(content.encode("utf-8")) if content else 0,
-            "parse_status": ref.parse_status,
-            "validation_status": ref.validation_status,
-        })
-    return outputs
+        grouped[ref.llm_run_id].append(ref)
+    return grouped
 
 
-async def get_execution_transcript(
+async def _load_contents(
     db: AsyncSession,
-    execution_id: str,
-) -> Optional[Dict[str, Any]]:
-    """Get transcript data for a workflow execution.
+    content_ids: Iterable[UUID],
+    max_inline_chars: Optional[int] = None,
+) -> Dict[UUID, Tuple[str, int, bool]]:
+    """Load content bodies in one query.
 
-    Args:
-        db: Database session
-        execution_id: Workflow execution ID
+    Bodies longer than max_inline_chars are cut to that prefix in SQL, so
+    large blobs never leave the database whole.
 
     Returns:
-        Dict with execution info and transcript entries.
-        Returns None if no LLM runs found.
+        Dict of content id -> (text, size in bytes, truncated)
     """
-    # Get all LLM runs for this workflow execution
+    ids = list(set(content_ids))
+    if not ids:
+        return {}
+
+    text_column = LLMContent.content_text
+    if max_inline_chars is not None:
+        text_column = func.substr(LLMContent.content_text, 1, max_inline_chars)
+
     result = await db.execute(
-        select(LLMRun)
-        .where(LLMRun.workflow_execution_id == execution_id)
-        .order_by(LLMRun.started_at)
+        select(
+            LLMContent.id,
+            text_column.label("text"),
+            LLMContent.content_size,
+            func.length(LLMContent.content_text).label("length"),
+        ).where(LLMContent.id.in_(ids))
     )
-    runs = list(result.scalars().all())
 
-    if not runs:
-        return None
+    contents = {}
+    for row in result.all():
+        truncated = max_inline_chars is not None and row.length > max_inline_chars
+        size = row.content_size if truncated else len(row.text.encode("utf-8"))
+        contents[row.id] = (row.text, size, truncated)
+    return contents
 
-    # Get project name from first run
-    first_run = runs[0]
-    project_name = await _get_project_name(db, first_run.project_id)
 
-    from app.api.services.service_pure import (
-        build_transcript_entry,
-        compute_transcript_totals,
-        format_transcript_timestamps,
-    )
+def _ref_content(
+    ref,
+    contents: Dict[UUID, Tuple[str, int, bool]],
+) -> Dict[str, Any]:
+    """Content fields for one input or output ref."""
+    content_id = _parse_content_ref(ref.content_ref)
+    text, size, truncated = contents.get(content_id, (None, 0, False))
+    fields: Dict[str, Any] = {
+        "kind": ref.kind,
+        "content": text,
+        "size": size if text else 0,
+    }
+    if truncated:
+        fields["truncated"] = True
+        fields["content_id"] = str(content_id)
+    return fields
 
-    # Build transcript entries
-    transcript_entries = []
 
-    for i, run in enumerate(runs, 1):
-        # Get inputs and outputs (I/O -- not extractable)
-        inputs = await _get_llm_run_inputs(db, run.id)
-        outputs = await _get_llm_run_outputs(db, run.id)
+async def _build_entries(
+    db: AsyncSession,
+    runs: List[LLMRun],
+    first_run_number: int,
+    max_inline_chars: Optional[int],
+) -> List[Dict[str, Any]]:
+    """Build transcript entries for a batch of runs in three queries."""
+    from app.api.services.service_pure import build_transcript_entry
+
+    run_ids = [run.id for run in runs]
+    input_refs = await _load_refs(db, LLMRunInputRef, run_ids)
+    output_refs = await _load_refs(db, LLMRunOutputRef, run_ids)
+
+    content_ids = [
+        _parse_content_ref(ref.content_ref)
+        for refs in (*input_refs.values(), *output_refs.values())
+        for ref in refs
+    ]
+    contents = await _load_contents(
+        db, (cid for cid in content_ids if cid is not None), max_inline_chars
+    )
+
+    entries = []
+    for i, run in enumerate(runs, first_run_number):
+        inputs = [
+            {**_ref_content(ref, contents), "redacted": ref.content_redacted}
+            for ref in input_refs[run.id]
+        ]
+        outputs = [
+            {
+                **_ref_content(ref, contents),
+                "parse_status": ref.parse_status,
+                "validation_status": ref.validation_status,
+            }
+            for ref in output_refs[run.id]
+        ]
 
         # Extract node_id and prompt_sources from metadata if available
         node_id = None
@@ -133,7 +174,7 @@ async def get_execution_transcript(
             node_id = run.run_metadata.get("node_id")
             prompt_sources = run.run_metadata.get("prompt_sources")
 
-        entry = build_transcript_entry(
+        entries.append(build_transcript_entry(
             run_number=i,
             run_id=str(run.id),
             role=run.role,
@@ -149,10 +190,37 @@ async def get_execution_transcript(
             inputs=inputs,
             outputs=outputs,
             display_tz=DISPLAY_TZ,
-        )
-        transcript_entries.append(entry)
+        ))
+    return entries
+
+
+async def _load_runs(db: AsyncSession, execution_id: str) -> List[LLMRun]:
+    result = await db.execute(
+        select(LLMRun)
+        .where(LLMRun.workflow_execution_id == execution_id)
+        .order_by(LLMRun.started_at)
+    )
+    return list(result.scalars().all())
+
+
+async def _transcript_header(
+    db: AsyncSession,
+    execution_id: str,
+    runs: List[LLMRun],
+) -> Dict[str, Any]:
+    """Execution-level transcript fields, covering every run."""
+    from app.api.services.service_pure import (
+        compute_transcript_totals,
+        format_transcript_timestamps,
+    )
+
+    first_run = runs[0]
+    project_name = await _get_project_name(db, first_run.project_id)
 
-    total_tokens, total_cost = compute_transcript_totals(transcript_entries)
+    total_tokens, total_cost = compute_transcript_totals([
+        {"tokens": run.total_tokens, "cost": float(run.cost_usd) if run.cost_usd else None}
+        for run in runs
+    ])
 
     timestamps = format_transcript_timestamps(
         started_at=runs[0].started_at,
@@ -165,9 +233,125 @@ async def get_execution_transcript(
         "project_id": str(first_run.project_id) if first_run.project_id else None,
         "project_name": project_name,
         "document_type": first_run.artifact_type,
-        "transcript": transcript_entries,
         "total_runs": len(runs),
         "total_tokens": total_tokens,
         "total_cost": total_cost,
         **timestamps,
     }
+
+
+async def get_execution_transcript(
+    db: AsyncSession,
+    execution_id: str,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    max_inline_chars: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """Get transcript data for a workflow execution.
+
+    Args:
+        db: Database session
+        execution_id: Workflow execution ID
+        offset: Number of runs to skip
+        limit: Maximum runs to include (None for all)
+        max_inline_chars: Truncate content bodies longer than this (None for full)
+
+    Returns:
+        Dict with execution info and transcript entries. Totals and
+        timestamps cover the whole execution, not just the page.
+        Returns None if no LLM runs found.
+    """
+    runs = await _load_runs(db, execution_id)
+
+    if not runs:
+        return None
+
+    page = runs[offset:offset + limit] if limit is not None else runs[offset:]
+    header = await _transcript_header(db, execution_id, runs)
+    entries = await _build_entries(db, page, offset + 1, max_inline_chars)
+
+    return {
+        **header,
+        "transcript": entries,
+        "offset": offset,
+        "limit": limit,
+        "has_more": offset + len(page) < len(runs),
+    }
+
+
+async def stream_execution_transcript(
+    db: AsyncSession,
+    execution_id: str,
+    batch_size: int = STREAM_BATCH_SIZE,
+    max_inline_chars: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Stream a transcript as a header followed by entries.
+
+    Yields {"type": "header", ...} first, then one {"type": "entry",
+    "entry": ...} per run, loading runs in batches of batch_size. Yields
+    nothing if no LLM runs are found.
+    """
+    runs = await _load_runs(db, execution_id)
+    if not runs:
+        return
+
+    yield {"type": "header", **await _transcript_header(db, execution_id, runs)}
+
+    for start in range(0, len(runs), batch_size):
+        batch = runs[start:start + batch_size]
+        for entry in await _build_entries(db, batch, start + 1, max_inline_chars):
+            yield {"type": "entry", "entry": entry}
+
+
+async def get_transcript_content(
+    db: AsyncSession,
+    execution_id: str,
+    content_id: UUID,
+    offset: int = 0,
+    length: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """Fetch a character range of a content body referenced by an execution.
+
+    Args:
+        db: Database session
+        execution_id: Workflow execution ID the content must belong to
+        content_id: llm_content id
+        offset: First character (0-based)
+        length: Number of characters (None for the rest)
+
+    Returns:
+        Dict with the range and total length, or None if the content is not
+        referenced by one of the execution's runs.
+    """
+    content_ref = f"{CONTENT_REF_PREFIX}{content_id}"
+    referenced = or_(*(
+        exists().where(
+            ref_model.content_ref == content_ref,
+            ref_model.llm_run_id == LLMRun.id,
+            LLMRun.workflow_execution_id == execution_id,
+        )
+        for ref_model in (LLMRunInputRef, LLMRunOutputRef)
+    ))
+
+    text_column = (
+        func.substr(LLMContent.content_text, offset + 1, length)
+        if length is not None
+        else func.substr(LLMContent.content_text, offset + 1)
+    )
+    result = await db.execute(
+        select(
+            text_column.label("text"),
+            func.length(LLMContent.content_text).label("length"),
+        ).where(LLMContent.id == content_id, referenced)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    return {
+        "content_id": str(content_id),
+        "offset": offset,
+        "length": len(row.text),
+        "total_length": row.length,
+        "content": row.text,
+    }
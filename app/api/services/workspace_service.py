@@ -5,13 +5,14 @@ Per ADR-044 WS-044-03, this service manages editing workspaces
 for configuration artifacts with Git-integrated workflow.
 """
 
+import hashlib
 import logging
 import re
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from threading import Lock
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.api.services.git_service import (
     GitService,
@@ -26,6 +27,8 @@ from app.config.package_loader import (
     get_package_loader,
     PackageNotFoundError,
 )
+from app.domain.workflow.incremental_plan_validator import IncrementalPlanValidator
+from app.domain.workflow.plan_validator import PlanValidationResult
 
 logger = logging.getLogger(__name__)
 
@@ -184,6 +187,13 @@ class WorkspaceService:
         # Index by user_id for quick lookup
         self._user_workspaces: Dict[str, str] = {}  # user_id -> workspace_id
         self._lock = Lock()
+        # Workflow definition path -> (content hash, validator holding the
+        # definition, last result). The workspace poll reuses the result while
+        # the file is unchanged; an edit re-checks only the changed nodes/edges.
+        self._plan_validations: Dict[
+            str, Tuple[str, IncrementalPlanValidator, PlanValidationResult]
+        ] = {}
+        self._plan_lock = Lock()
 
     # =========================================================================
     # Artifact ID Parsing
@@ -736,15 +746,13 @@ class WorkspaceService:
             if workflow_path.exists():
                 import json as _json
                 try:
-                    with open(workflow_path, "r", encoding="utf-8-sig") as f:
-                        raw = _json.load(f)
+                    content = workflow_path.read_bytes()
+                    raw = _json.loads(content.decode("utf-8-sig"))
 
                     # Only validate graph-based workflows (ADR-039) with PlanValidator.
                     # Step-based orchestration workflows (workflow.v1) get JSON validity only.
                     if "nodes" in raw and "edges" in raw:
-                        from app.domain.workflow.plan_validator import PlanValidator
-                        plan_validator = PlanValidator()
-                        result = plan_validator.validate(raw)
+                        result = self._validate_plan(str(workflow_path), content, raw)
 
                         if not result.valid:
                             for error in result.errors:
@@ -785,6 +793,20 @@ class WorkspaceService:
 
         return Tier1Report(passed=all_passed, results=results)
 
+    def _validate_plan(self, path: str, content: bytes, raw: Dict) -> PlanValidationResult:
+        """Validate a workflow definition, reusing the last result while the
+        file content is unchanged and syncing the held plan when it is not."""
+        digest = hashlib.sha256(content).hexdigest()
+        with self._plan_lock:
+            cached = self._plan_validations.get(path)
+            if cached is not None and cached[0] == digest:
+                return cached[2]
+
+            validator = cached[1] if cached is not None else IncrementalPlanValidator()
+            result = validator.sync(raw)
+            self._plan_validations[path] = (digest, validator, result)
+            return result
+
     # =========================================================================
     # Artifact Operations
     # =========================================================================
@@ -89,6 +89,13 @@ class RollbackRequest(BaseModel):
     )
 
 
+class RollbackTargetsResponse(BaseModel):
+    """Previously active versions available for rollback."""
+    doc_type_id: str
+    active_version: Optional[str] = None
+    versions: List[str]
+
+
 class RollbackResponse(BaseModel):
     """Rollback result response."""
     doc_type_id: str
@@ -237,6 +244,24 @@ async def get_release_history(
     )
 
 
+@router.get(
+    "/{doc_type_id}/rollback-targets",
+    response_model=RollbackTargetsResponse,
+    summary="List rollback targets",
+    description="List previously active versions, most recently active first.",
+)
+async def get_rollback_targets(
+    doc_type_id: str,
+    service: ReleaseService = Depends(get_release_service),
+) -> RollbackTargetsResponse:
+    """List versions a document type can be rolled back to."""
+    return RollbackTargetsResponse(
+        doc_type_id=doc_type_id,
+        active_version=service.get_active_version(doc_type_id),
+        versions=service.get_rollback_targets(doc_type_id),
+    )
+
+
 # ===========================================================================
 # Release Activation Endpoints
 # ===========================================================================
@@ -400,5 +425,5 @@ async def check_immutability(
         doc_type_id=doc_type_id,
         version=version,
         is_immutable=is_immutable,
-        reason="Version is currently active and released" if is_immutable else None,
+        reason="Version is or has been active and released" if is_immutable else None,
     )
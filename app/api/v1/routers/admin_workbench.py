@@ -348,12 +348,12 @@ class AssembledPromptResponse(BaseModel):
 @router.post(
     "/invalidate-cache",
     summary="Invalidate config cache",
-    description="Invalidate all cached configuration to pick up changes without restart.",
+    description="Reload cached configuration whose files changed, without restart.",
 )
 async def invalidate_cache(
     service: AdminWorkbenchService = Depends(get_admin_workbench_service),
 ) -> Dict[str, str]:
-    """Invalidate all config caches to pick up new workflows, document types, etc."""
+    """Invalidate changed config to pick up new workflows, document types, etc."""
     service.invalidate_cache()
     return {"status": "ok", "message": "Cache invalidated"}
 
@@ -964,7 +964,7 @@ async def get_active_releases(
 @router.post(
     "/cache/invalidate",
     summary="Invalidate cache",
-    description="Invalidate the package loader cache to reload from disk.",
+    description="Reload package loader entries whose files changed on disk.",
     status_code=status.HTTP_204_NO_CONTENT,
 )
 async def invalidate_cache_v2(
@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.core.database import get_db
 from app.core.config import USE_WORKFLOW_ENGINE_LLM
@@ -33,29 +34,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/document-workflows", tags=["document-workflows"])
 
-# Initialize plan registry at module load
-_plan_registry_loaded = False
-
-
-def _init_plan_registry():
-    """Ensure workflow plan registry is initialized.
-
-    The global registry auto-loads from combine-config/workflows/ on first access,
-    so this just ensures it's initialized and logs the result.
-    """
-    global _plan_registry_loaded
-    if _plan_registry_loaded:
-        return
-
-    # get_plan_registry() auto-loads all workflows from combine-config/workflows/
-    registry = get_plan_registry()
-
-    _plan_registry_loaded = True
-    logger.info(f"Plan registry initialized with {len(registry.list_plans())} workflow plans")
-
-
-# Initialize plan registry when module is imported
-_init_plan_registry()
+# The plan registry auto-loads from combine-config/workflows/ on first
+# access; the app lifespan warms it up (app.core.warmup) rather than this
+# module loading every plan at import.
 
 
 async def get_executor(db: AsyncSession = Depends(get_db)) -> PlanExecutor:
@@ -261,6 +242,7 @@ async def start_execution(
             for required_type in plan.requires_inputs:
                 result = await db.execute(
                     select(Document)
+                    .options(undefer(Document.content))
                     .where(Document.space_type == "project")
                     .where(Document.space_id == request.project_id)
                     .where(Document.doc_type_id == required_type)
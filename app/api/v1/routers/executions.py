@@ -1,13 +1,20 @@
 """Execution management endpoints."""
 
+import json
 from typing import Any, Dict, List, Optional
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.services.qa_coverage_service import get_qa_coverage
-from app.api.services.transcript_service import get_execution_transcript
+from app.api.services.transcript_service import (
+    get_execution_transcript,
+    get_transcript_content,
+    stream_execution_transcript,
+)
 from app.api.v1.dependencies import (
     get_workflow_registry,
     get_persistence,
@@ -30,7 +37,7 @@ from app.api.v1.services.execution_service import (
     ExecutionNotFoundError,
     InvalidExecutionStateError,
 )
-from app.core.database import get_db
+from app.core.database import async_session_factory, get_db
 from app.domain.workflow import (
     WorkflowRegistry,
     WorkflowNotFoundError,
@@ -495,6 +502,8 @@ class TranscriptInputOutput(BaseModel):
     redacted: Optional[bool] = None
     parse_status: Optional[str] = None
     validation_status: Optional[str] = None
+    truncated: bool = False
+    content_id: Optional[str] = None
 
 
 class TranscriptEntry(BaseModel):
@@ -532,6 +541,33 @@ class TranscriptResponse(BaseModel):
     started_at_iso: Optional[str]
     ended_at_formatted: Optional[str]
     ended_at_iso: Optional[str]
+    offset: int = 0
+    limit: Optional[int] = None
+    has_more: bool = False
+
+
+class TranscriptContentResponse(BaseModel):
+    """A character range of one transcript content body."""
+    content_id: str
+    offset: int
+    length: int
+    total_length: int
+    content: str
+
+
+# Content bodies longer than this are truncated in transcript responses;
+# fetch the rest from /transcript/content/{content_id}
+TRANSCRIPT_INLINE_CHARS = 64 * 1024
+
+
+def _transcript_not_found(execution_id: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "error_code": "EXECUTION_NOT_FOUND",
+            "message": f"No LLM runs found for execution '{execution_id}'",
+        },
+    )
 
 
 @router.get(
@@ -545,19 +581,25 @@ class TranscriptResponse(BaseModel):
 )
 async def get_transcript(
     execution_id: str,
+    offset: int = Query(0, ge=0, description="Runs to skip"),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Maximum runs to return"),
+    inline_chars: int = Query(
+        TRANSCRIPT_INLINE_CHARS, ge=1,
+        description="Truncate content bodies longer than this many characters",
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> TranscriptResponse:
     """Get transcript for an execution."""
-    data = await get_execution_transcript(db=db, execution_id=execution_id)
+    data = await get_execution_transcript(
+        db=db,
+        execution_id=execution_id,
+        offset=offset,
+        limit=limit,
+        max_inline_chars=inline_chars,
+    )
 
     if not data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error_code": "EXECUTION_NOT_FOUND",
-                "message": f"No LLM runs found for execution '{execution_id}'",
-            },
-        )
+        raise _transcript_not_found(execution_id)
 
     return TranscriptResponse(
         execution_id=data["execution_id"],
@@ -593,4 +635,88 @@ async def get_transcript(
         started_at_iso=data["started_at_iso"],
         ended_at_formatted=data["ended_at_formatted"],
         ended_at_iso=data["ended_at_iso"],
+        offset=data["offset"],
+        limit=data["limit"],
+        has_more=data["has_more"],
     )
+
+
+@router.get(
+    "/executions/{execution_id}/transcript/stream",
+    summary="Stream execution transcript",
+    description=(
+        "Stream the transcript as newline-delimited JSON: a header object, "
+        "then one entry object per run."
+    ),
+    responses={
+        404: {"model": ErrorResponse, "description": "No LLM runs found for execution"},
+    },
+)
+async def stream_transcript(
+    execution_id: str,
+    inline_chars: int = Query(
+        TRANSCRIPT_INLINE_CHARS, ge=1,
+        description="Truncate content bodies longer than this many characters",
+    ),
+) -> StreamingResponse:
+    """Stream transcript entries as NDJSON."""
+    # The body is sent after this function returns, when a Depends(get_db)
+    # session has already been closed, so the stream owns its own session.
+    db = async_session_factory()
+    events = stream_execution_transcript(
+        db=db, execution_id=execution_id, max_inline_chars=inline_chars,
+    )
+    try:
+        # Read the header before responding so a missing execution is a 404
+        header = await anext(events, None)
+    except BaseException:
+        await db.close()
+        raise
+    if header is None:
+        await db.close()
+        raise _transcript_not_found(execution_id)
+
+    async def ndjson():
+        try:
+            yield json.dumps(header) + "\n"
+            async for event in events:
+                yield json.dumps(event) + "\n"
+        finally:
+            await db.close()
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/executions/{execution_id}/transcript/content/{content_id}",
+    response_model=TranscriptContentResponse,
+    summary="Get transcript content range",
+    description="Fetch a character range of a truncated transcript content body.",
+    responses={
+        404: {"model": ErrorResponse, "description": "Content not found for execution"},
+    },
+)
+async def get_transcript_content_range(
+    execution_id: str,
+    content_id: UUID,
+    offset: int = Query(0, ge=0, description="First character (0-based)"),
+    length: Optional[int] = Query(None, ge=1, description="Number of characters"),
+    db: AsyncSession = Depends(get_db),
+) -> TranscriptContentResponse:
+    """Get a range of one content body referenced by the execution."""
+    data = await get_transcript_content(
+        db=db,
+        execution_id=execution_id,
+        content_id=content_id,
+        offset=offset,
+        length=length,
+    )
+    if not data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error_code": "CONTENT_NOT_FOUND",
+                "message": f"Content '{content_id}' not found for execution '{execution_id}'",
+            },
+        )
+    return TranscriptContentResponse(**data)
@@ -16,6 +16,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.core.database import get_db
 from app.auth.dependencies import require_auth
@@ -117,7 +118,7 @@ async def get_intent(
         )
 
     result = await db.execute(
-        select(Document).where(
+        select(Document).options(undefer(Document.content)).where(
             Document.id == doc_uuid,
             Document.doc_type_id == "intent_packet",
         )
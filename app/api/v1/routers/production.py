@@ -23,6 +23,7 @@ from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import JSONResponse
 from sse_starlette.sse import EventSourceResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.core.database import get_db
 from app.api.services.production_service import get_production_status
@@ -257,6 +258,7 @@ async def start_production(
                     if project_uuid:
                         result = await db.execute(
                             select(Document)
+                            .options(undefer(Document.content))
                             .where(Document.space_type == "project")
                             .where(Document.space_id == project_uuid)
                             .where(Document.doc_type_id == required_type)
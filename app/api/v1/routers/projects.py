@@ -10,21 +10,23 @@ Provides RESTful API for project management:
 """
 
 import copy
+import hashlib
 import logging
 import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, Field
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.api.models.document import Document
 from app.api.models.document_type import DocumentType
 from app.api.models.project import Project
-from app.api.services.document_status_service import document_status_service
+from app.api.services.document_status_service import document_status_service, etag_matches
 from app.api.services.project_creation_service import (
     generate_unique_project_id,
     create_project_from_intake as create_project_from_intake_service,
@@ -543,12 +545,22 @@ async def delete_project(
     logger.info(f"Deleted project {project.project_id}")
 
 
-@router.get("/{project_id}/tree", response_model=ProjectTreeResponse)
+@router.get(
+    "/{project_id}/tree",
+    response_model=ProjectTreeResponse,
+    responses={304: {"description": "Tree unchanged since the given ETag"}},
+)
 async def get_project_tree(
     project_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ) -> ProjectTreeResponse:
-    """Get project with documents and status."""
+    """Get project with documents and status.
+
+    Document statuses come from the materialized snapshot. The response
+    carries an ETag; a matching If-None-Match gets 304 Not Modified.
+    """
     # Try UUID first
     try:
         project_uuid = UUID(project_id)
@@ -569,7 +581,8 @@ async def get_project_tree(
         )
 
     # Get document statuses
-    document_statuses = await document_status_service.get_project_document_statuses(db, project.id)
+    snapshot = await document_status_service.get_project_snapshot(db, project.id)
+    document_statuses = snapshot.statuses
 
     documents = []
     for doc in document_statuses:
@@ -585,36 +598,22 @@ async def get_project_tree(
         else:
             documents.append(doc)
 
-    # Get intake content
-    intake_content = None
+    # Get intake content (falls back to project_discovery). Only the content
+    # column is selected; one query covers both candidates.
     intake_result = await db.execute(
-        select(Document).where(
-            and_(
-                Document.space_type == "project",
-                Document.space_id == project.id,
-                Document.doc_type_id == "concierge_intake",
-                Document.is_latest == True,
-            )
+        select(Document.doc_type_id, Document.content).where(
+            Document.space_type == "project",
+            Document.space_id == project.id,
+            Document.doc_type_id.in_(("concierge_intake", "project_discovery")),
+            Document.is_latest == True,
         )
     )
-    intake_doc = intake_result.scalar_one_or_none()
-    if intake_doc and intake_doc.content:
-        intake_content = intake_doc.content
-    else:
-        # Fallback to project_discovery
-        discovery_result = await db.execute(
-            select(Document).where(
-                and_(
-                    Document.space_type == "project",
-                    Document.space_id == project.id,
-                    Document.doc_type_id == "project_discovery",
-                    Document.is_latest == True,
-                )
-            )
-        )
-        discovery_doc = discovery_result.scalar_one_or_none()
-        if discovery_doc and discovery_doc.content:
-            intake_content = discovery_doc.content
+    intake_contents = {row.doc_type_id: row.content for row in intake_result}
+    intake_content = (
+        intake_contents.get("concierge_intake")
+        or intake_contents.get("project_discovery")
+        or None
+    )
 
     # Check workflow instance assignment (ADR-046 Phase 6)
     wf_result = await db.execute(
@@ -626,7 +625,7 @@ async def get_project_tree(
     has_workflow = wf_row is not None
     workflow_status = wf_row[0] if wf_row else None
 
-    return ProjectTreeResponse(
+    tree = ProjectTreeResponse(
         project=_project_to_response(project),
         documents=documents,
         intake_content=intake_content,
@@ -634,6 +633,13 @@ async def get_project_tree(
         workflow_status=workflow_status,
     )
 
+    etag = hashlib.blake2b(tree.model_dump_json().encode("utf-8"), digest_size=16).hexdigest()
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return tree
+
 
 @router.get("/{project_id}/interrupts")
 async def get_project_interrupts(
@@ -684,7 +690,7 @@ async def get_project_document(
             raise HTTPException(status_code=400, detail=str(e))
 
         result = await db.execute(
-            select(Document).where(
+            select(Document).options(undefer(Document.content)).where(
                 Document.space_id == project.id,
                 Document.doc_type_id == doc_type_id,
                 Document.display_id == identifier,
@@ -702,6 +708,7 @@ async def get_project_document(
         doc_type_id = identifier
         query = (
             select(Document)
+            .options(undefer(Document.content))
             .where(Document.space_type == "project")
             .where(Document.space_id == project.id)
             .where(Document.doc_type_id == doc_type_id)
@@ -782,7 +789,7 @@ async def render_document_markdown(
         raise HTTPException(status_code=400, detail=str(e))
 
     result = await db.execute(
-        select(Document).where(
+        select(Document).options(undefer(Document.content)).where(
             Document.space_id == project.id,
             Document.doc_type_id == doc_type_id,
             Document.display_id == display_id,
@@ -921,7 +928,7 @@ async def render_project_binder(
 
     # Query all latest documents for this project
     result = await db.execute(
-        select(Document).where(
+        select(Document).options(undefer(Document.content)).where(
             Document.space_type == "project",
             Document.space_id == project.id,
             Document.is_latest == True,
@@ -1235,6 +1242,7 @@ async def get_document_render_model(
     # Get the document
     doc_query = (
         select(Document)
+        .options(undefer(Document.content))
         .where(Document.space_type == "project")
         .where(Document.space_id == project.id)
         .where(Document.doc_type_id == doc_type_id)
@@ -1328,6 +1336,7 @@ async def get_document_render_model(
         # Query spawned child documents for this document
         child_result = await db.execute(
             select(Document)
+            .options(undefer(Document.content))
             .where(Document.parent_document_id == document.id)
             .where(Document.is_latest == True)
         )
@@ -1396,6 +1405,7 @@ async def get_document_pgc_context(
     # Source 2: workflow_executions context_state (older format)
     we_result = await db.execute(
         select(WorkflowExecution)
+        .options(undefer(WorkflowExecution.context_state))
         .where(WorkflowExecution.project_id == project.id)
         .where(WorkflowExecution.document_type == doc_type_id)
         .where(WorkflowExecution.status == "completed")
@@ -1670,43 +1680,54 @@ async def list_work_packages(
     """List governed work packages for a project."""
     project = await _resolve_project(project_id, db)
 
+    # Select only the content keys the list shows, not whole documents
+    content = Document.content
     result = await db.execute(
-        select(Document)
+        select(
+            Document.id,
+            Document.display_id,
+            Document.created_at,
+            content["title"].astext.label("title"),
+            content["name"].astext.label("name"),
+            content["state"].astext.label("state"),
+            content["provenance"].label("provenance"),
+        )
         .where(Document.space_type == 'project')
         .where(Document.space_id == project.id)
         .where(Document.doc_type_id == 'work_package')
         .where(Document.is_latest == True)
         .order_by(Document.created_at)
     )
-    docs = result.scalars().all()
+    rows = result.all()
 
     # Count work statements per WP
     ws_counts: Dict[str, int] = {}
-    if docs:
+    if rows:
+        parent_wp_id = content["parent_wp_id"].astext
         ws_result = await db.execute(
-            select(Document)
+            select(parent_wp_id, func.count())
             .where(Document.space_type == 'project')
             .where(Document.space_id == project.id)
             .where(Document.doc_type_id == 'work_statement')
             .where(Document.is_latest == True)
+            .where(parent_wp_id.isnot(None))
+            .where(parent_wp_id != '')
+            .group_by(parent_wp_id)
         )
-        for ws in ws_result.scalars().all():
-            parent = (ws.content or {}).get('parent_wp_id', '')
-            if parent:
-                ws_counts[parent] = ws_counts.get(parent, 0) + 1
+        ws_counts = {parent: count for parent, count in ws_result.all()}
 
     return [
         WorkPackageResponse(
-            id=str(doc.id),
-            wp_id=doc.display_id or str(doc.id)[:8],
-            title=(doc.content or {}).get('title'),
-            name=(doc.content or {}).get('name', doc.display_id),
-            state=(doc.content or {}).get('state', 'ready'),
-            ws_count=ws_counts.get(str(doc.id), 0),
-            provenance=(doc.content or {}).get('provenance'),
-            created_at=doc.created_at.isoformat() if doc.created_at else None,
-        )
-        for doc in docs
+            id=str(row.id),
+            wp_id=row.display_id or str(row.id)[:8],
+            title=row.title,
+            name=row.name if row.name is not None else row.display_id,
+            state=row.state if row.state is not None else 'ready',
+            ws_count=ws_counts.get(str(row.id), 0),
+            provenance=row.provenance,
+            created_at=row.created_at.isoformat() if row.created_at else None,
+        )
+        for row in rows
     ]
 
 
@@ -1743,27 +1764,32 @@ async def list_work_statements(
     """List work statements for a governed work package."""
     project = await _resolve_project(project_id, db)
 
+    content = Document.content
     result = await db.execute(
-        select(Document)
+        select(
+            Document.id,
+            Document.display_id,
+            Document.created_at,
+            content["parent_wp_id"].astext.label("parent_wp_id"),
+            content["title"].astext.label("title"),
+            content["state"].astext.label("state"),
+        )
         .where(Document.space_type == 'project')
         .where(Document.space_id == project.id)
         .where(Document.doc_type_id == 'work_statement')
         .where(Document.is_latest == True)
     )
-    ws_docs = result.scalars().all()
 
     # Filter to WSs belonging to this WP
     statements = []
-    for doc in ws_docs:
-        content = doc.content or {}
-        parent = content.get('parent_wp_id', '')
-        if parent == wp_id or str(doc.id).startswith(wp_id):
+    for row in result.all():
+        if row.parent_wp_id == wp_id or str(row.id).startswith(wp_id):
             statements.append({
-                "id": str(doc.id),
-                "ws_id": doc.display_id or str(doc.id)[:8],
-                "title": content.get('title'),
-                "state": content.get('state', 'ready'),
-                "created_at": doc.created_at.isoformat() if doc.created_at else None,
+                "id": str(row.id),
+                "ws_id": row.display_id or str(row.id)[:8],
+                "title": row.title,
+                "state": row.state if row.state is not None else 'ready',
+                "created_at": row.created_at.isoformat() if row.created_at else None,
             })
 
     return statements
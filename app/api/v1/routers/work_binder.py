@@ -22,14 +22,17 @@ governance invariant enforcement, and audit trail logging (WS-WB-008).
 
 import copy
 import logging
+from itertools import chain
 from typing import Any, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.api.models.document import Document
 from app.api.models.project import Project
@@ -220,6 +223,19 @@ class WPCListResponse(BaseModel):
 # ===========================================================================
 
 
+# WPC content keys shown in the candidate list
+_WPC_LIST_FIELDS = (
+    "wpc_id",
+    "title",
+    "rationale",
+    "scope_summary",
+    "source_ip_id",
+    "source_ip_version",
+    "frozen_at",
+    "frozen_by",
+)
+
+
 @router.get("/candidates", response_model=WPCListResponse)
 async def list_candidates(
     project_id: str,
@@ -233,27 +249,37 @@ async def list_candidates(
     """
     project = await _resolve_project(db, project_id)
 
-    # Query all WPC documents for this project
+    # Query all WPC documents for this project, selecting only the
+    # content keys the list shows
     wpc_result = await db.execute(
-        select(Document)
+        select(
+            Document.display_id,
+            Document.title,
+            func.jsonb_build_object(
+                *chain.from_iterable(
+                    (key, Document.content[key]) for key in _WPC_LIST_FIELDS
+                ),
+                type_=JSONB,
+            ).label("content"),
+        )
         .where(Document.space_type == "project")
         .where(Document.space_id == project.id)
         .where(Document.doc_type_id == "work_package_candidate")
         .where(Document.is_latest == True)  # noqa: E712
         .order_by(Document.created_at)
     )
-    wpc_docs = list(wpc_result.scalars().all())
+    wpc_rows = wpc_result.all()
 
-    if wpc_docs:
+    if wpc_rows:
         # Compute promoted flag via lineage (source_candidate_ids on WPs)
         promoted_ids = await _collect_promoted_wpc_ids(db, project.id)
 
         candidates = []
-        for doc in wpc_docs:
-            content = doc.content or {}
+        for row in wpc_rows:
+            content = {k: v for k, v in (row.content or {}).items() if v is not None}
             candidates.append(WPCDetail(
-                wpc_id=content.get("wpc_id", doc.display_id or ""),
-                title=content.get("title", doc.title or ""),
+                wpc_id=content.get("wpc_id", row.display_id or ""),
+                title=content.get("title", row.title or ""),
                 rationale=content.get("rationale", ""),
                 scope_summary=content.get("scope_summary", []),
                 source_ip_id=content.get("source_ip_id", ""),
@@ -1081,7 +1107,7 @@ async def list_work_statements(
         wp_id_filters.append(Document.content["parent_wp_id"].astext == wp_id)
 
     result = await db.execute(
-        select(Document).where(
+        select(Document).options(undefer(Document.content)).where(
             Document.doc_type_id == "work_statement",
             or_(*wp_id_filters),
             Document.space_id == wp_doc.space_id,
@@ -1283,7 +1309,7 @@ async def stabilize_work_package(
         wp_id_filters.append(Document.content["parent_wp_id"].astext == wp_id)
 
     result = await db.execute(
-        select(Document).where(
+        select(Document).options(undefer(Document.content)).where(
             Document.doc_type_id == "work_statement",
             or_(*wp_id_filters),
             Document.space_id == wp_doc.space_id,
@@ -1375,7 +1401,7 @@ async def _load_ip_document(
         )
 
     result = await db.execute(
-        select(Document).where(
+        select(Document).options(undefer(Document.content)).where(
             Document.id == doc_uuid,
             Document.is_latest == True,  # noqa: E712
         )
@@ -1432,7 +1458,7 @@ async def _load_wpc_document(
     duplicate WPC rows (created when import-candidates runs against
     different IP document versions with the same candidate IDs).
     """
-    query = select(Document).where(
+    query = select(Document).options(undefer(Document.content)).where(
         Document.doc_type_id == "work_package_candidate",
         Document.display_id == wpc_id,
         Document.is_latest == True,  # noqa: E712
@@ -1479,7 +1505,7 @@ async def _find_wp_by_source_wpc(
     contains the given wpc_id.
     """
     result = await db.execute(
-        select(Document).where(
+        select(Document).options(undefer(Document.content)).where(
             Document.doc_type_id == "work_package",
             Document.space_id == space_id,
             Document.is_latest == True,  # noqa: E712
@@ -1504,7 +1530,9 @@ async def _load_wp_document(
     ]
     if space_id is not None:
         filters.append(Document.space_id == space_id)
-    result = await db.execute(select(Document).where(*filters))
+    result = await db.execute(
+        select(Document).options(undefer(Document.content)).where(*filters)
+    )
     doc = result.scalars().first()
     if doc is not None:
         return doc
@@ -1516,7 +1544,9 @@ async def _load_wp_document(
     ]
     if space_id is not None:
         fallback_filters.append(Document.space_id == space_id)
-    result = await db.execute(select(Document).where(*fallback_filters))
+    result = await db.execute(
+        select(Document).options(undefer(Document.content)).where(*fallback_filters)
+    )
     doc = result.scalars().first()
     if doc is None:
         raise HTTPException(
@@ -1539,7 +1569,9 @@ async def _load_ws_document(
     ]
     if space_id is not None:
         filters.append(Document.space_id == space_id)
-    result = await db.execute(select(Document).where(*filters))
+    result = await db.execute(
+        select(Document).options(undefer(Document.content)).where(*filters)
+    )
     doc = result.scalars().first()
     if doc is None:
         raise HTTPException(
@@ -1610,6 +1642,7 @@ async def _find_ta_for_project(
     """Find the latest TA document for a project space."""
     result = await db.execute(
         select(Document)
+        .options(undefer(Document.content))
         .where(Document.space_type == "project")
         .where(Document.space_id == space_id)
         .where(Document.doc_type_id == "technical_architecture")
@@ -1628,14 +1661,13 @@ async def _collect_promoted_wpc_ids(
     Uses lineage (source_candidate_ids on WP content), not naming conventions.
     """
     result = await db.execute(
-        select(Document)
+        select(Document.content["source_candidate_ids"])
         .where(Document.space_type == "project")
         .where(Document.space_id == space_id)
         .where(Document.doc_type_id == "work_package")
         .where(Document.is_latest == True)  # noqa: E712
     )
     promoted_ids: set[str] = set()
-    for wp_doc in result.scalars().all():
-        src_ids = (wp_doc.content or {}).get("source_candidate_ids", [])
-        promoted_ids.update(src_ids)
+    for src_ids in result.scalars().all():
+        promoted_ids.update(src_ids or [])
     return promoted_ids
@@ -0,0 +1,318 @@
+"""
+Bounded caches for artifacts loaded from combine-config/.
+
+PackageLoader keeps one ArtifactCache per artifact kind (packages, roles,
+templates, tasks, PGC contexts, schemas). Each entry remembers the release
+directory it was loaded from, the mtime and size of every file in it and
+a hash of their contents, so a config change only drops the entries whose
+files actually changed:
+
+- ConfigSnapshot finds changed files with an mtime/size scan of the tree.
+- ArtifactCache.revalidate() rehashes only the entries under those paths;
+  a file that was touched but not edited (e.g. by a git checkout) keeps
+  its entry.
+
+Entries are evicted least-recently-used once a cache holds max_entries
+entries or max_bytes of source files. Memory is accounted as the on-disk
+size of an entry's files: parsed artifacts are larger, but in proportion.
+
+Usage:
+    cache = ArtifactCache("role", max_entries=128)
+    role = cache.get("technical_architect:1.0.0")
+    if role is None:
+        role = RolePrompt.from_path(path, ...)
+        cache.put("technical_architect:1.0.0", role, path)
+    cache.stats().to_dict()   # {"hits": ..., "misses": ..., "evictions": ...}
+"""
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size) of one file
+FileStamp = Tuple[int, int]
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def scan_files(root: Path) -> Dict[str, FileStamp]:
+    """Stat every file under root, skipping dot-files and dot-directories.
+
+    Returns:
+        Dict of absolute path -> (mtime_ns, size); empty if root is missing
+    """
+    stamps: Dict[str, FileStamp] = {}
+    if root.is_file():
+        st = root.stat()
+        return {str(root): (st.st_mtime_ns, st.st_size)}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.startswith("."):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            stamps[path] = (st.st_mtime_ns, st.st_size)
+    return stamps
+
+
+def hash_files(paths: Iterable[str]) -> str:
+    """Hash the names and contents of files (missing files hash as absent)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(paths):
+        digest.update(path.encode())
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            digest.update(b"\0missing")
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters for one ArtifactCache."""
+    name: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": self.entries,
+            "bytes": self.bytes,
+        }
+
+
+@dataclass
+class _Entry:
+    value: Any
+    root: str
+    stamps: Dict[str, FileStamp]
+    content_hash: str
+    size: int
+    checked_at: float
+
+
+class ArtifactCache:
+    """
+    Size-bounded LRU cache of loaded artifacts with per-entry invalidation.
+
+    Thread-safe: the startup warm-up loads artifacts from worker threads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: Optional[float] = None,
+        on_invalidate: Optional[Callable[[str], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            name: Artifact kind, used in stats and logs
+            max_entries: Evict least-recently-used entries beyond this count
+            max_bytes: Evict least-recently-used entries beyond this many
+                bytes of source files
+            ttl_seconds: If set, an entry older than this is rechecked against
+                its files on the next get (catches edits made without an
+                invalidate_cache call)
+            on_invalidate: Called with the key whenever a changed entry is dropped
+            clock: Time source (for testing)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._on_invalidate = on_invalidate
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats(name=name)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                if self._changed(entry):
+                    self._drop(key)
+                    entry = None
+                else:
+                    entry.checked_at = self._clock()
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry.value
+
+    def put(self, key: str, value: Any, root: Path) -> None:
+        """Cache value loaded from the files under root."""
+        stamps = scan_files(root)
+        entry = _Entry(
+            value=value,
+            root=str(root),
+            stamps=stamps,
+            content_hash=hash_files(stamps),
+            size=sum(size for _, size in stamps.values()),
+            checked_at=self._clock(),
+        )
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._evict()
+
+    def revalidate(self, changed_paths: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Drop entries whose files changed.
+
+        Args:
+            changed_paths: Paths known to have changed (from ConfigSnapshot);
+                only entries containing one of them are checked. None checks
+                every entry.
+
+        Returns:
+            Keys of the dropped entries
+        """
+        changed = None if changed_paths is None else set(changed_paths)
+        dropped = []
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if changed is not None and not _contains_any(entry.root, changed):
+                    continue
+                if self._changed(entry):
+                    self._drop(key)
+                    dropped.append(key)
+                else:
+                    # Touched but identical: adopt the new stamps
+                    entry.stamps = scan_files(Path(entry.root))
+                    entry.checked_at = self._clock()
+        return dropped
+
+    def covers(self, path: str) -> bool:
+        """True if path lies inside a cached entry's directory."""
+        with self._lock:
+            return any(_contains_any(entry.root, (path,)) for entry in self._entries.values())
+
+    def clear(self) -> None:
+        """Drop every entry (counted as invalidations)."""
+        with self._lock:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the counters."""
+        with self._lock:
+            return CacheStats(
+                name=self.name,
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    # -------------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # -------------------------------------------------------------------------
+
+    def _expired(self, entry: _Entry) -> bool:
+        return (
+            self.ttl_seconds is not None
+            and self._clock() - entry.checked_at >= self.ttl_seconds
+        )
+
+    @staticmethod
+    def _changed(entry: _Entry) -> bool:
+        stamps = scan_files(Path(entry.root))
+        if stamps == entry.stamps:
+            return False
+        return hash_files(stamps) != entry.content_hash
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        self._stats.invalidations += 1
+        logger.debug(f"Dropped changed {self.name} from cache: {key}")
+        if self._on_invalidate is not None:
+            self._on_invalidate(key)
+
+    def _evict(self) -> None:
+        # Always keep the newest entry, even if it alone exceeds max_bytes
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self._stats.evictions += 1
+
+
+def _contains_any(root: str, paths: Iterable[str]) -> bool:
+    prefix = root.rstrip(os.sep) + os.sep
+    return any(path == root or path.startswith(prefix) for path in paths)
+
+
+class ConfigSnapshot:
+    """
+    mtime/size snapshot of a config tree, for cheap change detection.
+
+    Usage:
+        snapshot = ConfigSnapshot(config_path)
+        ...
+        changed = snapshot.refresh()   # paths added, removed or modified since
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._stamps = scan_files(root)
+
+    def __len__(self) -> int:
+        return len(self._stamps)
+
+    def refresh(self) -> Set[str]:
+        """Rescan the tree and return the paths that changed since the last scan."""
+        stamps = scan_files(self.root)
+        old = self._stamps
+        changed = {p for p in stamps.keys() | old.keys() if stamps.get(p) != old.get(p)}
+        self._stamps = stamps
+        return changed
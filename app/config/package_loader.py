@@ -3,12 +3,23 @@ Package Loader for Git-canonical configuration.
 
 Per ADR-044, this module loads Document Type Packages and shared artifacts
 from the combine-config/ repository.
+
+Loaded artifacts are held in bounded per-kind caches (see artifact_cache).
+invalidate_cache() drops only the artifacts whose files changed, so a
+workspace commit reloads what it touched instead of everything.
 """
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
-
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from app.config.artifact_cache import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_MAX_ENTRIES,
+    ArtifactCache,
+    ConfigSnapshot,
+)
 from app.config.package_model import (
     DocumentTypePackage,
     RolePrompt,
@@ -53,13 +64,23 @@ class PackageLoader:
         role = loader.get_role("technical_architect")
     """
 
-    def __init__(self, config_path: Optional[Path] = None):
+    def __init__(
+        self,
+        config_path: Optional[Path] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: Optional[float] = None,
+    ):
         """
         Initialize the package loader.
 
         Args:
             config_path: Path to combine-config/ directory.
                         Defaults to combine-config/ in project root.
+            max_entries: Per-kind cache bound (entries)
+            max_bytes: Per-kind cache bound (bytes of source files)
+            ttl_seconds: Recheck a cached artifact's files after this long
+                        (None: only on invalidate_cache)
         """
         self.config_path = config_path or DEFAULT_CONFIG_PATH
 
@@ -77,12 +98,41 @@ class PackageLoader:
 
         # Caches
         self._active_releases: Optional[ActiveReleases] = None
-        self._package_cache: Dict[str, DocumentTypePackage] = {}
-        self._role_cache: Dict[str, RolePrompt] = {}
-        self._template_cache: Dict[str, Template] = {}
-        self._task_cache: Dict[str, TaskPrompt] = {}
-        self._pgc_cache: Dict[str, PgcContext] = {}
-        self._schema_cache: Dict[str, StandaloneSchema] = {}
+
+        def cache(name: str) -> ArtifactCache:
+            return ArtifactCache(
+                name,
+                max_entries=max_entries,
+                max_bytes=max_bytes,
+                ttl_seconds=ttl_seconds,
+                on_invalidate=self._on_artifact_changed,
+            )
+
+        self._package_cache = cache("package")
+        self._role_cache = cache("role")
+        self._template_cache = cache("template")
+        self._task_cache = cache("task")
+        self._pgc_cache = cache("pgc")
+        self._schema_cache = cache("schema")
+        self._caches = (
+            self._package_cache, self._role_cache, self._template_cache,
+            self._task_cache, self._pgc_cache, self._schema_cache,
+        )
+
+        # Baseline for finding changed files on invalidate_cache
+        self._snapshot = ConfigSnapshot(self.config_path)
+
+        # Incremented whenever config changes so dependent caches built from
+        # this loader (e.g. compiled mechanical operations) can detect reloads.
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Config generation; changes whenever cached config is found stale."""
+        return self._generation
+
+    def _on_artifact_changed(self, key: str) -> None:
+        self._generation += 1
 
     def get_active_releases(self) -> ActiveReleases:
         """Load and return the active releases configuration."""
@@ -97,15 +147,44 @@ class PackageLoader:
         return self._active_releases
 
     def invalidate_cache(self) -> None:
-        """Invalidate all caches. Call after config changes."""
+        """
+        Drop cached config whose files changed. Call after config changes.
+
+        Scans combine-config/ for files whose mtime or size changed and
+        rehashes only the cached artifacts containing them. The generation
+        is bumped if anything was dropped or a changed file is not backed by
+        a cached artifact (e.g. mechanical ops, read by other services).
+        """
+        changed = self._snapshot.refresh()
+        if not changed:
+            logger.debug("Package loader cache valid: no config files changed")
+            return
+
+        generation = self._generation
+        dropped = [key for cache in self._caches for key in cache.revalidate(changed)]
+        if str(self._active_releases_path) in changed:
+            self._active_releases = None
+        unbacked = [path for path in changed if not any(c.covers(path) for c in self._caches)]
+        if unbacked and self._generation == generation:
+            self._generation += 1
+
+        logger.info(
+            f"Package loader cache invalidated: {len(changed)} files changed, "
+            f"{len(dropped)} artifacts dropped"
+        )
+
+    def clear_cache(self) -> None:
+        """Drop every cached artifact regardless of changes."""
         self._active_releases = None
-        self._package_cache.clear()
-        self._role_cache.clear()
-        self._template_cache.clear()
-        self._task_cache.clear()
-        self._pgc_cache.clear()
-        self._schema_cache.clear()
-        logger.info("Package loader cache invalidated")
+        for cache in self._caches:
+            cache.clear()
+        self._snapshot.refresh()
+        self._generation += 1
+        logger.info("Package loader cache cleared")
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss/eviction counters and sizes for each artifact cache."""
+        return {cache.name: cache.stats().to_dict() for cache in self._caches}
 
     # =========================================================================
     # Document Type Packages
@@ -141,8 +220,9 @@ class PackageLoader:
 
         # Check cache
         cache_key = f"{doc_type_id}:{version}"
-        if cache_key in self._package_cache:
-            return self._package_cache[cache_key]
+        cached = self._package_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Load package
         package_path = self._document_types_path / doc_type_id / "releases" / version
@@ -158,7 +238,7 @@ class PackageLoader:
             )
 
         package = DocumentTypePackage.from_yaml(manifest_path)
-        self._package_cache[cache_key] = package
+        self._package_cache.put(cache_key, package, package_path)
 
         logger.debug(f"Loaded document type package: {doc_type_id} v{version}")
         return package
@@ -218,8 +298,9 @@ class PackageLoader:
 
         # Check cache
         cache_key = f"{role_id}:{version}"
-        if cache_key in self._role_cache:
-            return self._role_cache[cache_key]
+        cached = self._role_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Load role
         role_path = self._roles_path / role_id / "releases" / version
@@ -229,7 +310,7 @@ class PackageLoader:
             )
 
         role = RolePrompt.from_path(role_path, role_id, version)
-        self._role_cache[cache_key] = role
+        self._role_cache.put(cache_key, role, role_path)
 
         logger.debug(f"Loaded role prompt: {role_id} v{version}")
         return role
@@ -278,8 +359,9 @@ class PackageLoader:
 
         # Check cache
         cache_key = f"{template_id}:{version}"
-        if cache_key in self._template_cache:
-            return self._template_cache[cache_key]
+        cached = self._template_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Load template
         template_path = self._templates_path / template_id / "releases" / version
@@ -289,7 +371,7 @@ class PackageLoader:
             )
 
         template = Template.from_path(template_path, template_id, version)
-        self._template_cache[cache_key] = template
+        self._template_cache.put(cache_key, template, template_path)
 
         logger.debug(f"Loaded template: {template_id} v{version}")
         return template
@@ -338,8 +420,9 @@ class PackageLoader:
 
         # Check cache
         cache_key = f"{task_id}:{version}"
-        if cache_key in self._task_cache:
-            return self._task_cache[cache_key]
+        cached = self._task_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Load task
         task_path = self._tasks_path / task_id / "releases" / version
@@ -349,7 +432,7 @@ class PackageLoader:
             )
 
         task = TaskPrompt.from_path(task_path, task_id, version)
-        self._task_cache[cache_key] = task
+        self._task_cache.put(cache_key, task, task_path)
 
         logger.debug(f"Loaded task prompt: {task_id} v{version}")
         return task
@@ -398,8 +481,9 @@ class PackageLoader:
 
         # Check cache
         cache_key = f"{pgc_id}:{version}"
-        if cache_key in self._pgc_cache:
-            return self._pgc_cache[cache_key]
+        cached = self._pgc_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Load PGC
         pgc_path = self._pgc_path / pgc_id / "releases" / version
@@ -409,7 +493,7 @@ class PackageLoader:
             )
 
         pgc = PgcContext.from_path(pgc_path, pgc_id, version)
-        self._pgc_cache[cache_key] = pgc
+        self._pgc_cache.put(cache_key, pgc, pgc_path)
 
         logger.debug(f"Loaded PGC context: {pgc_id} v{version}")
         return pgc
@@ -458,8 +542,9 @@ class PackageLoader:
 
         # Check cache
         cache_key = f"{schema_id}:{version}"
-        if cache_key in self._schema_cache:
-            return self._schema_cache[cache_key]
+        cached = self._schema_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Load schema
         schema_path = self._schemas_path / schema_id / "releases" / version
@@ -469,7 +554,7 @@ class PackageLoader:
             )
 
         schema = StandaloneSchema.from_path(schema_path, schema_id, version)
-        self._schema_cache[cache_key] = schema
+        self._schema_cache.put(cache_key, schema, schema_path)
 
         logger.debug(f"Loaded standalone schema: {schema_id} v{version}")
         return schema
@@ -789,6 +874,7 @@ class PackageLoader:
 
 # Module-level singleton
 _loader: Optional[PackageLoader] = None
+_loader_lock = Lock()
 
 
 def get_package_loader(config_path: Optional[Path] = None) -> PackageLoader:
@@ -804,7 +890,10 @@ def get_package_loader(config_path: Optional[Path] = None) -> PackageLoader:
     global _loader
 
     if _loader is None:
-        _loader = PackageLoader(config_path)
+        # Warm-up threads call this concurrently; build exactly one loader
+        with _loader_lock:
+            if _loader is None:
+                _loader = PackageLoader(config_path)
 
     return _loader
 
@@ -117,6 +117,34 @@ ALLOW_RESET_IN_CRITICAL_PHASES = os.getenv("ALLOW_RESET_IN_CRITICAL_PHASES", "fa
 # Request Size Limits (QA-Blocker #1)
 MAX_REQUEST_BODY_SIZE = int(os.getenv("MAX_REQUEST_BODY_SIZE", 10 * 1024 * 1024))  # 10MB default
 
+# HTTP ingress secret scan tiers (app/api/middleware/secret_ingress.py)
+# Bodies up to INLINE bytes are scanned on the event loop, larger ones in a
+# pool of SECRET_SCAN_WORKERS threads, and from STREAM bytes up incrementally
+# in chunks, yielding to the event loop between chunks.
+SECRET_SCAN_INLINE_MAX_BYTES = int(os.getenv("SECRET_SCAN_INLINE_MAX_BYTES", 64 * 1024))
+SECRET_SCAN_STREAM_MIN_BYTES = int(os.getenv("SECRET_SCAN_STREAM_MIN_BYTES", 1024 * 1024))
+SECRET_SCAN_WORKERS = int(os.getenv("SECRET_SCAN_WORKERS", "2"))
+
+# Cross-worker config sync (app/core/config_sync.py)
+# Workers also poll the config generation this often in case a NOTIFY is
+# missed (e.g., while the listener reconnects). 0 disables polling.
+CONFIG_SYNC_POLL_SECONDS = float(os.getenv("CONFIG_SYNC_POLL_SECONDS", "30"))
+
+# Full-config validation (app/api/services/config_validator.py)
+# Worker processes for validate_all_active_packages / validate_config.
+# 1 validates in-process, where the package loader's caches are warm.
+CONFIG_VALIDATION_WORKERS = int(os.getenv("CONFIG_VALIDATION_WORKERS", "1"))
+
+# PlanExecutor hot-path tracing (app/observability/tracing.py)
+# "off" records nothing; "collect" keeps the last TRACING_MAX_SPANS spans
+# (GET /health/spans) and per-span histograms (GET /metrics, Prometheus).
+TRACING_MODE = os.getenv("TRACING_MODE", "off")
+TRACING_MAX_SPANS = int(os.getenv("TRACING_MAX_SPANS", "2048"))
+
+# Task-node context token counting (app/llm/token_estimator.py)
+# "heuristic" needs no extra packages; "tiktoken" requires tiktoken installed.
+TOKEN_ESTIMATOR_BACKEND = os.getenv("TOKEN_ESTIMATOR_BACKEND", "heuristic")
+
 # Feature Flags (WS-DOCUMENT-SYSTEM-CLEANUP Phase 8)
 # Debug routes are disabled by default in production
 # Set ENABLE_DEBUG_ROUTES=true to enable /test-*, /api/admin/llm-runs/*/replay
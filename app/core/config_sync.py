@@ -0,0 +1,385 @@
+"""
+Cross-worker sync of combine-config caches.
+
+The plan registry and package loader are per-process. When an admin
+commits to combine-config or changes an active release, the worker that
+served the request bumps a cluster-wide generation in Postgres
+(config_generation) and sends NOTIFY on CONFIG_CHANNEL. Every worker runs
+a ConfigSyncWorker that LISTENs on that channel, and also polls the row in
+case a notification is missed (listener reconnecting, pooler in between),
+and reloads only what changed when the generation moves:
+
+- PackageLoader.invalidate_cache() drops the artifacts whose files changed.
+- PlanRegistry.reload_changed() re-reads changed plans and swaps them in;
+  executions pinned to an older plan version keep running it.
+
+Reloads run in a worker thread, one at a time, and never block requests.
+The config files themselves must already be visible to the worker (same
+checkout or shared volume): the notification only says when to look.
+
+Usage:
+    sync = get_config_sync()
+    await sync.start()                     # lifespan startup
+    signal_config_changed("Activate wp 1.2.0")
+    await sync.stop()                      # lifespan shutdown
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CONFIG_CHANNEL = "combine_config_changed"
+
+# Seconds between liveness checks of the LISTEN connection
+LISTEN_KEEPALIVE_SECONDS = 60.0
+# Reconnect backoff for the LISTEN connection
+RECONNECT_MIN_SECONDS = 1.0
+RECONNECT_MAX_SECONDS = 60.0
+
+
+# =============================================================================
+# Database access
+# =============================================================================
+
+async def read_config_generation(db) -> int:
+    """Current cluster-wide config generation (0 if never bumped)."""
+    from sqlalchemy import select
+
+    from app.api.models.config_generation import ConfigGeneration
+
+    result = await db.execute(
+        select(ConfigGeneration.generation).where(ConfigGeneration.id == 1)
+    )
+    return result.scalar() or 0
+
+
+async def bump_config_generation(db, reason: Optional[str] = None) -> int:
+    """
+    Increment the config generation and notify every listening worker.
+
+    The NOTIFY is delivered when db commits; this function commits.
+
+    Args:
+        db: Database session
+        reason: What changed (stored for diagnostics)
+
+    Returns:
+        The new generation
+    """
+    from sqlalchemy import func, select
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+    from app.api.models.config_generation import ConfigGeneration
+
+    reason = (reason or "")[:255] or None
+    stmt = (
+        pg_insert(ConfigGeneration)
+        .values(id=1, generation=1, reason=reason)
+        .on_conflict_do_update(
+            index_elements=[ConfigGeneration.id],
+            set_={
+                "generation": ConfigGeneration.generation + 1,
+                "reason": reason,
+                "changed_at": func.now(),
+            },
+        )
+        .returning(ConfigGeneration.generation)
+    )
+    generation = (await db.execute(stmt)).scalar_one()
+    await db.execute(select(func.pg_notify(CONFIG_CHANNEL, str(generation))))
+    await db.commit()
+    return generation
+
+
+async def _read_generation() -> int:
+    from app.core.database import async_session_factory
+
+    async with async_session_factory() as db:
+        return await read_config_generation(db)
+
+
+async def _publish(reason: Optional[str]) -> int:
+    from app.core.database import async_session_factory
+
+    async with async_session_factory() as db:
+        return await bump_config_generation(db, reason)
+
+
+def reload_local_config() -> Dict[str, Any]:
+    """
+    Reload this process's config caches from disk (blocking).
+
+    Returns:
+        {"plans": [reloaded workflow_ids], "packages_changed": bool}
+    """
+    from app.config.package_loader import get_package_loader
+    from app.domain.workflow.plan_registry import get_plan_registry
+
+    loader = get_package_loader()
+    before = loader.generation
+    loader.invalidate_cache()
+    plans = get_plan_registry().reload_changed()
+    return {"plans": plans, "packages_changed": loader.generation != before}
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+class ConfigSyncWorker:
+    """
+    Keeps this process's config caches in step with the cluster generation.
+
+    Dependencies are injectable for testing; the defaults talk to the
+    application database and reload the process-wide registries.
+    """
+
+    def __init__(
+        self,
+        poll_seconds: Optional[float] = None,
+        read_generation: Callable[[], Awaitable[int]] = _read_generation,
+        publish: Callable[[Optional[str]], Awaitable[int]] = _publish,
+        reload: Callable[[], Any] = reload_local_config,
+        listen: bool = True,
+    ):
+        """
+        Args:
+            poll_seconds: Polling interval (defaults to CONFIG_SYNC_POLL_SECONDS;
+                0 disables polling)
+            read_generation: Returns the cluster generation
+            publish: Bumps the cluster generation; returns the new one
+            reload: Reloads local caches (blocking; run in a thread)
+            listen: LISTEN for notifications (off in tests)
+        """
+        if poll_seconds is None:
+            from app.core.config import CONFIG_SYNC_POLL_SECONDS
+            poll_seconds = CONFIG_SYNC_POLL_SECONDS
+        self.poll_seconds = poll_seconds
+        self._read_generation = read_generation
+        self._publish = publish
+        self._reload = reload
+        self._listen = listen
+
+        self.generation: Optional[int] = None
+        self.reloads = 0
+        self.last_reload_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.listening = False
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_id: Optional[int] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+        # Keep fire-and-forget tasks alive until done
+        self._pending: Set["asyncio.Future[Any]"] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    async def start(self) -> None:
+        """Record the current generation and start listening and polling."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+
+        try:
+            # This process just loaded config from disk: it is current
+            self.generation = await self._read_generation()
+        except Exception as e:
+            self.last_error = str(e)
+            logger.warning(f"Config sync could not read generation, polling will retry: {e}")
+
+        if self._listen:
+            self._tasks.append(asyncio.create_task(self._listen_loop(), name="config-sync-listen"))
+        if self.poll_seconds > 0:
+            self._tasks.append(asyncio.create_task(self._poll_loop(), name="config-sync-poll"))
+        logger.info(
+            f"Config sync started at generation {self.generation} "
+            f"(listen={self._listen}, poll={self.poll_seconds}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop listening and polling."""
+        if not self.running:
+            return
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._loop = None
+        self.listening = False
+
+    async def sync(self, generation: Optional[int] = None) -> bool:
+        """
+        Reload local config if the cluster generation moved past ours.
+
+        Args:
+            generation: Generation seen in a notification (read from the
+                database if None)
+
+        Returns:
+            True if a reload ran
+        """
+        if generation is None:
+            generation = await self._read_generation()
+        async with self._lock:
+            if self.generation is not None and generation <= self.generation:
+                return False
+            start = time.perf_counter()
+            result = await asyncio.to_thread(self._reload)
+            self.generation = generation
+            self.reloads += 1
+            self.last_reload_at = time.time()
+            logger.info(
+                f"Config reloaded for generation {generation} in "
+                f"{(time.perf_counter() - start) * 1000:.1f}ms: {result}"
+            )
+            return True
+
+    def notify_changed(self, reason: Optional[str] = None) -> None:
+        """Publish a config change to every worker (safe from any thread)."""
+        if not self.running:
+            return
+        if threading.get_ident() == self._thread_id:
+            future = self._loop.create_task(self._publish_safely(reason))
+        else:
+            future = asyncio.run_coroutine_threadsafe(self._publish_safely(reason), self._loop)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "listening": self.listening,
+            "poll_seconds": self.poll_seconds,
+            "generation": self.generation,
+            "reloads": self.reloads,
+            "last_reload_at": self.last_reload_at,
+            "last_error": self.last_error,
+        }
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    async def _publish_safely(self, reason: Optional[str]) -> None:
+        try:
+            generation = await self._publish(reason)
+            logger.info(f"Published config generation {generation}: {reason}")
+        except Exception as e:
+            # Other workers catch up when the next change is published or
+            # on restart; at least bring this worker up to date.
+            self.last_error = str(e)
+            logger.warning(f"Failed to publish config change, reloading locally only: {e}")
+            async with self._lock:
+                await asyncio.to_thread(self._reload)
+
+    def _on_notification(self, payload: str) -> None:
+        try:
+            generation = int(payload)
+        except (TypeError, ValueError):
+            generation = None
+        task = asyncio.ensure_future(self._sync_safely(generation))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _sync_safely(self, generation: Optional[int] = None) -> None:
+        try:
+            await self.sync(generation)
+        except Exception as e:
+            self.last_error = str(e)
+            logger.warning(f"Config sync failed: {e}")
+
+    async def _poll_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                await self._sync_safely()
+
+    async def _listen_loop(self) -> None:
+        delay = RECONNECT_MIN_SECONDS
+        while not self._stopping.is_set():
+            try:
+                await self._listen_once()
+                delay = RECONNECT_MIN_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning(f"Config sync listener lost, reconnecting in {delay:.0f}s: {e}")
+            finally:
+                self.listening = False
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=delay * (1 + random.random() / 2)
+                )
+            except asyncio.TimeoutError:
+                delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+
+    async def _listen_once(self) -> None:
+        from app.core.database import engine
+
+        def callback(connection, pid, channel, payload):
+            self._on_notification(payload)
+
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            await driver.add_listener(CONFIG_CHANNEL, callback)
+            self.listening = True
+            try:
+                # Catch anything published while we were not listening
+                await self._sync_safely()
+                while not self._stopping.is_set():
+                    try:
+                        await asyncio.wait_for(
+                            self._stopping.wait(), timeout=LISTEN_KEEPALIVE_SECONDS
+                        )
+                    except asyncio.TimeoutError:
+                        await driver.execute("SELECT 1")
+            finally:
+                if not driver.is_closed():
+                    await driver.remove_listener(CONFIG_CHANNEL, callback)
+
+
+# Module-level singleton
+_sync: Optional[ConfigSyncWorker] = None
+
+
+def get_config_sync() -> ConfigSyncWorker:
+    """Get the process-wide config sync worker."""
+    global _sync
+    if _sync is None:
+        _sync = ConfigSyncWorker()
+    return _sync
+
+
+def reset_config_sync() -> None:
+    """Reset the process-wide config sync worker (for testing)."""
+    global _sync
+    _sync = None
+
+
+def signal_config_changed(reason: Optional[str] = None) -> None:
+    """
+    Tell every worker that combine-config changed.
+
+    No-op (logged) when the sync worker is not running, e.g. in scripts
+    and tests.
+    """
+    if _sync is None or not _sync.running:
+        logger.debug(f"Config sync not running, change not published: {reason}")
+        return
+    _sync.notify_changed(reason)
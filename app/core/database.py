@@ -82,6 +82,8 @@ async def init_database():
     from app.api.models.project import Project  # noqa: F401
     from app.api.models.document import Document  # noqa: F401
     from app.api.models.document_type import DocumentType  # noqa: F401
+    from app.api.models.project_document_status import ProjectDocumentStatus  # noqa: F401
+    from app.api.models.config_generation import ConfigGeneration  # noqa: F401
     from app.api.models.document_relation import DocumentRelation  # noqa: F401
     from app.api.models.document_definition import DocumentDefinition  # noqa: F401
     from app.api.models.file import File  # noqa: F401
@@ -97,7 +99,7 @@ async def init_database():
     # LLM logging models (canonical location: domain/models)
     from app.domain.models.llm_logging import (  # noqa: F401
         LLMContent, LLMRun, LLMRunInputRef,
-        LLMRunOutputRef, LLMRunError, LLMRunToolCall
+        LLMRunOutputRef, LLMRunError, LLMRunToolCall, LLMCostDaily
     )
     from app.api.models.llm_thread import (  # noqa: F401
         LLMThreadModel, LLMWorkItemModel, LLMLedgerEntryModel
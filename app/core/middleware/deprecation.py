@@ -6,11 +6,11 @@ Per HTTP RFC 7234: Warning: 299 - "message"
 """
 
 import logging
-from typing import Callable, Dict, Optional
+from typing import Dict, Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
 from starlette.responses import Response, RedirectResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +57,7 @@ def get_deprecation_info(path: str) -> Optional[Dict[str, str]]:
     return None
 
 
-class DeprecationMiddleware(BaseHTTPMiddleware):
+class DeprecationMiddleware:
     """
     Middleware that adds Warning headers to deprecated routes.
     
@@ -66,40 +66,45 @@ class DeprecationMiddleware(BaseHTTPMiddleware):
     - Logs all deprecated route hits for monitoring
     - Does NOT redirect (caller handles redirect if needed)
     """
-    
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and add deprecation warning if needed."""
-        
-        deprecation_info = get_deprecation_info(request.url.path)
-        
-        if deprecation_info:
-            # Log deprecated route usage
-            logger.warning(
-                f"DEPRECATED_ROUTE_HIT: {request.method} {request.url.path} "
-                f"from {request.client.host if request.client else 'unknown'} "
-                f"-> {deprecation_info['message']}"
-            )
-        
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        deprecation_info = get_deprecation_info(scope["path"])
+
+        if not deprecation_info:
+            await self.app(scope, receive, send)
+            return
+
+        # Log deprecated route usage
+        client = scope.get("client")
+        logger.warning(
+            f"DEPRECATED_ROUTE_HIT: {scope['method']} {scope['path']} "
+            f"from {client[0] if client else 'unknown'} "
+            f"-> {deprecation_info['message']}"
+        )
+
+        async def send_with_warning(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                # RFC 7234 Warning header format: warn-code warn-agent "warn-text"
+                headers["Warning"] = f'299 - "Deprecated: {deprecation_info["message"]}"'
+
+                # Also add Deprecation header (draft standard)
+                headers["Deprecation"] = "true"
+
+                # Add Sunset header if we want to indicate removal date
+                # headers["Sunset"] = "Sat, 01 Mar 2026 00:00:00 GMT"
+            await send(message)
+
         # Call the actual route handler
-        response = await call_next(request)
-        
-        # Add warning header if deprecated
-        if deprecation_info:
-            # RFC 7234 Warning header format: warn-code warn-agent "warn-text"
-            warning_value = f'299 - "Deprecated: {deprecation_info["message"]}"'
-            response.headers["Warning"] = warning_value
-            
-            # Also add Deprecation header (draft standard)
-            response.headers["Deprecation"] = "true"
-            
-            # Add Sunset header if we want to indicate removal date
-            # response.headers["Sunset"] = "Sat, 01 Mar 2026 00:00:00 GMT"
-        
-        return response
+        await self.app(scope, receive, send_with_warning)
 
 
 def add_deprecation_warning(
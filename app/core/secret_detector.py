@@ -15,12 +15,13 @@ Detection layers:
 """
 
 import base64
+import codecs
 import json
 import math
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -310,6 +311,218 @@ def scan_dict(data: dict, max_depth: int = 5) -> ScanResult:
     return ScanResult("CLEAN", None, 0.0, DETECTOR_VERSION)
 
 
+# ---------------------------------------------------------------------------
+# Incremental scanning (large bodies)
+# ---------------------------------------------------------------------------
+
+# JSON structure, and the body of a string literal up to its closing quote,
+# an incomplete escape, or the end of the chunk (unrolled: no backtracking)
+_JSON_STRUCTURE = re.compile(r'[{}\[\]:,"]')
+_JSON_STRING_BODY = re.compile(
+    r'[^"\\]*(?:(?:\\u[0-9a-fA-F]{4}|\\[^u])[^"\\]*)*', re.DOTALL
+)
+_WHITESPACE_TAIL = re.compile(r'\s(?=\S*\Z)')
+# Scan a text window without a whitespace break once it grows past this
+_MAX_TEXT_WINDOW = 1024 * 1024
+# Longest opened PEM block held back waiting for its footer
+_MAX_PEM_HOLD = 64 * 1024
+
+
+class StreamScanner:
+    """Scan a body fed in chunks without decoding or parsing all of it.
+
+    JSON bodies (first non-blank byte is { or [) are walked with a small
+    state machine; keys are not scanned, as in scan_dict. String values
+    are decoded as their bytes arrive and scanned with scan_text in
+    windows that end on whitespace, so a multi-megabyte value costs about
+    the same per chunk as a small one. Other bodies are scanned the same
+    way, in whitespace-bounded windows, so no token is split. Only an
+    unfinished window (and at most one incomplete escape) is held between
+    chunks.
+
+    Differences from scan_dict/scan_text on the whole body: JSON values
+    are scanned at any depth, and a PEM header and footer in different
+    windows still count as a PEM block.
+
+    Usage:
+        scanner = StreamScanner()
+        for chunk in chunks:
+            result = scanner.feed(chunk)
+            if result is not None:
+                break                      # SECRET_DETECTED
+        else:
+            result = scanner.finish()
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._mode: Optional[str] = None  # "json" or "text" once sniffed
+        self._pending = ""
+        # JSON state: container stack ("{" / "[") and key expectation
+        self._stack: List[str] = []
+        self._expecting_key = False
+        # Open string literal: whether it is a key, and its decoded,
+        # not yet scanned content
+        self._in_string = False
+        self._string_is_key = False
+        self._string_parts: List[str] = []
+        # PEM header seen in an earlier window of the same text or value
+        self._pem_begin = False
+        self._result: Optional[ScanResult] = None
+
+    def feed(self, chunk: bytes) -> Optional[ScanResult]:
+        """Scan the next chunk; returns the result once a secret is found."""
+        if self._result is None:
+            self._pending += self._decoder.decode(chunk)
+            self._scan_pending(final=False)
+        return self._result
+
+    def finish(self) -> ScanResult:
+        """Scan whatever is left and return the verdict for the whole body."""
+        if self._result is None:
+            self._pending += self._decoder.decode(b"", final=True)
+            self._scan_pending(final=True)
+        return self._result or ScanResult("CLEAN", None, 0.0, DETECTOR_VERSION)
+
+    def _scan_pending(self, final: bool) -> None:
+        if self._mode is None:
+            head = self._pending.lstrip()
+            if not head:
+                return
+            self._mode = "json" if head[0] in "{[" else "text"
+        if self._mode == "json":
+            self._scan_json(final)
+        else:
+            self._scan_text(final)
+
+    def _detected(self, result: ScanResult) -> bool:
+        if result.verdict == "SECRET_DETECTED":
+            self._result = result
+            return True
+        return False
+
+    def _scan_json(self, final: bool) -> None:
+        text = self._pending
+        pos = 0
+        if self._in_string:
+            pos = self._scan_string(text, pos)
+        while not self._in_string and self._result is None:
+            m = _JSON_STRUCTURE.search(text, pos)
+            if m is None:
+                pos = len(text)
+                break
+            ch = m.group()
+            pos = m.end()
+            if ch == '"':
+                self._in_string = True
+                self._string_is_key = self._expecting_key
+                self._pem_begin = False
+                pos = self._scan_string(text, pos)
+            elif ch in "{[":
+                self._stack.append(ch)
+                self._expecting_key = ch == "{"
+            elif ch in "}]":
+                if self._stack:
+                    self._stack.pop()
+                self._expecting_key = False
+            elif ch == ",":
+                self._expecting_key = bool(self._stack) and self._stack[-1] == "{"
+            else:  # ":"
+                self._expecting_key = False
+        if self._result is not None:
+            return
+        self._pending = text[pos:]
+        if final:
+            # Truncated or malformed JSON: scan what is left as text
+            if self._in_string and not self._string_is_key:
+                self._string_parts.append(self._pending)
+                self._flush_string(final=True)
+            elif self._pending:
+                self._detected(scan_text(self._pending))
+            self._pending = ""
+            self._in_string = False
+
+    def _scan_string(self, text: str, pos: int) -> int:
+        """Consume an open string literal from pos; returns the new position.
+
+        Stops after the closing quote, or at the end of text (holding back
+        an incomplete escape) with the literal still open.
+        """
+        while True:
+            m = _JSON_STRING_BODY.match(text, pos)
+            pos = m.end()
+            if m.group() and not self._string_is_key:
+                self._string_parts.append(_decode_json_fragment(m.group()))
+            if pos < len(text) and text[pos] == '"':
+                self._in_string = False
+                if not self._string_is_key:
+                    self._flush_string(final=True)
+                self._string_parts = []
+                return pos + 1
+            if len(text) - pos < 6:
+                # End of chunk, possibly inside an escape sequence
+                if not self._string_is_key:
+                    self._flush_string(final=False)
+                return pos
+            # Malformed escape (e.g. \uZZZZ): keep it literally
+            if not self._string_is_key:
+                self._string_parts.append(text[pos:pos + 2])
+            pos += 2
+
+    def _flush_string(self, final: bool) -> None:
+        """Scan the decoded string content that ends on whitespace."""
+        content = "".join(self._string_parts)
+        if (
+            not final
+            and "-----BEGIN " in content
+            and "-----END " not in content
+            and len(content) <= _MAX_PEM_HOLD
+        ):
+            # Hold an opened PEM block until its footer arrives, so it is
+            # reported as PEM_BLOCK like scan_dict on the whole value
+            self._string_parts = [content]
+            return
+        window, rest = self._split_window(content, final)
+        self._string_parts = [rest] if rest else []
+        if window:
+            self._scan_window(window)
+
+    def _scan_text(self, final: bool) -> None:
+        window, self._pending = self._split_window(self._pending, final)
+        if window:
+            self._scan_window(window)
+
+    @staticmethod
+    def _split_window(text: str, final: bool) -> Tuple[str, str]:
+        """Split text into a window ending on whitespace and the rest."""
+        if final:
+            return text, ""
+        m = _WHITESPACE_TAIL.search(text)
+        if m is not None:
+            cut = m.end()
+        elif len(text) > _MAX_TEXT_WINDOW:
+            cut = len(text)
+        else:
+            return "", text
+        return text[:cut], text[cut:]
+
+    def _scan_window(self, window: str) -> None:
+        if "-----BEGIN " in window:
+            self._pem_begin = True
+        if self._pem_begin and "PRIVATE KEY-----" in window:
+            self._result = ScanResult("SECRET_DETECTED", "PEM_BLOCK", shannon_entropy(window), DETECTOR_VERSION)
+            return
+        self._detected(scan_text(window))
+
+
+def _decode_json_fragment(raw: str) -> str:
+    """Decode the escapes in part of a JSON string literal."""
+    try:
+        return json.loads(f'"{raw}"', strict=False)
+    except ValueError:
+        return raw
+
+
 def redact_for_logging(scan_result: ScanResult, request_id: str = "") -> dict:
     """Produce a redacted audit record suitable for logging.
 
@@ -0,0 +1,209 @@
+"""
+Startup warm-up for config-backed registries.
+
+Workflow plans, document type packages, mechanical operations and
+standalone schemas are read from combine-config/ on first use. Loading
+them while modules import made every process pay for them, including each
+test run. Instead the lifespan hook runs every loader concurrently in
+worker threads and awaits them before the server accepts requests, so no
+request sees a partially loaded registry.
+
+Usage:
+    state = await run_warmup()          # or start_warmup() in the background
+    state.to_dict()                      # {"status": "ready", "tasks": {...}}
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Task/overall states
+NOT_STARTED = "not_started"
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+
+
+# =============================================================================
+# Loaders
+# =============================================================================
+# Each loader populates a process-wide cache and returns how many items it
+# loaded. Imports are local so importing this module stays cheap.
+
+def _load_plans() -> int:
+    from app.domain.workflow.plan_registry import get_plan_registry
+    return len(get_plan_registry().list_ids())
+
+
+def _load_packages() -> int:
+    from app.config.package_loader import get_package_loader
+    loader = get_package_loader()
+    active = loader.get_active_releases()
+    for doc_type_id in active.document_types:
+        loader.get_document_type(doc_type_id)
+    return len(active.document_types)
+
+
+def _load_mechanical_ops() -> int:
+    from app.api.services.mechanical_ops_service import get_mechanical_ops_service
+    return get_mechanical_ops_service().compile_active_operations()
+
+
+def _load_schemas() -> int:
+    from app.config.package_loader import get_package_loader
+    loader = get_package_loader()
+    active = loader.get_active_releases()
+    for schema_id in active.schemas:
+        loader.get_schema(schema_id)
+    return len(active.schemas)
+
+
+DEFAULT_LOADERS: Dict[str, Callable[[], int]] = {
+    "plans": _load_plans,
+    "packages": _load_packages,
+    "mechanical_ops": _load_mechanical_ops,
+    "schemas": _load_schemas,
+}
+
+
+# =============================================================================
+# State
+# =============================================================================
+
+@dataclass
+class WarmupTask:
+    """Progress of one registry loader."""
+    name: str
+    status: str = PENDING
+    items: Optional[int] = None
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "items": self.items,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
+
+@dataclass
+class WarmupState:
+    """Progress of the startup warm-up."""
+    tasks: Dict[str, WarmupTask] = field(default_factory=dict)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def status(self) -> str:
+        """Overall status: not_started, running, ready or failed."""
+        if self.started_at is None:
+            return NOT_STARTED
+        if self.finished_at is None:
+            return RUNNING
+        if any(task.status == FAILED for task in self.tasks.values()):
+            return FAILED
+        return READY
+
+    @property
+    def complete(self) -> bool:
+        """True once every loader has finished, successfully or not."""
+        return self.finished_at is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        duration_ms = None
+        if self.started_at is not None and self.finished_at is not None:
+            duration_ms = round((self.finished_at - self.started_at) * 1000, 1)
+        return {
+            "status": self.status,
+            "duration_ms": duration_ms,
+            "tasks": {name: task.to_dict() for name, task in self.tasks.items()},
+        }
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+async def _run_task(task: WarmupTask, loader: Callable[[], int]) -> None:
+    task.status = RUNNING
+    start = time.perf_counter()
+    try:
+        task.items = await asyncio.to_thread(loader)
+        task.status = READY
+    except Exception as e:
+        # A failed warm-up is not fatal: the registry loads (and raises)
+        # again on first use.
+        task.status = FAILED
+        task.error = str(e)
+        logger.warning(f"Warm-up of {task.name} failed: {e}")
+    task.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+
+
+async def run_warmup(
+    loaders: Optional[Dict[str, Callable[[], int]]] = None,
+    state: Optional[WarmupState] = None,
+) -> WarmupState:
+    """
+    Run registry loaders concurrently and record their progress.
+
+    Args:
+        loaders: Dict of name -> loader (defaults to DEFAULT_LOADERS)
+        state: State to record into (defaults to the process-wide state)
+
+    Returns:
+        The completed WarmupState
+    """
+    loaders = DEFAULT_LOADERS if loaders is None else loaders
+    state = state if state is not None else get_warmup_state()
+
+    state.tasks = {name: WarmupTask(name=name) for name in loaders}
+    state.started_at = time.perf_counter()
+    state.finished_at = None
+
+    await asyncio.gather(*(
+        _run_task(state.tasks[name], loader) for name, loader in loaders.items()
+    ))
+
+    state.finished_at = time.perf_counter()
+    summary = ", ".join(
+        f"{task.name}={task.items} ({task.duration_ms}ms)" for task in state.tasks.values()
+    )
+    logger.info(f"Warm-up {state.status} in {state.to_dict()['duration_ms']}ms: {summary}")
+    return state
+
+
+def start_warmup(
+    loaders: Optional[Dict[str, Callable[[], int]]] = None,
+) -> "asyncio.Task[WarmupState]":
+    """Start the warm-up in the background on the running event loop."""
+    state = get_warmup_state()
+    # Mark as started immediately so readiness reports "running", not
+    # "not_started", before the task gets its first turn on the loop.
+    state.started_at = time.perf_counter()
+    state.finished_at = None
+    return asyncio.create_task(run_warmup(loaders, state), name="registry-warmup")
+
+
+# Module-level singleton
+_state: Optional[WarmupState] = None
+
+
+def get_warmup_state() -> WarmupState:
+    """Get the process-wide warm-up state."""
+    global _state
+    if _state is None:
+        _state = WarmupState()
+    return _state
+
+
+def reset_warmup_state() -> None:
+    """Reset the process-wide warm-up state (for testing)."""
+    global _state
+    _state = None
@@ -7,6 +7,7 @@ from .llm_logging import (
     LLMRunOutputRef,
     LLMRunError,
     LLMRunToolCall,
+    LLMCostDaily,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "LLMRunOutputRef",
     "LLMRunError",
     "LLMRunToolCall",
+    "LLMCostDaily",
 ]
\ No newline at end of file
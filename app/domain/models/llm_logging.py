@@ -7,12 +7,12 @@ The LLMExecutionLogger service uses raw SQL, but these models
 enable SQLAlchemy's Base.metadata.create_all() to work in tests.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
 from sqlalchemy import (
-    Column, String, Integer, Text, DateTime, Boolean,
+    Column, String, Integer, BigInteger, Text, Date, DateTime, Boolean,
     ForeignKey, Index, CheckConstraint, DECIMAL, text
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
@@ -583,3 +583,71 @@ class LLMRunToolCall(Base):
         Index("idx_llm_tool_call_status", "status"),
         {"comment": "Tool call tracking (ADR-010) - UNUSED IN MVP, reserved for future"}
     )
+
+
+class LLMCostDaily(Base):
+    """
+    Daily cost rollup of LLM runs.
+    
+    One row per UTC day of started_at and artifact_type ('' for runs
+    without one). run_count is incremented when a run starts, the other
+    totals when it completes; rebuilt from llm_run by the backfill
+    (app.domain.services.llm_cost_rollup).
+    """
+    
+    __tablename__ = "llm_cost_daily"
+    
+    day: Mapped[date] = Column(
+        Date,
+        primary_key=True,
+        doc="UTC date of llm_run.started_at"
+    )
+    
+    artifact_type: Mapped[str] = Column(
+        Text,
+        primary_key=True,
+        server_default="",
+        doc="llm_run.artifact_type, '' when NULL"
+    )
+    
+    run_count: Mapped[int] = Column(
+        Integer,
+        nullable=False,
+        server_default="0"
+    )
+    
+    error_count: Mapped[int] = Column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        doc="Runs completed with status FAILED"
+    )
+    
+    input_tokens: Mapped[int] = Column(
+        BigInteger,
+        nullable=False,
+        server_default="0"
+    )
+    
+    output_tokens: Mapped[int] = Column(
+        BigInteger,
+        nullable=False,
+        server_default="0"
+    )
+    
+    cost_usd: Mapped[float] = Column(
+        DECIMAL(14, 6),
+        nullable=False,
+        server_default="0"
+    )
+    
+    updated_at: Mapped[datetime] = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+    
+    __table_args__ = (
+        {"comment": "Daily LLM cost rollup for the cost dashboard"},
+    )
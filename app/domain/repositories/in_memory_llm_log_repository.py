@@ -4,9 +4,9 @@ In-memory implementation for Tier-1 tests.
 Real storage semantics, queryable, no DB dependency.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from uuid import UUID
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from dataclasses import replace
 
@@ -33,6 +33,7 @@ class InMemoryLLMLogRepository:
         self._input_refs: Dict[UUID, List[LLMInputRefRecord]] = {}
         self._output_refs: Dict[UUID, List[LLMOutputRefRecord]] = {}
         self._errors: Dict[UUID, List[LLMErrorRecord]] = {}
+        self._cost_daily: Dict[Tuple[date, str], Dict[str, Any]] = {}
         
         self._pending_runs: Dict[UUID, LLMRunRecord] = {}
         self._pending_content: Dict[UUID, LLMContentRecord] = {}
@@ -42,6 +43,8 @@ class InMemoryLLMLogRepository:
         self._pending_errors: List[LLMErrorRecord] = []
         self._pending_run_updates: Dict[UUID, Dict[str, Any]] = {}
         self._pending_content_touches: Dict[UUID, datetime] = {}
+        # (run_id, completed): a started run counts once, a completed one adds usage
+        self._pending_cost_rollups: List[Tuple[UUID, bool]] = []
     
     async def get_content_by_hash(self, content_hash: str) -> Optional[LLMContentRecord]:
         content_id = self._content_by_hash.get(content_hash)
@@ -111,6 +114,12 @@ class InMemoryLLMLogRepository:
             'primary_error_message': message,
         })
     
+    async def add_run_to_cost_rollup(self, run_id: UUID) -> None:
+        self._pending_cost_rollups.append((run_id, False))
+    
+    async def add_run_usage_to_cost_rollup(self, run_id: UUID) -> None:
+        self._pending_cost_rollups.append((run_id, True))
+    
     async def get_run(self, run_id: UUID) -> Optional[LLMRunRecord]:
         return self._runs.get(run_id)
     
@@ -179,6 +188,24 @@ class InMemoryLLMLogRepository:
                 self._errors[err.llm_run_id] = []
             self._errors[err.llm_run_id].append(err)
         self._pending_errors.clear()
+        
+        for run_id, completed in self._pending_cost_rollups:
+            run = self._runs.get(run_id)
+            if run is None:
+                continue
+            key = (run.started_at.astimezone(timezone.utc).date(), run.artifact_type or "")
+            row = self._cost_daily.setdefault(key, {
+                "run_count": 0, "error_count": 0,
+                "input_tokens": 0, "output_tokens": 0, "cost_usd": Decimal("0"),
+            })
+            if not completed:
+                row["run_count"] += 1
+                continue
+            row["error_count"] += 1 if run.status == "FAILED" else 0
+            row["input_tokens"] += run.input_tokens or 0
+            row["output_tokens"] += run.output_tokens or 0
+            row["cost_usd"] += Decimal(str(run.cost_usd or 0))
+        self._pending_cost_rollups.clear()
     
     async def rollback(self) -> None:
         self._pending_runs.clear()
@@ -189,6 +216,10 @@ class InMemoryLLMLogRepository:
         self._pending_errors.clear()
         self._pending_run_updates.clear()
         self._pending_content_touches.clear()
+        self._pending_cost_rollups.clear()
+    
+    def get_cost_daily(self) -> Dict[Tuple[date, str], Dict[str, Any]]:
+        return self._cost_daily
     
     def get_content_text(self, content_hash: str) -> Optional[str]:
         content_id = self._content_by_hash.get(content_hash)
@@ -207,6 +238,7 @@ class InMemoryLLMLogRepository:
         self._input_refs.clear()
         self._output_refs.clear()
         self._errors.clear()
+        self._cost_daily.clear()
         self._pending_runs.clear()
         self._pending_content.clear()
         self._pending_content_hash.clear()
@@ -215,3 +247,4 @@ class InMemoryLLMLogRepository:
         self._pending_errors.clear()
         self._pending_run_updates.clear()
         self._pending_content_touches.clear()
+        self._pending_cost_rollups.clear()
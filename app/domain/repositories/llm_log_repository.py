@@ -145,6 +145,14 @@ class LLMLogRepository(Protocol):
     ) -> None:
         ...
     
+    async def add_run_to_cost_rollup(self, run_id: UUID) -> None:
+        """Count a new run in the daily cost rollup (llm_cost_daily)."""
+        ...
+    
+    async def add_run_usage_to_cost_rollup(self, run_id: UUID) -> None:
+        """Add a completed run's errors, tokens and cost to the daily cost rollup."""
+        ...
+    
     async def get_run(self, run_id: UUID) -> Optional[LLMRunRecord]:
         ...
     
@@ -131,6 +131,20 @@ class PostgresLLMLogRepository:
             run.cost_usd = cost_usd
             run.run_metadata = metadata
     
+    async def add_run_to_cost_rollup(self, run_id: UUID) -> None:
+        from app.domain.services.llm_cost_rollup import build_run_started_statement
+        
+        # The run insert is still pending on the session
+        await self.db.flush()
+        await self.db.execute(build_run_started_statement(run_id))
+    
+    async def add_run_usage_to_cost_rollup(self, run_id: UUID) -> None:
+        from app.domain.services.llm_cost_rollup import build_run_completed_statement
+        
+        # The completion update is still pending on the session
+        await self.db.flush()
+        await self.db.execute(build_run_completed_statement(run_id))
+    
     async def bump_error_summary(
         self,
         run_id: UUID,
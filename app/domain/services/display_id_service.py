@@ -1,14 +1,16 @@
 """Display ID Service — minting and resolution for ADR-055 Document Identity Standard.
 
-Provides three functions:
+Provides four functions:
 - parse_display_id(): Pure parser, splits {TYPE}-{NNN} into (prefix, number_str)
 - resolve_display_id(): Resolves prefix to doc_type_id via document_types registry
 - mint_display_id(): Mints the next sequential display_id for a doc type in a space
+- reserve_display_ids(): Mints a batch of display_ids for several doc types in one query
 """
 
 import re
+from typing import Dict, List
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import Integer, and_, cast, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.models.document import Document
@@ -82,3 +84,57 @@ async def mint_display_id(db: AsyncSession, space_id: UUID, doc_type_id: str) ->
         next_num = 1
 
     return f"{prefix}-{next_num:03d}"
+
+
+async def reserve_display_ids(
+    db: AsyncSession,
+    space_id: UUID,
+    counts: Dict[str, int],
+) -> Dict[str, List[str]]:
+    """Mint display_ids for a batch of new documents in a space.
+
+    {'work_package': 3} -> {'work_package': ['WP-004', 'WP-005', 'WP-006']}
+
+    One query reads every prefix and current highest sequence number.
+    The maximum is taken numerically, so WP-1000 follows WP-999. Like
+    mint_display_id, this requires serialized access within a transaction.
+
+    Raises ValueError if a doc type has no display_prefix.
+    """
+    wanted = {doc_type_id: n for doc_type_id, n in counts.items() if n > 0}
+    if not wanted:
+        return {}
+
+    # NULL for display_ids not ending in -NNN, which MAX ignores
+    sequence = cast(func.substring(Document.display_id, r"-(\d+)$"), Integer)
+    result = await db.execute(
+        select(
+            DocumentType.doc_type_id,
+            DocumentType.display_prefix,
+            func.coalesce(func.max(sequence), 0),
+        )
+        .select_from(DocumentType)
+        .outerjoin(
+            Document,
+            and_(
+                Document.doc_type_id == DocumentType.doc_type_id,
+                Document.space_id == space_id,
+            ),
+        )
+        .where(DocumentType.doc_type_id.in_(sorted(wanted)))
+        .group_by(DocumentType.doc_type_id, DocumentType.display_prefix)
+    )
+
+    reserved: Dict[str, List[str]] = {}
+    for doc_type_id, prefix, max_num in result.all():
+        if not prefix:
+            continue
+        reserved[doc_type_id] = [
+            f"{prefix}-{num:03d}"
+            for num in range(max_num + 1, max_num + wanted[doc_type_id] + 1)
+        ]
+
+    missing = sorted(set(wanted) - set(reserved))
+    if missing:
+        raise ValueError(f"Document type {missing[0]!r} has no display_prefix.")
+    return reserved
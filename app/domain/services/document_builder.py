@@ -25,7 +25,6 @@ import json
 import asyncio
 import logging
 import httpx
-from anthropic import AsyncAnthropic
 
 from app.core.config import settings
 from app.domain.registry.loader import (
@@ -176,10 +175,26 @@ class DocumentBuilder:
         self.correlation_id = correlation_id  # Stored as UUID
         self.llm_logger = llm_logger  # ADR-010: Injected, not created here
         self.llm_parser = LLMResponseParser()
-        self.anthropic_client = AsyncAnthropic(
-            api_key=settings.ANTHROPIC_API_KEY,
-            timeout=httpx.Timeout(300.0, connect=10.0)
-        )
+        self._anthropic_client = None
+    
+    @property
+    def anthropic_client(self):
+        """Anthropic SDK client, created on first use.
+        
+        The SDK takes over a second to import, so it is kept out of the
+        import path of every router that depends on this module.
+        """
+        if self._anthropic_client is None:
+            from anthropic import AsyncAnthropic
+            self._anthropic_client = AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                timeout=httpx.Timeout(300.0, connect=10.0)
+            )
+        return self._anthropic_client
+    
+    @anthropic_client.setter
+    def anthropic_client(self, client) -> None:
+        self._anthropic_client = client
     
     # =========================================================================
     # PUBLIC API - Check Buildability
@@ -0,0 +1,232 @@
+"""
+Daily LLM cost rollup (llm_cost_daily).
+
+The cost dashboard used to load every llm_run row in its window and sum
+costs in Python. Runs are now added to a per-day, per-artifact type
+rollup instead, so the dashboard reads at most (days x artifact types)
+rows with one grouped query. Like the old query, every run counts as a
+call, whether or not it completes: the run is counted in the transaction
+that starts it, and its tokens, cost and FAILED status are added in the
+one that completes it.
+
+The rollup grows by increments; subtract_runs_from_cost_rollup() takes
+runs back out before they are deleted. backfill_cost_rollup() rebuilds a
+date range from llm_run and is the repair path if it drifts (e.g. a run
+completed twice, or rows written before the rollup existed).
+"""
+
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import case, delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models.llm_logging import LLMCostDaily, LLMRun
+
+logger = logging.getLogger(__name__)
+
+_ROLLUP_COLUMNS = [
+    "day",
+    "artifact_type",
+    "run_count",
+    "error_count",
+    "input_tokens",
+    "output_tokens",
+    "cost_usd",
+]
+
+
+def _run_day():
+    """UTC calendar day of llm_run.started_at."""
+    return func.date(func.timezone("UTC", LLMRun.started_at))
+
+
+def _failed():
+    return case((LLMRun.status == "FAILED", 1), else_=0)
+
+
+def _build_upsert(source):
+    stmt = pg_insert(LLMCostDaily).from_select(_ROLLUP_COLUMNS, source)
+    return stmt.on_conflict_do_update(
+        index_elements=[LLMCostDaily.day, LLMCostDaily.artifact_type],
+        set_={
+            "run_count": LLMCostDaily.run_count + stmt.excluded.run_count,
+            "error_count": LLMCostDaily.error_count + stmt.excluded.error_count,
+            "input_tokens": LLMCostDaily.input_tokens + stmt.excluded.input_tokens,
+            "output_tokens": LLMCostDaily.output_tokens + stmt.excluded.output_tokens,
+            "cost_usd": LLMCostDaily.cost_usd + stmt.excluded.cost_usd,
+            "updated_at": func.now(),
+        },
+    )
+
+
+def build_run_started_statement(run_id: UUID):
+    """INSERT ... SELECT ... ON CONFLICT counting one new run in its day's row."""
+    source = select(
+        _run_day(),
+        func.coalesce(LLMRun.artifact_type, ""),
+        literal(1),
+        literal(0),
+        literal(0),
+        literal(0),
+        literal(0),
+    ).where(LLMRun.id == run_id)
+    return _build_upsert(source)
+
+
+def build_run_completed_statement(run_id: UUID):
+    """INSERT ... SELECT ... ON CONFLICT adding a finished run's usage to its day's row."""
+    source = select(
+        _run_day(),
+        func.coalesce(LLMRun.artifact_type, ""),
+        literal(0),
+        _failed(),
+        func.coalesce(LLMRun.input_tokens, 0),
+        func.coalesce(LLMRun.output_tokens, 0),
+        func.coalesce(LLMRun.cost_usd, 0),
+    ).where(LLMRun.id == run_id)
+    return _build_upsert(source)
+
+
+async def subtract_runs_from_cost_rollup(db: AsyncSession, *run_filter) -> int:
+    """
+    Subtract llm_run rows from llm_cost_daily. Does NOT commit.
+
+    Call in the transaction that deletes the runs, before the delete, so
+    the rollup never counts a run that no longer exists. Days left with
+    no runs are removed.
+
+    Args:
+        db: Database session
+        run_filter: WHERE clauses selecting the runs (on LLMRun columns)
+
+    Returns:
+        Number of rollup rows updated
+    """
+    day = _run_day()
+    artifact_type = func.coalesce(LLMRun.artifact_type, "")
+    totals = (
+        select(
+            day.label("day"),
+            artifact_type.label("artifact_type"),
+            func.count().label("run_count"),
+            func.sum(_failed()).label("error_count"),
+            func.coalesce(func.sum(LLMRun.input_tokens), 0).label("input_tokens"),
+            func.coalesce(func.sum(LLMRun.output_tokens), 0).label("output_tokens"),
+            func.coalesce(func.sum(LLMRun.cost_usd), 0).label("cost_usd"),
+        )
+        .where(*run_filter)
+        .group_by(day, artifact_type)
+        .subquery()
+    )
+    result = await db.execute(
+        update(LLMCostDaily)
+        .where(
+            LLMCostDaily.day == totals.c.day,
+            LLMCostDaily.artifact_type == totals.c.artifact_type,
+        )
+        .values(
+            run_count=LLMCostDaily.run_count - totals.c.run_count,
+            error_count=LLMCostDaily.error_count - totals.c.error_count,
+            input_tokens=LLMCostDaily.input_tokens - totals.c.input_tokens,
+            output_tokens=LLMCostDaily.output_tokens - totals.c.output_tokens,
+            cost_usd=LLMCostDaily.cost_usd - totals.c.cost_usd,
+            updated_at=func.now(),
+        )
+    )
+    await db.execute(delete(LLMCostDaily).where(LLMCostDaily.run_count <= 0))
+    return result.rowcount or 0
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+async def backfill_cost_rollup(
+    db: AsyncSession,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> int:
+    """
+    Rebuild llm_cost_daily from llm_run for a date range. Does NOT commit.
+
+    Args:
+        db: Database session
+        start_date: First UTC day to rebuild (None for the beginning)
+        end_date: Last UTC day to rebuild, inclusive (None for today)
+
+    Returns:
+        Number of rollup rows written
+    """
+    day_filter = []
+    run_filter = []
+    if start_date is not None:
+        day_filter.append(LLMCostDaily.day >= start_date)
+        run_filter.append(LLMRun.started_at >= _day_start(start_date))
+    if end_date is not None:
+        day_filter.append(LLMCostDaily.day <= end_date)
+        run_filter.append(LLMRun.started_at < _day_start(end_date + timedelta(days=1)))
+
+    await db.execute(delete(LLMCostDaily).where(*day_filter))
+
+    day = _run_day()
+    artifact_type = func.coalesce(LLMRun.artifact_type, "")
+    source = (
+        select(
+            day,
+            artifact_type,
+            func.count(),
+            func.sum(_failed()),
+            func.coalesce(func.sum(LLMRun.input_tokens), 0),
+            func.coalesce(func.sum(LLMRun.output_tokens), 0),
+            func.coalesce(func.sum(LLMRun.cost_usd), 0),
+        )
+        .where(*run_filter)
+        .group_by(day, artifact_type)
+    )
+    result = await db.execute(pg_insert(LLMCostDaily).from_select(_ROLLUP_COLUMNS, source))
+    written = result.rowcount or 0
+    logger.info(f"Rebuilt llm_cost_daily {start_date or 'start'}..{end_date or 'today'}: {written} rows")
+    return written
+
+
+async def get_document_daily_costs(
+    db: AsyncSession,
+    start_date: date,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Document build totals per day since start_date, in one grouped query.
+
+    Args:
+        db: Database session
+        start_date: First UTC day to include
+
+    Returns:
+        Dict of "YYYY-MM-DD" -> {cost, tokens, calls, errors}
+    """
+    result = await db.execute(
+        select(
+            LLMCostDaily.day,
+            func.sum(LLMCostDaily.cost_usd).label("cost"),
+            func.sum(LLMCostDaily.input_tokens + LLMCostDaily.output_tokens).label("tokens"),
+            func.sum(LLMCostDaily.run_count).label("calls"),
+            func.sum(LLMCostDaily.error_count).label("errors"),
+        )
+        .where(
+            LLMCostDaily.day >= start_date,
+            LLMCostDaily.artifact_type != "",
+        )
+        .group_by(LLMCostDaily.day)
+    )
+    return {
+        row.day.strftime("%Y-%m-%d"): {
+            "cost": float(row.cost or 0),
+            "tokens": int(row.tokens or 0),
+            "calls": int(row.calls or 0),
+            "errors": int(row.errors or 0),
+        }
+        for row in result.all()
+    }
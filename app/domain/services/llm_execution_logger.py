@@ -79,13 +79,15 @@ class LLMExecutionLogger:
             schema_version=schema_version,
             schema_id=schema_id,
             schema_bundle_hash=schema_bundle_hash,
-            status="IN_PROGRESS",
+            status="IN_PROGRESS",
             workflow_execution_id=workflow_execution_id,
             started_at=datetime.now(timezone.utc),
         )
         
         try:
             await self.repo.insert_run(record)
+            # Counted now, so runs that never complete still show as calls
+            await self.repo.add_run_to_cost_rollup(run_id)
             await self.repo.commit()
             
             schema_info = f", schema: {schema_id}" if schema_id else ""
@@ -216,7 +218,7 @@ class LLMExecutionLogger:
             if cost_usd is None:
                 input_tokens = usage.get("input_tokens", 0)
                 output_tokens = usage.get("output_tokens", 0)
-                if input_tokens > 0 or output_tokens > 0:
+                if input_tokens > 0 or output_tokens > 0:
                     from app.domain.utils.pricing import calculate_cost
                     cost_usd = Decimal(str(calculate_cost(input_tokens, output_tokens)))
             
@@ -230,6 +232,8 @@ class LLMExecutionLogger:
                 cost_usd=cost_usd,
                 metadata=metadata,
             )
+            # Same transaction, so the rollup never counts an uncommitted run
+            await self.repo.add_run_usage_to_cost_rollup(run_id)
             await self.repo.commit()
             
             logger.info(f"[ADR-010] Completed LLM run {run_id}: {status} "
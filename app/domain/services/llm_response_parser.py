@@ -4,11 +4,20 @@ LLM Response Parser - Extract JSON from LLM responses using multiple strategies.
 This module provides parsing strategies to extract JSON artifacts from varied LLM
 output formats including clean JSON, markdown fences, and text with explanations.
 
+The default strategy makes one pass over the text with JsonSpanScanner,
+tracking bracket depth and string state to locate complete JSON objects and
+arrays, and then runs json.loads on the best candidate only: a span in a
+markdown code fence (the largest, as MarkdownFenceStrategy picks), else the
+first complete top-level span. The older strategies each re-read and
+re-parsed the whole response; they remain available for custom strategy
+lists.
+
 Author: D-1 (Senior Developer)
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, List, Sequence, Protocol
+from typing import Dict, Any, Optional, List, Sequence, Protocol, Tuple
 import json
 import re
 import logging
@@ -123,6 +132,203 @@ class FuzzyBoundaryStrategy:
         return None
 
 
+# Next opening bracket outside any JSON value
+_OPEN_RE = re.compile(r'[{\[]')
+# Everything up to the next bracket inside a JSON value, skipping over
+# complete strings; stops at a bracket, at the end, or at a string that
+# does not close before the end
+_SKIP_RE = re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+# Remainder of a JSON string up to (not including) its closing quote
+_STRING_BODY_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+# A code fence opening / closing around a JSON value (the same fences
+# MarkdownFenceStrategy accepts)
+_FENCE_OPEN_RE = re.compile(r'```(?:json)?$')
+_FENCE_CLOSE_RE = re.compile(r'\s*\n```')
+
+_decoder = json.JSONDecoder()
+_CLOSERS = {"}": "{", "]": "["}
+_PARSE_FAILED = object()
+
+
+def _is_fenced(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] is the whole content of a code fence."""
+    i = start
+    while i > 0 and text[i - 1].isspace():
+        i -= 1
+    if "\n" not in text[i:start] or not _FENCE_OPEN_RE.search(text, max(i - 7, 0), i):
+        return False
+    return _FENCE_CLOSE_RE.match(text, end) is not None
+
+
+class JsonSpanScanner:
+    """Locate complete JSON objects and arrays in text, in a single pass.
+
+    Tracks bracket nesting and string/escape state (brackets inside JSON
+    strings do not count) and records the span of every top-level value
+    that closes. Text can be fed in chunks; each chunk is scanned once.
+
+    Candidates are ranked as the old strategy chain ranked them: spans that
+    fill a ```/```json code fence first, largest first, then every other
+    span in text order. A top-level span is parsed as soon as it closes
+    until one succeeds, so the first complete value is usually ready when
+    the text ends.
+
+    If the text ends inside an unclosed structure (a truncated response)
+    and no top-level value closed, the result is whatever
+    FuzzyBoundaryStrategy makes of the text (outermost braces or
+    brackets), as before single-pass parsing; a cut-off document fails
+    rather than yielding one of its fragments.
+    """
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._chunk_starts: List[int] = []
+        self._length = 0
+        # (opening char, absolute offset) of each unclosed bracket
+        self._stack: List[Tuple[str, int]] = []
+        self._in_string = False
+        self._escape = False
+        # Complete top-level spans
+        self._spans: List[Tuple[int, int]] = []
+        self._parsed: Dict[Tuple[int, int], Any] = {}
+        self._have_value = False
+        self._saw_bracket = False
+
+    def feed(self, chunk: str) -> None:
+        """Scan the next piece of text."""
+        if not chunk:
+            return
+        base = self._length
+        self._chunk_starts.append(base)
+        self._chunks.append(chunk)
+        self._length += len(chunk)
+
+        stack = self._stack
+        n = len(chunk)
+        i = 0
+        while i < n:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    i += 1
+                    continue
+                j = _STRING_BODY_RE.match(chunk, i).end()
+                if j == n:
+                    break
+                if chunk[j] == '"':
+                    self._in_string = False
+                    i = j + 1
+                else:
+                    # Backslash at the end of the chunk: escapes the next one
+                    self._escape = True
+                    break
+            elif not stack:
+                m = _OPEN_RE.search(chunk, i)
+                if m is None:
+                    break
+                start = m.start()
+                self._saw_bracket = True
+                try:
+                    # A value complete within this chunk is located and
+                    # parsed in one step by the C decoder
+                    value, end = _decoder.raw_decode(chunk, start)
+                except ValueError:
+                    stack.append((m.group(), base + start))
+                    i = start + 1
+                else:
+                    self._parsed[(base + start, base + end)] = value
+                    self._close_top_level(base + start, base + end)
+                    i = end
+            else:
+                j = _SKIP_RE.match(chunk, i).end()
+                if j == n:
+                    break
+                c = chunk[j]
+                i = j + 1
+                if c == '"':
+                    self._in_string = True
+                elif c in "{[":
+                    stack.append((c, base + j))
+                else:
+                    opener, start = stack.pop()
+                    if opener != _CLOSERS[c]:
+                        # Mismatched bracket: this was not JSON
+                        stack.clear()
+                    elif not stack:
+                        self._close_top_level(start, base + i)
+
+    def result(self) -> Optional[Any]:
+        """Parse and return the best candidate value, or None if there is none."""
+        if self._stack and not self._spans:
+            return FuzzyBoundaryStrategy().parse(self.text)
+        for span in self._candidates():
+            value = self._parse(span)
+            if value is not _PARSE_FAILED:
+                return value
+        if self._saw_bracket:
+            return None
+        # No brackets at all: the whole text may still be a JSON scalar
+        try:
+            return json.loads(self.text)
+        except (json.JSONDecodeError, ValueError, TypeError):
+            return None
+
+    @property
+    def text(self) -> str:
+        """All text fed so far."""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+            self._chunk_starts = [0]
+        return self._chunks[0] if self._chunks else ""
+
+    def _close_top_level(self, start: int, end: int) -> None:
+        self._spans.append((start, end))
+        if not self._have_value:
+            self._have_value = self._parse((start, end)) is not _PARSE_FAILED
+
+    def _candidates(self) -> List[Tuple[int, int]]:
+        text = self.text
+        fenced = [span for span in self._spans if _is_fenced(text, *span)]
+        if not fenced:
+            return self._spans
+        # Largest fence first (ties keep text order), then the rest in order
+        fenced.sort(key=lambda span: span[0] - span[1])
+        return fenced + [span for span in self._spans if span not in fenced]
+
+    def _parse(self, span: Tuple[int, int]) -> Any:
+        value = self._parsed.get(span)
+        if value is None:
+            try:
+                value = json.loads(self._slice(*span))
+            except (json.JSONDecodeError, ValueError, TypeError):
+                value = _PARSE_FAILED
+            self._parsed[span] = value
+        return value
+
+    def _slice(self, start: int, end: int) -> str:
+        # Join only the chunks the span covers
+        first = bisect_right(self._chunk_starts, start) - 1
+        last = bisect_right(self._chunk_starts, end - 1)
+        offset = self._chunk_starts[first]
+        return "".join(self._chunks[first:last])[start - offset:end - offset]
+
+
+class SinglePassStrategy:
+    """Scan once for JSON spans and parse only the best candidate.
+
+    Covers what DirectParseStrategy, MarkdownFenceStrategy and
+    FuzzyBoundaryStrategy handle between them: clean JSON, JSON in a code
+    fence, and JSON surrounded by commentary.
+    """
+
+    def parse(self, text: str) -> Optional[Dict[str, Any]]:
+        """Parse the fenced, else the first, complete JSON value in text."""
+        scanner = JsonSpanScanner()
+        scanner.feed(text)
+        return scanner.result()
+
+
 class LLMResponseParser:
     """Parse JSON artifacts from LLM responses using multiple strategies."""
     
@@ -132,17 +338,13 @@ class LLMResponseParser:
         
         Args:
             strategies: Ordered list of strategies to try. If None, uses default:
-                       [DirectParseStrategy, MarkdownFenceStrategy, FuzzyBoundaryStrategy]
+                       [SinglePassStrategy]
                        
         Raises:
             ValueError: If strategies list is empty
         """
         if strategies is None:
-            strategies = [
-                DirectParseStrategy(),
-                MarkdownFenceStrategy(),
-                FuzzyBoundaryStrategy()
-            ]
+            strategies = [SinglePassStrategy()]
         
         if not strategies:
             raise ValueError("Parser requires at least one strategy")
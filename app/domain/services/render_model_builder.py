@@ -10,13 +10,19 @@ data structures. Channel-specific rendering happens downstream.
 
 import hashlib
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.api.services.document_definition_service import DocumentDefinitionService
 from app.api.services.component_registry_service import ComponentRegistryService
 from app.api.services.schema_registry_service import SchemaRegistryService
 from app.domain.services.render_model_pure import (
+    PointerStep,
+    compile_pointer,
+    resolve_steps,
     resolve_pointer,
     compute_schema_bundle_hash,
     collect_component_ids_from_sections,
@@ -284,6 +290,290 @@ class RenderModel:
         return result
 
 
+# =============================================================================
+# COMPILED RENDER PLANS
+# =============================================================================
+# Everything a render needs that depends only on the docdef version - the
+# sorted sections, each section's resolved schema_id and shape processor,
+# pre-parsed pointers and the schema bundle hash - is compiled once into a
+# RenderPlan. Rendering is then a single synchronous pass over the data.
+# =============================================================================
+
+# Seconds a cached plan is trusted. Accepted docdefs and components are
+# immutable, but the bundle hash follows the latest accepted schema
+# versions; this bounds staleness across workers that did not see the
+# invalidation.
+RENDER_PLAN_TTL_SECONDS = 300.0
+
+RENDER_PLAN_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class SectionPlan:
+    """
+    One docdef section compiled for rendering.
+
+    Attributes:
+        section_id: Section identifier
+        config: Section config from the docdef (read-only by convention)
+        schema_id: Schema id of the section's component, or None if missing
+        source_steps: Pre-parsed source_pointer
+        render: Shape processor preselected at compile time
+    """
+    section_id: str
+    config: Dict[str, Any] = field(repr=False)
+    schema_id: Optional[str]
+    source_steps: Tuple[PointerStep, ...]
+    render: Callable[["SectionPlan", Dict[str, Any]], List[RenderBlock]] = field(repr=False)
+
+    def to_render_section(self, blocks: List[RenderBlock]) -> RenderSection:
+        config = self.config
+        return RenderSection(
+            section_id=self.section_id,
+            title=config.get("title", ""),
+            order=config.get("order", 0),
+            description=config.get("description"),
+            blocks=blocks,
+            viewer_tab=config.get("viewer_tab", "details"),
+            sidecar_max_items=config.get("sidecar_max_items"),
+        )
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    """
+    A document definition compiled for rendering.
+
+    Attributes:
+        document_def_id: Full docdef ID
+        document_type: Short document type name
+        sections: Section plans, already sorted by order
+        section_count: Number of sections in the docdef
+        schema_bundle_sha256: Precomputed schema bundle hash
+    """
+    document_def_id: str
+    document_type: str
+    sections: Tuple[SectionPlan, ...]
+    section_count: int
+    schema_bundle_sha256: str
+
+    def render(
+        self,
+        document_data: Dict[str, Any],
+        document_id: str,
+        title: Optional[str] = None,
+        subtitle: Optional[str] = None,
+    ) -> RenderModel:
+        """Render document data. No I/O; raises only for missing components."""
+        render_sections: List[RenderSection] = []
+        for section in self.sections:
+            blocks = section.render(section, document_data)
+            # Per DOCUMENT_VIEWER_CONTRACT: omit empty sections
+            if blocks:
+                render_sections.append(section.to_render_section(blocks))
+
+        return RenderModel(
+            render_model_version="1.0",
+            schema_id="schema:RenderModelV1",
+            schema_bundle_sha256=self.schema_bundle_sha256,
+            document_id=document_id,
+            document_type=self.document_type,
+            title=title or document_data.get("title", self.document_type),
+            subtitle=subtitle,
+            sections=render_sections,
+            metadata={
+                "section_count": self.section_count,
+            },
+        )
+
+
+# Shape processors -------------------------------------------------------------
+
+def _render_single(plan: SectionPlan, document_data: Dict[str, Any]) -> List[RenderBlock]:
+    section = plan.config
+    data = resolve_steps(document_data, plan.source_steps)
+    if data is None:
+        return []
+
+    context_mapping = section.get("context", {})
+    static_context = context_mapping if context_mapping else None
+    block_data = data if isinstance(data, dict) else {"value": data}
+
+    detail_ref_template = section.get("detail_ref_template")
+    if detail_ref_template:
+        block_data = dict(block_data)
+        block_data["detail_ref"] = {
+            "document_type": detail_ref_template.get("document_type", ""),
+            "params": {
+                k: resolve_pointer(document_data, v)
+                for k, v in detail_ref_template.get("params", {}).items()
+            }
+        }
+
+    return [RenderBlock(
+        type=plan.schema_id,
+        key=f"{plan.section_id}:0",
+        data=block_data,
+        context=static_context,
+    )]
+
+
+def _render_list(plan: SectionPlan, document_data: Dict[str, Any]) -> List[RenderBlock]:
+    items = resolve_steps(document_data, plan.source_steps)
+    if not items or not isinstance(items, list):
+        return []
+
+    return [
+        RenderBlock(
+            type=plan.schema_id,
+            key=f"{plan.section_id}:{idx}",
+            data=item if isinstance(item, dict) else {"value": item},
+            context=None,
+        )
+        for idx, item in enumerate(items)
+    ]
+
+
+def _render_nested_list(plan: SectionPlan, document_data: Dict[str, Any]) -> List[RenderBlock]:
+    section = plan.config
+    block_descriptors = flatten_nested_list(
+        section_id=plan.section_id,
+        source_pointer=section.get("source_pointer", ""),
+        repeat_over_pointer=section["repeat_over"],
+        context_mapping=section.get("context", {}),
+        document_data=document_data,
+    )
+    return [
+        RenderBlock(type=plan.schema_id, key=bd["key"], data=bd["data"], context=bd["context"])
+        for bd in block_descriptors
+    ]
+
+
+def _render_container_simple(plan: SectionPlan, document_data: Dict[str, Any]) -> List[RenderBlock]:
+    items = resolve_steps(document_data, plan.source_steps)
+    if not items or not isinstance(items, list):
+        return []
+
+    context_mapping = plan.config.get("context", {})
+    return [RenderBlock(
+        type=plan.schema_id,
+        key=f"{plan.section_id}:container",
+        data={"items": [item if isinstance(item, dict) else {"value": item} for item in items]},
+        context=context_mapping if context_mapping else None,
+    )]
+
+
+def _render_container_repeat(plan: SectionPlan, document_data: Dict[str, Any]) -> List[RenderBlock]:
+    section = plan.config
+    block_descriptors = process_container_repeat(
+        section_id=plan.section_id,
+        source_pointer=section.get("source_pointer", ""),
+        repeat_over_pointer=section["repeat_over"],
+        context_mapping=section.get("context", {}),
+        derived_fields=section.get("derived_fields", []),
+        exclude_fields=section.get("exclude_fields", []),
+        detail_ref_template=section.get("detail_ref_template"),
+        derivation_functions=DERIVATION_FUNCTIONS,
+        document_data=document_data,
+    )
+    return [
+        RenderBlock(type=plan.schema_id, key=bd["key"], data=bd["data"], context=bd["context"])
+        for bd in block_descriptors
+    ]
+
+
+def _render_derived(plan: SectionPlan, document_data: Dict[str, Any]) -> List[RenderBlock]:
+    derived_from = plan.config["derived_from"]
+    func_name = derived_from.get("function")
+
+    derived_value = apply_derivation(
+        source_pointer=derived_from.get("source", ""),
+        func_name=func_name,
+        omit_when_empty=derived_from.get("omit_when_source_empty", False),
+        derivation_functions=DERIVATION_FUNCTIONS,
+        document_data=document_data,
+    )
+
+    if derived_value is None:
+        if func_name not in DERIVATION_FUNCTIONS:
+            logger.warning(f"Unknown derivation function: {func_name}")
+        return []
+
+    # The component is only required once there is a value to render
+    if plan.schema_id is None:
+        raise ComponentNotFoundError(f"Component not found: {plan.config.get('component_id')}")
+
+    context_mapping = plan.config.get("context", {})
+    return [RenderBlock(
+        type=plan.schema_id,
+        key=f"{plan.section_id}:derived",
+        data={"value": derived_value},
+        context=context_mapping if context_mapping else None,
+    )]
+
+
+def _render_nothing(plan: SectionPlan, document_data: Dict[str, Any]) -> List[RenderBlock]:
+    return []
+
+
+def _select_processor(
+    section: Dict[str, Any],
+) -> Callable[[SectionPlan, Dict[str, Any]], List[RenderBlock]]:
+    """Pick the shape processor for a section once, at compile time."""
+    section_id = section.get("section_id", "unknown")
+    shape = section.get("shape", "single")
+
+    if section.get("derived_from"):
+        return _render_derived
+    if shape == "single":
+        return _render_single
+    if shape == "list":
+        return _render_list
+    if shape == "nested_list":
+        if not section.get("repeat_over"):
+            logger.warning(f"nested_list shape requires repeat_over: {section_id}")
+            return _render_nothing
+        return _render_nested_list
+    if shape == "container":
+        return _render_container_repeat if section.get("repeat_over") else _render_container_simple
+
+    logger.warning(f"Unknown shape '{shape}' for section {section_id}")
+    return _render_nothing
+
+
+# Plan cache ---------------------------------------------------------------------
+
+_plan_cache: "OrderedDict[tuple, Tuple[float, RenderPlan]]" = OrderedDict()
+_plan_cache_lock = Lock()
+
+
+def _get_cached_plan(key: tuple) -> Optional[RenderPlan]:
+    with _plan_cache_lock:
+        entry = _plan_cache.get(key)
+        if entry is None:
+            return None
+        compiled_at, plan = entry
+        if time.monotonic() - compiled_at > RENDER_PLAN_TTL_SECONDS:
+            del _plan_cache[key]
+            return None
+        _plan_cache.move_to_end(key)
+        return plan
+
+
+def _put_cached_plan(key: tuple, plan: RenderPlan) -> None:
+    with _plan_cache_lock:
+        _plan_cache[key] = (time.monotonic(), plan)
+        _plan_cache.move_to_end(key)
+        while len(_plan_cache) > RENDER_PLAN_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+
+
+def invalidate_render_plans() -> None:
+    """Drop all cached render plans (call when docdefs, components or schemas change)."""
+    with _plan_cache_lock:
+        _plan_cache.clear()
+
+
 class RenderModelBuilder:
     """
     Builds RenderModels from document definitions and document data.
@@ -295,6 +585,10 @@ class RenderModelBuilder:
       - Creates RenderBlock(s) based on shape semantics
       - Groups blocks under RenderSection
     - Returns data-only RenderModel with nested sections structure
+    
+    The docdef-dependent work is compiled into a RenderPlan (see
+    compile_plan), cached per docdef version when every artifact it was
+    built from is accepted, and therefore immutable.
     """
     
     def __init__(
@@ -339,77 +633,110 @@ class RenderModelBuilder:
             DocDefNotFoundError: If document definition not found
             ComponentNotFoundError: If any component not found
         """
+        plan = await self.get_plan(document_def_id)
+        
+        # Compute document_id if not provided
+        if not document_id:
+            document_id = self._compute_document_id(plan.document_type, document_data)
+        
+        render_model = plan.render(
+            document_data,
+            document_id=document_id,
+            title=title,
+            subtitle=subtitle,
+        )
+        
+        total_blocks = sum(len(s.blocks) for s in render_model.sections)
+        logger.info(
+            f"Built RenderModel for {plan.document_type}: "
+            f"sections={len(render_model.sections)}, blocks={total_blocks}"
+        )
+        
+        return render_model
+    
+    async def get_plan(self, document_def_id: str) -> RenderPlan:
+        """
+        Get the compiled render plan for a document definition.
+        
+        Looks the docdef up, then serves its plan from cache or compiles it.
+        
+        Args:
+            document_def_id: Exact docdef ID or short name
+            
+        Returns:
+            RenderPlan
+            
+        Raises:
+            DocDefNotFoundError: If document definition not found
+            ComponentNotFoundError: If a non-derived section's component is missing
+        """
         # Resolve short name to full docdef ID if needed
         document_def_id = resolve_docdef_id(document_def_id)
 
-        # 1. Load document definition
         docdef = await self.docdef_service.get(document_def_id)
         if not docdef:
             raise DocDefNotFoundError(f"Document definition not found: {document_def_id}")
 
-        # Extract document_type from docdef ID
-        document_type = extract_document_type(document_def_id)
-        
-        # Compute document_id if not provided
-        if not document_id:
-            document_id = self._compute_document_id(document_type, document_data)
-        
-        # Compute schema bundle SHA256
-        schema_bundle_sha256 = await self._compute_schema_bundle_sha256(docdef)
-        
-        # Determine title
-        display_title = title or document_data.get("title", document_type)
-        
-        # 2. Process sections in order
-        sections_config = docdef.sections or []
-        sorted_sections = sort_sections(sections_config)
+        # Keyed by row identity: the same docdef id may be re-seeded as a new row
+        key = (document_def_id, getattr(docdef, "id", None), self.schema_service is not None)
+        plan = _get_cached_plan(key)
+        if plan is None:
+            plan, cacheable = await self.compile_plan(document_def_id, docdef)
+            if cacheable and key[1] is not None:
+                _put_cached_plan(key, plan)
+        return plan
+    
+    async def compile_plan(self, document_def_id: str, docdef) -> Tuple[RenderPlan, bool]:
+        """
+        Compile a docdef into a RenderPlan.
         
-        render_sections: List[RenderSection] = []
+        Each component and schema is fetched once, however many sections
+        reference it.
         
-        for section_config in sorted_sections:
-            section_blocks = await self._process_section(
-                section=section_config,
-                document_data=document_data,
-            )
+        Args:
+            document_def_id: Full docdef ID
+            docdef: Loaded document definition
             
-            # Per DOCUMENT_VIEWER_CONTRACT: omit empty sections
-            if not section_blocks:
-                continue
+        Returns:
+            (plan, cacheable) - cacheable is True when the docdef and all of
+            its components are accepted
             
-            # Create RenderSection
-            render_section = RenderSection(
-                section_id=section_config.get("section_id", "unknown"),
-                title=section_config.get("title", ""),
-                order=section_config.get("order", 0),
-                description=section_config.get("description"),
-                blocks=section_blocks,
-                viewer_tab=section_config.get("viewer_tab", "details"),
-                sidecar_max_items=section_config.get("sidecar_max_items"),
-            )
-            render_sections.append(render_section)
+        Raises:
+            ComponentNotFoundError: If a non-derived section's component is missing
+        """
+        sections_config = docdef.sections or []
         
-        # Build render model with envelope fields
-        render_model = RenderModel(
-            render_model_version="1.0",
-            schema_id="schema:RenderModelV1",
-            schema_bundle_sha256=schema_bundle_sha256,
-            document_id=document_id,
-            document_type=document_type,
-            title=display_title,
-            subtitle=subtitle,
-            sections=render_sections,
-            metadata={
-                "section_count": len(sections_config),
-            },
-        )
+        components: Dict[str, Any] = {}
+        for comp_id in collect_component_ids_from_sections(sections_config):
+            components[comp_id] = await self.component_service.get(comp_id)
         
-        total_blocks = sum(len(s.blocks) for s in render_sections)
-        logger.info(
-            f"Built RenderModel for {document_type}: "
-            f"sections={len(render_sections)}, blocks={total_blocks}"
+        cacheable = getattr(docdef, "status", None) == "accepted" and all(
+            c is not None and getattr(c, "status", None) == "accepted"
+            for c in components.values()
         )
         
-        return render_model
+        section_plans = []
+        for section in sort_sections(sections_config):
+            component = components.get(section.get("component_id"))
+            if component is None and not section.get("derived_from"):
+                raise ComponentNotFoundError(f"Component not found: {section.get('component_id')}")
+            
+            section_plans.append(SectionPlan(
+                section_id=section.get("section_id", "unknown"),
+                config=section,
+                schema_id=component.schema_id if component else None,
+                source_steps=compile_pointer(section.get("source_pointer", "")),
+                render=_select_processor(section),
+            ))
+        
+        plan = RenderPlan(
+            document_def_id=document_def_id,
+            document_type=extract_document_type(document_def_id),
+            sections=tuple(section_plans),
+            section_count=len(sections_config),
+            schema_bundle_sha256=await self._compute_schema_bundle_sha256(components),
+        )
+        return plan, cacheable
     
     def _compute_document_id(
         self,
@@ -456,22 +783,17 @@ class RenderModelBuilder:
     
     async def _compute_schema_bundle_sha256(
         self,
-        docdef,
+        components: Dict[str, Any],
     ) -> str:
         """
         Compute SHA256 hash of schema bundle for this document.
 
-        Collects all component schemas and hashes the bundle.
+        Hashes the schemas of the docdef's (already fetched) components.
         """
-        sections = docdef.sections or []
-
-        # Collect unique component IDs using pure helper
-        component_ids = collect_component_ids_from_sections(sections)
-
-        # Build schema bundle (I/O: fetches components and schemas)
+        # Build schema bundle (I/O: fetches schemas)
         bundle: Dict[str, Any] = {"schemas": {}}
-        for comp_id in sorted(component_ids):
-            component = await self.component_service.get(comp_id)
+        for comp_id in sorted(components):
+            component = components[comp_id]
             if component and component.schema_id:
                 # Try to get full schema if service available
                 if self.schema_service:
@@ -490,208 +812,6 @@ class RenderModelBuilder:
         # Compute hash using pure function
         return compute_schema_bundle_hash(bundle)
     
-    async def _process_section(
-        self,
-        section: Dict[str, Any],
-        document_data: Dict[str, Any],
-    ) -> List[RenderBlock]:
-        section_id = section.get("section_id", "unknown")
-        component_id = section.get("component_id")
-        shape = section.get("shape", "single")
-        derived_from = section.get("derived_from")
-        context_mapping = section.get("context", {})
-        
-        if derived_from:
-            return await self._process_derived_section(
-                section_id=section_id,
-                component_id=component_id,
-                derived_from=derived_from,
-                document_data=document_data,
-                context_mapping=context_mapping,
-            )
-        
-        component = await self.component_service.get(component_id)
-        if not component:
-            raise ComponentNotFoundError(f"Component not found: {component_id}")
-        
-        schema_id = component.schema_id
-        
-        shape_handlers = {
-            "single": self._process_single_shape,
-            "list": self._process_list_shape,
-            "nested_list": self._process_nested_list_shape,
-            "container": self._process_container_shape,
-        }
-        
-        handler = shape_handlers.get(shape)
-        if handler:
-            return handler(section, schema_id, document_data)
-        
-        logger.warning(f"Unknown shape '{shape}' for section {section_id}")
-        return []
-    def _process_single_shape(
-        self,
-        section: Dict[str, Any],
-        schema_id: str,
-        document_data: Dict[str, Any],
-    ) -> List[RenderBlock]:
-        section_id = section.get("section_id", "unknown")
-        source_pointer = section.get("source_pointer", "")
-        context_mapping = section.get("context", {})
-        
-        data = self._resolve_pointer(document_data, source_pointer)
-        if data is None:
-            return []
-        
-        static_context = context_mapping if context_mapping else None
-        block_data = data if isinstance(data, dict) else {"value": data}
-        
-        detail_ref_template = section.get("detail_ref_template")
-        if detail_ref_template:
-            block_data = dict(block_data) if isinstance(block_data, dict) else {"value": block_data}
-            block_data["detail_ref"] = {
-                "document_type": detail_ref_template.get("document_type", ""),
-                "params": {
-                    k: self._resolve_pointer(document_data, v) 
-                    for k, v in detail_ref_template.get("params", {}).items()
-                }
-            }
-        
-        return [RenderBlock(
-            type=schema_id,
-            key=f"{section_id}:0",
-            data=block_data,
-            context=static_context,
-        )]
-    def _process_list_shape(
-        self,
-        section: Dict[str, Any],
-        schema_id: str,
-        document_data: Dict[str, Any],
-    ) -> List[RenderBlock]:
-        section_id = section.get("section_id", "unknown")
-        source_pointer = section.get("source_pointer", "")
-        
-        items = self._resolve_pointer(document_data, source_pointer)
-        if not items or not isinstance(items, list):
-            return []
-        
-        blocks = []
-        for idx, item in enumerate(items):
-            item_data = item if isinstance(item, dict) else {"value": item}
-            blocks.append(RenderBlock(
-                type=schema_id,
-                key=f"{section_id}:{idx}",
-                data=item_data,
-                context=None,
-            ))
-        return blocks
-
-    def _process_nested_list_shape(
-        self,
-        section: Dict[str, Any],
-        schema_id: str,
-        document_data: Dict[str, Any],
-    ) -> List[RenderBlock]:
-        section_id = section.get("section_id", "unknown")
-        source_pointer = section.get("source_pointer", "")
-        repeat_over = section.get("repeat_over")
-        context_mapping = section.get("context", {})
-
-        if not repeat_over:
-            logger.warning(f"nested_list shape requires repeat_over: {section_id}")
-            return []
-
-        block_descriptors = flatten_nested_list(
-            section_id=section_id,
-            source_pointer=source_pointer,
-            repeat_over_pointer=repeat_over,
-            context_mapping=context_mapping,
-            document_data=document_data,
-        )
-
-        return [
-            RenderBlock(
-                type=schema_id,
-                key=bd["key"],
-                data=bd["data"],
-                context=bd["context"],
-            )
-            for bd in block_descriptors
-        ]
-    def _process_container_shape(
-        self,
-        section: Dict[str, Any],
-        schema_id: str,
-        document_data: Dict[str, Any],
-    ) -> List[RenderBlock]:
-        repeat_over = section.get("repeat_over")
-        
-        if repeat_over:
-            return self._process_container_with_repeat(section, schema_id, document_data)
-        else:
-            return self._process_container_simple(section, schema_id, document_data)
-
-    def _process_container_simple(
-        self,
-        section: Dict[str, Any],
-        schema_id: str,
-        document_data: Dict[str, Any],
-    ) -> List[RenderBlock]:
-        section_id = section.get("section_id", "unknown")
-        source_pointer = section.get("source_pointer", "")
-        context_mapping = section.get("context", {})
-        
-        items = self._resolve_pointer(document_data, source_pointer)
-        if not items or not isinstance(items, list):
-            return []
-        
-        processed_items = []
-        for item in items:
-            item_data = item if isinstance(item, dict) else {"value": item}
-            processed_items.append(item_data)
-        
-        static_context = context_mapping if context_mapping else None
-        
-        return [RenderBlock(
-            type=schema_id,
-            key=f"{section_id}:container",
-            data={"items": processed_items},
-            context=static_context,
-        )]
-    def _process_container_with_repeat(
-        self,
-        section: Dict[str, Any],
-        schema_id: str,
-        document_data: Dict[str, Any],
-    ) -> List[RenderBlock]:
-        section_id = section.get("section_id", "unknown")
-        source_pointer = section.get("source_pointer", "")
-        repeat_over = section.get("repeat_over")
-        context_mapping = section.get("context", {})
-        derived_fields = section.get("derived_fields", [])
-
-        block_descriptors = process_container_repeat(
-            section_id=section_id,
-            source_pointer=source_pointer,
-            repeat_over_pointer=repeat_over,
-            context_mapping=context_mapping,
-            derived_fields=derived_fields,
-            exclude_fields=section.get("exclude_fields", []),
-            detail_ref_template=section.get("detail_ref_template"),
-            derivation_functions=DERIVATION_FUNCTIONS,
-            document_data=document_data,
-        )
-
-        return [
-            RenderBlock(
-                type=schema_id,
-                key=bd["key"],
-                data=bd["data"],
-                context=bd["context"],
-            )
-            for bd in block_descriptors
-        ]
     def _build_parent_as_data(
         self,
         section: Dict[str, Any],
@@ -705,60 +825,6 @@ class RenderModelBuilder:
             detail_ref_template=section.get("detail_ref_template"),
             derivation_functions=DERIVATION_FUNCTIONS,
         )
-
-    async def _process_derived_section(
-        self,
-        section_id: str,
-        component_id: str,
-        derived_from: Dict[str, Any],
-        document_data: Dict[str, Any],
-        context_mapping: Dict[str, Any],
-    ) -> List[RenderBlock]:
-        """
-        Process a derived section using frozen derivation rules.
-
-        Args:
-            section_id: Section identifier
-            component_id: Component to use for rendering
-            derived_from: {"function": "risk_level", "source": "/risks"}
-            document_data: Full document data
-            context_mapping: Static context from section config
-
-        Returns:
-            List containing single RenderBlock with derived value
-        """
-        func_name = derived_from.get("function")
-        source_pointer = derived_from.get("source", "")
-        omit_when_empty = derived_from.get("omit_when_source_empty", False)
-
-        # Apply derivation using pure function
-        derived_value = apply_derivation(
-            source_pointer=source_pointer,
-            func_name=func_name,
-            omit_when_empty=omit_when_empty,
-            derivation_functions=DERIVATION_FUNCTIONS,
-            document_data=document_data,
-        )
-
-        if derived_value is None:
-            if func_name not in DERIVATION_FUNCTIONS:
-                logger.warning(f"Unknown derivation function: {func_name}")
-            return []
-
-        # Resolve component to get schema_id (I/O)
-        component = await self.component_service.get(component_id)
-        if not component:
-            raise ComponentNotFoundError(f"Component not found: {component_id}")
-
-        schema_id = component.schema_id
-        static_context = context_mapping if context_mapping else None
-
-        return [RenderBlock(
-            type=schema_id,
-            key=f"{section_id}:derived",
-            data={"value": derived_value},
-            context=static_context,
-        )]
     
     def _resolve_pointer(
         self,
@@ -783,24 +849,3 @@ class RenderModelBuilder:
         Delegates to pure build_context function.
         """
         return build_context(parent, context_mapping)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
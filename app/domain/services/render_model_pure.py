@@ -9,41 +9,66 @@ Extracted as part of WS-CRAP-005: Testability Refactoring.
 
 import hashlib
 import json
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Tuple
 
 
 # ---------------------------------------------------------------------------
 # resolve_pointer  (was RenderModelBuilder._resolve_pointer, CC 9)
 # ---------------------------------------------------------------------------
 
-def resolve_pointer(data: Dict[str, Any], pointer: str) -> Any:
+# A parsed pointer step: the raw token (dict key) and its list index, or
+# None when the token is not an integer.
+PointerStep = Tuple[str, Optional[int]]
+
+
+@lru_cache(maxsize=1024)
+def compile_pointer(pointer: str) -> Tuple[PointerStep, ...]:
     """
-    Resolve a JSON pointer against data.
+    Parse a JSON pointer into steps once; "" and "/" parse to no steps.
 
     Args:
-        data: Data object to resolve against
         pointer: JSON pointer (e.g., "/epics", "/open_questions")
 
     Returns:
-        Resolved value or None if not found
+        Tuple of (token, index) steps; empty tokens are dropped
     """
     if not pointer or pointer == "/":
-        return data
+        return ()
 
-    parts = pointer.lstrip("/").split("/")
-
-    current = data
-    for part in parts:
+    steps = []
+    for part in pointer.lstrip("/").split("/"):
         if not part:
             continue
+        try:
+            index: Optional[int] = int(part)
+        except ValueError:
+            index = None
+        steps.append((part, index))
+    return tuple(steps)
 
+
+def resolve_steps(data: Any, steps: Tuple[PointerStep, ...]) -> Any:
+    """
+    Resolve pre-parsed pointer steps against data.
+
+    Args:
+        data: Data object to resolve against
+        steps: Steps from compile_pointer
+
+    Returns:
+        Resolved value or None if not found
+    """
+    current = data
+    for part, index in steps:
         if isinstance(current, dict):
             current = current.get(part)
         elif isinstance(current, list):
+            if index is None:
+                return None
             try:
-                idx = int(part)
-                current = current[idx]
-            except (ValueError, IndexError):
+                current = current[index]
+            except IndexError:
                 return None
         else:
             return None
@@ -54,6 +79,20 @@ def resolve_pointer(data: Dict[str, Any], pointer: str) -> Any:
     return current
 
 
+def resolve_pointer(data: Dict[str, Any], pointer: str) -> Any:
+    """
+    Resolve a JSON pointer against data.
+
+    Args:
+        data: Data object to resolve against
+        pointer: JSON pointer (e.g., "/epics", "/open_questions")
+
+    Returns:
+        Resolved value or None if not found
+    """
+    return resolve_steps(data, compile_pointer(pointer))
+
+
 # ---------------------------------------------------------------------------
 # compute_schema_bundle_hash  (was part of _compute_schema_bundle_sha256, CC 11)
 # ---------------------------------------------------------------------------
@@ -3,109 +3,261 @@ Staleness Service for ADR-036 / WS-DOCUMENT-SYSTEM-CLEANUP Phase 4.
 
 Propagates staleness to downstream documents when upstream documents change.
 Staleness is informational, not destructive - documents remain viewable.
+
+The dependency graph is compiled from the active document type packages
+(``required_inputs``) with its transitive closure precomputed, and is
+rebuilt whenever the package loader reloads config. Source saves can be
+queued and flushed together: any number of sources in one transaction
+produce a single set-based UPDATE.
 """
 
 import logging
-from typing import Dict, List
+from dataclasses import dataclass
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import update, select, and_
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.models.document import Document
 
 logger = logging.getLogger(__name__)
 
+# Lifecycle states that can become stale (ADR-036)
+STALEABLE_STATES = ("partial", "complete")
+
 
 # =============================================================================
-# DEPENDENCY GRAPH (Per WS-DOCUMENT-SYSTEM-CLEANUP)
+# DEPENDENCY GRAPH (compiled from package manifests)
 # =============================================================================
-# This graph defines which document types depend on which.
-# When an upstream document changes, direct dependents are marked stale.
-# Staleness does NOT cascade (only direct dependents).
 
-DOCUMENT_TYPE_DEPENDENCIES: Dict[str, List[str]] = {
-    # doc_type_id -> list of doc_type_ids that depend on it
-    "project_discovery": ["technical_architecture"],
-    # technical_architecture has no downstream dependents
-}
+@dataclass(frozen=True)
+class DependencyGraph:
+    """
+    Document type dependency graph.
+
+    Attributes:
+        dependents: doc_type_id -> types that list it in required_inputs
+        upstream: doc_type_id -> its required_inputs
+        closure: doc_type_id -> every type reachable through dependents
+    """
+    dependents: Mapping[str, FrozenSet[str]]
+    upstream: Mapping[str, FrozenSet[str]]
+    closure: Mapping[str, FrozenSet[str]]
+
+    def downstream(self, doc_type_id: str, transitive: bool = False) -> FrozenSet[str]:
+        """Types to mark stale when doc_type_id changes."""
+        source = self.closure if transitive else self.dependents
+        return source.get(doc_type_id, frozenset())
+
+
+def build_dependency_graph(required_inputs: Mapping[str, Iterable[str]]) -> DependencyGraph:
+    """
+    Compile a dependency graph from each type's required inputs.
+
+    Pure function - no I/O, no side effects. Cycles are tolerated: a type
+    on a cycle is in its own closure.
+
+    Args:
+        required_inputs: doc_type_id -> doc_type_ids it requires
+
+    Returns:
+        DependencyGraph
+    """
+    upstream: Dict[str, FrozenSet[str]] = {}
+    dependents: Dict[str, Set[str]] = {}
+    for doc_type_id, inputs in required_inputs.items():
+        upstream[doc_type_id] = frozenset(inputs or ())
+        for input_type in upstream[doc_type_id]:
+            dependents.setdefault(input_type, set()).add(doc_type_id)
+
+    closure: Dict[str, FrozenSet[str]] = {}
+    for doc_type_id in dependents:
+        reached: Set[str] = set()
+        stack = list(dependents[doc_type_id])
+        while stack:
+            current = stack.pop()
+            if current in reached:
+                continue
+            reached.add(current)
+            stack.extend(dependents.get(current, ()))
+        closure[doc_type_id] = frozenset(reached)
+
+    return DependencyGraph(
+        dependents=MappingProxyType({k: frozenset(v) for k, v in dependents.items()}),
+        upstream=MappingProxyType(upstream),
+        closure=MappingProxyType(closure),
+    )
+
+
+def load_dependency_graph(loader=None) -> DependencyGraph:
+    """
+    Compile the graph from the active document type packages.
+
+    Args:
+        loader: PackageLoader (defaults to the shared instance)
+    """
+    from app.config.package_loader import PackageLoaderError, get_package_loader
+
+    loader = loader or get_package_loader()
+    required_inputs: Dict[str, List[str]] = {}
+    for doc_type_id in loader.get_active_releases().document_types:
+        try:
+            package = loader.get_document_type(doc_type_id)
+        except PackageLoaderError as e:
+            logger.warning(f"Skipping {doc_type_id} in dependency graph: {e}")
+            continue
+        required_inputs[doc_type_id] = list(package.required_inputs)
+    return build_dependency_graph(required_inputs)
+
+
+# Module-level cache, rebuilt when the loader's config generation changes
+_graph: Optional[DependencyGraph] = None
+_graph_generation: Optional[int] = None
+_graph_lock = Lock()
+
 
+def get_dependency_graph() -> DependencyGraph:
+    """Get the dependency graph for the active config."""
+    global _graph, _graph_generation
+    from app.config.package_loader import get_package_loader
 
-def get_downstream_types(doc_type_id: str) -> List[str]:
+    loader = get_package_loader()
+    generation = getattr(loader, "generation", 0)
+    with _graph_lock:
+        if _graph is None or _graph_generation != generation:
+            _graph = load_dependency_graph(loader)
+            _graph_generation = generation
+        return _graph
+
+
+def reset_dependency_graph() -> None:
+    """Drop the cached graph (for testing)."""
+    global _graph, _graph_generation
+    with _graph_lock:
+        _graph = None
+        _graph_generation = None
+
+
+def get_downstream_types(doc_type_id: str, transitive: bool = False) -> List[str]:
     """
-    Get document types that directly depend on the given type.
-    
-    Per ADR-036: Only direct dependents, no cascading.
+    Get document types that depend on the given type.
+
+    Per ADR-036 only direct dependents are marked by default;
+    transitive=True includes every type reachable through them.
     """
-    return DOCUMENT_TYPE_DEPENDENCIES.get(doc_type_id, [])
+    return sorted(get_dependency_graph().downstream(doc_type_id, transitive))
 
 
 class StalenessService:
     """
     Service for propagating staleness to downstream documents.
-    
+
     Per ADR-036:
     - Staleness is informational, not destructive
     - Documents remain fully renderable when stale
     - No auto-regeneration triggered
-    - Only direct dependents are marked (no cascade)
+    - Only direct dependents are marked unless transitive mode is on
+
+    Usage (batched):
+        service.queue(doc_a)
+        service.queue(doc_b)
+        marked = await service.flush()      # one UPDATE
     """
-    
-    def __init__(self, db: AsyncSession):
-        self.db = db
-    
-    async def propagate_staleness(
+
+    def __init__(
         self,
-        source_document: Document,
-    ) -> int:
+        db: AsyncSession,
+        transitive: bool = False,
+        graph: Optional[DependencyGraph] = None,
+    ):
         """
-        Mark downstream documents as stale when source document changes.
-        
+        Initialize service.
+
         Args:
-            source_document: The document that was just saved/updated
-            
+            db: Database session
+            transitive: Also mark dependents of dependents
+            graph: Dependency graph (defaults to the active config's)
+        """
+        self.db = db
+        self.transitive = transitive
+        self._graph = graph
+        # (space_type, space_id, doc_type_id) of queued source saves
+        self._pending: Set[Tuple[str, UUID, str]] = set()
+
+    @property
+    def graph(self) -> DependencyGraph:
+        if self._graph is None:
+            self._graph = get_dependency_graph()
+        return self._graph
+
+    @property
+    def pending_count(self) -> int:
+        """Number of distinct queued sources."""
+        return len(self._pending)
+
+    def queue(self, source_document: Document) -> None:
+        """Queue a saved document for the next flush."""
+        self._pending.add((
+            source_document.space_type,
+            source_document.space_id,
+            source_document.doc_type_id,
+        ))
+
+    async def flush(self, transitive: Optional[bool] = None) -> int:
+        """
+        Mark downstream documents of every queued source stale.
+
+        Issues one UPDATE for all queued sources. Documents of a type that
+        was itself queued in the same space are left alone: they were saved
+        in this batch.
+
+        Args:
+            transitive: Override the service's transitive mode
+
         Returns:
             Count of documents marked stale
         """
-        # Get downstream document types
-        downstream_types = get_downstream_types(source_document.doc_type_id)
-        
-        if not downstream_types:
-            logger.debug(
-                f"No downstream types for {source_document.doc_type_id}, "
-                "skipping staleness propagation"
-            )
+        pending, self._pending = self._pending, set()
+        transitive = self.transitive if transitive is None else transitive
+
+        targets = plan_staleness_targets(pending, self.graph, transitive)
+        if not targets:
+            logger.debug("No downstream types for queued sources, skipping staleness propagation")
             return 0
-        
-        # Find downstream documents in the same space that are not already stale
-        # Per ADR-036: Only mark documents that are 'partial' or 'complete'
-        result = await self.db.execute(
-            update(Document)
-            .where(
-                and_(
-                    Document.space_type == source_document.space_type,
-                    Document.space_id == source_document.space_id,
-                    Document.doc_type_id.in_(downstream_types),
-                    Document.is_latest == True,
-                    Document.lifecycle_state.in_(['partial', 'complete']),
-                )
-            )
-            .values(
-                lifecycle_state='stale',
-                is_stale=True,  # Keep legacy field in sync
-            )
-        )
-        
+
+        result = await self.db.execute(build_staleness_update(targets))
         count = result.rowcount
-        
+
         if count > 0:
             logger.info(
                 f"Marked {count} downstream documents as stale "
-                f"(source: {source_document.doc_type_id} in space {source_document.space_id})"
+                f"({len(pending)} sources across {len(targets)} spaces, transitive={transitive})"
             )
-        
         return count
-    
+
+    async def propagate_staleness(
+        self,
+        source_document: Document,
+        transitive: Optional[bool] = None,
+    ) -> int:
+        """
+        Mark downstream documents as stale when source document changes.
+
+        Flushes anything already queued in the same UPDATE.
+
+        Args:
+            source_document: The document that was just saved/updated
+            transitive: Override the service's transitive mode
+
+        Returns:
+            Count of documents marked stale
+        """
+        self.queue(source_document)
+        return await self.flush(transitive=transitive)
+
     async def get_stale_documents(
         self,
         space_type: str,
@@ -113,11 +265,11 @@ class StalenessService:
     ) -> List[Document]:
         """
         Get all stale documents in a space.
-        
+
         Args:
             space_type: Space type (project, org, team)
             space_id: Space UUID
-            
+
         Returns:
             List of stale documents
         """
@@ -128,21 +280,82 @@ class StalenessService:
             .where(Document.lifecycle_state == 'stale')
             .where(Document.is_latest == True)
         )
-        
+
         result = await self.db.execute(query)
         return list(result.scalars().all())
-    
+
     async def get_upstream_dependencies(
         self,
         doc_type_id: str,
     ) -> List[str]:
         """
-        Get document types that this type depends on.
-        
-        Inverse of DOCUMENT_TYPE_DEPENDENCIES.
+        Get document types that this type depends on (its required_inputs).
         """
-        upstream = []
-        for source, dependents in DOCUMENT_TYPE_DEPENDENCIES.items():
-            if doc_type_id in dependents:
-                upstream.append(source)
-        return upstream
\ No newline at end of file
+        return sorted(self.graph.upstream.get(doc_type_id, frozenset()))
+
+
+# =============================================================================
+# STATEMENT BUILDING (pure)
+# =============================================================================
+
+def plan_staleness_targets(
+    sources: Iterable[Tuple[str, UUID, str]],
+    graph: DependencyGraph,
+    transitive: bool = False,
+) -> Dict[Tuple[str, UUID], FrozenSet[str]]:
+    """
+    Group the downstream types of queued sources by space.
+
+    Pure function - no I/O, no side effects.
+
+    Args:
+        sources: (space_type, space_id, doc_type_id) of changed documents
+        graph: Dependency graph
+        transitive: Use the transitive closure
+
+    Returns:
+        (space_type, space_id) -> doc_type_ids to mark stale (spaces with
+        nothing to mark are omitted)
+    """
+    changed: Dict[Tuple[str, UUID], Set[str]] = {}
+    for space_type, space_id, doc_type_id in sources:
+        changed.setdefault((space_type, space_id), set()).add(doc_type_id)
+
+    targets: Dict[Tuple[str, UUID], FrozenSet[str]] = {}
+    for space, source_types in changed.items():
+        downstream: Set[str] = set()
+        for doc_type_id in source_types:
+            downstream |= graph.downstream(doc_type_id, transitive)
+        downstream -= source_types
+        if downstream:
+            targets[space] = frozenset(downstream)
+    return targets
+
+
+def build_staleness_update(targets: Mapping[Tuple[str, UUID], FrozenSet[str]]):
+    """
+    Build the set-based UPDATE for planned targets.
+
+    Each space contributes one (space_id, doc_type_id IN ...) branch; with
+    is_latest and lifecycle_state these match idx_documents_staleness.
+    """
+    spaces = [
+        and_(
+            Document.space_type == space_type,
+            Document.space_id == space_id,
+            Document.doc_type_id.in_(sorted(doc_type_ids)),
+        )
+        for (space_type, space_id), doc_type_ids in targets.items()
+    ]
+    return (
+        update(Document)
+        .where(
+            spaces[0] if len(spaces) == 1 else or_(*spaces),
+            Document.is_latest == True,
+            Document.lifecycle_state.in_(STALEABLE_STATES),
+        )
+        .values(
+            lifecycle_state='stale',
+            is_stale=True,  # Keep legacy field in sync
+        )
+    )
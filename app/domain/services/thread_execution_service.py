@@ -138,9 +138,7 @@ class ThreadExecutionService:
         lock_scope: Optional[str] = None,
     ) -> LLMWorkItem:
         """Create a work item for a thread."""
-        # Get current max sequence
-        existing = await self.work_item_repo.get_by_thread(thread_id)
-        sequence = max([w.sequence for w in existing], default=0) + 1
+        sequence = await self.work_item_repo.next_sequence(thread_id)
         
         work_item = LLMWorkItem.create(
             thread_id=thread_id,
@@ -283,10 +281,53 @@ class ThreadExecutionService:
         logger.debug(f"Recorded error for thread {thread_id}")
         return entry
     
+    async def record_entries(
+        self,
+        thread_id: UUID,
+        work_item_id: UUID,
+        entries: List[Tuple[LedgerEntryType, Dict[str, Any]]],
+    ) -> List[LLMLedgerEntry]:
+        """Record several ledger entries for one work item, in order."""
+        records = [
+            LLMLedgerEntry.create(
+                thread_id=thread_id,
+                work_item_id=work_item_id,
+                entry_type=entry_type,
+                payload=payload,
+            )
+            for entry_type, payload in entries
+        ]
+        await self.ledger_repo.append_many(records)
+        logger.debug(f"Recorded {len(records)} entries for work item {work_item_id}")
+        return records
+    
     async def get_ledger_entries(self, thread_id: UUID) -> List[LLMLedgerEntry]:
         """Get all ledger entries for a thread."""
         return await self.ledger_repo.get_by_thread(thread_id)
     
+    async def get_ledger_entries_by_type(
+        self,
+        thread_id: UUID,
+        payload_type: str,
+        after_seq: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[LLMLedgerEntry]:
+        """Get a thread's newest entries of one payload type, oldest first."""
+        return await self.ledger_repo.get_by_payload_type(
+            thread_id, payload_type, after_seq=after_seq, limit=limit
+        )
+    
+    async def count_ledger_entries_by_type(
+        self,
+        thread_id: UUID,
+        payload_type: str,
+        after_seq: Optional[int] = None,
+    ) -> int:
+        """Count a thread's entries of one payload type."""
+        return await self.ledger_repo.count_by_payload_type(
+            thread_id, payload_type, after_seq=after_seq
+        )
+    
     # =========================================================================
     # Idempotency Key Generation
     # =========================================================================
@@ -68,6 +68,7 @@ from app.domain.workflow.plan_models import (
     Governance,
 )
 from app.domain.workflow.plan_validator import PlanValidator, PlanValidationError
+from app.domain.workflow.incremental_plan_validator import IncrementalPlanValidator
 from app.domain.workflow.plan_loader import PlanLoader, PlanLoadError
 from app.domain.workflow.plan_registry import (
     PlanRegistry,
@@ -77,6 +78,7 @@ from app.domain.workflow.plan_registry import (
 from app.domain.workflow.document_workflow_state import (
     DocumentWorkflowState,
     DocumentWorkflowStatus,
+    ExecutionSummary,
     NodeExecution,
 )
 from app.domain.workflow.outcome_mapper import OutcomeMapper, OutcomeMapperError
@@ -169,6 +171,7 @@ __all__ = [
     # ADR-039: Plan Loading
     "PlanValidator",
     "PlanValidationError",
+    "IncrementalPlanValidator",
     "PlanLoader",
     "PlanLoadError",
     "PlanRegistry",
@@ -177,6 +180,7 @@ __all__ = [
     # ADR-039: Document Workflow State
     "DocumentWorkflowState",
     "DocumentWorkflowStatus",
+    "ExecutionSummary",
     "NodeExecution",
     # ADR-039: Routing
     "OutcomeMapper",
@@ -6,6 +6,7 @@ These functions handle:
 1. Raw LLM envelope unwrapping
 2. Execution ID lineage injection
 3. SSE event payload construction
+4. Bulk child upsert statement construction
 """
 
 import json
@@ -14,6 +15,10 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT ... ON CONFLICT statement; 13 columns each stays well
+# under PostgreSQL's 32767 bind parameter limit.
+CHILD_UPSERT_BATCH_SIZE = 1000
+
 
 def unwrap_raw_envelope(doc_content: Any) -> Any:
     """Unwrap raw LLM output envelope if present.
@@ -91,3 +96,31 @@ def build_children_event_payload(
     ]
     superseded = [cid for cid in existing_ids if cid not in spawned_ids]
     return {"created": created, "updated": updated, "superseded": superseded}
+
+
+def build_child_upsert(rows: list[dict]):
+    """Build INSERT ... ON CONFLICT (parent_document_id, doc_type_id, instance_id) DO UPDATE.
+
+    New children are inserted as given. For a child that already exists
+    (latest row for the same parent, doc type and instance_id) the title, content
+    and revision_hash are replaced and the version incremented; display_id
+    and created_* are left untouched. The conflict target is the partial
+    unique index idx_documents_child_instance.
+    """
+    from sqlalchemy import func
+    from sqlalchemy.dialects.postgresql import insert
+    from app.api.models.document import Document
+
+    stmt = insert(Document).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[Document.parent_document_id, Document.doc_type_id, Document.instance_id],
+        index_where=Document.is_latest == True,
+        set_={
+            "title": stmt.excluded.title,
+            "content": stmt.excluded.content,
+            "revision_hash": stmt.excluded.revision_hash,
+            "version": Document.version + 1,
+            # Python-side onupdate defaults do not apply to ON CONFLICT
+            "updated_at": func.now(),
+        },
+    )
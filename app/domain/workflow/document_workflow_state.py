@@ -76,6 +76,10 @@ class DocumentWorkflowState:
     # User who initiated this execution
     user_id: Optional[str] = None
 
+    # Plan version the execution started on; later steps run the same
+    # version even after a config reload activates a newer one
+    workflow_version: Optional[str] = None
+
     # Execution history (ordered)
     node_history: List[NodeExecution] = field(default_factory=list)
 
@@ -262,6 +266,7 @@ class DocumentWorkflowState:
         return {
             "execution_id": self.execution_id,
             "workflow_id": self.workflow_id,
+            "workflow_version": self.workflow_version,
             "project_id": self.project_id,
             "document_type": self.document_type,
             "user_id": self.user_id,
@@ -290,6 +295,7 @@ class DocumentWorkflowState:
         return cls(
             execution_id=data["execution_id"],
             workflow_id=data["workflow_id"],
+            workflow_version=data.get("workflow_version"),
             project_id=data["project_id"],
             document_type=data["document_type"],
             user_id=data.get("user_id"),
@@ -322,3 +328,56 @@ class DocumentWorkflowState:
     def from_json(cls, json_str: str) -> "DocumentWorkflowState":
         """Deserialize from JSON string."""
         return cls.from_dict(json.loads(json_str))
+
+
+@dataclass
+class ExecutionSummary:
+    """List view of a workflow execution.
+
+    Carries identity, position and step counts but not the node history or
+    context state, so listing executions does not load either.
+    """
+    execution_id: str
+    workflow_id: str
+    project_id: str
+    document_type: str
+    current_node_id: str
+    status: DocumentWorkflowStatus
+    terminal_outcome: Optional[str] = None
+    pending_user_input: bool = False
+    step_count: int = 0
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    @classmethod
+    def from_state(cls, state: DocumentWorkflowState) -> "ExecutionSummary":
+        """Summarize a full state."""
+        return cls(
+            execution_id=state.execution_id,
+            workflow_id=state.workflow_id,
+            project_id=state.project_id,
+            document_type=state.document_type,
+            current_node_id=state.current_node_id,
+            status=state.status,
+            terminal_outcome=state.terminal_outcome,
+            pending_user_input=state.pending_user_input,
+            step_count=len(state.node_history),
+            created_at=state.created_at,
+            updated_at=state.updated_at,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dict for API responses."""
+        return {
+            "execution_id": self.execution_id,
+            "project_id": self.project_id,
+            "document_type": self.document_type,
+            "workflow_id": self.workflow_id,
+            "status": self.status.value,
+            "current_node_id": self.current_node_id,
+            "terminal_outcome": self.terminal_outcome,
+            "pending_user_input": self.pending_user_input,
+            "step_count": self.step_count,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
@@ -7,27 +7,163 @@ INVARIANTS (WS-INTAKE-ENGINE-001):
 - Edge selection is deterministic given (current_node, outcome, state)
 - Conditions are evaluated in order; first matching edge wins
 - No LLMs, no heuristics in routing decisions
+
+Each plan is compiled once into a RoutingTable: edges indexed by
+(node_id, outcome) with their conditions turned into predicates, and the
+end nodes indexed by id. The table is cached on the plan (plans are not
+mutated after loading), so building an EdgeRouter per routing decision is
+cheap and every execution of a plan shares one table.
 """
 
 import logging
-from typing import Any, List, Optional, Tuple
+import operator
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 from app.domain.workflow.plan_models import (
     ConditionOperator,
     Edge,
     EdgeCondition,
+    Node,
+    NodeType,
     WorkflowPlan,
 )
 from app.domain.workflow.document_workflow_state import DocumentWorkflowState
 
 logger = logging.getLogger(__name__)
 
+# Compiled edge condition(s): True if the edge may be taken in this state
+Predicate = Callable[[DocumentWorkflowState], bool]
+
 
 class EdgeRoutingError(Exception):
     """Error during edge routing."""
     pass
 
 
+# =============================================================================
+# CONDITION COMPILATION
+# =============================================================================
+
+def _retry_count(state: DocumentWorkflowState) -> Any:
+    # Retry counter is scoped to the generating node, not the current node
+    # (WS-INTAKE-ENGINE-001): when QA fails, retry is incremented for the
+    # generating node, so edge conditions check that same counter.
+    node_id = getattr(state, 'generating_node_id', None) or state.current_node_id
+    return state.get_retry_count(node_id)
+
+
+# condition.type -> reads the value to compare from state
+CONDITION_VALUES: Mapping[str, Callable[[DocumentWorkflowState], Any]] = MappingProxyType({
+    "retry_count": _retry_count,
+    "status": lambda state: state.status.value,
+    "escalation_active": lambda state: state.escalation_active,
+})
+
+_OPERATORS: Mapping[ConditionOperator, Callable[[Any, Any], bool]] = MappingProxyType({
+    ConditionOperator.EQ: operator.eq,
+    ConditionOperator.NE: operator.ne,
+    ConditionOperator.LT: operator.lt,
+    ConditionOperator.LTE: operator.le,
+    ConditionOperator.GT: operator.gt,
+    ConditionOperator.GTE: operator.ge,
+})
+
+
+def compare(actual: Any, op: ConditionOperator, expected: Any) -> bool:
+    """Compare actual value against expected using operator.
+
+    A missing value (None) never matches; incomparable types do not match.
+    """
+    if actual is None:
+        return False
+
+    compare_fn = _OPERATORS.get(op)
+    if compare_fn is None:
+        logger.warning(f"Unknown operator: {op}")
+        return False
+    try:
+        return compare_fn(actual, expected)
+    except TypeError:
+        logger.warning(f"Type error comparing {actual} {op} {expected}")
+        return False
+
+
+def compile_condition(condition: EdgeCondition) -> Predicate:
+    """Compile one edge condition into a predicate over state."""
+    get_value = CONDITION_VALUES.get(condition.type)
+    if get_value is None:
+        logger.warning(f"Unknown condition type: {condition.type}")
+        return lambda state: False
+
+    op, expected = condition.operator, condition.value
+    return lambda state: compare(get_value(state), op, expected)
+
+
+def compile_conditions(conditions: List[EdgeCondition]) -> Optional[Predicate]:
+    """Compile edge conditions (AND logic); None if there are none."""
+    if not conditions:
+        return None
+    predicates = tuple(compile_condition(c) for c in conditions)
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda state: all(predicate(state) for predicate in predicates)
+
+
+# =============================================================================
+# ROUTING TABLE
+# =============================================================================
+
+@dataclass(frozen=True)
+class CompiledEdge:
+    """An edge with its conditions compiled (predicate None = unconditional)."""
+    edge: Edge
+    predicate: Optional[Predicate]
+
+
+@dataclass(frozen=True)
+class RoutingTable:
+    """Immutable routing lookups for one plan.
+
+    Attributes:
+        routes: (node_id, outcome) -> candidate edges in definition order
+        nodes_with_edges: node_ids that have any outgoing edge
+        end_nodes: node_id -> end node
+    """
+    routes: Mapping[Tuple[str, str], Tuple[CompiledEdge, ...]]
+    nodes_with_edges: FrozenSet[str]
+    end_nodes: Mapping[str, Node]
+
+
+def compile_routing_table(plan: WorkflowPlan) -> RoutingTable:
+    """Compile a plan's edges and end nodes into a RoutingTable.
+
+    Pure function - no I/O, no side effects.
+    """
+    routes: Dict[Tuple[str, str], List[CompiledEdge]] = {}
+    for edge in plan.edges:
+        routes.setdefault((edge.from_node_id, edge.outcome), []).append(
+            CompiledEdge(edge=edge, predicate=compile_conditions(edge.conditions))
+        )
+    return RoutingTable(
+        routes=MappingProxyType({key: tuple(edges) for key, edges in routes.items()}),
+        nodes_with_edges=frozenset(edge.from_node_id for edge in plan.edges),
+        end_nodes=MappingProxyType({
+            node.node_id: node for node in plan.nodes if node.type == NodeType.END
+        }),
+    )
+
+
+def get_routing_table(plan: WorkflowPlan) -> RoutingTable:
+    """Get the plan's routing table, compiling it on first use."""
+    table = plan._routing_table
+    if table is None:
+        table = compile_routing_table(plan)
+        plan._routing_table = table
+    return table
+
+
 class EdgeRouter:
     """Routes workflow execution by evaluating edges and conditions.
 
@@ -45,6 +181,7 @@ class EdgeRouter:
             plan: The WorkflowPlan containing nodes and edges
         """
         self.plan = plan
+        self.table = get_routing_table(plan)
 
     def get_next_node(
         self,
@@ -55,10 +192,9 @@ class EdgeRouter:
         """Determine the next node based on outcome and state.
 
         This is the main routing function. It:
-        1. Finds all edges from current_node_id
-        2. Filters by outcome match
-        3. Evaluates conditions
-        4. Returns the first matching edge's target
+        1. Looks up the compiled edges for (current_node_id, outcome)
+        2. Evaluates their condition predicates in definition order
+        3. Returns the first matching edge's target
 
         Args:
             current_node_id: The node that just executed
@@ -73,135 +209,24 @@ class EdgeRouter:
         Raises:
             EdgeRoutingError: If routing fails unexpectedly
         """
-        edges = self.plan.get_edges_from(current_node_id)
-
-        if not edges:
+        if current_node_id not in self.table.nodes_with_edges:
             logger.warning(f"No edges from node {current_node_id}")
             return None, None
 
-        # Find matching edges
-        matching_edges = self._find_matching_edges(edges, outcome, state)
-
-        if not matching_edges:
-            logger.warning(
-                f"No matching edge from {current_node_id} with outcome '{outcome}'"
-            )
-            return None, None
-
-        # First matching edge wins (deterministic)
-        selected_edge = matching_edges[0]
-
-        logger.info(
-            f"Routing: {current_node_id} --[{outcome}]--> "
-            f"{selected_edge.to_node_id or '(non-advancing)'}"
+        # First matching edge wins (deterministic); conditions all must pass
+        for candidate in self.table.routes.get((current_node_id, outcome), ()):
+            if candidate.predicate is None or candidate.predicate(state):
+                selected_edge = candidate.edge
+                logger.info(
+                    f"Routing: {current_node_id} --[{outcome}]--> "
+                    f"{selected_edge.to_node_id or '(non-advancing)'}"
+                )
+                return selected_edge.to_node_id, selected_edge
+
+        logger.warning(
+            f"No matching edge from {current_node_id} with outcome '{outcome}'"
         )
-
-        return selected_edge.to_node_id, selected_edge
-
-    def _find_matching_edges(
-        self,
-        edges: List[Edge],
-        outcome: str,
-        state: DocumentWorkflowState,
-    ) -> List[Edge]:
-        """Find all edges that match the outcome and pass conditions.
-
-        Args:
-            edges: Candidate edges from current node
-            outcome: The execution outcome
-            state: Current workflow state
-
-        Returns:
-            List of matching edges (may be empty)
-        """
-        matching = []
-
-        for edge in edges:
-            # Check outcome match
-            if edge.outcome != outcome:
-                continue
-
-            # Check conditions (all must pass)
-            if edge.conditions:
-                if not self._evaluate_conditions(edge.conditions, state):
-                    continue
-
-            matching.append(edge)
-
-        return matching
-
-    def _evaluate_conditions(
-        self,
-        conditions: List[EdgeCondition],
-        state: DocumentWorkflowState,
-    ) -> bool:
-        """Evaluate edge conditions against state.
-
-        All conditions must pass (AND logic).
-
-        Args:
-            conditions: List of conditions to evaluate
-            state: Current workflow state
-
-        Returns:
-            True if ALL conditions pass
-        """
-        for condition in conditions:
-            if not self._evaluate_condition(condition, state):
-                return False
-        return True
-
-    def _evaluate_condition(
-        self,
-        condition: EdgeCondition,
-        state: DocumentWorkflowState,
-    ) -> bool:
-        """Evaluate a single condition.
-
-        Args:
-            condition: The condition to evaluate
-            state: Current workflow state
-
-        Returns:
-            True if condition passes
-        """
-        # Get the value to compare
-        actual_value = self._get_condition_value(condition.type, state)
-
-        # Compare based on operator
-        return self._compare(actual_value, condition.operator, condition.value)
-
-    def _get_condition_value(
-        self,
-        condition_type: str,
-        state: DocumentWorkflowState,
-    ) -> Any:
-        """Get the actual value for a condition type.
-
-        Args:
-            condition_type: Type of condition (e.g., "retry_count")
-            state: Current workflow state
-
-        Returns:
-            The value to compare
-        """
-        if condition_type == "retry_count":
-            # Get retry count for the generating node (not current node)
-            # Per WS-INTAKE-ENGINE-001: retry counter scoped to generating_node_id
-            # When QA fails, retry is incremented for the generating node, so
-            # edge conditions should check that same counter
-            node_id = getattr(state, 'generating_node_id', None) or state.current_node_id
-            return state.get_retry_count(node_id)
-
-        if condition_type == "status":
-            return state.status.value
-
-        if condition_type == "escalation_active":
-            return state.escalation_active
-
-        # Default: try to get from state's execution history or metadata
-        logger.warning(f"Unknown condition type: {condition_type}")
-        return None
+        return None, None
 
     def _compare(
         self,
@@ -219,28 +244,7 @@ class EdgeRouter:
         Returns:
             True if comparison passes
         """
-        if actual is None:
-            return False
-
-        try:
-            if operator == ConditionOperator.EQ:
-                return actual == expected
-            elif operator == ConditionOperator.NE:
-                return actual != expected
-            elif operator == ConditionOperator.LT:
-                return actual < expected
-            elif operator == ConditionOperator.LTE:
-                return actual <= expected
-            elif operator == ConditionOperator.GT:
-                return actual > expected
-            elif operator == ConditionOperator.GTE:
-                return actual >= expected
-            else:
-                logger.warning(f"Unknown operator: {operator}")
-                return False
-        except TypeError:
-            logger.warning(f"Type error comparing {actual} {operator} {expected}")
-            return False
+        return compare(actual, operator, expected)
 
     def get_escalation_options(self, edge: Edge) -> List[str]:
         """Get escalation options from an edge (for circuit breaker).
@@ -262,10 +266,7 @@ class EdgeRouter:
         Returns:
             True if node is an end node
         """
-        node = self.plan.get_node(node_id)
-        if not node:
-            return False
-        return node.type.value == "end"
+        return node_id in self.table.end_nodes
 
     def get_terminal_outcome(self, node_id: str) -> Optional[str]:
         """Get the terminal outcome for an end node.
@@ -276,10 +277,8 @@ class EdgeRouter:
         Returns:
             The terminal outcome or None if not an end node
         """
-        node = self.plan.get_node(node_id)
-        if not node or node.type.value != "end":
-            return None
-        return node.terminal_outcome
+        node = self.table.end_nodes.get(node_id)
+        return node.terminal_outcome if node else None
 
     def get_gate_outcome(self, node_id: str) -> Optional[str]:
         """Get the gate outcome for an end node.
@@ -290,10 +289,8 @@ class EdgeRouter:
         Returns:
             The gate outcome or None if not defined
         """
-        node = self.plan.get_node(node_id)
-        if not node or node.type.value != "end":
-            return None
-        return node.gate_outcome
+        node = self.table.end_nodes.get(node_id)
+        return node.gate_outcome if node else None
 
     def validate_outcome(
         self,
@@ -309,5 +306,4 @@ class EdgeRouter:
         Returns:
             True if there's at least one edge with this outcome
         """
-        edges = self.plan.get_edges_from(current_node_id)
-        return any(e.outcome == outcome for e in edges)
+        return (current_node_id, outcome) in self.table.routes
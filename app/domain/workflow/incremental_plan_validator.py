@@ -0,0 +1,606 @@
+"""Incremental validation of a workflow plan under edit (ADR-039).
+
+PlanValidator.validate re-checks every node, edge and condition schema and
+rebuilds the adjacency list for reachability on each call. The workbench
+editor changes one node or edge at a time, and the workspace poll
+revalidates the same definition again and again. IncrementalPlanValidator
+holds one plan and keeps each check's findings between edits:
+
+- Per-node and per-edge schema errors, with a content fingerprint of each
+  item. An edit whose content is unchanged is a no-op; a changed item is
+  the only one re-checked.
+- Node-id and outbound-edge counts, the adjacency map, and indexes from a
+  node id to its nodes and to the edges that reference it. An edit updates
+  these by its delta and re-checks only the edges and nodes whose
+  findings can change: edges into or out of an id that appeared or
+  disappeared, and nodes whose id gained or lost its last outbound edge.
+- The reachable set. Adding an edge extends it from the new target only;
+  it is recomputed over the kept adjacency map only when an edge removal
+  or entry change could shrink it.
+- Outcome-mapping and governance errors, recomputed only when a gate node,
+  outcome_mapping or governance changes.
+
+Removing an item shifts the positions (and error paths) of the items after
+it, so removals rebuild the graph indexes; schema checks are still not
+repeated except for later items that have errors.
+
+result() assembles the findings into exactly what PlanValidator.validate
+returns for the current plan (same errors, warnings and order).
+
+Usage:
+    validator = IncrementalPlanValidator()
+    result = validator.load(raw)
+    result = validator.update_node({"node_id": "qa", "type": "qa"})
+    result = validator.remove_edge("e3")
+    result = validator.sync(edited_raw)    # diff a whole edited definition
+"""
+
+import json
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.domain.workflow.plan_validator import (
+    PlanValidationError,
+    PlanValidationResult,
+    PlanValidator,
+    find_reachable,
+)
+
+_MISSING = object()
+
+# Findings per item position
+_Findings = Dict[int, List[PlanValidationError]]
+
+
+def _fingerprint(item: Any) -> str:
+    """Canonical JSON of a node or edge (equal content, equal fingerprint)."""
+    return json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _decrement(counter: Counter, key: Any) -> bool:
+    """Decrement a count; True if it dropped to zero (and was removed)."""
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+        return True
+    return False
+
+
+def _endpoints(edge: Dict[str, Any]) -> Tuple[Any, Any]:
+    return edge.get("from_node_id"), edge.get("to_node_id")
+
+
+def _add_position(index: Dict[Any, Set[int]], key: Any, position: int) -> None:
+    index.setdefault(key, set()).add(position)
+
+
+def _discard_position(index: Dict[Any, Set[int]], key: Any, position: int) -> None:
+    positions = index.get(key)
+    if positions is not None:
+        positions.discard(position)
+        if not positions:
+            del index[key]
+
+
+def _in_order(findings: _Findings) -> List[PlanValidationError]:
+    return [error for position in sorted(findings) for error in findings[position]]
+
+
+class _Items:
+    """An ordered list of nodes or edges with per-item schema results."""
+
+    def __init__(self, id_field: str):
+        self.id_field = id_field
+        self.items: List[Dict[str, Any]] = []
+        self.fingerprints: List[str] = []
+        self.schema: _Findings = {}
+        # id -> position of the first item with that id
+        self.positions: Dict[Any, int] = {}
+
+    def position(self, item_id: Any) -> int:
+        try:
+            return self.positions[item_id]
+        except KeyError:
+            raise KeyError(f"No item with {self.id_field} {item_id!r}") from None
+
+    def reindex(self) -> None:
+        self.positions = {}
+        for position, item in enumerate(self.items):
+            self.positions.setdefault(item.get(self.id_field), position)
+
+
+class IncrementalPlanValidator(PlanValidator):
+    """Validates one plan and revalidates only what each edit affects.
+
+    Items are addressed by node_id / edge_id; with duplicate ids the first
+    item wins.
+    """
+
+    def __init__(self) -> None:
+        self._opaque_plan: Optional[Dict[str, Any]] = None
+        self._fields: Dict[str, Any] = {}
+        self._has_nodes = False
+        self._has_edges = False
+        self._nodes = _Items("node_id")
+        self._edges = _Items("edge_id")
+        self._governance: Optional[Tuple[list, list]] = None
+        self._node_ids: Counter = Counter()
+        # node_id -> positions of the nodes with that id
+        self._node_positions: Dict[Any, Set[int]] = {}
+        # node_id -> positions of the edges from or to it
+        self._edge_positions: Dict[Any, Set[int]] = {}
+        # from_node_id -> number of edges leaving it
+        self._out_degree: Counter = Counter()
+        # from_node_id -> Counter of to_node_ids
+        self._adjacency: Dict[Any, Counter] = {}
+        self._reachable: Optional[Set[str]] = None
+        # Graph findings by item position
+        self._bad_edges: _Findings = {}
+        self._dead_ends: _Findings = {}
+        self._orphans: Optional[_Findings] = None
+        self._outcome: Optional[Tuple[list, list]] = None
+
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+
+    def load(self, raw: Dict[str, Any]) -> PlanValidationResult:
+        """Replace the held plan and validate it in full."""
+        nodes = raw.get("nodes", [])
+        edges = raw.get("edges", [])
+        if not isinstance(nodes, list) or not isinstance(edges, list):
+            # Nothing to track per item; result() validates the whole plan
+            self._reset({})
+            self._opaque_plan = raw
+            return self.result()
+
+        self._reset({k: v for k, v in raw.items() if k not in ("nodes", "edges")})
+        self._has_nodes = "nodes" in raw
+        self._has_edges = "edges" in raw
+        for node in nodes:
+            self._check_schema(self._nodes, len(self._nodes.items), node)
+        for edge in edges:
+            self._check_schema(self._edges, len(self._edges.items), edge)
+        self._nodes.reindex()
+        self._edges.reindex()
+        self._rebuild_graph()
+        return self.result()
+
+    def sync(self, raw: Dict[str, Any]) -> PlanValidationResult:
+        """
+        Bring the held plan up to date with an edited copy.
+
+        Items are compared position by position, so in-place edits (the
+        common case in the editor) re-check only the changed items. A
+        change in the number of nodes or edges reloads the plan.
+        """
+        nodes = raw.get("nodes", [])
+        edges = raw.get("edges", [])
+        if (
+            self._opaque_plan is not None
+            or not isinstance(nodes, list)
+            or not isinstance(edges, list)
+            or len(nodes) != len(self._nodes.items)
+            or len(edges) != len(self._edges.items)
+            or ("nodes" in raw) != self._has_nodes
+            or ("edges" in raw) != self._has_edges
+        ):
+            return self.load(raw)
+
+        for position, node in enumerate(nodes):
+            self._replace(self._nodes, position, node)
+        for position, edge in enumerate(edges):
+            self._replace(self._edges, position, edge)
+        self._nodes.reindex()
+        self._edges.reindex()
+
+        fields = {k: v for k, v in raw.items() if k not in ("nodes", "edges")}
+        for name in set(self._fields) | set(fields):
+            if self._fields.get(name, _MISSING) != fields.get(name, _MISSING):
+                self._field_changed(name)
+        self._fields = fields
+        return self.result()
+
+    @property
+    def plan(self) -> Dict[str, Any]:
+        """The current plan as a raw dict."""
+        if self._opaque_plan is not None:
+            return self._opaque_plan
+        raw = dict(self._fields)
+        if self._has_nodes:
+            raw["nodes"] = list(self._nodes.items)
+        if self._has_edges:
+            raw["edges"] = list(self._edges.items)
+        return raw
+
+    # -------------------------------------------------------------------------
+    # Edits
+    # -------------------------------------------------------------------------
+
+    def update_node(
+        self,
+        node: Dict[str, Any],
+        node_id: Optional[str] = None,
+    ) -> PlanValidationResult:
+        """
+        Add or replace a node.
+
+        Args:
+            node: New node content
+            node_id: Node to replace (defaults to node["node_id"]; pass the
+                old id to rename). Appended if no node has that id.
+        """
+        self._require_items()
+        self._has_nodes = True
+        self._update(self._nodes, node, node.get("node_id") if node_id is None else node_id)
+        return self.result()
+
+    def remove_node(self, node_id: str) -> PlanValidationResult:
+        """Remove a node (KeyError if absent). Its edges are left in place."""
+        self._require_items()
+        self._remove(self._nodes, node_id)
+        return self.result()
+
+    def update_edge(
+        self,
+        edge: Dict[str, Any],
+        edge_id: Optional[str] = None,
+    ) -> PlanValidationResult:
+        """Add or replace an edge (see update_node)."""
+        self._require_items()
+        self._has_edges = True
+        self._update(self._edges, edge, edge.get("edge_id") if edge_id is None else edge_id)
+        return self.result()
+
+    def remove_edge(self, edge_id: str) -> PlanValidationResult:
+        """Remove an edge (KeyError if absent)."""
+        self._require_items()
+        self._remove(self._edges, edge_id)
+        return self.result()
+
+    def set_field(self, name: str, value: Any) -> PlanValidationResult:
+        """Set a top-level field other than nodes and edges."""
+        self._require_items()
+        self._check_field_name(name)
+        self._fields[name] = value
+        self._field_changed(name)
+        return self.result()
+
+    def remove_field(self, name: str) -> PlanValidationResult:
+        """Remove a top-level field other than nodes and edges."""
+        self._require_items()
+        self._check_field_name(name)
+        self._fields.pop(name, None)
+        self._field_changed(name)
+        return self.result()
+
+    # -------------------------------------------------------------------------
+    # Result
+    # -------------------------------------------------------------------------
+
+    def result(self) -> PlanValidationResult:
+        """Validation result for the current plan."""
+        if self._opaque_plan is not None:
+            return self.validate(self._opaque_plan)
+
+        # Phase 1: Schema (top-level checks are a handful of lookups)
+        errors: List[PlanValidationError] = []
+        presence = dict.fromkeys(self._fields)
+        if self._has_nodes:
+            presence["nodes"] = None
+        if self._has_edges:
+            presence["edges"] = None
+        self._validate_required_fields(presence, errors)
+        errors.extend(_in_order(self._nodes.schema))
+        errors.extend(_in_order(self._edges.schema))
+        self._validate_entry_node_ids_schema(self._fields, errors)
+        if errors:
+            return PlanValidationResult(valid=False, errors=errors)
+
+        # Phase 2: Graph integrity
+        warnings: List[PlanValidationError] = []
+        errors.extend(_in_order(self._bad_edges))
+        self._validate_entry_nodes(self._entry_node_ids(), self._node_ids, errors)
+        errors.extend(_in_order(self._dead_ends))
+        warnings.extend(_in_order(self._orphan_warnings()))
+
+        # Phases 3 and 4: cached until their inputs change
+        outcome_errors, outcome_warnings = self._outcome_results()
+        errors.extend(outcome_errors)
+        warnings.extend(outcome_warnings)
+        governance_errors, governance_warnings = self._governance_results()
+        errors.extend(governance_errors)
+        warnings.extend(governance_warnings)
+
+        return PlanValidationResult(
+            valid=len(errors) == 0,
+            errors=errors,
+            warnings=warnings,
+        )
+
+    # -------------------------------------------------------------------------
+    # Internals: items
+    # -------------------------------------------------------------------------
+
+    def _reset(self, fields: Dict[str, Any]) -> None:
+        self._opaque_plan = None
+        self._fields = fields
+        self._has_nodes = False
+        self._has_edges = False
+        self._nodes = _Items("node_id")
+        self._edges = _Items("edge_id")
+        self._reset_graph()
+        self._governance = None
+
+    def _require_items(self) -> None:
+        if self._opaque_plan is not None:
+            raise ValueError("Plan nodes/edges are not arrays; load() a valid structure first")
+
+    def _check_field_name(self, name: str) -> None:
+        if name in ("nodes", "edges"):
+            raise ValueError(f"Use the node/edge methods to change '{name}'")
+
+    def _field_changed(self, name: str) -> None:
+        if name == "entry_node_ids":
+            self._forget_reachable()
+        elif name == "outcome_mapping":
+            self._outcome = None
+        elif name == "governance":
+            self._governance = None
+
+    def _update(self, items: _Items, item: Dict[str, Any], item_id: Any) -> None:
+        position = items.positions.get(item_id, len(items.items))
+        appended = position == len(items.items)
+        old_id = None if appended else items.items[position].get(items.id_field)
+        if self._replace(items, position, item) and (
+            appended or old_id != item.get(items.id_field)
+        ):
+            items.reindex()
+
+    def _replace(self, items: _Items, position: int, item: Dict[str, Any]) -> bool:
+        """Put item at position (appending at the end); False if unchanged."""
+        old = items.items[position] if position < len(items.items) else None
+        if not self._check_schema(items, position, item):
+            return False
+        if items is self._nodes:
+            if old is not None and old.get("node_id") == item.get("node_id"):
+                # Same id: only this node's own findings can change
+                self._check_dead_end(position)
+                if self._orphans is not None:
+                    self._check_orphan(position)
+                if "gate" in (old.get("type"), item.get("type")):
+                    self._outcome = None
+                return True
+            if old is not None:
+                self._drop_node(position, old)
+            self._add_node(position, item)
+        else:
+            if old is not None and _endpoints(old) == _endpoints(item):
+                # Same endpoints: the graph is unchanged
+                self._check_edge(position)
+                return True
+            if old is not None:
+                self._drop_edge(position, old)
+            self._add_edge(position, item)
+        return True
+
+    def _remove(self, items: _Items, item_id: Any) -> None:
+        position = items.position(item_id)
+        del items.items[position]
+        del items.fingerprints[position]
+        # Later items moved up one: re-check those whose error paths
+        # carry the old index
+        shifted = {}
+        for later, errors in items.schema.items():
+            if later > position:
+                shifted[later - 1] = self._schema_errors(items, items.items[later - 1], later - 1)
+            elif later < position:
+                shifted[later] = errors
+        items.schema = shifted
+        items.reindex()
+        self._rebuild_graph()
+
+    def _check_schema(self, items: _Items, position: int, item: Dict[str, Any]) -> bool:
+        """Store item and its schema errors at position; False if unchanged."""
+        fingerprint = _fingerprint(item)
+        if position < len(items.items):
+            if items.fingerprints[position] == fingerprint:
+                return False
+            items.items[position] = item
+            items.fingerprints[position] = fingerprint
+        else:
+            items.items.append(item)
+            items.fingerprints.append(fingerprint)
+        errors = self._schema_errors(items, item, position)
+        self._record(items.schema, position, errors)
+        return True
+
+    def _schema_errors(
+        self,
+        items: _Items,
+        item: Dict[str, Any],
+        position: int,
+    ) -> List[PlanValidationError]:
+        errors: List[PlanValidationError] = []
+        if items is self._nodes:
+            self._validate_node_schema(item, position, errors)
+        else:
+            self._validate_edge_schema(item, position, errors)
+        return errors
+
+    # -------------------------------------------------------------------------
+    # Internals: graph
+    # -------------------------------------------------------------------------
+
+    def _reset_graph(self) -> None:
+        self._node_ids = Counter()
+        self._node_positions = {}
+        self._edge_positions = {}
+        self._out_degree = Counter()
+        self._adjacency = {}
+        self._reachable = None
+        self._bad_edges = {}
+        self._dead_ends = {}
+        self._orphans = None
+        self._outcome = None
+
+    def _rebuild_graph(self) -> None:
+        self._reset_graph()
+        for position, node in enumerate(self._nodes.items):
+            self._node_ids[node.get("node_id")] += 1
+            _add_position(self._node_positions, node.get("node_id"), position)
+        for position, edge in enumerate(self._edges.items):
+            from_id = edge.get("from_node_id")
+            to_id = edge.get("to_node_id")
+            self._out_degree[from_id] += 1
+            _add_position(self._edge_positions, from_id, position)
+            if to_id is not None:
+                self._adjacency.setdefault(from_id, Counter())[to_id] += 1
+                _add_position(self._edge_positions, to_id, position)
+            self._check_edge(position)
+        for position in range(len(self._nodes.items)):
+            self._check_dead_end(position)
+
+    def _add_node(self, position: int, node: Dict[str, Any]) -> None:
+        node_id = node.get("node_id")
+        self._node_ids[node_id] += 1
+        _add_position(self._node_positions, node_id, position)
+        if self._node_ids[node_id] == 1:
+            self._check_edges_of(node_id)
+        self._check_dead_end(position)
+        if self._orphans is not None:
+            self._check_orphan(position)
+        if node.get("type") == "gate":
+            self._outcome = None
+
+    def _drop_node(self, position: int, node: Dict[str, Any]) -> None:
+        node_id = node.get("node_id")
+        _discard_position(self._node_positions, node_id, position)
+        if _decrement(self._node_ids, node_id):
+            self._check_edges_of(node_id)
+        self._dead_ends.pop(position, None)
+        if self._orphans is not None:
+            self._orphans.pop(position, None)
+        if node.get("type") == "gate":
+            self._outcome = None
+
+    def _add_edge(self, position: int, edge: Dict[str, Any]) -> None:
+        from_id = edge.get("from_node_id")
+        to_id = edge.get("to_node_id")
+        _add_position(self._edge_positions, from_id, position)
+        self._out_degree[from_id] += 1
+        if self._out_degree[from_id] == 1:
+            self._check_dead_ends_of(from_id)
+        if to_id is not None:
+            _add_position(self._edge_positions, to_id, position)
+            self._adjacency.setdefault(from_id, Counter())[to_id] += 1
+            # A new edge can only grow the reachable set: extend from its target
+            if self._reachable is not None and from_id in self._reachable:
+                self._extend_reachable(to_id)
+        self._check_edge(position)
+
+    def _drop_edge(self, position: int, edge: Dict[str, Any]) -> None:
+        from_id = edge.get("from_node_id")
+        to_id = edge.get("to_node_id")
+        _discard_position(self._edge_positions, from_id, position)
+        if _decrement(self._out_degree, from_id):
+            self._check_dead_ends_of(from_id)
+        if to_id is not None:
+            _discard_position(self._edge_positions, to_id, position)
+            successors = self._adjacency[from_id]
+            # Dropping the last from->to link of a reachable node may
+            # disconnect its target
+            if _decrement(successors, to_id) and (
+                self._reachable is not None and from_id in self._reachable
+            ):
+                self._forget_reachable()
+            if not successors:
+                del self._adjacency[from_id]
+        self._bad_edges.pop(position, None)
+
+    def _check_edges_of(self, node_id: Any) -> None:
+        for position in self._edge_positions.get(node_id, ()):
+            self._check_edge(position)
+
+    def _check_dead_ends_of(self, node_id: Any) -> None:
+        for position in self._node_positions.get(node_id, ()):
+            self._check_dead_end(position)
+
+    def _check_edge(self, position: int) -> None:
+        errors: List[PlanValidationError] = []
+        self._validate_edge_endpoints(self._edges.items[position], position, self._node_ids, errors)
+        self._record(self._bad_edges, position, errors)
+
+    def _check_dead_end(self, position: int) -> None:
+        node = self._nodes.items[position]
+        errors: List[PlanValidationError] = []
+        # A node without an id fails the schema phase; nothing to record
+        if "node_id" in node:
+            # Every node's id exists, so any edge leaving it counts
+            self._validate_outbound(node, self._out_degree, errors)
+        self._record(self._dead_ends, position, errors)
+
+    def _check_orphan(self, position: int) -> None:
+        node = self._nodes.items[position]
+        errors: List[PlanValidationError] = []
+        if "node_id" in node:
+            self._validate_reachable(node, self._reachable, errors)
+        self._record(self._orphans, position, errors)
+
+    def _record(self, findings: _Findings, position: int, errors: List[PlanValidationError]) -> None:
+        if errors:
+            findings[position] = errors
+        else:
+            findings.pop(position, None)
+
+    def _entry_node_ids(self) -> List[str]:
+        return self._fields.get("entry_node_ids", [])
+
+    def _forget_reachable(self) -> None:
+        self._reachable = None
+        self._orphans = None
+
+    def _extend_reachable(self, start_id: Any) -> None:
+        """BFS from a newly linked node, clearing orphan findings it reaches."""
+        reachable = self._reachable
+        if start_id in reachable:
+            return
+        reachable.add(start_id)
+        queue = deque([start_id])
+        while queue:
+            current = queue.popleft()
+            if self._orphans is not None:
+                for position in self._node_positions.get(current, ()):
+                    self._orphans.pop(position, None)
+            for neighbor in self._adjacency.get(current, ()):
+                if neighbor not in reachable:
+                    reachable.add(neighbor)
+                    queue.append(neighbor)
+
+    def _orphan_warnings(self) -> _Findings:
+        if self._orphans is None:
+            if self._reachable is None:
+                self._reachable = find_reachable(self._adjacency, self._entry_node_ids())
+            self._orphans = {}
+            for position in range(len(self._nodes.items)):
+                self._check_orphan(position)
+        return self._orphans
+
+    def _outcome_results(self) -> Tuple[list, list]:
+        if self._outcome is None:
+            raw: Dict[str, Any] = {"nodes": self._nodes.items}
+            if "outcome_mapping" in self._fields:
+                raw["outcome_mapping"] = self._fields["outcome_mapping"]
+            errors: List[PlanValidationError] = []
+            warnings: List[PlanValidationError] = []
+            self._validate_outcome_mapping(raw, errors, warnings)
+            self._outcome = (errors, warnings)
+        return self._outcome
+
+    def _governance_results(self) -> Tuple[list, list]:
+        if self._governance is None:
+            errors: List[PlanValidationError] = []
+            warnings: List[PlanValidationError] = []
+            self._validate_governance(self._fields, errors, warnings)
+            self._governance = (errors, warnings)
+        return self._governance
@@ -15,13 +15,16 @@ Phase 8 additions:
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import chain
 from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 if TYPE_CHECKING:
     pass
@@ -91,11 +94,36 @@ class EscalationResolution:
         }
 
 
+# context_state keys read by _determine_interrupt_type and
+# _build_interrupt_payload. get_pending selects only these, not the whole
+# (deferred) context_state column.
+INTERRUPT_CONTEXT_KEYS = ("escalation_active", "constraint_conflict", "escalation_options")
+
+
+@dataclass
+class PausedExecutionSummary:
+    """The columns of a paused WorkflowExecution needed to describe its interrupt.
+
+    context_state holds only INTERRUPT_CONTEXT_KEYS.
+    """
+
+    execution_id: str
+    document_type: Optional[str]
+    workflow_id: Optional[str]
+    current_node_id: Optional[str]
+    pending_user_input_rendered: Optional[str] = None
+    pending_choices: Optional[Any] = None
+    pending_user_input_payload: Optional[Any] = None
+    pending_user_input_schema_ref: Optional[str] = None
+    context_state: Dict[str, Any] = field(default_factory=dict)
+
+
 def _determine_interrupt_type(execution: Any) -> InterruptType:
     """Determine interrupt type from execution state.
 
     Args:
-        execution: The paused workflow execution (WorkflowExecution)
+        execution: The paused workflow execution (WorkflowExecution or
+            PausedExecutionSummary)
 
     Returns:
         The interrupt type based on current node and state
@@ -127,7 +155,8 @@ def _build_interrupt_payload(execution: Any) -> Dict[str, Any]:
     """Build interrupt payload from execution state.
 
     Args:
-        execution: The paused workflow execution (WorkflowExecution)
+        execution: The paused workflow execution (WorkflowExecution or
+            PausedExecutionSummary)
 
     Returns:
         Structured payload with questions, choices, etc.
@@ -203,14 +232,47 @@ class InterruptRegistry:
                 return []
             project_uuid = project.id
 
-        # Query paused executions for this project
+        # Query paused executions for this project. Select the pause columns
+        # and the few context_state keys interrupts need, not the full
+        # execution_log/context_state documents.
+        context_state = WorkflowExecution.context_state
         result = await self.db.execute(
-            select(WorkflowExecution)
+            select(
+                WorkflowExecution.execution_id,
+                WorkflowExecution.document_type,
+                WorkflowExecution.workflow_id,
+                WorkflowExecution.current_node_id,
+                WorkflowExecution.pending_user_input_rendered,
+                WorkflowExecution.pending_choices,
+                WorkflowExecution.pending_user_input_payload,
+                WorkflowExecution.pending_user_input_schema_ref,
+                func.jsonb_build_object(
+                    *chain.from_iterable(
+                        (key, context_state[key]) for key in INTERRUPT_CONTEXT_KEYS
+                    ),
+                    type_=JSONB,
+                ).label("context_state"),
+            )
             .where(WorkflowExecution.project_id == project_uuid)
             .where(WorkflowExecution.pending_user_input == True)
             .where(WorkflowExecution.status == "paused")
         )
-        executions = result.scalars().all()
+        executions = [
+            PausedExecutionSummary(
+                execution_id=row.execution_id,
+                document_type=row.document_type,
+                workflow_id=row.workflow_id,
+                current_node_id=row.current_node_id,
+                pending_user_input_rendered=row.pending_user_input_rendered,
+                pending_choices=row.pending_choices,
+                pending_user_input_payload=row.pending_user_input_payload,
+                pending_user_input_schema_ref=row.pending_user_input_schema_ref,
+                context_state={
+                    k: v for k, v in (row.context_state or {}).items() if v is not None
+                },
+            )
+            for row in result.all()
+        ]
 
         # Map to OperatorInterrupt objects
         interrupts = []
@@ -245,6 +307,7 @@ class InterruptRegistry:
 
         result = await self.db.execute(
             select(WorkflowExecution)
+            .options(undefer(WorkflowExecution.context_state))
             .where(WorkflowExecution.execution_id == interrupt_id)
             .where(WorkflowExecution.pending_user_input == True)
         )
@@ -287,6 +350,7 @@ class InterruptRegistry:
 
         result = await self.db.execute(
             select(WorkflowExecution)
+            .options(undefer(WorkflowExecution.context_state))
             .where(WorkflowExecution.execution_id == interrupt_id)
             .where(WorkflowExecution.pending_user_input == True)
         )
@@ -358,6 +422,7 @@ class InterruptRegistry:
 
         result = await self.db.execute(
             select(WorkflowExecution)
+            .options(undefer(WorkflowExecution.context_state))
             .where(WorkflowExecution.execution_id == execution_id)
         )
         execution = result.scalar_one_or_none()
@@ -411,6 +476,7 @@ class InterruptRegistry:
 
         result = await self.db.execute(
             select(WorkflowExecution)
+            .options(undefer(WorkflowExecution.context_state))
             .where(WorkflowExecution.execution_id == interrupt_id)
         )
         execution = result.scalar_one_or_none()
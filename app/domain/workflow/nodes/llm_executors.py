@@ -38,6 +38,7 @@ from app.domain.workflow.plan_models import NodeType
 from app.domain.workflow.prompt_loader import PromptLoader as FilePromptLoader
 from app.llm.providers.anthropic import AnthropicProvider
 from app.llm.models import Message, MessageRole
+from app.observability.tracing import get_tracer
 
 if TYPE_CHECKING:
     from app.domain.services.llm_execution_logger import LLMExecutionLogger
@@ -183,15 +184,16 @@ class LoggingLLMService:
 
         # Execute LLM call
         try:
-            response = await self._provider.complete_with_retry(
-                messages=message_objects,
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                system_prompt=system_prompt,
-                max_retries=3,
-                base_delay=0.5,
-            )
+            with get_tracer().span("llm.wait", task_ref=task_ref, model=model):
+                response = await self._provider.complete_with_retry(
+                    messages=message_objects,
+                    model=model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system_prompt=system_prompt,
+                    max_retries=3,
+                    base_delay=0.5,
+                )
 
             # Log success
             if run_id and self._logger:
@@ -298,8 +300,23 @@ async def create_llm_executors(
         execution_logger=execution_logger,
     )
 
-    # Create prompt loader
-    prompt_loader = PromptLoaderAdapter()
+    return build_llm_executors(llm_service)
+
+
+def build_llm_executors(
+    llm_service: LoggingLLMService,
+    prompt_loader: Optional[PromptLoaderAdapter] = None,
+) -> Dict[NodeType, NodeExecutor]:
+    """Create the LLM-backed executors around an existing LLM service.
+
+    Args:
+        llm_service: Service used for every LLM call
+        prompt_loader: Optional prompt loader (defaults to combine-config prompts)
+
+    Returns:
+        Dict mapping NodeType to executor instance
+    """
+    prompt_loader = prompt_loader or PromptLoaderAdapter()
 
     # Create executors
     task_executor = TaskNodeExecutor(
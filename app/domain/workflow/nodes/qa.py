@@ -31,6 +31,7 @@ from app.domain.workflow.validation import (
     ConstraintDriftValidator,
     DriftValidationResult,
 )
+from app.observability.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -120,36 +121,43 @@ class QANodeExecutor(NodeExecutor):
         errors: List[str] = []
         feedback: Dict[str, Any] = {}
 
+        tracer = get_tracer()
+
         # 1. Drift validation (ADR-042) - fails fast
-        fail_result, drift_warnings = self._check_drift_validation(
-            document, context, node_id,
-        )
+        with tracer.span("qa.drift_validation"):
+            fail_result, drift_warnings = self._check_drift_validation(
+                document, context, node_id,
+            )
         if fail_result:
             return fail_result
 
         # 2. Code-based validation (WS-PGC-VALIDATION-001) - fails fast
-        fail_result, code_validation_warnings = self._check_code_validation(
-            document, context, node_id,
-        )
+        with tracer.span("qa.code_validation"):
+            fail_result, code_validation_warnings = self._check_code_validation(
+                document, context, node_id,
+            )
         if fail_result:
             return fail_result
 
         # 3. Schema validation
-        self._check_schema_validation(
-            document, node_config.get("schema_ref"), errors, feedback,
-        )
+        with tracer.span("qa.schema_validation"):
+            self._check_schema_validation(
+                document, node_config.get("schema_ref"), errors, feedback,
+            )
 
         # 4. Semantic QA (WS-SEMANTIC-QA-001 Layer 2)
-        fail_result, semantic_warnings, semantic_qa_report = await self._check_semantic_qa(
-            node_id, document, context, errors,
-        )
+        with tracer.span("qa.semantic_qa"):
+            fail_result, semantic_warnings, semantic_qa_report = await self._check_semantic_qa(
+                node_id, document, context, errors,
+            )
         if fail_result:
             return fail_result
 
         # 5. LLM QA
-        await self._check_llm_qa(
-            node_id, node_config, document, context, errors, feedback,
-        )
+        with tracer.span("qa.llm_qa"):
+            await self._check_llm_qa(
+                node_id, node_config, document, context, errors, feedback,
+            )
 
         # 6. Final outcome
         if errors:
@@ -4,8 +4,9 @@ Task nodes generate documents via LLM completion.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from app.llm.context_packer import ContextPacker, PackStats
 from app.domain.workflow.nodes.base import (
     DocumentWorkflowContext,
     LLMService,
@@ -13,6 +14,7 @@ from app.domain.workflow.nodes.base import (
     NodeResult,
     PromptLoader,
 )
+from app.observability.tracing import get_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -29,21 +31,27 @@ class TaskNodeExecutor(NodeExecutor):
     - Returns outcome "success" or "failed"
     - Does NOT inspect edges or make routing decisions
     - Does NOT mutate workflow control state
+
+    Context documents are serialized compactly; a node may cap its
+    context with ``context_budget_tokens`` in the workflow plan.
     """
 
     def __init__(
         self,
         llm_service: LLMService,
         prompt_loader: PromptLoader,
+        context_packer: Optional[ContextPacker] = None,
     ):
         """Initialize with dependencies.
 
         Args:
             llm_service: Service for LLM completions
             prompt_loader: Service for loading prompts
+            context_packer: Packs context documents into the node budget
         """
         self.llm_service = llm_service
         self.prompt_loader = prompt_loader
+        self.context_packer = context_packer or ContextPacker()
 
     def get_supported_node_type(self) -> str:
         """Return the node type this executor handles."""
@@ -99,7 +107,15 @@ class TaskNodeExecutor(NodeExecutor):
                 task_prompt = self.prompt_loader.load_task_prompt(task_ref)
 
             # Build messages from context
-            messages = self._build_messages(task_prompt, context)
+            messages, packing = self._build_messages_with_stats(
+                task_prompt,
+                context,
+                budget_tokens=node_config.get("context_budget_tokens"),
+            )
+            logger.info(
+                f"Task node {node_id} context: {packing.tokens} tokens "
+                f"({len(packing.omitted_fields)} fields omitted, {packing.tokens_saved} saved)"
+            )
 
             # Execute LLM completion with execution tracking
             execution_id = context.extra.get("execution_id")
@@ -125,7 +141,8 @@ class TaskNodeExecutor(NodeExecutor):
             )
 
             # Parse and store produced document
-            produced_document = self._parse_response(response, produces)
+            with get_tracer().span("task.parse_response", produces=produces or ""):
+                produced_document = self._parse_response(response, produces)
 
             # Debug: log what we got back
             logger.debug(f"Task node {node_id}: Response length={len(response)}, keys={list(produced_document.keys()) if isinstance(produced_document, dict) else 'not-dict'}")
@@ -160,6 +177,7 @@ class TaskNodeExecutor(NodeExecutor):
                 produced_document=produced_document,
                 task_ref=task_ref,
                 produces=produces,
+                context_packing=packing.to_dict(),
             )
 
         except Exception as e:
@@ -173,16 +191,41 @@ class TaskNodeExecutor(NodeExecutor):
         self,
         task_prompt: str,
         context: DocumentWorkflowContext,
+        budget_tokens: Optional[int] = None,
     ) -> List[Dict[str, str]]:
         """Build LLM messages from task prompt and context.
 
         Args:
             task_prompt: The task prompt template
             context: Workflow context
+            budget_tokens: Optional token budget for the whole request
 
         Returns:
             List of message dicts for LLM
         """
+        messages, _ = self._build_messages_with_stats(task_prompt, context, budget_tokens)
+        return messages
+
+    def _build_messages_with_stats(
+        self,
+        task_prompt: str,
+        context: DocumentWorkflowContext,
+        budget_tokens: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, str]], PackStats]:
+        """Build LLM messages and report context packing stats.
+
+        Fixed sections (user request, constraints, QA feedback, task prompt)
+        are always sent in full; the structured sections (extracted context,
+        input and previous documents) share whatever budget remains.
+
+        Args:
+            task_prompt: The task prompt template
+            context: Workflow context
+            budget_tokens: Optional token budget for the whole request
+
+        Returns:
+            (messages, packing stats)
+        """
         messages = []
 
         # Build context from multiple sources (ADR-040 compliant)
@@ -205,22 +248,40 @@ class TaskNodeExecutor(NodeExecutor):
             if feedback_text:
                 context_parts.append(feedback_text)
 
-        # 3. Structured context state (intake summary, project type, etc.)
+        # 3-5. Structured sections, packed together into the remaining budget
+        documents: Dict[str, Any] = {}
         if context.context_state:
             relevant_state = {k: v for k, v in context.context_state.items()
                            if not k.startswith("document_") and k != "last_produced_document"}
             if relevant_state:
-                import json
-                context_parts.append(f"## Extracted Context\n{json.dumps(relevant_state, indent=2)}")
+                documents["context"] = relevant_state
+        for doc_type, content in (context.input_documents or {}).items():
+            documents[f"input:{doc_type}"] = content
+        for doc_type, content in (context.document_content or {}).items():
+            documents[f"previous:{doc_type}"] = content
+
+        documents_budget = None
+        if budget_tokens is not None:
+            fixed_tokens = self.context_packer.count_tokens(
+                "\n\n".join(context_parts + [task_prompt])
+            )
+            documents_budget = max(0, budget_tokens - fixed_tokens)
+
+        packed, stats = self.context_packer.pack_documents(documents, documents_budget)
+        stats.budget_tokens = budget_tokens
+
+        # 3. Structured context state (intake summary, project type, etc.)
+        if "context" in packed:
+            context_parts.append(f"## Extracted Context\n{packed['context']}")
 
         # 4. Input documents from project (loaded via requires_inputs)
         if context.input_documents:
-            input_context = self._format_input_documents(context.input_documents)
+            input_context = self._format_packed(packed, "input", context.input_documents)
             context_parts.append(f"## Input Documents\n{input_context}")
 
         # 5. Produced documents from earlier nodes in this workflow
         if context.document_content:
-            doc_context = self._format_input_documents(context.document_content)
+            doc_context = self._format_packed(packed, "previous", context.document_content)
             context_parts.append(f"## Previous Documents\n{doc_context}")
 
         # Add context as first message if we have any
@@ -236,36 +297,18 @@ class TaskNodeExecutor(NodeExecutor):
             "content": task_prompt,
         })
 
-        return messages
+        return messages, stats
 
-    def _format_input_documents(
-        self,
-        input_documents: Dict[str, Dict[str, Any]],
+    @staticmethod
+    def _format_packed(
+        packed: Dict[str, str],
+        prefix: str,
+        documents: Dict[str, Any],
     ) -> str:
-        """Format input documents as context string.
-
-        Args:
-            input_documents: Dict of document_type -> document content
-
-        Returns:
-            Formatted string representation
-        """
-        parts = []
-        for doc_type, content in input_documents.items():
-            parts.append(f"## {doc_type}\n{self._serialize_document(content)}")
-        return "\n\n".join(parts)
-
-    def _serialize_document(self, content: Dict[str, Any]) -> str:
-        """Serialize document content to string.
-
-        Args:
-            content: Document content dict
-
-        Returns:
-            String representation
-        """
-        import json
-        return json.dumps(content, indent=2, default=str)
+        """Format packed documents of one section as a context string."""
+        return "\n\n".join(
+            f"## {doc_type}\n{packed[f'{prefix}:{doc_type}']}" for doc_type in documents
+        )
 
     def _render_bound_constraints_summary(
         self,
@@ -2,17 +2,22 @@
 
 Minimal implementation - stores only essential fields.
 Everything else derived at runtime from execution_log.
+
+execution_log and context_state are deferred on the model: loading a state
+undefers them, listing executions selects only summary columns.
 """
 
 import logging
 from typing import List, Optional
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.domain.workflow.document_workflow_state import (
     DocumentWorkflowState,
     DocumentWorkflowStatus,
+    ExecutionSummary,
 )
 
 logger = logging.getLogger(__name__)
@@ -94,6 +99,7 @@ class PgStatePersistence:
                 document_id=state.project_id,
                 document_type=state.document_type,
                 workflow_id=state.workflow_id,
+                workflow_version=state.workflow_version,
                 project_id=project_uuid,  # ADR-043: Set project_id for interrupt querying
                 user_id=user_uuid,
                 current_node_id=state.current_node_id,
@@ -123,7 +129,12 @@ class PgStatePersistence:
         self._db.expire_all()
 
         result = await self._db.execute(
-            select(WorkflowExecution).where(WorkflowExecution.execution_id == execution_id)
+            select(WorkflowExecution)
+            .options(
+                undefer(WorkflowExecution.execution_log),
+                undefer(WorkflowExecution.context_state),
+            )
+            .where(WorkflowExecution.execution_id == execution_id)
         )
         row = result.scalar_one_or_none()
 
@@ -143,7 +154,12 @@ class PgStatePersistence:
         from app.api.models.workflow_execution import WorkflowExecution
         
         result = await self._db.execute(
-            select(WorkflowExecution).where(
+            select(WorkflowExecution)
+            .options(
+                undefer(WorkflowExecution.execution_log),
+                undefer(WorkflowExecution.context_state),
+            )
+            .where(
                 and_(
                     WorkflowExecution.document_id == project_id,
                     WorkflowExecution.workflow_id == workflow_id,
@@ -162,11 +178,29 @@ class PgStatePersistence:
         self,
         status_filter: Optional[List[DocumentWorkflowStatus]] = None,
         limit: int = 100,
-    ) -> List[DocumentWorkflowState]:
-        """List executions, optionally filtered by status via ORM."""
+    ) -> List[ExecutionSummary]:
+        """List executions, optionally filtered by status.
+
+        Step count and first/last timestamps are computed in SQL so neither
+        execution_log nor context_state leaves the database.
+        """
         from app.api.models.workflow_execution import WorkflowExecution
-        
-        query = select(WorkflowExecution)
+        from app.domain.workflow.state_mapping import row_dict_to_summary
+
+        log = WorkflowExecution.execution_log
+        query = select(
+            WorkflowExecution.execution_id,
+            WorkflowExecution.document_id,
+            WorkflowExecution.document_type,
+            WorkflowExecution.workflow_id,
+            WorkflowExecution.current_node_id,
+            WorkflowExecution.status,
+            WorkflowExecution.terminal_outcome,
+            WorkflowExecution.pending_user_input,
+            func.jsonb_array_length(log).label("step_count"),
+            log[0]["timestamp"].astext.label("first_timestamp"),
+            log[-1]["timestamp"].astext.label("last_timestamp"),
+        )
         
         if status_filter:
             status_values = [s.value for s in status_filter]
@@ -175,9 +209,7 @@ class PgStatePersistence:
         query = query.order_by(WorkflowExecution.execution_id.desc()).limit(limit)
         
         result = await self._db.execute(query)
-        rows = result.scalars().all()
-
-        return [self._row_to_state(row) for row in rows]
+        return [row_dict_to_summary(dict(row._mapping)) for row in result.all()]
 
     def _row_to_state(self, row) -> DocumentWorkflowState:
         """Convert ORM object to DocumentWorkflowState.
@@ -191,6 +223,7 @@ class PgStatePersistence:
             "document_id": row.document_id,
             "document_type": row.document_type,
             "workflow_id": row.workflow_id,
+            "workflow_version": row.workflow_version,
             "user_id": row.user_id,
             "current_node_id": row.current_node_id,
             "status": row.status,
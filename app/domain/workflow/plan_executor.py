@@ -29,13 +29,14 @@ Thread Ownership (WS-ADR-025 Phase 3):
 import logging
 import uuid
 
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from app.domain.workflow.plan_models import Node, NodeType, WorkflowPlan
 from app.domain.workflow.plan_registry import PlanRegistry, get_plan_registry
 from app.domain.workflow.document_workflow_state import (
     DocumentWorkflowState,
     DocumentWorkflowStatus,
+    ExecutionSummary,
 )
 from app.domain.workflow.edge_router import EdgeRouter
 from app.domain.workflow.nodes.base import (
@@ -45,12 +46,10 @@ from app.domain.workflow.nodes.base import (
 )
 from app.domain.workflow.thread_manager import ThreadManager
 from app.domain.workflow.outcome_recorder import OutcomeRecorder
+from app.observability.tracing import get_tracer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-# Import publish_event for station events (WS-STATION-DATA-001 Phase 2)
-from app.api.v1.routers.production import publish_event
-
 # Type hint only - actual import is lazy to avoid circular imports
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -59,6 +58,18 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+async def publish_event(project_id: str, event_type: str, data: dict) -> None:
+    """Publish a station event to SSE subscribers (WS-STATION-DATA-001 Phase 2).
+
+    The SSE router lives in the API layer. Importing it at module load
+    pulled the entire router tree into every importer of the workflow
+    package and made app.domain.workflow unimportable on its own (cycle
+    through app.api), so it is resolved on first publish instead.
+    """
+    from app.api.v1.routers.production import publish_event as _publish
+    await _publish(project_id, event_type, data)
+
+
 class StatePersistence(Protocol):
     """Protocol for state persistence backends."""
 
@@ -80,8 +91,8 @@ class StatePersistence(Protocol):
         self,
         status_filter: Optional[List[DocumentWorkflowStatus]] = None,
         limit: int = 100,
-    ) -> List[DocumentWorkflowState]:
-        """List executions, optionally filtered by status."""
+    ) -> List[ExecutionSummary]:
+        """List execution summaries, optionally filtered by status."""
         ...
 
 
@@ -112,8 +123,8 @@ class InMemoryStatePersistence:
         self,
         status_filter: Optional[List[DocumentWorkflowStatus]] = None,
         limit: int = 100,
-    ) -> List[DocumentWorkflowState]:
-        """List executions, optionally filtered by status."""
+    ) -> List[ExecutionSummary]:
+        """List execution summaries, optionally filtered by status."""
         states = list(self._states.values())
 
         # Filter by status if specified
@@ -124,7 +135,7 @@ class InMemoryStatePersistence:
         states.sort(key=lambda s: s.updated_at, reverse=True)
 
         # Apply limit
-        return states[:limit]
+        return [ExecutionSummary.from_state(s) for s in states[:limit]]
 
 
 class PlanExecutorError(Exception):
@@ -177,10 +188,11 @@ class PlanExecutor:
         self._outcome_recorder = outcome_recorder
         self._db_session = db_session
 
-        # Lazy import to avoid circular dependency
+        # Lazy import to avoid circular dependency. The shared service keeps
+        # compiled operations cached across executions.
         if ops_service is None:
-            from app.api.services.mechanical_ops_service import MechanicalOpsService
-            ops_service = MechanicalOpsService()
+            from app.api.services.mechanical_ops_service import get_mechanical_ops_service
+            ops_service = get_mechanical_ops_service()
         self._ops_service = ops_service
 
         # Node executors by type - injectable for testing
@@ -254,6 +266,7 @@ class PlanExecutor:
         state = DocumentWorkflowState(
             execution_id=execution_id,
             workflow_id=plan.workflow_id,
+            workflow_version=plan.version,
             project_id=project_id,
             document_type=document_type,
             current_node_id=entry_node.node_id,
@@ -263,7 +276,7 @@ class PlanExecutor:
         )
 
         # Save initial state
-        await self._persistence.save(state)
+        await self._save_state(state)
 
         # WS-STATION-DATA-001 Phase 2: Emit stations_declared event
         await self._emit_stations_declared(plan, state)
@@ -306,6 +319,19 @@ class PlanExecutor:
         Raises:
             PlanExecutorError: If execution fails
         """
+        with get_tracer().span("plan_executor.step", execution_id=execution_id) as step_span:
+            return await self._execute_step(step_span, execution_id, user_input, user_choice)
+
+    async def _execute_step(
+        self,
+        step_span: Any,
+        execution_id: str,
+        user_input: Optional[Any],
+        user_choice: Optional[str],
+    ) -> DocumentWorkflowState:
+        """Body of execute_step, inside the step span."""
+        tracer = get_tracer()
+
         # Load state
         state = await self._persistence.load(execution_id)
         if not state:
@@ -319,8 +345,8 @@ class PlanExecutor:
             logger.info(f"Execution {execution_id} already terminal: {state.status}")
             return state
 
-        # Load plan
-        plan = self._plan_registry.get(state.workflow_id)
+        # Load plan (the version this execution started on)
+        plan = self._plan_registry.get(state.workflow_id, version=state.workflow_version)
         if not plan:
             raise PlanExecutorError(f"Plan not found: {state.workflow_id}")
 
@@ -330,9 +356,14 @@ class PlanExecutor:
             raise PlanExecutorError(
                 f"Node not found: {state.current_node_id} in plan {plan.workflow_id}"
             )
+        node_type = getattr(current_node.type, "value", current_node.type)
+        step_span.set_attribute("workflow_id", plan.workflow_id)
+        step_span.set_attribute("node_id", current_node.node_id)
+        step_span.set_attribute("node_type", node_type)
 
         # Build execution context
-        context = await self._build_context(state, plan, user_input, user_choice)
+        with tracer.span("plan_executor.build_context"):
+            context = await self._build_context(state, plan, user_input, user_choice)
 
         # Clear pause state if we have user input
         if state.pending_user_input and (user_input or user_choice):
@@ -353,11 +384,16 @@ class PlanExecutor:
 
         # Execute the node
         try:
-            result = await self._execute_node(current_node, context, state)
+            with tracer.span(
+                "plan_executor.execute_node",
+                node_id=current_node.node_id,
+                node_type=node_type,
+            ):
+                result = await self._execute_node(current_node, context, state)
         except Exception as e:
             logger.exception(f"Node execution failed: {e}")
             state.set_failed(str(e))
-            await self._persistence.save(state)
+            await self._save_state(state)
             raise PlanExecutorError(f"Node execution failed: {e}") from e
 
         # Emit internal_step event based on result and phase transitions
@@ -372,16 +408,18 @@ class PlanExecutor:
                 )
 
         # Persist conversation turns to thread (if applicable)
-        await self._persist_conversation(result, current_node, state, context)
+        with tracer.span("plan_executor.persist_conversation"):
+            await self._persist_conversation(result, current_node, state, context)
 
         # Handle result
-        await self._handle_result(result, current_node, state, plan)
+        with tracer.span("plan_executor.handle_result", outcome=result.outcome):
+            await self._handle_result(result, current_node, state, plan)
 
         # Update thread status on workflow completion/failure
         await self._sync_thread_status(state)
 
         # Persist state (INVARIANT: persist after every node completion)
-        await self._persistence.save(state)
+        await self._save_state(state)
 
         return state
 
@@ -423,7 +461,7 @@ class PlanExecutor:
         # ADR-042/ADR-047: Merge questions with answers via mechanical operation
         from app.api.services.mech_handlers import execute_operation
 
-        op = self._ops_service.get_operation("pgc_clarification_processor")
+        op = self._find_operation("pgc_clarification_processor")
         if op:
             result = await execute_operation(
                 operation=op,
@@ -471,7 +509,7 @@ class PlanExecutor:
         if next_node_id:
             state.current_node_id = next_node_id
             state.status = DocumentWorkflowStatus.RUNNING
-            await self._persistence.save(state)
+            await self._save_state(state)
             return await self.execute_step(execution_id)
         else:
             raise PlanExecutorError(
@@ -618,7 +656,7 @@ class PlanExecutor:
             # Other choices may need custom handling
             state.status = DocumentWorkflowStatus.RUNNING
 
-        await self._persistence.save(state)
+        await self._save_state(state)
         return state
 
     async def cancel_execution(
@@ -664,9 +702,14 @@ class PlanExecutor:
             metadata={"cancelled_by": "operator"},
         )
 
-        await self._persistence.save(state)
+        await self._save_state(state)
         return state
 
+    async def _save_state(self, state: DocumentWorkflowState) -> None:
+        """Persist workflow state through the persistence backend."""
+        with get_tracer().span("persistence.save"):
+            await self._persistence.save(state)
+
     async def _build_context(
         self,
         state: DocumentWorkflowState,
@@ -814,7 +857,7 @@ class PlanExecutor:
                 if not context.context_state.get("pgc_clarifications"):
                     from app.api.services.mech_handlers import execute_operation
 
-                    op = self._ops_service.get_operation("pgc_clarification_processor")
+                    op = self._find_operation("pgc_clarification_processor")
                     if op:
                         result = await execute_operation(
                             operation=op,
@@ -886,6 +929,7 @@ class PlanExecutor:
             "gate_outcome": node.gate_outcome,
             "includes": node.includes,  # ADR-041 template includes
             "internals": node.internals,  # ADR-047 Gate Profile internals
+            "context_budget_tokens": node.context_budget_tokens,
         }
 
         # Build state snapshot
@@ -1043,15 +1087,20 @@ class PlanExecutor:
 
         produces_key = result.metadata.get("produces", "last_produced")
 
-        # ADR-042/ADR-047: Pin invariants into known_constraints BEFORE storing
-        pinned_document = await self._pin_invariants_via_operation(
+        # ADR-042/ADR-047: Pin invariants into known_constraints, then filter
+        # excluded topics, as one fused pipeline when available
+        fused = await self._pin_and_filter_via_pipeline(
             result.produced_document, state
         )
-
-        # ADR-042/ADR-047: Filter excluded topics from recommendations
-        filtered_document = await self._filter_excluded_via_operation(
-            pinned_document, state
-        )
+        if fused:
+            pinned_document, filtered_document = fused
+        else:
+            pinned_document = await self._pin_invariants_via_operation(
+                result.produced_document, state
+            )
+            filtered_document = await self._filter_excluded_via_operation(
+                pinned_document, state
+            )
 
         state.update_context_state({
             f"document_{produces_key}": filtered_document,
@@ -1100,7 +1149,7 @@ class PlanExecutor:
                 logger.info(f"Advanced to {next_node_id} before pausing for review")
 
             state.set_paused(prompt=None, choices=None)
-            await self._persistence.save(state)
+            await self._save_state(state)
             logger.info("Intake qualified - pausing for user review")
             return True
 
@@ -1315,39 +1364,33 @@ class PlanExecutor:
             return
 
         try:
+            # One work item per node execution, however many turns it produced
+            turns = []
+
             # Record user input if present
             user_input = context.extra.get("user_input")
             if user_input:
                 # Convert dict to JSON string for thread recording
                 import json
                 content = json.dumps(user_input, indent=2) if isinstance(user_input, dict) else user_input
-                await self._thread_manager.record_conversation_turn(
-                    thread_id=state.thread_id,
-                    role="user",
-                    content=content,
-                    node_id=node.node_id,
-                )
+                turns.append({"role": "user", "content": content})
 
             # Record assistant response if produced
             if result.produced_document:
                 # For concierge nodes, the response might be in the document
                 response_content = result.produced_document.get("response")
                 if response_content:
-                    await self._thread_manager.record_conversation_turn(
-                        thread_id=state.thread_id,
-                        role="assistant",
-                        content=response_content,
-                        node_id=node.node_id,
-                    )
+                    turns.append({"role": "assistant", "content": response_content})
 
             # Record user prompt for paused states
             if result.requires_user_input and result.user_prompt:
-                await self._thread_manager.record_conversation_turn(
-                    thread_id=state.thread_id,
-                    role="assistant",
-                    content=result.user_prompt,
-                    node_id=node.node_id,
-                )
+                turns.append({"role": "assistant", "content": result.user_prompt})
+
+            await self._thread_manager.record_conversation_turns(
+                thread_id=state.thread_id,
+                turns=turns,
+                node_id=node.node_id,
+            )
 
         except Exception as e:
             logger.warning(f"Failed to persist conversation to thread: {e}")
@@ -1417,6 +1460,68 @@ class PlanExecutor:
         except Exception as e:
             logger.warning(f"Failed to record governance outcome: {e}")
 
+    def _find_operation(self, op_id: str) -> Optional[Any]:
+        """Compiled mechanical operation, or None to use the inline fallback.
+
+        ADR-047: an operation with no active version, or whose definition
+        fails to load, must not abort the step; callers fall back to their
+        inline implementation.
+        """
+        from app.config.package_loader import PackageLoaderError
+
+        try:
+            return self._ops_service.get_compiled_operation(op_id)
+        except PackageLoaderError as e:
+            logger.warning(f"Operation {op_id} unavailable: {e}, using fallback")
+            return None
+
+    async def _pin_and_filter_via_pipeline(
+        self,
+        document: Dict[str, Any],
+        state: DocumentWorkflowState,
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Pin invariants and filter exclusions as one fused pipeline.
+
+        ADR-047: discovery_invariant_pinner and discovery_exclusion_filter
+        are both pure and operate on the same document, so they run back
+        to back through a compiled pipeline.
+
+        Args:
+            document: The produced document
+            state: Workflow state containing pgc_invariants
+
+        Returns:
+            (pinned_document, filtered_document), or None if the pipeline is
+            unavailable or a stage failed (callers use the per-op path)
+        """
+        invariants = state.context_state.get("pgc_invariants", [])
+        if not invariants:
+            return None
+
+        from app.api.services.mech_handlers import CompiledPipeline
+
+        try:
+            pipeline = self._ops_service.get_compiled_pipeline(
+                ["discovery_invariant_pinner", "discovery_exclusion_filter"],
+                carry="document",
+            )
+        except Exception as e:
+            logger.warning(f"Pin/filter pipeline unavailable: {e}, using per-operation path")
+            return None
+
+        if not isinstance(pipeline, CompiledPipeline):
+            return None
+
+        run = await pipeline.run({"document": document, "invariants": invariants})
+        if not run.success:
+            logger.warning(
+                f"Pin/filter pipeline failed at {run.failed_op}: {run.result.error}, "
+                f"using per-operation path"
+            )
+            return None
+
+        return run.outputs[0], run.outputs[-1]
+
     async def _pin_invariants_via_operation(
         self,
         document: Dict[str, Any],
@@ -1440,7 +1545,7 @@ class PlanExecutor:
 
         from app.api.services.mech_handlers import execute_operation
 
-        op = self._ops_service.get_operation("discovery_invariant_pinner")
+        op = self._find_operation("discovery_invariant_pinner")
         if op:
             result = await execute_operation(
                 operation=op,
@@ -1477,7 +1582,7 @@ class PlanExecutor:
 
         from app.api.services.mech_handlers import execute_operation
 
-        op = self._ops_service.get_operation("discovery_exclusion_filter")
+        op = self._find_operation("discovery_exclusion_filter")
         if op:
             result = await execute_operation(
                 operation=op,
@@ -1853,7 +1958,7 @@ class PlanExecutor:
             # Update context_state with system-corrected document
             doc_key = f"document_{state.document_type}"
             state.context_state[doc_key] = doc_content
-            await self._persistence.save(state)
+            await self._save_state(state)
 
             logger.info(
                 f"Persisted {state.document_type} document to database "
@@ -1861,10 +1966,11 @@ class PlanExecutor:
             )
 
             # Spawn child documents if the handler defines them
-            await self._spawn_child_documents(
-                state, doc_content, document.id, document.title,
-                execution_id=state.execution_id,
-            )
+            with get_tracer().span("plan_executor.spawn_child_documents"):
+                await self._spawn_child_documents(
+                    state, doc_content, document.id, document.title,
+                    execution_id=state.execution_id,
+                )
 
         except Exception as e:
             logger.error(f"Failed to persist document: {e}")
@@ -1890,6 +1996,9 @@ class PlanExecutor:
         WS-CRAP-009: Thinned dispatcher — delegates to pure helpers and
         sub-methods for envelope unwrap, lineage injection, upsert, stale
         marking, and event payload construction.
+
+        All children are written with one bulk upsert; if that fails the
+        per-child upsert loop runs instead.
         """
         from app.domain.handlers.registry import handler_exists, get_handler
         from app.api.models.document import Document
@@ -1915,9 +2024,18 @@ class PlanExecutor:
             parent_id, child_specs, Document,
         )
 
-        spawned_ids, created_count, updated_count = await self._run_upsert_loop(
-            child_specs, existing_children, state, parent_id,
-        )
+        try:
+            spawned_ids, created_count, updated_count = await self._bulk_upsert_children(
+                child_specs, existing_children, state, parent_id,
+            )
+        except Exception as e:
+            logger.warning(
+                f"Bulk child upsert failed for parent {parent_id}, "
+                f"upserting one at a time: {e}"
+            )
+            spawned_ids, created_count, updated_count = await self._run_upsert_loop(
+                child_specs, existing_children, state, parent_id,
+            )
 
         superseded_count = self._mark_stale_children(existing_children, spawned_ids)
 
@@ -2016,6 +2134,109 @@ class PlanExecutor:
             if doc.instance_id
         }
 
+    async def _bulk_upsert_children(
+        self,
+        child_specs: list[dict],
+        existing_children: dict,
+        state: DocumentWorkflowState,
+        parent_id: "UUID",  # noqa: F821
+    ) -> tuple[set, int, int]:
+        """Upsert all child specs with INSERT ... ON CONFLICT DO UPDATE.
+
+        Display ids for new children are reserved in one query and revision
+        hashes are computed while building the rows. Runs in a savepoint so
+        a failure leaves the session usable for the per-child fallback.
+        Returns (spawned_ids, created, updated).
+        """
+        from collections import Counter
+        from uuid import UUID
+        from sqlalchemy.orm.attributes import set_committed_value
+        from app.api.models.document import compute_revision_hash
+        from app.domain.services.display_id_service import reserve_display_ids
+        from app.domain.workflow.child_document_helpers import (
+            CHILD_UPSERT_BATCH_SIZE,
+            build_child_upsert,
+        )
+
+        # Keyed by identifier: a repeated identifier keeps its last spec,
+        # as the per-child loop's final update would.
+        specs = {}
+        for spec in child_specs:
+            identifier = spec.get("identifier", "")
+            if not identifier:
+                logger.error(
+                    f"Child spec for {spec.get('doc_type_id')} missing identifier - "
+                    f"skipping (would violate multi-instance uniqueness)"
+                )
+                continue
+            specs[identifier] = spec
+        if not specs:
+            return set(), 0, 0
+
+        # The conflict target includes doc_type_id, so a loaded child of
+        # another type with the same identifier is not the row being updated.
+        matched = {
+            identifier: existing_children[identifier]
+            for identifier, spec in specs.items()
+            if identifier in existing_children
+            and existing_children[identifier].doc_type_id == spec["doc_type_id"]
+        }
+
+        space_id = UUID(state.project_id)
+        new_counts = Counter(
+            spec["doc_type_id"]
+            for identifier, spec in specs.items()
+            if identifier not in matched
+        )
+        reserved = {
+            doc_type_id: iter(display_ids)
+            for doc_type_id, display_ids in (
+                await reserve_display_ids(self._db_session, space_id, new_counts)
+            ).items()
+        }
+
+        rows = []
+        for identifier, spec in specs.items():
+            existing = matched.get(identifier)
+            rows.append({
+                "space_type": "project",
+                "space_id": space_id,
+                "doc_type_id": spec["doc_type_id"],
+                "title": spec["title"],
+                "content": spec["content"],
+                "revision_hash": compute_revision_hash(spec["content"]),
+                "version": 1,
+                "is_latest": True,
+                "status": "draft",
+                "created_by": None,
+                "parent_document_id": parent_id,
+                "instance_id": identifier,
+                # Ignored on conflict: display_id is immutable (ADR-055)
+                "display_id": (
+                    existing.display_id if existing is not None
+                    else next(reserved[spec["doc_type_id"]])
+                ),
+            })
+
+        async with self._db_session.begin_nested():
+            for start in range(0, len(rows), CHILD_UPSERT_BATCH_SIZE):
+                await self._db_session.execute(
+                    build_child_upsert(rows[start:start + CHILD_UPSERT_BATCH_SIZE])
+                )
+
+        # The upsert bypassed the identity map; bring loaded children up to date.
+        for row in rows:
+            existing = matched.get(row["instance_id"])
+            if existing is not None:
+                set_committed_value(existing, "title", row["title"])
+                set_committed_value(existing, "content", row["content"])
+                set_committed_value(existing, "revision_hash", row["revision_hash"])
+                set_committed_value(existing, "version", existing.version + 1)
+
+        updated_count = len(matched)
+        logger.debug(f"Bulk upserted {len(rows)} children of {parent_id}")
+        return set(specs), len(rows) - updated_count, updated_count
+
     async def _run_upsert_loop(
         self,
         child_specs: list[dict],
@@ -2298,24 +2519,9 @@ class PlanExecutor:
         if status_filter:
             enum_filter = [DocumentWorkflowStatus(s) for s in status_filter]
 
-        states = await self._persistence.list_executions(
+        summaries = await self._persistence.list_executions(
             status_filter=enum_filter,
             limit=limit,
         )
 
-        return [
-            {
-                "execution_id": state.execution_id,
-                "project_id": state.project_id,
-                "document_type": state.document_type,
-                "workflow_id": state.workflow_id,
-                "status": state.status.value,
-                "current_node_id": state.current_node_id,
-                "terminal_outcome": state.terminal_outcome,
-                "pending_user_input": state.pending_user_input,
-                "step_count": len(state.node_history),
-                "created_at": state.created_at.isoformat(),
-                "updated_at": state.updated_at.isoformat(),
-            }
-            for state in states
-        ]
+        return [summary.to_dict() for summary in summaries]
@@ -9,6 +9,7 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from app.domain.workflow.edge_router import get_routing_table
 from app.domain.workflow.plan_models import WorkflowPlan
 from app.domain.workflow.plan_validator import (
     PlanValidationError,
@@ -98,8 +99,11 @@ class PlanLoader:
                 errors=result.errors,
             )
 
-        # Parse into typed model
-        return WorkflowPlan.from_dict(raw)
+        # Parse into typed model and compile its routing table once, so
+        # executions share it instead of scanning edges per decision
+        plan = WorkflowPlan.from_dict(raw)
+        get_routing_table(plan)
+        return plan
 
     def load_all(self, directory: Path) -> List[WorkflowPlan]:
         """Load all workflow plans from a directory.
@@ -125,24 +129,15 @@ class PlanLoader:
         if active_releases:
             # Load from versioned structure
             for workflow_id, version in active_releases.get("workflows", {}).items():
-                definition_path = directory / workflow_id / "releases" / version / "definition.json"
+                definition_path = self.definition_path(directory, workflow_id, version)
                 if definition_path.exists():
                     try:
-                        with open(definition_path, "r", encoding="utf-8-sig") as f:
-                            raw = json.load(f)
-
-                        # Skip non-plan workflows (e.g., steps-format POWs)
-                        if "nodes" not in raw or "edges" not in raw:
-                            logger.debug(
-                                f"Skipping {workflow_id} v{version}: not a plan-format workflow"
-                            )
-                            continue
-
-                        plan = self.load_dict(raw, source_path=str(definition_path))
-                        plans.append(plan)
-                        logger.debug(f"Loaded workflow {workflow_id} v{version}")
+                        plan = self.load_versioned(directory, workflow_id, version)
                     except (json.JSONDecodeError, PlanLoadError) as e:
                         logger.warning(f"Failed to load workflow {workflow_id}: {e}")
+                        continue
+                    if plan is not None:
+                        plans.append(plan)
                 else:
                     logger.warning(f"Workflow definition not found: {definition_path}")
         else:
@@ -162,6 +157,50 @@ class PlanLoader:
 
         return plans
 
+    @staticmethod
+    def definition_path(directory: Path, workflow_id: str, version: str) -> Path:
+        """Path of a versioned workflow definition under directory."""
+        return directory / workflow_id / "releases" / version / "definition.json"
+
+    def load_versioned(
+        self,
+        directory: Path,
+        workflow_id: str,
+        version: str,
+    ) -> Optional[WorkflowPlan]:
+        """Load one release of a workflow from the versioned structure.
+
+        Args:
+            directory: The workflows directory (e.g., combine-config/workflows/)
+            workflow_id: Workflow to load
+            version: Release version
+
+        Returns:
+            The WorkflowPlan, or None if the definition is not a
+            plan-format workflow (e.g., steps-format POWs)
+
+        Raises:
+            FileNotFoundError: If the definition does not exist
+            json.JSONDecodeError: If the definition is not valid JSON
+            PlanLoadError: If validation fails
+        """
+        definition_path = self.definition_path(directory, workflow_id, version)
+        with open(definition_path, "r", encoding="utf-8-sig") as f:
+            raw = json.load(f)
+
+        if "nodes" not in raw or "edges" not in raw:
+            logger.debug(f"Skipping {workflow_id} v{version}: not a plan-format workflow")
+            return None
+
+        plan = self.load_dict(raw, source_path=str(definition_path))
+        logger.debug(f"Loaded workflow {workflow_id} v{version}")
+        return plan
+
+    def active_workflow_versions(self, directory: Path) -> Dict[str, str]:
+        """workflow_id -> active version from active_releases.json ({} if absent)."""
+        active_releases = self._load_active_releases(directory)
+        return dict((active_releases or {}).get("workflows", {}))
+
     def _load_active_releases(self, directory: Path) -> Optional[Dict[str, Any]]:
         """Load active_releases.json from combine-config structure.
 
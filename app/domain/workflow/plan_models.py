@@ -126,6 +126,7 @@ class Node:
     internals: Dict[str, Any] = field(default_factory=dict)  # ADR-047 Gate Profile internals
     station: Optional[StationMetadata] = None  # WS-STATION-DATA-001: Production floor station
     gate_kind: Optional[str] = None  # WS-RING0-001: "qa", "pgc", etc.
+    context_budget_tokens: Optional[int] = None  # Token cap for task node input context
 
     def is_qa_gate(self) -> bool:
         """Canonical definition of QA-ness. Single source of truth.
@@ -162,6 +163,7 @@ class Node:
             internals=raw.get("internals", {}),
             station=StationMetadata.from_dict(raw["station"]) if raw.get("station") else None,
             gate_kind=raw.get("gate_kind"),
+            context_budget_tokens=raw.get("context_budget_tokens"),
         )
 
 
@@ -301,19 +303,42 @@ class WorkflowPlan:
     # Computed indexes for efficient lookup
     _nodes_by_id: Dict[str, Node] = field(default_factory=dict, repr=False)
     _edges_by_from: Dict[str, List[Edge]] = field(default_factory=dict, repr=False)
+    _stations_by_node: Dict[str, StationMetadata] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _stations: List[StationMetadata] = field(default_factory=list, repr=False, compare=False)
+
+    # Routing table compiled by edge_router.get_routing_table(); plans are
+    # not mutated after loading, so it is shared by every execution
+    _routing_table: Any = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Build indexes after initialization."""
         self._build_indexes()
 
     def _build_indexes(self):
-        """Build lookup indexes for nodes and edges."""
+        """Build lookup indexes for nodes, edges and stations."""
         self._nodes_by_id = {node.node_id: node for node in self.nodes}
         self._edges_by_from = {}
         for edge in self.edges:
-            if edge.from_node_id not in self._edges_by_from:
-                self._edges_by_from[edge.from_node_id] = []
-            self._edges_by_from[edge.from_node_id].append(edge)
+            self._edges_by_from.setdefault(edge.from_node_id, []).append(edge)
+
+        # A node's own station wins; internal nodes (e.g., "pass_a") take
+        # the station of the first gate listing them in its internals
+        self._stations_by_node = {
+            node.node_id: node.station for node in self.nodes if node.station
+        }
+        for parent in self.nodes:
+            if parent.internals and parent.station:
+                for internal_id in parent.internals:
+                    self._stations_by_node.setdefault(internal_id, parent.station)
+
+        stations_by_id: Dict[str, StationMetadata] = {}
+        for node in self.nodes:
+            if node.station and node.station.id not in stations_by_id:
+                stations_by_id[node.station.id] = node.station
+        self._stations = sorted(stations_by_id.values(), key=lambda s: s.order)
+        self._routing_table = None
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get node by ID."""
@@ -352,14 +377,7 @@ class WorkflowPlan:
         Returns:
             List of station dicts: [{id, label, order}]
         """
-        stations_by_id: Dict[str, StationMetadata] = {}
-        for node in self.nodes:
-            if node.station and node.station.id not in stations_by_id:
-                stations_by_id[node.station.id] = node.station
-        
-        # Sort by order and convert to dicts
-        sorted_stations = sorted(stations_by_id.values(), key=lambda s: s.order)
-        return [{"id": s.id, "label": s.label, "order": s.order} for s in sorted_stations]
+        return [{"id": s.id, "label": s.label, "order": s.order} for s in self._stations]
 
     def get_node_station(self, node_id: str) -> Optional[StationMetadata]:
         """Get the station for a specific node.
@@ -367,19 +385,7 @@ class WorkflowPlan:
         Handles internal nodes (e.g., "pass_a", "entry") by finding the
         parent gate node that contains them in its internals.
         """
-        # Direct lookup first
-        node = self.get_node(node_id)
-        if node and node.station:
-            return node.station
-        
-        # If not found or no station, search for parent gate containing this internal
-        for potential_parent in self.nodes:
-            if potential_parent.internals:
-                if node_id in potential_parent.internals:
-                    if potential_parent.station:
-                        return potential_parent.station
-        
-        return None
+        return self._stations_by_node.get(node_id)
 
     @classmethod
     def from_dict(cls, raw: Dict[str, Any]) -> "WorkflowPlan":
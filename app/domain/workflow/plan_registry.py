@@ -1,14 +1,29 @@
 """Registry for Document Interaction Workflow Plans (ADR-039).
 
 Provides cached access to loaded workflow plans.
+
+Plans loaded from the versioned combine-config structure can be reloaded
+in place with reload_changed(): only workflows whose active version or
+definition file changed are re-read, and the lookup tables are swapped in
+one assignment so readers never see a half-reloaded registry. Every plan
+version seen is retained, so an execution pinned to a superseded version
+keeps running the plan it started with.
 """
 
+import json
+import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 
-from app.domain.workflow.plan_loader import PlanLoader
+from app.domain.workflow.plan_loader import PlanLoadError, PlanLoader
 from app.domain.workflow.plan_models import WorkflowPlan
 
+logger = logging.getLogger(__name__)
+
+# (active version, mtime_ns, size) of a loaded definition.json
+_SourceStamp = Tuple[str, int, int]
+
 
 class PlanNotFoundError(Exception):
     """Raised when a requested plan is not found."""
@@ -36,6 +51,12 @@ class PlanRegistry:
         self.loader = loader or PlanLoader()
         self._plans: Dict[str, WorkflowPlan] = {}
         self._plans_by_document_type: Dict[str, WorkflowPlan] = {}
+        # (workflow_id, version) -> plan, for executions pinned to a version
+        self._versions: Dict[Tuple[str, str], WorkflowPlan] = {}
+        # workflow_id -> stamp of the definition it was loaded from
+        self._sources: Dict[str, _SourceStamp] = {}
+        self._directory: Optional[Path] = None
+        self._reload_lock = Lock()
 
     def register(self, plan: WorkflowPlan) -> None:
         """Register a workflow plan.
@@ -52,6 +73,7 @@ class PlanRegistry:
                 "Use replace() to update."
             )
         self._plans[plan.workflow_id] = plan
+        self._versions[(plan.workflow_id, plan.version)] = plan
         if plan.document_type:
             self._plans_by_document_type[plan.document_type] = plan
 
@@ -68,14 +90,18 @@ class PlanRegistry:
                 del self._plans_by_document_type[old_plan.document_type]
 
         self._plans[plan.workflow_id] = plan
+        self._versions[(plan.workflow_id, plan.version)] = plan
         if plan.document_type:
             self._plans_by_document_type[plan.document_type] = plan
 
-    def get(self, plan_id: str) -> WorkflowPlan:
+    def get(self, plan_id: str, version: Optional[str] = None) -> WorkflowPlan:
         """Get a workflow plan by ID.
 
         Args:
             plan_id: The workflow_id of the plan
+            version: Version the caller pinned (e.g., when its execution
+                started). Falls back to the current plan, with a warning,
+                if that version is no longer available.
 
         Returns:
             The WorkflowPlan
@@ -83,9 +109,15 @@ class PlanRegistry:
         Raises:
             PlanNotFoundError: If plan not found
         """
-        if plan_id not in self._plans:
-            raise PlanNotFoundError(plan_id, available=list(self._plans.keys()))
-        return self._plans[plan_id]
+        plans = self._plans
+        if version is not None:
+            pinned = self._versions.get((plan_id, version)) or self._load_pinned(plan_id, version)
+            if pinned is not None:
+                return pinned
+            logger.warning(f"Plan {plan_id} v{version} unavailable, using current version")
+        if plan_id not in plans:
+            raise PlanNotFoundError(plan_id, available=list(plans.keys()))
+        return plans[plan_id]
 
     def get_by_document_type(self, document_type: str) -> Optional[WorkflowPlan]:
         """Get a workflow plan by document type.
@@ -140,6 +172,9 @@ class PlanRegistry:
         """Clear all registered plans."""
         self._plans.clear()
         self._plans_by_document_type.clear()
+        self._versions.clear()
+        self._sources.clear()
+        self._directory = None
 
     def load_from_directory(self, directory: Path) -> int:
         """Load all workflow plans from a directory.
@@ -156,8 +191,103 @@ class PlanRegistry:
         plans = self.loader.load_all(directory)
         for plan in plans:
             self.register(plan)
+
+        self._directory = directory
+        active = self.loader.active_workflow_versions(directory)
+        for plan in plans:
+            version = active.get(plan.workflow_id)
+            stamp = self._stamp(directory, plan.workflow_id, version) if version else None
+            if stamp is not None:
+                self._sources[plan.workflow_id] = stamp
         return len(plans)
 
+    def reload_changed(self) -> List[str]:
+        """Reload plans whose active version or definition changed.
+
+        Re-reads active_releases.json from the directory passed to
+        load_from_directory() and loads only workflows whose active version,
+        or definition file, differs from what was loaded. Workflows dropped
+        from active_releases.json are unregistered. The new lookup tables are
+        built aside and swapped in at once; plans already handed out are
+        never mutated.
+
+        A definition that fails to load is logged and the previous plan kept.
+
+        Returns:
+            Sorted workflow_ids that were added, reloaded or removed
+        """
+        directory = self._directory
+        if directory is None:
+            return []
+
+        with self._reload_lock:
+            active = self.loader.active_workflow_versions(directory)
+            if not active:
+                # Legacy flat structure (or unreadable manifest): nothing to diff
+                return []
+
+            plans = dict(self._plans)
+            sources = dict(self._sources)
+            changed: List[str] = []
+
+            for workflow_id, version in active.items():
+                stamp = self._stamp(directory, workflow_id, version)
+                if stamp is None:
+                    logger.warning(f"Workflow definition not found: {workflow_id} v{version}")
+                    continue
+                if sources.get(workflow_id) == stamp:
+                    continue
+                try:
+                    plan = self.loader.load_versioned(directory, workflow_id, version)
+                except (OSError, json.JSONDecodeError, PlanLoadError) as e:
+                    logger.warning(f"Failed to reload workflow {workflow_id}, keeping previous: {e}")
+                    continue
+                sources[workflow_id] = stamp
+                if plan is None:
+                    continue
+                plans[workflow_id] = plan
+                self._versions[(workflow_id, plan.version)] = plan
+                changed.append(workflow_id)
+
+            # Only unregister plans this registry loaded from the directory
+            for workflow_id in [w for w in sources if w not in active]:
+                del sources[workflow_id]
+                if plans.pop(workflow_id, None) is not None:
+                    changed.append(workflow_id)
+
+            if changed:
+                by_document_type = {
+                    plan.document_type: plan for plan in plans.values() if plan.document_type
+                }
+                # Swap: readers see either the old tables or the new ones
+                self._plans, self._plans_by_document_type = plans, by_document_type
+                logger.info(f"Reloaded workflow plans: {', '.join(sorted(changed))}")
+            self._sources = sources
+            return sorted(changed)
+
+    def _load_pinned(self, plan_id: str, version: str) -> Optional[WorkflowPlan]:
+        """Load a version that is not active (pinned before a restart)."""
+        if self._directory is None:
+            return None
+        path = self.loader.definition_path(self._directory, plan_id, version)
+        if not path.exists():
+            return None
+        try:
+            plan = self.loader.load_versioned(self._directory, plan_id, version)
+        except (OSError, json.JSONDecodeError, PlanLoadError) as e:
+            logger.warning(f"Failed to load pinned plan {plan_id} v{version}: {e}")
+            return None
+        if plan is not None:
+            self._versions[(plan_id, version)] = plan
+        return plan
+
+    def _stamp(self, directory: Path, workflow_id: str, version: str) -> Optional[_SourceStamp]:
+        try:
+            st = self.loader.definition_path(directory, workflow_id, version).stat()
+        except OSError:
+            return None
+        return (version, st.st_mtime_ns, st.st_size)
+
     def load_file(self, path: Path) -> WorkflowPlan:
         """Load a single workflow plan from file.
 
@@ -177,27 +307,31 @@ class PlanRegistry:
 
 # Global registry instance for convenience
 _global_registry: Optional[PlanRegistry] = None
+_global_registry_lock = Lock()
 
 
 def get_plan_registry() -> PlanRegistry:
     """Get the global plan registry instance.
 
     Creates a new instance if one doesn't exist.
-    Auto-loads workflows from combine-config/workflows directory.
+    Auto-loads workflows from combine-config/workflows directory. The
+    instance is published only once fully loaded, so a concurrent caller
+    never sees a partial registry.
     """
     global _global_registry
     if _global_registry is None:
-        _global_registry = PlanRegistry()
-        # Auto-load workflows from combine-config (versioned structure)
-        workflow_dir = Path("combine-config/workflows")
-        if workflow_dir.exists():
-            try:
-                count = _global_registry.load_from_directory(workflow_dir)
-                import logging
-                logging.getLogger(__name__).info(f"Loaded {count} workflow plans from {workflow_dir}")
-            except Exception as e:
-                import logging
-                logging.getLogger(__name__).warning(f"Failed to auto-load workflows: {e}")
+        with _global_registry_lock:
+            if _global_registry is None:
+                registry = PlanRegistry()
+                # Auto-load workflows from combine-config (versioned structure)
+                workflow_dir = Path("combine-config/workflows")
+                if workflow_dir.exists():
+                    try:
+                        count = registry.load_from_directory(workflow_dir)
+                        logger.info(f"Loaded {count} workflow plans from {workflow_dir}")
+                    except Exception as e:
+                        logger.warning(f"Failed to auto-load workflows: {e}")
+                _global_registry = registry
     return _global_registry
 
 
@@ -3,9 +3,10 @@
 Validates both schema structure and semantic integrity of workflow plans.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Set
+from typing import Any, Container, Dict, Iterable, List, Set
 
 
 class PlanValidationErrorCode(str, Enum):
@@ -48,6 +49,25 @@ class PlanValidationResult:
     warnings: List[PlanValidationError] = field(default_factory=list)
 
 
+def find_reachable(
+    adjacency: Dict[str, Iterable[str]],
+    start_ids: Iterable[str],
+) -> Set[str]:
+    """BFS over an adjacency map (node_id -> successor node_ids).
+
+    The start nodes are always included.
+    """
+    reachable: Set[str] = set(start_ids)
+    queue = deque(reachable)
+    while queue:
+        current = queue.popleft()
+        for neighbor in adjacency.get(current, ()):
+            if neighbor not in reachable:
+                reachable.add(neighbor)
+                queue.append(neighbor)
+    return reachable
+
+
 class PlanValidator:
     """Validates workflow plan structure and semantics.
 
@@ -107,14 +127,7 @@ class PlanValidator:
         errors: List[PlanValidationError],
     ) -> None:
         """Validate basic schema structure."""
-        # Check required top-level fields
-        for field_name in self.REQUIRED_TOP_LEVEL_FIELDS:
-            if field_name not in raw:
-                errors.append(PlanValidationError(
-                    code=PlanValidationErrorCode.MISSING_REQUIRED_FIELD,
-                    message=f"Missing required field: {field_name}",
-                    path=f"$.{field_name}",
-                ))
+        self._validate_required_fields(raw, errors)
 
         # Validate nodes array
         if "nodes" in raw:
@@ -140,7 +153,28 @@ class PlanValidator:
                 for i, edge in enumerate(raw["edges"]):
                     self._validate_edge_schema(edge, i, errors)
 
-        # Validate entry_node_ids
+        self._validate_entry_node_ids_schema(raw, errors)
+
+    def _validate_required_fields(
+        self,
+        raw: Dict[str, Any],
+        errors: List[PlanValidationError],
+    ) -> None:
+        """Check required top-level fields are present."""
+        for field_name in self.REQUIRED_TOP_LEVEL_FIELDS:
+            if field_name not in raw:
+                errors.append(PlanValidationError(
+                    code=PlanValidationErrorCode.MISSING_REQUIRED_FIELD,
+                    message=f"Missing required field: {field_name}",
+                    path=f"$.{field_name}",
+                ))
+
+    def _validate_entry_node_ids_schema(
+        self,
+        raw: Dict[str, Any],
+        errors: List[PlanValidationError],
+    ) -> None:
+        """Validate the entry_node_ids array."""
         if "entry_node_ids" in raw:
             if not isinstance(raw["entry_node_ids"], list):
                 errors.append(PlanValidationError(
@@ -195,6 +229,18 @@ class PlanValidator:
                 path=path,
             ))
 
+        # Optional context budget must be a positive integer
+        budget = node.get("context_budget_tokens")
+        if budget is not None and (
+            not isinstance(budget, int) or isinstance(budget, bool) or budget <= 0
+        ):
+            errors.append(PlanValidationError(
+                code=PlanValidationErrorCode.INVALID_FIELD_TYPE,
+                message="context_budget_tokens must be a positive integer",
+                path=f"{path}.context_budget_tokens",
+                context={"value": budget},
+            ))
+
     def _validate_edge_schema(
         self,
         edge: Dict[str, Any],
@@ -262,44 +308,69 @@ class PlanValidator:
         """Validate graph structure integrity."""
         # Build node index
         node_ids: Set[str] = {node["node_id"] for node in raw.get("nodes", [])}
-        _end_node_ids: Set[str] = {
-            node["node_id"]
-            for node in raw.get("nodes", [])
-            if node.get("type") == "end"
-        }
 
-        # Track nodes with outbound edges
+        # Validate edges, tracking nodes with outbound edges
         nodes_with_outbound: Set[str] = set()
-
-        # Validate edges
         for i, edge in enumerate(raw.get("edges", [])):
-            from_id = edge.get("from_node_id")
-            to_id = edge.get("to_node_id")
+            if self._validate_edge_endpoints(edge, i, node_ids, errors):
+                nodes_with_outbound.add(edge.get("from_node_id"))
 
-            # Validate source exists
-            if from_id and from_id not in node_ids:
-                errors.append(PlanValidationError(
-                    code=PlanValidationErrorCode.EDGE_SOURCE_NOT_FOUND,
-                    message=f"Edge '{edge.get('edge_id')}' references "
-                            f"non-existent source node: {from_id}",
-                    path=f"$.edges[{i}].from_node_id",
-                    context={"node_id": from_id},
-                ))
-            else:
-                nodes_with_outbound.add(from_id)
+        self._validate_entry_nodes(raw.get("entry_node_ids", []), node_ids, errors)
 
-            # Validate target exists (null is valid for non-advancing)
-            if to_id is not None and to_id not in node_ids:
-                errors.append(PlanValidationError(
-                    code=PlanValidationErrorCode.EDGE_TARGET_NOT_FOUND,
-                    message=f"Edge '{edge.get('edge_id')}' references "
-                            f"non-existent target node: {to_id}",
-                    path=f"$.edges[{i}].to_node_id",
-                    context={"node_id": to_id},
-                ))
+        for node in raw.get("nodes", []):
+            self._validate_outbound(node, nodes_with_outbound, errors)
 
-        # Validate entry nodes exist
-        for entry_id in raw.get("entry_node_ids", []):
+        # Check for orphan nodes (unreachable from entry)
+        reachable = self._find_reachable_nodes(raw)
+        for node in raw.get("nodes", []):
+            self._validate_reachable(node, reachable, warnings)
+
+    def _validate_edge_endpoints(
+        self,
+        edge: Dict[str, Any],
+        index: int,
+        node_ids: Container[str],
+        errors: List[PlanValidationError],
+    ) -> bool:
+        """Check an edge's source and target exist.
+
+        Returns:
+            True if the edge counts as an outbound edge of its source
+        """
+        from_id = edge.get("from_node_id")
+        to_id = edge.get("to_node_id")
+        counts_as_outbound = True
+
+        # Validate source exists
+        if from_id and from_id not in node_ids:
+            errors.append(PlanValidationError(
+                code=PlanValidationErrorCode.EDGE_SOURCE_NOT_FOUND,
+                message=f"Edge '{edge.get('edge_id')}' references "
+                        f"non-existent source node: {from_id}",
+                path=f"$.edges[{index}].from_node_id",
+                context={"node_id": from_id},
+            ))
+            counts_as_outbound = False
+
+        # Validate target exists (null is valid for non-advancing)
+        if to_id is not None and to_id not in node_ids:
+            errors.append(PlanValidationError(
+                code=PlanValidationErrorCode.EDGE_TARGET_NOT_FOUND,
+                message=f"Edge '{edge.get('edge_id')}' references "
+                        f"non-existent target node: {to_id}",
+                path=f"$.edges[{index}].to_node_id",
+                context={"node_id": to_id},
+            ))
+        return counts_as_outbound
+
+    def _validate_entry_nodes(
+        self,
+        entry_node_ids: List[str],
+        node_ids: Container[str],
+        errors: List[PlanValidationError],
+    ) -> None:
+        """Check entry nodes exist."""
+        for entry_id in entry_node_ids:
             if entry_id not in node_ids:
                 errors.append(PlanValidationError(
                     code=PlanValidationErrorCode.ENTRY_NODE_NOT_FOUND,
@@ -308,54 +379,48 @@ class PlanValidator:
                     context={"node_id": entry_id},
                 ))
 
-        # Check non-end nodes have outbound edges
-        for node in raw.get("nodes", []):
-            node_id = node["node_id"]
-            if node.get("type") != "end" and node_id not in nodes_with_outbound:
-                errors.append(PlanValidationError(
-                    code=PlanValidationErrorCode.NO_OUTBOUND_EDGES,
-                    message=f"Non-end node '{node_id}' has no outbound edges",
-                    path="$.nodes",
-                    context={"node_id": node_id},
-                ))
+    def _validate_outbound(
+        self,
+        node: Dict[str, Any],
+        nodes_with_outbound: Container[str],
+        errors: List[PlanValidationError],
+    ) -> None:
+        """Check a non-end node has outbound edges."""
+        node_id = node["node_id"]
+        if node.get("type") != "end" and node_id not in nodes_with_outbound:
+            errors.append(PlanValidationError(
+                code=PlanValidationErrorCode.NO_OUTBOUND_EDGES,
+                message=f"Non-end node '{node_id}' has no outbound edges",
+                path="$.nodes",
+                context={"node_id": node_id},
+            ))
 
-        # Check for orphan nodes (unreachable from entry)
-        reachable = self._find_reachable_nodes(raw)
-        for node in raw.get("nodes", []):
-            node_id = node["node_id"]
-            if node_id not in reachable:
-                warnings.append(PlanValidationError(
-                    code=PlanValidationErrorCode.ORPHAN_NODE,
-                    message=f"Node '{node_id}' is unreachable from entry nodes",
-                    path="$.nodes",
-                    context={"node_id": node_id},
-                ))
+    def _validate_reachable(
+        self,
+        node: Dict[str, Any],
+        reachable: Container[str],
+        warnings: List[PlanValidationError],
+    ) -> None:
+        """Warn if a node is unreachable from the entry nodes."""
+        node_id = node["node_id"]
+        if node_id not in reachable:
+            warnings.append(PlanValidationError(
+                code=PlanValidationErrorCode.ORPHAN_NODE,
+                message=f"Node '{node_id}' is unreachable from entry nodes",
+                path="$.nodes",
+                context={"node_id": node_id},
+            ))
 
     def _find_reachable_nodes(self, raw: Dict[str, Any]) -> Set[str]:
         """Find all nodes reachable from entry nodes via BFS."""
         # Build adjacency list
         adjacency: Dict[str, List[str]] = {}
         for edge in raw.get("edges", []):
-            from_id = edge.get("from_node_id")
             to_id = edge.get("to_node_id")
-            if from_id not in adjacency:
-                adjacency[from_id] = []
             if to_id is not None:
-                adjacency[from_id].append(to_id)
-
-        # BFS from entry nodes
-        reachable: Set[str] = set()
-        queue = list(raw.get("entry_node_ids", []))
-        reachable.update(queue)
-
-        while queue:
-            current = queue.pop(0)
-            for neighbor in adjacency.get(current, []):
-                if neighbor not in reachable:
-                    reachable.add(neighbor)
-                    queue.append(neighbor)
+                adjacency.setdefault(edge.get("from_node_id"), []).append(to_id)
 
-        return reachable
+        return find_reachable(adjacency, raw.get("entry_node_ids", []))
 
     def _validate_outcome_mapping(
         self,
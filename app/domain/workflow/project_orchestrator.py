@@ -22,6 +22,7 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.api.models.document import Document
 from app.api.models.workflow_execution import WorkflowExecution
@@ -357,6 +358,7 @@ class ProjectOrchestrator:
                     for required_type in plan.requires_inputs:
                         result = await self.db.execute(
                             select(Document)
+                            .options(undefer(Document.content))
                             .where(Document.space_type == "project")
                             .where(Document.space_id == project_uuid)
                             .where(Document.doc_type_id == required_type)
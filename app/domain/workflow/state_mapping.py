@@ -11,6 +11,7 @@ from typing import Any, Dict, List
 from app.domain.workflow.document_workflow_state import (
     DocumentWorkflowState,
     DocumentWorkflowStatus,
+    ExecutionSummary,
     NodeExecution,
 )
 
@@ -82,7 +83,7 @@ def row_dict_to_state(row_data: Dict[str, Any]) -> DocumentWorkflowState:
     Args:
         row_data: Dict with keys matching ORM column names:
             execution_id, document_id, document_type, workflow_id,
-            user_id, current_node_id, status, execution_log,
+            workflow_version, user_id, current_node_id, status, execution_log,
             retry_counts, gate_outcome, terminal_outcome, thread_id,
             context_state, pending_user_input, pending_user_input_rendered,
             pending_choices, pending_user_input_payload,
@@ -124,6 +125,7 @@ def row_dict_to_state(row_data: Dict[str, Any]) -> DocumentWorkflowState:
         project_id=row_data.get("document_id") or "unknown",
         document_type=row_data.get("document_type") or "unknown",
         workflow_id=row_data.get("workflow_id") or "unknown",
+        workflow_version=row_data.get("workflow_version"),
         user_id=str(row_data["user_id"]) if row_data.get("user_id") else None,
         current_node_id=row_data.get("current_node_id"),
         status=status,
@@ -141,3 +143,47 @@ def row_dict_to_state(row_data: Dict[str, Any]) -> DocumentWorkflowState:
         created_at=created_at,
         updated_at=updated_at,
     )
+
+
+def row_dict_to_summary(row_data: Dict[str, Any]) -> ExecutionSummary:
+    """Convert a projected list row to ExecutionSummary.
+
+    The list query selects step_count and the first/last execution_log
+    timestamps in SQL instead of the execution_log itself.
+
+    Args:
+        row_data: Dict with keys execution_id, document_id, document_type,
+            workflow_id, current_node_id, status, terminal_outcome,
+            pending_user_input, step_count, first_timestamp, last_timestamp
+
+    Returns:
+        ExecutionSummary instance
+    """
+    first = row_data.get("first_timestamp")
+    last = row_data.get("last_timestamp")
+    if first and last:
+        created_at = datetime.fromisoformat(first)
+        updated_at = datetime.fromisoformat(last)
+    else:
+        created_at = updated_at = datetime.now(timezone.utc)
+
+    raw_status = row_data.get("status")
+    status = (
+        DocumentWorkflowStatus(raw_status)
+        if raw_status
+        else DocumentWorkflowStatus.RUNNING
+    )
+
+    return ExecutionSummary(
+        execution_id=row_data.get("execution_id"),
+        project_id=row_data.get("document_id") or "unknown",
+        document_type=row_data.get("document_type") or "unknown",
+        workflow_id=row_data.get("workflow_id") or "unknown",
+        current_node_id=row_data.get("current_node_id"),
+        status=status,
+        terminal_outcome=row_data.get("terminal_outcome"),
+        pending_user_input=row_data.get("pending_user_input") or False,
+        step_count=row_data.get("step_count") or 0,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
@@ -5,12 +5,20 @@ Bridges the workflow executor with the thread execution service.
 
 Key Responsibilities:
 - Create threads when workflows start (if plan.thread_ownership.owns_thread)
-- Persist conversation turns to thread ledger
+- Persist conversation turns to thread ledger (one work item per node execution)
 - Load conversation history when resuming interrupted workflows
 
+History is bounded so resuming a long-lived thread costs the same on turn
+500 as on turn 5: it is the latest summary checkpoint plus a window of the
+newest turns after it, read with indexed ledger queries (by payload type,
+in ledger seq order) and trimmed to a token budget. Every SUMMARY_INTERVAL
+turns a new checkpoint folds the older turns into the summary.
+
 INVARIANTS (WS-ADR-025 Phase 3):
 - Thread ID is stored in DocumentWorkflowState.thread_id
 - Conversation messages are persisted as ledger entries (type: conversation_turn)
+- Summary checkpoints are ledger entries (type: conversation_summary) covering
+  every turn up to through_seq
 - Thread status mirrors workflow status (running/complete/failed)
 """
 
@@ -18,13 +26,15 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.llm.token_estimator import get_token_estimator
+
 if TYPE_CHECKING:
-    pass
+    from app.persistence.models import LLMLedgerEntry
 
 
 logger = logging.getLogger(__name__)
@@ -39,20 +49,46 @@ class ThreadManager:
     - Threads can be resumed if workflow is interrupted
     """
 
-    # Custom ledger entry type for conversation turns
+    # Custom ledger entry types for conversation turns and summary checkpoints
     CONVERSATION_TURN_TYPE = "conversation_turn"
+    CONVERSATION_SUMMARY_TYPE = "conversation_summary"
+
+    # History window: newest turns after the last checkpoint
+    DEFAULT_MAX_MESSAGES = 50
+    DEFAULT_MAX_TOKENS = 8000
+
+    # Fold SUMMARY_INTERVAL turns into a new checkpoint once they are
+    # followed by SUMMARY_KEEP_RECENT newer turns (kept verbatim)
+    SUMMARY_INTERVAL = 40
+    SUMMARY_KEEP_RECENT = 10
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        max_tokens: Optional[int] = DEFAULT_MAX_TOKENS,
+        summary_interval: int = SUMMARY_INTERVAL,
+        summarizer: Optional[Callable[[Optional[str], List[Dict[str, Any]]], str]] = None,
+    ):
         """Initialize thread manager.
 
         Args:
             db: Database session
+            max_messages: Most turns loaded into history
+            max_tokens: Token budget for loaded history (None for no limit)
+            summary_interval: Turns between summary checkpoints
+            summarizer: Builds a checkpoint from the previous summary and
+                the turns it now covers (defaults to summarize_turns)
         """
         # Deferred import to avoid circular dependency
         from app.domain.services.thread_execution_service import ThreadExecutionService as TES
 
         self.db = db
         self._service = TES(db)
+        self.max_messages = max_messages
+        self.max_tokens = max_tokens
+        self.summary_interval = summary_interval
+        self._summarize = summarizer or summarize_turns
 
     async def create_workflow_thread(
         self,
@@ -146,7 +182,7 @@ class ThreadManager:
         node_id: Optional[str] = None,
         turn_number: Optional[int] = None,
     ) -> None:
-        """Record a conversation turn to the thread ledger.
+        """Record a single conversation turn to the thread ledger.
 
         Args:
             thread_id: The thread ID
@@ -155,75 +191,157 @@ class ThreadManager:
             node_id: Optional node ID where turn occurred
             turn_number: Optional turn number for ordering
         """
-        # Create a work item for the turn (or reuse existing)
-        work_item = await self._service.create_work_item(
-            thread_id=UUID(thread_id),
-            lock_scope=None,
-        )
+        turn: Dict[str, Any] = {"role": role, "content": content}
+        if turn_number is not None:
+            turn["turn_number"] = turn_number
+        await self.record_conversation_turns(thread_id, [turn], node_id=node_id)
 
-        # Build turn payload
-        payload = {
-            "type": self.CONVERSATION_TURN_TYPE,
-            "role": role,
-            "content": content,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
+    async def record_conversation_turns(
+        self,
+        thread_id: str,
+        turns: List[Dict[str, Any]],
+        node_id: Optional[str] = None,
+    ) -> None:
+        """Record the turns of one node execution under a single work item.
 
-        if node_id:
-            payload["node_id"] = node_id
-        if turn_number is not None:
-            payload["turn_number"] = turn_number
-
-        # Record to ledger based on role
-        if role == "user":
-            await self._service.record_prompt(
-                thread_id=UUID(thread_id),
-                work_item_id=work_item.id,
-                prompt_data=payload,
-            )
-        else:
-            await self._service.record_response(
-                thread_id=UUID(thread_id),
-                work_item_id=work_item.id,
-                response_data=payload,
-            )
+        Args:
+            thread_id: The thread ID
+            turns: Dicts with role, content and optional turn_number, in order
+            node_id: Optional node ID where the turns occurred
+        """
+        if not turns:
+            return
 
-        logger.debug(f"Recorded {role} turn to thread {thread_id}")
+        # Deferred import to avoid circular dependency
+        from app.persistence.models import LedgerEntryType
+
+        tid = UUID(thread_id)
+        work_item = await self._service.create_work_item(thread_id=tid, lock_scope=None)
+
+        timestamp = datetime.now(timezone.utc).isoformat()
+        entries = []
+        for turn in turns:
+            # Build turn payload
+            payload = {
+                "type": self.CONVERSATION_TURN_TYPE,
+                "role": turn["role"],
+                "content": turn["content"],
+                "timestamp": timestamp,
+            }
+            if node_id:
+                payload["node_id"] = node_id
+            if turn.get("turn_number") is not None:
+                payload["turn_number"] = turn["turn_number"]
+
+            # Record to ledger based on role
+            entry_type = LedgerEntryType.PROMPT if turn["role"] == "user" else LedgerEntryType.RESPONSE
+            entries.append((entry_type, payload))
+
+        await self._service.record_entries(tid, work_item.id, entries)
+        logger.debug(f"Recorded {len(entries)} turns to thread {thread_id}")
+
+        try:
+            # Savepoint: a failed checkpoint statement must not abort the
+            # transaction holding the turns just recorded
+            async with self.db.begin_nested():
+                await self._checkpoint_if_due(tid, work_item.id)
+        except Exception as e:
+            # Turns are recorded; the next node execution retries the checkpoint
+            logger.warning(f"Failed to write conversation summary for thread {thread_id}: {e}")
 
     async def load_conversation_history(
         self,
         thread_id: str,
+        max_messages: Optional[int] = None,
+        max_tokens: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Load conversation history from thread ledger.
+        """Load bounded conversation history from thread ledger.
 
         Args:
             thread_id: The thread ID
+            max_messages: Most turns to load (defaults to self.max_messages)
+            max_tokens: Token budget (defaults to self.max_tokens)
 
         Returns:
-            List of message dicts with role and content, ordered by timestamp
+            List of message dicts with role and content, oldest first. If
+            earlier turns were summarized, the first message is a system
+            message carrying the summary.
         """
-        entries = await self._service.get_ledger_entries(UUID(thread_id))
-
-        # Filter to conversation turns and extract messages
-        messages = []
-        for entry in entries:
-            payload = entry.payload
-            if payload.get("type") == self.CONVERSATION_TURN_TYPE:
-                messages.append({
-                    "role": payload.get("role"),
-                    "content": payload.get("content"),
-                    "timestamp": payload.get("timestamp"),
-                    "node_id": payload.get("node_id"),
-                })
-
-        # Sort by timestamp
-        messages.sort(key=lambda m: m.get("timestamp", ""))
-
-        # Return simplified format (just role and content)
-        return [
-            {"role": m["role"], "content": m["content"]}
-            for m in messages
-        ]
+        tid = UUID(thread_id)
+        max_messages = self.max_messages if max_messages is None else max_messages
+        max_tokens = self.max_tokens if max_tokens is None else max_tokens
+
+        summary = await self._latest_summary(tid)
+        through_seq = summary.payload.get("through_seq") if summary else None
+
+        entries = await self._service.get_ledger_entries_by_type(
+            tid, self.CONVERSATION_TURN_TYPE, after_seq=through_seq, limit=max_messages,
+        )
+        messages = [_to_message(entry) for entry in entries]
+
+        prefix = []
+        if summary:
+            prefix.append({
+                "role": "system",
+                "content": f"Summary of earlier conversation:\n{summary.payload.get('summary', '')}",
+            })
+
+        if max_tokens is not None:
+            count = get_token_estimator().count
+            budget = max_tokens - sum(count(m["content"] or "") for m in prefix)
+            # Keep the newest turns that fit, and always the newest one
+            # (e.g. a pasted document larger than the whole budget)
+            kept = 0
+            for message in reversed(messages):
+                budget -= count(message["content"] or "")
+                if budget < 0 and kept:
+                    break
+                kept += 1
+            messages = messages[len(messages) - kept:]
+
+        return prefix + messages
+
+    async def _latest_summary(self, thread_id: UUID) -> Optional["LLMLedgerEntry"]:
+        summaries = await self._service.get_ledger_entries_by_type(
+            thread_id, self.CONVERSATION_SUMMARY_TYPE, limit=1,
+        )
+        return summaries[-1] if summaries else None
+
+    async def _checkpoint_if_due(self, thread_id: UUID, work_item_id: UUID) -> None:
+        """Fold older turns into a summary once enough have accumulated."""
+        from app.persistence.models import LedgerEntryType
+
+        summary = await self._latest_summary(thread_id)
+        through_seq = summary.payload.get("through_seq") if summary else None
+
+        pending = await self._service.count_ledger_entries_by_type(
+            thread_id, self.CONVERSATION_TURN_TYPE, after_seq=through_seq,
+        )
+        if pending < self.summary_interval + self.SUMMARY_KEEP_RECENT:
+            return
+
+        entries = await self._service.get_ledger_entries_by_type(
+            thread_id, self.CONVERSATION_TURN_TYPE, after_seq=through_seq,
+        )
+        covered = entries[:-self.SUMMARY_KEEP_RECENT] if self.SUMMARY_KEEP_RECENT else entries
+        if not covered:
+            return
+
+        previous = summary.payload.get("summary") if summary else None
+        payload = {
+            "type": self.CONVERSATION_SUMMARY_TYPE,
+            "summary": self._summarize(previous, [_to_message(e) for e in covered]),
+            "through_seq": covered[-1].seq,
+            "turn_count": (summary.payload.get("turn_count", 0) if summary else 0) + len(covered),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        await self._service.record_entries(
+            thread_id, work_item_id, [(LedgerEntryType.SUMMARY, payload)]
+        )
+        logger.info(
+            f"Summarized {len(covered)} turns of thread {thread_id} "
+            f"through seq {payload['through_seq']}"
+        )
 
     async def get_thread_status(self, thread_id: str) -> Optional[str]:
         """Get thread status.
@@ -264,3 +382,42 @@ def get_thread_purpose(plan_config: Dict[str, Any]) -> Optional[str]:
     """
     thread_ownership = plan_config.get("thread_ownership", {})
     return thread_ownership.get("thread_purpose")
+
+
+# Summary checkpoint limits (summarize_turns)
+SUMMARY_MAX_CHARS = 4000
+SUMMARY_LINE_CHARS = 200
+
+
+def _to_message(entry: "LLMLedgerEntry") -> Dict[str, Any]:
+    return {"role": entry.payload.get("role"), "content": entry.payload.get("content")}
+
+
+def summarize_turns(
+    previous: Optional[str],
+    messages: List[Dict[str, Any]],
+) -> str:
+    """Build a summary checkpoint without an LLM call.
+
+    Extractive: one line per turn (role and the start of its content),
+    appended to the previous summary and capped at SUMMARY_MAX_CHARS,
+    keeping the most recent lines.
+
+    Args:
+        previous: The previous checkpoint's summary, if any
+        messages: Turns to fold in, oldest first
+
+    Returns:
+        Summary text
+    """
+    lines = [previous] if previous else []
+    for message in messages:
+        text = " ".join(str(message.get("content") or "").split())
+        if len(text) > SUMMARY_LINE_CHARS:
+            text = text[:SUMMARY_LINE_CHARS - 3] + "..."
+        lines.append(f"{message.get('role')}: {text}")
+
+    summary = "\n".join(lines)
+    if len(summary) > SUMMARY_MAX_CHARS:
+        summary = "..." + summary[-(SUMMARY_MAX_CHARS - 3):]
+    return summary
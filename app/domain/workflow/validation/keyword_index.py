@@ -0,0 +1,135 @@
+"""Keyword index for the PGC validation rules.
+
+The promotion, contradiction and grounding checks compare every document
+item (constraint, assumption, guardrail) with every source (PGC answer,
+intake brief) by keyword overlap. Doing that with Python sets builds two
+new sets per pair. KeywordIndex makes each comparison a couple of integer
+operations:
+
+- Keywords are interned to integer ids.
+- Each indexed keyword set is a bitset (a Python int with one bit per
+  keyword id), so an intersection size is (a & b).bit_count().
+- An inverted index (keyword id -> bitset of items) restricts a query to
+  the items sharing at least one keyword with it.
+
+Scores and tie-breaking are identical to jaccard_similarity and
+keyword_overlap_ratio in rules.py.
+
+Usage:
+    index = KeywordIndex(source_keyword_sets)
+    ratio, position = index.best_coverage(constraint_keywords)
+    matches = index.similar(constraint_keywords, threshold=0.5)
+"""
+
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def _bit_positions(bits: int) -> Iterator[int]:
+    """Positions of the set bits in ascending order."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class KeywordIndex:
+    """Interned, bitset-encoded keyword sets with an inverted index."""
+
+    def __init__(self, keyword_sets: Iterable[AbstractSet[str]] = ()):
+        """
+        Args:
+            keyword_sets: Keyword sets to index, in order (positions are
+                reported back by the query methods)
+        """
+        self._ids: Dict[str, int] = {}
+        self._masks: List[int] = []
+        self._sizes: List[int] = []
+        # keyword id -> bitset of item positions containing it
+        self._postings: List[int] = []
+        for keywords in keyword_sets:
+            self.add(keywords)
+
+    def __len__(self) -> int:
+        return len(self._masks)
+
+    def add(self, keywords: AbstractSet[str]) -> int:
+        """Index a keyword set and return its position."""
+        position = len(self._masks)
+        item_bit = 1 << position
+        mask = 0
+        for keyword in keywords:
+            keyword_id = self._ids.get(keyword)
+            if keyword_id is None:
+                keyword_id = self._ids[keyword] = len(self._postings)
+                self._postings.append(0)
+            mask |= 1 << keyword_id
+            self._postings[keyword_id] |= item_bit
+        self._masks.append(mask)
+        self._sizes.append(len(keywords))
+        return position
+
+    def best_coverage(self, keywords: AbstractSet[str]) -> Tuple[float, Optional[int]]:
+        """
+        Find the indexed set covering the largest fraction of keywords.
+
+        Equivalent to taking the maximum of keyword_overlap_ratio(item,
+        keywords) over the items, first item winning ties.
+
+        Returns:
+            (ratio, position), or (0.0, None) if no item shares a keyword
+        """
+        if not keywords:
+            return 0.0, None
+        mask, candidates = self._encode(keywords)
+        best_count = 0
+        best_position = None
+        masks = self._masks
+        for position in _bit_positions(candidates):
+            count = (masks[position] & mask).bit_count()
+            if count > best_count:
+                best_count = count
+                best_position = position
+        return best_count / len(keywords), best_position
+
+    def similar(
+        self,
+        keywords: AbstractSet[str],
+        threshold: float,
+    ) -> List[Tuple[int, float]]:
+        """
+        Find indexed sets whose Jaccard similarity with keywords exceeds threshold.
+
+        Sets whose sizes alone rule out a match are skipped without
+        computing an intersection.
+
+        Returns:
+            (position, similarity) pairs in position order
+        """
+        if not keywords:
+            return []
+        size = len(keywords)
+        mask, candidates = self._encode(keywords)
+        masks = self._masks
+        sizes = self._sizes
+        matches = []
+        for position in _bit_positions(candidates):
+            other = sizes[position]
+            # Jaccard <= min/max size
+            if min(size, other) < threshold * max(size, other):
+                continue
+            intersection = (masks[position] & mask).bit_count()
+            similarity = intersection / (size + other - intersection)
+            if similarity > threshold:
+                matches.append((position, similarity))
+        return matches
+
+    def _encode(self, keywords: AbstractSet[str]) -> Tuple[int, int]:
+        """Bitset of a query's known keywords, and of the items sharing one."""
+        mask = 0
+        candidates = 0
+        for keyword in keywords:
+            keyword_id = self._ids.get(keyword)
+            if keyword_id is not None:
+                mask |= 1 << keyword_id
+                candidates |= self._postings[keyword_id]
+        return mask, candidates
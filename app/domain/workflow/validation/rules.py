@@ -7,11 +7,17 @@ Matching Algorithm (from WS):
 - Case-insensitive comparison
 - Use simple word tokenization (split on whitespace/punctuation)
 - Jaccard similarity for contradiction detection
+
+Keyword sets are extracted once per distinct text (cached) and compared
+through a KeywordIndex, so a check only scores the pairs that share a
+keyword.
 """
 
 import re
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
+from app.domain.workflow.validation.keyword_index import KeywordIndex
 from app.domain.workflow.validation.validation_result import ValidationIssue
 
 
@@ -38,6 +44,9 @@ PROHIBITED_TERMS: Dict[str, List[str]] = {
 }
 
 
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+
 def extract_keywords(text: str) -> Set[str]:
     """Extract keywords from text, excluding stopwords.
 
@@ -49,14 +58,20 @@ def extract_keywords(text: str) -> Set[str]:
     """
     if not text:
         return set()
+    return set(_keywords(text))
+
+
+@lru_cache(maxsize=4096)
+def _keywords(text: str) -> FrozenSet[str]:
+    """Cached keyword extraction (the same answers and intake feed several checks)."""
+    if not text:
+        return frozenset()
 
     # Tokenize: split on whitespace and punctuation
-    tokens = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+    tokens = _WORD_RE.findall(text.lower())
 
     # Filter stopwords and very short words
-    keywords = {t for t in tokens if t not in STOPWORDS and len(t) > 2}
-
-    return keywords
+    return frozenset(t for t in tokens if t not in STOPWORDS and len(t) > 2)
 
 
 def jaccard_similarity(set_a: Set[str], set_b: Set[str]) -> float:
@@ -105,12 +120,12 @@ def _is_empty_answer(answer: Any) -> bool:
     return answer is None or answer == "" or answer == "undecided"
 
 
-def _build_answer_keywords(question: Dict[str, Any], answer: Any) -> Set[str]:
+def _build_answer_keywords(question: Dict[str, Any], answer: Any) -> FrozenSet[str]:
     """Extract combined keywords from a PGC question and its answer."""
     q_text = question.get("text", "") or question.get("question", "")
     answer_text = str(answer) if not isinstance(answer, bool) else ""
     combined_text = f"{q_text} {answer_text}"
-    return extract_keywords(combined_text)
+    return _keywords(combined_text)
 
 
 def _collect_pgc_sources(
@@ -171,29 +186,37 @@ def _collect_intake_source(intake: Optional[Dict[str, Any]]) -> Optional[Dict[st
         return None
 
     return {
-        "keywords": extract_keywords(" ".join(intake_texts)),
+        "keywords": _keywords(" ".join(intake_texts)),
         "source": "intake",
         "priority": "stated",
     }
 
 
+def _index_sources(sources: List[Dict[str, Any]]) -> KeywordIndex:
+    """Index the keyword sets of sources, in list order."""
+    return KeywordIndex(source["keywords"] for source in sources)
+
+
 def _find_best_source_match(
     constraint_keywords: Set[str],
     sources: List[Dict[str, Any]],
+    index: Optional[KeywordIndex] = None,
 ) -> tuple:
     """Find the best keyword overlap match against a list of sources.
 
+    Args:
+        constraint_keywords: Keywords of the constraint or guardrail
+        sources: Source dicts with 'keywords'
+        index: Index of the sources (built if not given; pass one when
+            matching many items against the same sources)
+
     Returns:
         Tuple of (best_match_ratio, best_source_dict_or_None)
     """
-    best_match = 0.0
-    best_source = None
-    for source in sources:
-        overlap = keyword_overlap_ratio(source["keywords"], constraint_keywords)
-        if overlap > best_match:
-            best_match = overlap
-            best_source = source
-    return best_match, best_source
+    if index is None:
+        index = _index_sources(sources)
+    best_match, position = index.best_coverage(constraint_keywords)
+    return best_match, (sources[position] if position is not None else None)
 
 
 def _match_confidence(match_pct: int, high_threshold: int, medium_threshold: int) -> str:
@@ -332,6 +355,9 @@ def check_promotion_validity(
     # Build should/could sources (to detect promotion from these)
     should_sources = _collect_pgc_sources(question_map, pgc_answers, {"should", "could"})
 
+    valid_index = _index_sources(valid_sources)
+    should_index = _index_sources(should_sources)
+
     # Check each constraint
     for constraint in constraints:
         constraint_id = constraint.get("id", "unknown")
@@ -340,12 +366,14 @@ def check_promotion_validity(
         if not constraint_text:
             continue
 
-        constraint_keywords = extract_keywords(constraint_text)
+        constraint_keywords = _keywords(constraint_text)
         if not constraint_keywords:
             continue
 
         # Check against valid sources (must-answers and intake)
-        best_valid_match, _ = _find_best_source_match(constraint_keywords, valid_sources)
+        best_valid_match, _ = _find_best_source_match(
+            constraint_keywords, valid_sources, valid_index
+        )
 
         # If >= 50% match to valid source, it's valid
         if best_valid_match >= 0.5:
@@ -353,7 +381,7 @@ def check_promotion_validity(
 
         # Check if it matches a should/could source (promotion violation)
         best_should_match, matched_should_source = _find_best_source_match(
-            constraint_keywords, should_sources
+            constraint_keywords, should_sources, should_index
         )
 
         if best_should_match >= 0.5 and matched_should_source:
@@ -393,7 +421,7 @@ def check_internal_contradictions(
             constraint_items.append({
                 "id": c.get("id", "unknown"),
                 "text": text,
-                "keywords": extract_keywords(text),
+                "keywords": _keywords(text),
             })
 
     assumption_items = []
@@ -403,29 +431,28 @@ def check_internal_contradictions(
             assumption_items.append({
                 "id": a.get("id", "unknown"),
                 "text": text,
-                "keywords": extract_keywords(text),
+                "keywords": _keywords(text),
             })
 
-    # Compare each pair
+    # Compare only the pairs that share keywords
+    assumption_index = KeywordIndex(a_item["keywords"] for a_item in assumption_items)
     for c_item in constraint_items:
-        for a_item in assumption_items:
-            similarity = jaccard_similarity(c_item["keywords"], a_item["keywords"])
-
-            if similarity > 0.5:
-                issues.append(ValidationIssue(
-                    severity="error",
-                    check_type="contradiction",
-                    section="known_constraints/assumptions",
-                    field_id=f"{c_item['id']}/{a_item['id']}",
-                    message="Same concept appears in both constraints and assumptions",
-                    evidence={
-                        "constraint_id": c_item["id"],
-                        "constraint_text": c_item["text"],
-                        "assumption_id": a_item["id"],
-                        "assumption_text": a_item["text"],
-                        "jaccard_similarity": round(similarity, 2),
-                    },
-                ))
+        for position, similarity in assumption_index.similar(c_item["keywords"], 0.5):
+            a_item = assumption_items[position]
+            issues.append(ValidationIssue(
+                severity="error",
+                check_type="contradiction",
+                section="known_constraints/assumptions",
+                field_id=f"{c_item['id']}/{a_item['id']}",
+                message="Same concept appears in both constraints and assumptions",
+                evidence={
+                    "constraint_id": c_item["id"],
+                    "constraint_text": c_item["text"],
+                    "assumption_id": a_item["id"],
+                    "assumption_text": a_item["text"],
+                    "jaccard_similarity": round(similarity, 2),
+                },
+            ))
 
     return issues
 
@@ -514,39 +541,12 @@ def check_grounding(
     issues: List[ValidationIssue] = []
 
     # Build valid sources (same as promotion check, but include should-priority too)
-    valid_source_keywords: List[Set[str]] = []
-
-    # Add all PGC answers with explicit values as valid sources
     question_map = {q.get("id"): q for q in pgc_questions}
-    for q_id, answer in pgc_answers.items():
-        question = question_map.get(q_id)
-        if not question:
-            continue
-
-        priority = question.get("priority", "").lower()
-        if priority not in ("must", "should"):
-            continue
-
-        if answer is None or answer == "" or answer == "undecided":
-            continue
-
-        q_text = question.get("text", "") or question.get("question", "")
-        answer_text = str(answer) if not isinstance(answer, bool) else ""
-        combined_text = f"{q_text} {answer_text}"
-        valid_source_keywords.append(extract_keywords(combined_text))
-
-    # Add intake as valid source
-    if intake:
-        intake_texts = []
-        for field in ["description", "brief", "statement", "artifact_type", "audience"]:
-            if field in intake and intake[field]:
-                intake_texts.append(str(intake[field]))
-
-        if "raw_inputs" in intake and isinstance(intake["raw_inputs"], list):
-            intake_texts.extend(str(inp) for inp in intake["raw_inputs"])
-
-        if intake_texts:
-            valid_source_keywords.append(extract_keywords(" ".join(intake_texts)))
+    valid_sources = _collect_pgc_sources(question_map, pgc_answers, {"must", "should"})
+    intake_source = _collect_intake_source(intake)
+    if intake_source:
+        valid_sources.append(intake_source)
+    valid_index = _index_sources(valid_sources)
 
     # Check each guardrail
     for guardrail in guardrails:
@@ -556,15 +556,12 @@ def check_grounding(
         if not guardrail_text:
             continue
 
-        guardrail_keywords = extract_keywords(guardrail_text)
+        guardrail_keywords = _keywords(guardrail_text)
         if not guardrail_keywords:
             continue
 
         # Find best match
-        best_match = 0.0
-        for source_keywords in valid_source_keywords:
-            overlap = keyword_overlap_ratio(source_keywords, guardrail_keywords)
-            best_match = max(best_match, overlap)
+        best_match, _ = _find_best_source_match(guardrail_keywords, valid_sources, valid_index)
 
         if best_match < 0.5:
             issues.append(ValidationIssue(
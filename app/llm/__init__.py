@@ -27,6 +27,15 @@ from app.llm.document_condenser import (
     CondenseConfig,
     ROLE_FOCUS,
 )
+from app.llm.token_estimator import (
+    TokenEstimator,
+    get_token_estimator,
+)
+from app.llm.context_packer import (
+    ContextPacker,
+    PackStats,
+    compact_json,
+)
 from app.llm.output_parser import (
     OutputParser,
     OutputValidator,
@@ -71,6 +80,12 @@ __all__ = [
     "DocumentCondenser",
     "CondenseConfig",
     "ROLE_FOCUS",
+    # Token estimation / context packing
+    "TokenEstimator",
+    "get_token_estimator",
+    "ContextPacker",
+    "PackStats",
+    "compact_json",
     # Output parsing
     "OutputParser",
     "OutputValidator",
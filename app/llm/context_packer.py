@@ -0,0 +1,205 @@
+"""Budgeted context packing for LLM document inputs.
+
+Serializes structured documents compactly (no indentation whitespace) and,
+when a token budget is set, omits the least important top-level fields of
+the largest documents until the context fits. Every pack reports how many
+tokens the omissions saved.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.llm.token_estimator import TokenEstimator, get_token_estimator
+
+logger = logging.getLogger(__name__)
+
+
+# Fields omitted first when a document is over budget: bookkeeping the
+# model does not need to produce the next artifact.
+LOW_PRIORITY_FIELDS = frozenset({
+    "meta",
+    "metadata",
+    "provenance",
+    "audit",
+    "history",
+    "change_log",
+    "changelog",
+    "trace",
+    "debug",
+    "lineage",
+    "render_hints",
+    "generated_at",
+    "created_at",
+    "updated_at",
+})
+
+# Fields never omitted: identity and the core statement of intent.
+HIGH_PRIORITY_FIELDS = frozenset({
+    "id",
+    "title",
+    "name",
+    "summary",
+    "project_name",
+    "objective",
+    "objectives",
+    "scope",
+    "constraints",
+    "known_constraints",
+    "schema_version",
+})
+
+LOW, NORMAL, HIGH = 0, 1, 2
+
+
+def field_priority(key: str) -> int:
+    """Priority of a top-level document field (LOW, NORMAL or HIGH).
+
+    Pure function — no I/O, no side effects.
+    """
+    if key in HIGH_PRIORITY_FIELDS:
+        return HIGH
+    if key.startswith("_") or key in LOW_PRIORITY_FIELDS:
+        return LOW
+    return NORMAL
+
+
+def compact_json(value: Any) -> str:
+    """Serialize a value as JSON without insignificant whitespace."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+@dataclass
+class PackStats:
+    """Token accounting for one packing call."""
+    tokens: int = 0
+    unpacked_tokens: int = 0
+    budget_tokens: Optional[int] = None
+    omitted_fields: List[str] = field(default_factory=list)
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.unpacked_tokens - self.tokens)
+
+    def add(self, other: "PackStats") -> None:
+        self.tokens += other.tokens
+        self.unpacked_tokens += other.unpacked_tokens
+        self.omitted_fields.extend(other.omitted_fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tokens": self.tokens,
+            "unpacked_tokens": self.unpacked_tokens,
+            "tokens_saved": self.tokens_saved,
+            "budget_tokens": self.budget_tokens,
+            "omitted_fields": list(self.omitted_fields),
+        }
+
+
+class ContextPacker:
+    """Packs documents into a token budget."""
+
+    def __init__(self, estimator: Optional[TokenEstimator] = None):
+        """
+        Initialize packer.
+
+        Args:
+            estimator: Token estimator (defaults to the shared instance)
+        """
+        self._estimator = estimator or get_token_estimator()
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in text."""
+        return self._estimator.count(text)
+
+    def pack_document(
+        self,
+        name: str,
+        content: Any,
+        budget_tokens: Optional[int] = None,
+    ) -> Tuple[str, PackStats]:
+        """
+        Serialize one document, omitting fields if it exceeds the budget.
+
+        Omitted fields are replaced by a short marker so the model knows
+        the field exists. HIGH priority fields are always kept, so the
+        result can still exceed a very small budget.
+
+        Args:
+            name: Document name (used in omitted-field labels)
+            content: Document content
+            budget_tokens: Maximum tokens for this document, or None
+
+        Returns:
+            (serialized text, stats)
+        """
+        text = compact_json(content)
+        tokens = self.count_tokens(text)
+        stats = PackStats(tokens=tokens, unpacked_tokens=tokens, budget_tokens=budget_tokens)
+
+        if budget_tokens is None or stats.tokens <= budget_tokens or not isinstance(content, dict):
+            return text, stats
+
+        field_tokens = {
+            key: self.count_tokens(compact_json(value)) for key, value in content.items()
+        }
+        candidates = sorted(
+            (key for key in content if field_priority(key) != HIGH),
+            key=lambda k: (field_priority(k), -field_tokens[k]),
+        )
+
+        packed = dict(content)
+        for key in candidates:
+            if tokens <= budget_tokens:
+                break
+            marker = f"[omitted: ~{field_tokens[key]} tokens]"
+            packed[key] = marker
+            tokens -= field_tokens[key] - self.count_tokens(compact_json(marker))
+            stats.omitted_fields.append(f"{name}.{key}")
+
+        text = compact_json(packed)
+        stats.tokens = self.count_tokens(text)
+        return text, stats
+
+    def pack_documents(
+        self,
+        documents: Dict[str, Any],
+        budget_tokens: Optional[int] = None,
+    ) -> Tuple[Dict[str, str], PackStats]:
+        """
+        Pack several documents into a shared budget.
+
+        Smaller documents are packed first; whatever they leave unused
+        flows to the larger ones, so only the largest documents lose fields.
+
+        Args:
+            documents: Dict of name -> content
+            budget_tokens: Total token budget, or None for compact only
+
+        Returns:
+            (dict of name -> serialized text in input order, combined stats)
+        """
+        total = PackStats(budget_tokens=budget_tokens)
+        if not documents:
+            return {}, total
+
+        sizes = {
+            name: self.count_tokens(compact_json(content))
+            for name, content in documents.items()
+        }
+        order = sorted(documents, key=lambda name: sizes[name])
+
+        packed: Dict[str, str] = {}
+        remaining = budget_tokens
+        for index, name in enumerate(order):
+            share = None
+            if remaining is not None:
+                share = max(0, remaining // (len(order) - index))
+            text, stats = self.pack_document(name, documents[name], share)
+            packed[name] = text
+            total.add(stats)
+            if remaining is not None:
+                remaining = max(0, remaining - stats.tokens)
+
+        return {name: packed[name] for name in documents}, total
@@ -1,7 +1,21 @@
 """Document condenser for role-aware summarization."""
 
+import hashlib
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Markdown headers (levels 1-3), matched over the whole document in one
+# pass against "\n" + content. Anchoring on a literal newline rather than
+# a MULTILINE "^" lets the regex engine skip straight between line starts.
+# The separator excludes newlines so a bare "##" line never swallows the
+# next line as its title.
+_HEADER_RE = re.compile(r"\n(#{1,3})[^\S\n]+(.+)")
+
+DEFAULT_CACHE_SIZE = 256
 
 
 @dataclass
@@ -58,17 +72,80 @@ ROLE_FOCUS = {
 }
 
 
+class FocusMatcher:
+    """
+    Scores text against a fixed set of focus terms.
+
+    Terms are lowercased once at construction. Each term is then located
+    with a plain substring search, which CPython runs in C and which is
+    faster than a combined regex for a handful of terms.
+    """
+
+    def __init__(self, terms: Sequence[str]):
+        """
+        Initialize matcher.
+
+        Args:
+            terms: Focus terms (matched case-insensitively)
+        """
+        self.terms: Tuple[str, ...] = tuple(term.lower() for term in terms)
+        # (head, tail) pairs for each space in a term, for matches that
+        # straddle the space joining header and body
+        self._joins: Dict[str, Tuple[Tuple[str, str], ...]] = {
+            term: tuple(
+                (term[:i], term[i + 1:]) for i, char in enumerate(term) if char == " "
+            )
+            for term in self.terms
+        }
+
+    def score(self, header_lower: str, content_lower: str) -> int:
+        """Score a section: 2 per term in the header, 1 per term only in the body.
+
+        Equivalent to searching ``header + " " + content`` without building
+        the concatenated copy.
+        """
+        score = 0
+        for term in self.terms:
+            if term in header_lower:
+                score += 2
+            elif term in content_lower:
+                score += 1
+            else:
+                for head, tail in self._joins[term]:
+                    if content_lower.startswith(tail) and header_lower.endswith(head):
+                        score += 1
+                        break
+        return score
+
+
+@lru_cache(maxsize=64)
+def get_focus_matcher(terms: Tuple[str, ...]) -> FocusMatcher:
+    """Get a compiled matcher for a set of focus terms, built once per set."""
+    return FocusMatcher(terms)
+
+
 class DocumentCondenser:
     """Condenses documents based on target role's focus areas."""
     
-    def __init__(self, config: Optional[CondenseConfig] = None):
+    def __init__(
+        self,
+        config: Optional[CondenseConfig] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
         """
         Initialize condenser.
         
         Args:
             config: Condensing configuration
+            cache_size: Maximum number of condensed outputs kept, keyed by
+                (content hash, role, budget); 0 disables caching
         """
         self._config = config or CondenseConfig()
+        self._cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
     
     def condense(
         self,
@@ -91,6 +168,21 @@ class DocumentCondenser:
         if self._estimate_tokens(content) <= self._config.max_tokens:
             return content
         
+        return self._condense_cached(content, role, self._content_digest(content))
+    
+    def _condense_cached(self, content: str, role: str, digest: bytes) -> str:
+        """Condense an over-budget document, reusing a cached result."""
+        key = (digest, role, self._config.max_tokens)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        condensed = self._condense_uncached(content, role)
+        self._cache_put(key, condensed)
+        return condensed
+    
+    def _condense_uncached(self, content: str, role: str) -> str:
+        """Condense a document that exceeds the configured budget."""
         # Get role's focus areas
         focus_areas = ROLE_FOCUS.get(role, [])
         
@@ -132,14 +224,18 @@ class DocumentCondenser:
         
         result = []
         for doc in documents:
-            condensed = self.condense(
-                content=doc.get("content", ""),
-                role=role,
-                document_type=doc.get("type"),
-            )
-            # Further truncate if over budget
-            if self._estimate_tokens(condensed) > tokens_per_doc:
-                condensed = self._truncate(condensed, tokens_per_doc)
+            content = doc.get("content", "")
+            digest = self._content_digest(content)
+            key = (digest, role, self._config.max_tokens, tokens_per_doc)
+            condensed = self._cache_get(key)
+            if condensed is None:
+                condensed = content
+                if self._estimate_tokens(content) > self._config.max_tokens:
+                    condensed = self._condense_cached(content, role, digest)
+                # Further truncate if over budget
+                if self._estimate_tokens(condensed) > tokens_per_doc:
+                    condensed = self._truncate(condensed, tokens_per_doc)
+                self._cache_put(key, condensed)
             
             result.append({
                 "type": doc.get("type", "Unknown"),
@@ -148,39 +244,65 @@ class DocumentCondenser:
         
         return result
     
+    def clear_cache(self) -> None:
+        """Drop all cached condensed outputs."""
+        with self._lock:
+            self._cache.clear()
+    
+    @staticmethod
+    def _content_digest(content: str) -> bytes:
+        return hashlib.blake2b(
+            content.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+    
+    def _cache_get(self, key: tuple) -> Optional[str]:
+        if self._cache_size <= 0:
+            return None
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                self.cache_misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+    
+    def _cache_put(self, key: tuple, value: str) -> None:
+        if self._cache_size <= 0:
+            return
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+    
     def _estimate_tokens(self, text: str) -> int:
         """Estimate token count (rough: ~4 chars per token)."""
         return len(text) // 4
     
     def _split_sections(self, content: str) -> List[Dict[str, str]]:
-        """Split content into sections by headers."""
-        import re
+        """Split content into sections by headers.
         
+        Text before the first header is dropped, as is a header with no
+        lines under it before the next header.
+        """
         sections = []
-        current_header = None
-        current_content = []
-        
-        for line in content.split("\n"):
-            # Check for markdown headers
-            header_match = re.match(r'^(#{1,3})\s+(.+)$', line)
-            if header_match:
-                # Save previous section if it has content
-                if current_header is not None and current_content:
-                    sections.append({
-                        "header": current_header,
-                        "content": "\n".join(current_content),
-                    })
-                current_header = header_match.group(2)
-                current_content = []
-            else:
-                current_content.append(line)
+        # Offsets into "\n" + content: a match's end, less the prefix, plus
+        # the newline after the header line is where its body starts.
+        headers = list(_HEADER_RE.finditer("\n" + content))
         
-        # Save last section if it has a header
-        if current_header is not None and current_content:
-            sections.append({
-                "header": current_header,
-                "content": "\n".join(current_content),
-            })
+        for index, match in enumerate(headers):
+            body_start = match.end()
+            if index + 1 < len(headers):
+                body_end = headers[index + 1].start() - 1
+            else:
+                body_end = len(content)
+            
+            if body_start <= body_end:
+                sections.append({
+                    "header": match.group(2),
+                    "content": content[body_start:body_end],
+                })
         
         return sections
     
@@ -189,18 +311,16 @@ class DocumentCondenser:
         sections: List[Dict[str, str]], 
         focus_areas: List[str]
     ) -> List[Dict]:
-        """Score sections based on relevance to focus areas."""
+        """Score sections based on relevance to focus areas.
+        
+        A focus term scores 2 when it appears in the header, 1 when it
+        appears only in the body.
+        """
         scored = []
+        matcher = get_focus_matcher(tuple(focus_areas))
         
         for section in sections:
-            header_lower = section["header"].lower()
-            content_lower = section["content"].lower()
-            combined = header_lower + " " + content_lower
-            
-            score = 0
-            for area in focus_areas:
-                if area.lower() in combined:
-                    score += 2 if area.lower() in header_lower else 1
+            score = matcher.score(section["header"].lower(), section["content"].lower())
             
             scored.append({
                 **section,
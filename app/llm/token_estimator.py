@@ -0,0 +1,146 @@
+"""Token estimation with caching.
+
+Counts tokens with a lexical heuristic that, unlike ``len/4``, charges
+for punctuation and indentation runs the way BPE tokenizers do. The
+backend is chosen by TOKEN_ESTIMATOR_BACKEND (app/core/config.py), not by
+what happens to be importable: "heuristic" (the default) needs no extra
+packages; "tiktoken" uses the cl100k_base encoding (a close proxy for
+Claude's tokenizer) and fails at startup if tiktoken is not installed.
+Results are memoised in a bounded LRU keyed by a content hash, so
+repeated documents (the same input docs on every node of a workflow) are
+only counted once.
+"""
+
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 4096
+
+# Words split into ~4-char pieces; each punctuation mark and each
+# whitespace run longer than one char is its own token.
+_LEXICAL_RE = re.compile(r"[A-Za-z]+|\d+|[^\w\s]|\s{2,}|[^\x00-\x7f]")
+
+
+def heuristic_token_count(text: str) -> int:
+    """Estimate tokens without a tokenizer.
+
+    Pure function — no I/O, no side effects.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    count = 0
+    for piece in _LEXICAL_RE.findall(text):
+        if piece[0].isalpha() and piece.isascii():
+            count += (len(piece) + 3) // 4
+        elif piece[0].isdigit():
+            count += (len(piece) + 2) // 3
+        else:
+            count += 1
+    return count
+
+
+BACKEND_HEURISTIC = "heuristic"
+BACKEND_TIKTOKEN = "tiktoken"
+
+
+def _tiktoken_counter() -> Callable[[str], int]:
+    import tiktoken
+
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+class TokenEstimator:
+    """Counts tokens, memoising results by content hash."""
+
+    def __init__(
+        self,
+        counter: Optional[Callable[[str], int]] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Initialize estimator.
+
+        Args:
+            counter: Token counting function (defaults to
+                heuristic_token_count)
+            cache_size: Maximum number of memoised counts
+        """
+        if counter is None or counter is heuristic_token_count:
+            counter = heuristic_token_count
+            self.backend = BACKEND_HEURISTIC
+        else:
+            self.backend = getattr(counter, "__name__", "custom")
+
+        self._counter = counter
+        self._cache: "OrderedDict[bytes, int]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count(self, text: str) -> int:
+        """Return the token count for text."""
+        if not text:
+            return 0
+
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        tokens = self._counter(text)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = tokens
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def clear(self) -> None:
+        """Drop all memoised counts."""
+        with self._lock:
+            self._cache.clear()
+
+
+def create_token_estimator(backend: str) -> TokenEstimator:
+    """Build an estimator for a TOKEN_ESTIMATOR_BACKEND value."""
+    backend = backend.strip().lower()
+    if backend == BACKEND_HEURISTIC:
+        return TokenEstimator(heuristic_token_count)
+    if backend == BACKEND_TIKTOKEN:
+        estimator = TokenEstimator(_tiktoken_counter())
+        estimator.backend = BACKEND_TIKTOKEN
+        return estimator
+    raise ValueError(
+        f"Unknown token estimator backend: {backend!r} (expected 'heuristic' or 'tiktoken')"
+    )
+
+
+# Module-level singleton
+_estimator: Optional[TokenEstimator] = None
+
+
+def get_token_estimator() -> TokenEstimator:
+    """Get the shared TokenEstimator, built from TOKEN_ESTIMATOR_BACKEND."""
+    global _estimator
+    if _estimator is None:
+        from app.core.config import TOKEN_ESTIMATOR_BACKEND
+
+        _estimator = create_token_estimator(TOKEN_ESTIMATOR_BACKEND)
+        logger.info(f"Token estimator backend: {_estimator.backend}")
+    return _estimator
@@ -0,0 +1,39 @@
+"""Load generation and replay harness for PlanExecutor.
+
+Run with: python -m app.loadtest --help
+"""
+
+from app.loadtest.harness import LoadReport, delete_run_data, percentile, run_load
+from app.loadtest.latency import LatencyModel
+from app.loadtest.replay import (
+    RecordedExchange,
+    ReplayLLMProvider,
+    ReplayLLMService,
+    create_replay_executors,
+    fetch_recordings,
+    load_recordings,
+    save_recordings,
+)
+from app.loadtest.synthetic import (
+    SyntheticNodeExecutor,
+    create_synthetic_executors,
+    happy_path_outcome,
+)
+
+__all__ = [
+    "LatencyModel",
+    "LoadReport",
+    "RecordedExchange",
+    "ReplayLLMProvider",
+    "ReplayLLMService",
+    "SyntheticNodeExecutor",
+    "create_replay_executors",
+    "create_synthetic_executors",
+    "delete_run_data",
+    "fetch_recordings",
+    "happy_path_outcome",
+    "load_recordings",
+    "percentile",
+    "run_load",
+    "save_recordings",
+]
@@ -0,0 +1,205 @@
+"""
+Load-generation and replay harness for PlanExecutor.
+
+Runs N concurrent workflow executions through the real executor,
+persistence and event paths without calling an LLM, and reports
+steps/sec, DB round trips per step, p50/p99 step latency and memory per
+execution.
+
+Node executors come from one of:
+- synthetic (default): simulated LLM latency, happy-path outcomes
+- --replay FILE: production executors answered from recorded exchanges
+- --replay-db: the same, reading recordings from the ADR-010 tables
+
+State goes to the database configured by DATABASE_URL (a local
+PostgreSQL), unless --in-memory is given. Each execution gets its own
+project; the projects, documents, PGC answers, executions and LLM runs
+written by the run are deleted afterwards unless --keep-data is given.
+The PostgreSQL path is covered only by tests of the SQL it sends and has
+not yet been run against a live database; check the first run's
+"error" lines and the cleanup before relying on its figures.
+
+Usage:
+    python -m app.loadtest --executions 200 --concurrency 20
+    python -m app.loadtest --latency lognormal:800,4000 --latency-scale 0.01
+    python -m app.loadtest --export-recordings /tmp/recordings.jsonl --limit 1000
+    python -m app.loadtest --replay /tmp/recordings.jsonl --latency recorded
+    python -m app.loadtest --in-memory --document-type project_discovery --json
+    python -m app.loadtest --in-memory --spans
+
+Exit codes:
+  0 = every execution ran without raising
+  1 = one or more executions raised (see "error" lines)
+  2 = bad arguments or no recordings
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from app.loadtest.harness import LoadReport, delete_run_data, run_load
+from app.loadtest.latency import LatencyModel
+from app.loadtest.replay import (
+    RecordedExchange,
+    ReplayLLMProvider,
+    create_replay_executors,
+    fetch_recordings,
+    load_recordings,
+    save_recordings,
+)
+from app.loadtest.synthetic import create_synthetic_executors
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.loadtest", description=__doc__.split("\n\n")[1].strip()
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--replay", type=Path, metavar="FILE",
+                        help="Replay recorded exchanges from a JSONL file")
+    source.add_argument("--replay-db", action="store_true",
+                        help="Replay recorded exchanges from the ADR-010 tables")
+    source.add_argument("--export-recordings", type=Path, metavar="FILE",
+                        help="Write ADR-010 exchanges to a JSONL file and exit")
+    parser.add_argument("--limit", type=int, default=500,
+                        help="Recordings to read from the database (default: 500)")
+    parser.add_argument("--executions", type=int, default=50,
+                        help="Executions to run (default: 50)")
+    parser.add_argument("--concurrency", type=int, default=10,
+                        help="Executions in flight at once (default: 10)")
+    parser.add_argument("--document-type", action="append", dest="document_types",
+                        help="Document type to execute (repeatable; default: every plan)")
+    parser.add_argument("--latency", default=None,
+                        help="Latency model: recorded, constant:MS, uniform:MIN,MAX, "
+                             "lognormal:P50,P99 (default: recorded when replaying, "
+                             "else lognormal:800,4000)")
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="Multiply every latency (e.g. 0.01 to run 100x faster)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency sampling")
+    parser.add_argument("--max-steps", type=int, default=100,
+                        help="Step limit per execution (default: 100)")
+    parser.add_argument("--no-answer-pauses", action="store_true",
+                        help="Stop at user-input pauses instead of taking the first choice")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip the traced batch that measures memory per execution")
+    parser.add_argument("--in-memory", action="store_true",
+                        help="Keep workflow state in memory instead of the database")
+    parser.add_argument("--keep-data", action="store_true",
+                        help="Keep the rows the run wrote to the database")
+    parser.add_argument("--spans", action="store_true",
+                        help="Trace PlanExecutor phases and report time per span "
+                             "(includes warm-up executions)")
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    return parser
+
+
+async def _read_db_recordings(document_types: Optional[List[str]], limit: int) -> List[RecordedExchange]:
+    from app.core.database import async_session_factory
+
+    async with async_session_factory() as db:
+        return await fetch_recordings(db, artifact_types=document_types, limit=limit)
+
+
+async def _run(args: argparse.Namespace) -> int:
+    from app.domain.workflow.plan_registry import get_plan_registry
+
+    if args.export_recordings:
+        exchanges = await _read_db_recordings(args.document_types, args.limit)
+        written = save_recordings(args.export_recordings, exchanges)
+        print(f"{args.export_recordings}: {written} exchanges")
+        return 0 if written else 2
+
+    registry = get_plan_registry()
+    document_types = args.document_types or sorted(
+        plan.document_type for plan in registry.list_plans() if plan.document_type
+    )
+    replaying = bool(args.replay or args.replay_db)
+    latency = LatencyModel.parse(
+        args.latency or ("recorded" if replaying else "lognormal:800,4000"),
+        scale=args.latency_scale,
+    )
+
+    if replaying:
+        if args.replay:
+            exchanges = load_recordings(args.replay)
+        else:
+            exchanges = await _read_db_recordings(args.document_types, args.limit)
+        if not exchanges:
+            print("ERROR: no recorded exchanges to replay", file=sys.stderr)
+            return 2
+        provider = ReplayLLMProvider(exchanges, latency=latency, seed=args.seed)
+
+        def factory(db):
+            return create_replay_executors(provider, db)
+        mode = f"replay ({len(exchanges)} exchanges, latency {latency})"
+    else:
+        if latency.kind == "recorded":
+            print("ERROR: --latency recorded needs --replay or --replay-db", file=sys.stderr)
+            return 2
+        executors = create_synthetic_executors(registry, latency, seed=args.seed)
+
+        def factory(db):
+            return executors
+        mode = f"synthetic (latency {latency})"
+
+    histogram = None
+    if args.spans:
+        from app.observability.tracing import SpanHistogram, create_tracer, set_tracer
+
+        tracer = create_tracer("collect")
+        set_tracer(tracer)
+        histogram = tracer.processor(SpanHistogram)
+
+    engine = None
+    if not args.in_memory:
+        from app.core.database import engine
+
+    report: LoadReport = await run_load(
+        factory,
+        document_types,
+        executions=args.executions,
+        concurrency=args.concurrency,
+        engine=engine,
+        plan_registry=registry,
+        max_steps=args.max_steps,
+        answer_pauses=not args.no_answer_pauses,
+        trace_memory=not args.no_memory,
+        mode=mode,
+    )
+    if engine is not None and not args.keep_data:
+        await delete_run_data(engine, report)
+    if engine is not None:
+        await engine.dispose()
+
+    spans = histogram.snapshot() if histogram else None
+    if args.json:
+        data = report.to_dict()
+        if spans is not None:
+            data["spans"] = spans
+        print(json.dumps(data, indent=2))
+    else:
+        print("\n".join(report.format_lines()))
+        for series in spans or []:
+            label = series["span"] + (f" [{series['node_type']}]" if "node_type" in series else "")
+            print(f"span  {label:<48} n={series['count']:<6} avg {series['avg_ms']:.3f}ms")
+    return 1 if report.statuses.get("error") else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    # Per-step logging (e.g. skipped document persistence in memory) would
+    # dominate both the output and the measurement
+    logging.basicConfig(level=logging.ERROR)
+    try:
+        return asyncio.run(_run(args))
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
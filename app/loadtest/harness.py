@@ -0,0 +1,423 @@
+"""Concurrent PlanExecutor runs with throughput, latency, DB and memory figures.
+
+run_load() starts N executions, at most `concurrency` at a time, and
+drives each one step by step through the real PlanExecutor: state
+persistence (PostgreSQL when an engine is given, in memory otherwise),
+routing, document handling and event publishing all run as in
+production. Only the node executors are supplied by the caller (replay or
+synthetic, see replay.py and synthetic.py).
+
+With a database, every execution gets its own projects row (created
+before the timed pass), so produced documents are inserted, given display
+ids and spawn their children as they do for a real project.
+delete_run_data removes all of it again.
+
+Measured:
+- steps/sec: execute_step calls (including resumes after a pause) per
+  wall-clock second
+- DB round trips per step: SQL statements sent through the engine,
+  including those of start_execution, divided by steps
+- p50/p99 step latency: wall time of each execute_step call
+- memory per execution: peak and retained traced allocation of a separate
+  batch of `concurrency` executions run under tracemalloc after the timed
+  pass (tracing slows Python down several times, so it is kept out of the
+  timed figures)
+"""
+
+import asyncio
+import gc
+import logging
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import delete, event, insert, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.domain.workflow.document_workflow_state import DocumentWorkflowStatus
+from app.domain.workflow.nodes.base import NodeExecutor
+from app.domain.workflow.plan_executor import InMemoryStatePersistence, PlanExecutor
+from app.domain.workflow.plan_models import NodeType
+from app.domain.workflow.plan_registry import PlanRegistry, get_plan_registry
+
+logger = logging.getLogger(__name__)
+
+# Builds the node executors for one execution (given its DB session, if any)
+ExecutorsFactory = Callable[[Optional[AsyncSession]], Dict[NodeType, NodeExecutor]]
+
+# Human-readable projects.project_id of harness projects: this, then a
+# random suffix (the column holds 20 characters)
+PROJECT_ID_PREFIX = "LT-"
+
+_MAX_ERRORS_KEPT = 10
+
+_FINISHED = (DocumentWorkflowStatus.COMPLETED, DocumentWorkflowStatus.FAILED)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile of an ascending sequence (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    k = (pct / 100) * (len(sorted_values) - 1)
+    low = int(k)
+    if low + 1 >= len(sorted_values):
+        return float(sorted_values[-1])
+    return sorted_values[low] + (k - low) * (sorted_values[low + 1] - sorted_values[low])
+
+
+@dataclass
+class LoadReport:
+    """Results of one load run."""
+    mode: str
+    executions: int
+    concurrency: int
+    run_id: str
+    wall_seconds: float = 0.0
+    steps: int = 0
+    # None when the run had no database
+    db_round_trips: Optional[int] = None
+    # None when memory was not traced
+    memory_per_execution_bytes: Optional[int] = None
+    retained_per_execution_bytes: Optional[int] = None
+    statuses: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    execution_ids: List[str] = field(default_factory=list, repr=False)
+    project_ids: List[str] = field(default_factory=list, repr=False)
+    step_latencies_ms: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def steps_per_second(self) -> float:
+        return self.steps / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def round_trips_per_step(self) -> Optional[float]:
+        if self.db_round_trips is None or not self.steps:
+            return None
+        return self.db_round_trips / self.steps
+
+    @property
+    def p50_step_ms(self) -> float:
+        return percentile(sorted(self.step_latencies_ms), 50)
+
+    @property
+    def p99_step_ms(self) -> float:
+        return percentile(sorted(self.step_latencies_ms), 99)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "run_id": self.run_id,
+            "executions": self.executions,
+            "concurrency": self.concurrency,
+            "statuses": dict(self.statuses),
+            "steps": self.steps,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "steps_per_second": round(self.steps_per_second, 2),
+            "db_round_trips": self.db_round_trips,
+            "round_trips_per_step": (
+                round(self.round_trips_per_step, 2)
+                if self.round_trips_per_step is not None else None
+            ),
+            "p50_step_ms": round(self.p50_step_ms, 2),
+            "p99_step_ms": round(self.p99_step_ms, 2),
+            "memory_per_execution_bytes": self.memory_per_execution_bytes,
+            "retained_per_execution_bytes": self.retained_per_execution_bytes,
+            "errors": list(self.errors),
+        }
+
+    def format_lines(self) -> List[str]:
+        """Human-readable summary."""
+        statuses = ", ".join(f"{name}={count}" for name, count in sorted(self.statuses.items()))
+        lines = [
+            f"mode                 {self.mode}",
+            f"executions           {self.executions} (concurrency {self.concurrency}): {statuses}",
+            f"steps                {self.steps} in {self.wall_seconds:.2f}s",
+            f"steps/sec            {self.steps_per_second:.1f}",
+            f"step latency         p50 {self.p50_step_ms:.1f}ms  p99 {self.p99_step_ms:.1f}ms",
+        ]
+        if self.db_round_trips is None:
+            lines.append("DB round trips/step  n/a (in-memory persistence)")
+        elif self.round_trips_per_step is None:
+            lines.append(f"DB round trips/step  n/a ({self.db_round_trips} total, no steps)")
+        else:
+            lines.append(
+                f"DB round trips/step  {self.round_trips_per_step:.1f} "
+                f"({self.db_round_trips} total)"
+            )
+        if self.memory_per_execution_bytes is not None:
+            lines.append(
+                f"memory/execution     {self.memory_per_execution_bytes / 1024:.1f} KiB peak, "
+                f"{(self.retained_per_execution_bytes or 0) / 1024:.1f} KiB retained"
+            )
+        lines.extend(f"error                {error}" for error in self.errors)
+        return lines
+
+
+class _StatementCounter:
+    """Counts SQL statements sent through an engine."""
+
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine.sync_engine
+        self.count = 0
+
+    def _on_execute(self, *args: Any) -> None:
+        self.count += 1
+
+    def start(self) -> None:
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+
+    def stop(self) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+
+async def run_load(
+    executors_factory: ExecutorsFactory,
+    document_types: Sequence[str],
+    executions: int = 10,
+    concurrency: int = 4,
+    engine: Optional[AsyncEngine] = None,
+    plan_registry: Optional[PlanRegistry] = None,
+    max_steps: int = 100,
+    answer_pauses: bool = True,
+    trace_memory: bool = True,
+    warmup: bool = True,
+    mode: str = "custom",
+) -> LoadReport:
+    """
+    Run executions concurrently and measure them.
+
+    The timed pass is preceded by an untimed warm-up (one execution per
+    document type, so lazy imports and plan loading are not measured) and
+    followed, if trace_memory, by one traced batch of `concurrency`
+    executions for the memory figures.
+
+    Args:
+        executors_factory: Node executors for each execution
+        document_types: Document types to execute, used round-robin
+        executions: Number of timed executions
+        concurrency: Maximum executions in flight
+        engine: Database engine for state persistence (None: in memory)
+        plan_registry: Plan registry (default: the global one)
+        max_steps: Step limit per execution
+        answer_pauses: Resume paused executions with their first choice
+        trace_memory: Measure memory per execution with tracemalloc
+        warmup: Run the untimed warm-up executions
+        mode: Label for the report
+
+    Returns:
+        LoadReport for the timed pass
+    """
+    if not document_types:
+        raise ValueError("At least one document type is required")
+    report = LoadReport(
+        mode=mode,
+        executions=executions,
+        concurrency=concurrency,
+        run_id=uuid.uuid4().hex[:8],
+    )
+    batch = _Batch(
+        executors_factory, document_types, report,
+        engine=engine,
+        plan_registry=plan_registry or get_plan_registry(),
+        max_steps=max_steps,
+        answer_pauses=answer_pauses,
+    )
+
+    if warmup:
+        await batch.run(await batch.new_projects(len(document_types)), concurrency, LoadReport(
+            mode=mode, executions=0, concurrency=concurrency, run_id=report.run_id,
+        ))
+
+    project_ids = await batch.new_projects(executions)
+    counter = _StatementCounter(engine) if engine is not None else None
+    if counter:
+        counter.start()
+    try:
+        start = time.perf_counter()
+        await batch.run(project_ids, concurrency, report)
+        report.wall_seconds = time.perf_counter() - start
+    finally:
+        if counter:
+            counter.stop()
+            report.db_round_trips = counter.count
+
+    if trace_memory:
+        await _measure_memory(batch, min(concurrency, executions), report)
+    return report
+
+
+async def _measure_memory(batch: "_Batch", count: int, report: LoadReport) -> None:
+    """Run one traced batch; record peak and retained allocation per execution."""
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await batch.run(await batch.new_projects(count), count, LoadReport(
+            mode=report.mode, executions=count, concurrency=count, run_id=report.run_id,
+        ))
+        peak = tracemalloc.get_traced_memory()[1]
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    report.memory_per_execution_bytes = max(0, peak - baseline) // max(1, count)
+    report.retained_per_execution_bytes = max(0, retained - baseline) // max(1, count)
+
+
+class _Batch:
+    """Starts executions and drives them to the end."""
+
+    def __init__(
+        self,
+        executors_factory: ExecutorsFactory,
+        document_types: Sequence[str],
+        report: LoadReport,
+        engine: Optional[AsyncEngine],
+        plan_registry: PlanRegistry,
+        max_steps: int,
+        answer_pauses: bool,
+    ):
+        self._executors_factory = executors_factory
+        self._document_types = document_types
+        # Every execution and project id goes on the main report, for
+        # delete_run_data
+        self._report = report
+        self._registry = plan_registry
+        self._max_steps = max_steps
+        self._answer_pauses = answer_pauses
+        self._memory_persistence = InMemoryStatePersistence() if engine is None else None
+        self._session_factory = (
+            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            if engine is not None else None
+        )
+
+    async def new_projects(self, count: int) -> List[str]:
+        """Project ids for `count` executions, inserted into projects when
+        running against a database."""
+        project_ids = [str(uuid.uuid4()) for _ in range(count)]
+        if self._session_factory is None or not project_ids:
+            return project_ids
+
+        from app.api.models.project import Project
+
+        async with self._session_factory() as db:
+            await db.execute(insert(Project), [
+                {
+                    "id": uuid.UUID(project_id),
+                    "project_id": f"{PROJECT_ID_PREFIX}{project_id.replace('-', '')[:12]}",
+                    "name": f"Load test {self._report.run_id}",
+                    "created_by": "loadtest",
+                }
+                for project_id in project_ids
+            ])
+            await db.commit()
+        self._report.project_ids.extend(project_ids)
+        return project_ids
+
+    async def run(self, project_ids: Sequence[str], concurrency: int, report: LoadReport) -> None:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(index: int) -> None:
+            project_id = project_ids[index]
+            document_type = self._document_types[index % len(self._document_types)]
+            async with semaphore:
+                try:
+                    status = await self._execute(project_id, document_type, report)
+                except Exception as e:
+                    status = "error"
+                    if len(report.errors) < _MAX_ERRORS_KEPT:
+                        report.errors.append(f"{document_type}: {type(e).__name__}: {e}")
+                    logger.debug(f"Load execution {project_id} failed", exc_info=True)
+            report.statuses[status] = report.statuses.get(status, 0) + 1
+
+        await asyncio.gather(*(one(index) for index in range(len(project_ids))))
+
+    async def _execute(self, project_id: str, document_type: str, report: LoadReport) -> str:
+        if self._session_factory is None:
+            executor = PlanExecutor(
+                self._memory_persistence, self._registry,
+                executors=self._executors_factory(None),
+            )
+            return await self._drive(executor, project_id, document_type, report)
+
+        async with self._session_factory() as db:
+            executor = PlanExecutor(
+                _pg_persistence(db), self._registry,
+                executors=self._executors_factory(db), db_session=db,
+            )
+            return await self._drive(executor, project_id, document_type, report)
+
+    async def _drive(
+        self,
+        executor: PlanExecutor,
+        project_id: str,
+        document_type: str,
+        report: LoadReport,
+    ) -> str:
+        """Run one execution to the end; returns its final status."""
+        state = await executor.start_execution(project_id, document_type, {})
+        self._report.execution_ids.append(state.execution_id)
+
+        for _ in range(self._max_steps):
+            if state.status in _FINISHED:
+                return state.status.value
+            if state.status == DocumentWorkflowStatus.PAUSED:
+                if not (self._answer_pauses and state.pending_choices):
+                    return state.status.value
+                start = time.perf_counter()
+                state = await executor.submit_user_input(
+                    state.execution_id, user_choice=state.pending_choices[0]
+                )
+            else:
+                start = time.perf_counter()
+                state = await executor.execute_step(state.execution_id)
+            report.step_latencies_ms.append((time.perf_counter() - start) * 1000)
+            report.steps += 1
+
+        return state.status.value if state.status in _FINISHED else "max_steps"
+
+
+def _pg_persistence(db: AsyncSession):
+    from app.domain.workflow.pg_state_persistence import PgStatePersistence
+    return PgStatePersistence(db)
+
+
+async def delete_run_data(engine: AsyncEngine, report: LoadReport) -> None:
+    """
+    Delete everything a load run wrote, in one transaction.
+
+    That is its LLM runs (taken back out of the daily cost rollup first),
+    PGC answers, documents and their children, workflow executions and the
+    harness projects. The harness runs PlanExecutor without a
+    ThreadManager, so it writes no llm_threads or ledger rows.
+    """
+    if not report.execution_ids and not report.project_ids:
+        return
+    from app.api.models.document import Document
+    from app.domain.models.llm_logging import LLMRun
+    from app.api.models.pgc_answer import PGCAnswer
+    from app.api.models.project import Project
+    from app.api.models.workflow_execution import WorkflowExecution
+    from app.domain.services.llm_cost_rollup import subtract_runs_from_cost_rollup
+
+    in_run = LLMRun.workflow_execution_id.in_(report.execution_ids)
+    project_uuids = [uuid.UUID(project_id) for project_id in report.project_ids]
+    in_projects = (Document.space_type == "project") & Document.space_id.in_(project_uuids)
+    async with async_sessionmaker(engine, class_=AsyncSession)() as db:
+        await subtract_runs_from_cost_rollup(db, in_run)
+        await db.execute(delete(LLMRun).where(in_run))
+        await db.execute(delete(PGCAnswer).where(PGCAnswer.execution_id.in_(report.execution_ids)))
+        # Children reference their parent (ON DELETE RESTRICT): unlink first
+        await db.execute(update(Document).where(in_projects).values(parent_document_id=None))
+        await db.execute(delete(Document).where(in_projects))
+        await db.execute(
+            delete(WorkflowExecution).where(WorkflowExecution.execution_id.in_(report.execution_ids))
+        )
+        await db.execute(delete(Project).where(Project.id.in_(project_uuids)))
+        await db.commit()
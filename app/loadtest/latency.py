@@ -0,0 +1,82 @@
+"""Latency models for the load harness.
+
+A latency spec is a string so it can be given on the command line:
+
+    recorded                use the latency recorded with each exchange
+    constant:200            always 200ms
+    uniform:50,400          uniformly between 50ms and 400ms
+    lognormal:800,4000      log-normal with p50=800ms and p99=4000ms
+
+LLM latencies are long-tailed, so lognormal is the useful synthetic
+model: give it the p50/p99 from production and it reproduces the tail.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# z-score of the 99th percentile of a standard normal distribution
+_Z_P99 = 2.3263
+
+LATENCY_KINDS = ("recorded", "constant", "uniform", "lognormal")
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """How long a simulated LLM call takes."""
+    kind: str = "recorded"
+    params: Tuple[float, ...] = ()
+    # Multiplier applied to every sample (e.g. 0.01 to replay 100x faster)
+    scale: float = 1.0
+
+    @classmethod
+    def parse(cls, spec: str, scale: float = 1.0) -> "LatencyModel":
+        """
+        Parse a latency spec (see module docstring).
+
+        Raises:
+            ValueError: If the spec is malformed
+        """
+        kind, _, rest = spec.strip().partition(":")
+        if kind not in LATENCY_KINDS:
+            raise ValueError(
+                f"Unknown latency model '{kind}' (expected one of {', '.join(LATENCY_KINDS)})"
+            )
+        params = tuple(float(value) for value in rest.split(",")) if rest else ()
+        expected = {"recorded": 0, "constant": 1, "uniform": 2, "lognormal": 2}[kind]
+        if len(params) != expected:
+            raise ValueError(f"Latency model '{kind}' takes {expected} parameter(s): {spec!r}")
+        if any(value < 0 for value in params):
+            raise ValueError(f"Latency parameters must be non-negative: {spec!r}")
+        if kind == "lognormal" and not 0 < params[0] <= params[1]:
+            raise ValueError(f"lognormal needs 0 < p50 <= p99: {spec!r}")
+        return cls(kind=kind, params=params, scale=scale)
+
+    def sample_ms(self, rng: random.Random, recorded_ms: Optional[float] = None) -> float:
+        """
+        Draw one latency in milliseconds.
+
+        Args:
+            rng: Random source (seeded by the caller for repeatable runs)
+            recorded_ms: Latency recorded with the exchange being replayed
+        """
+        if self.kind == "recorded":
+            value = recorded_ms or 0.0
+        elif self.kind == "constant":
+            value = self.params[0]
+        elif self.kind == "uniform":
+            value = rng.uniform(*self.params)
+        else:
+            p50, p99 = self.params
+            sigma = (math.log(p99) - math.log(p50)) / _Z_P99
+            value = rng.lognormvariate(math.log(p50), sigma)
+        return value * self.scale
+
+    def __str__(self) -> str:
+        spec = self.kind
+        if self.params:
+            spec += ":" + ",".join(f"{value:g}" for value in self.params)
+        if self.scale != 1.0:
+            spec += f" x{self.scale:g}"
+        return spec
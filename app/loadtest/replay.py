@@ -0,0 +1,232 @@
+"""Replay of recorded LLM exchanges (ADR-010 logs) through the real node executors.
+
+ADR-010 logging stores every LLM call: the llm_run row (prompt id,
+tokens, latency in metadata), and the response text in llm_content via
+llm_run_output_ref. fetch_recordings() reads those back as
+RecordedExchange objects, which can be saved to a JSONL file so a load
+run does not need the source database.
+
+During a replay the node executors are the production ones (from
+build_llm_executors) and the LoggingLLMService is the production one too,
+so ADR-010 logging of the replayed calls is part of the measured path.
+Only the provider is replaced: ReplayLLMProvider answers each call with a
+recorded response for the same prompt, after the recorded (or a
+synthetic) latency.
+
+The provider does not see the task reference, so ReplayLLMService puts it
+in a context variable before handing the call to LoggingLLMService.
+"""
+
+import asyncio
+import json
+import logging
+import random
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.workflow.nodes.base import NodeExecutor
+from app.domain.workflow.nodes.llm_executors import LoggingLLMService, build_llm_executors
+from app.domain.workflow.plan_models import NodeType
+from app.llm.models import LLMResponse, Message
+from app.llm.providers.mock import MockLLMProvider
+from app.loadtest.latency import LatencyModel
+
+logger = logging.getLogger(__name__)
+
+# Task reference of the LLM call in progress (set by ReplayLLMService)
+current_prompt_id: ContextVar[Optional[str]] = ContextVar("current_prompt_id", default=None)
+
+
+@dataclass(frozen=True)
+class RecordedExchange:
+    """One recorded LLM call."""
+    prompt_id: str
+    response: str
+    latency_ms: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    artifact_type: Optional[str] = None
+    model: str = "replay"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RecordedExchange":
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+def load_recordings(path: Path) -> List[RecordedExchange]:
+    """Read exchanges from a JSONL file written by save_recordings."""
+    with open(path, encoding="utf-8") as f:
+        return [RecordedExchange.from_dict(json.loads(line)) for line in f if line.strip()]
+
+
+def save_recordings(path: Path, exchanges: Iterable[RecordedExchange]) -> int:
+    """Write exchanges as JSONL. Returns the number written."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for exchange in exchanges:
+            f.write(json.dumps(asdict(exchange)) + "\n")
+            count += 1
+    return count
+
+
+async def fetch_recordings(
+    db: AsyncSession,
+    artifact_types: Optional[Sequence[str]] = None,
+    limit: int = 500,
+) -> List[RecordedExchange]:
+    """
+    Load successful LLM exchanges from the ADR-010 tables, newest first.
+
+    Args:
+        db: Session on the database holding llm_run / llm_content
+        artifact_types: Only runs for these artifact types (optional)
+        limit: Maximum exchanges to load
+    """
+    from app.api.models.llm_log import LLMContent, LLMRun, LLMRunOutputRef
+
+    query = (
+        select(
+            LLMRun.prompt_id,
+            LLMRun.artifact_type,
+            LLMRun.model_name,
+            LLMRun.input_tokens,
+            LLMRun.output_tokens,
+            LLMRun.started_at,
+            LLMRun.ended_at,
+            LLMRun.run_metadata,
+            LLMContent.content_text,
+        )
+        .join(LLMRunOutputRef, LLMRunOutputRef.llm_run_id == LLMRun.id)
+        .join(LLMContent, LLMContent.content_hash == LLMRunOutputRef.content_hash)
+        .where(LLMRun.status == "SUCCESS", LLMRunOutputRef.kind == "response")
+        .order_by(LLMRun.started_at.desc())
+        .limit(limit)
+    )
+    if artifact_types:
+        query = query.where(LLMRun.artifact_type.in_(list(artifact_types)))
+
+    exchanges = []
+    for row in (await db.execute(query)).all():
+        latency_ms = (row.run_metadata or {}).get("latency_ms")
+        if latency_ms is None and row.ended_at and row.started_at:
+            latency_ms = (row.ended_at - row.started_at).total_seconds() * 1000
+        exchanges.append(RecordedExchange(
+            prompt_id=row.prompt_id,
+            response=row.content_text,
+            latency_ms=float(latency_ms or 0.0),
+            input_tokens=row.input_tokens or 0,
+            output_tokens=row.output_tokens or 0,
+            artifact_type=row.artifact_type,
+            model=row.model_name,
+        ))
+    return exchanges
+
+
+class ReplayLLMProvider(MockLLMProvider):
+    """Mock provider answering from recorded exchanges.
+
+    Calls are matched to recordings by prompt id (the node's task_ref);
+    recordings for the same prompt are used in turn. A prompt with no
+    recordings falls back to the whole pool, so a run still exercises the
+    executor even when recordings come from an older workflow version.
+    """
+
+    def __init__(
+        self,
+        exchanges: Sequence[RecordedExchange],
+        latency: Optional[LatencyModel] = None,
+        seed: Optional[int] = None,
+    ):
+        if not exchanges:
+            raise ValueError("ReplayLLMProvider needs at least one recorded exchange")
+        super().__init__()
+        self._exchanges = list(exchanges)
+        self._by_prompt: Dict[str, List[RecordedExchange]] = {}
+        for exchange in self._exchanges:
+            self._by_prompt.setdefault(exchange.prompt_id, []).append(exchange)
+        self._next: Dict[Optional[str], int] = {}
+        self._latency = latency or LatencyModel()
+        self._rng = random.Random(seed)
+        self.unmatched_calls = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "replay"
+
+    def next_exchange(self, prompt_id: Optional[str]) -> RecordedExchange:
+        """The recording to answer the next call for prompt_id with."""
+        pool = self._by_prompt.get(prompt_id) if prompt_id else None
+        if pool is None:
+            self.unmatched_calls += 1
+            pool = self._exchanges
+        position = self._next.get(prompt_id, 0)
+        self._next[prompt_id] = position + 1
+        return pool[position % len(pool)]
+
+    async def complete(
+        self,
+        messages: List[Message],
+        model: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+    ) -> LLMResponse:
+        """Answer with a recorded response after its latency."""
+        exchange = self.next_exchange(current_prompt_id.get())
+        latency_ms = self._latency.sample_ms(self._rng, exchange.latency_ms)
+        await asyncio.sleep(latency_ms / 1000)
+
+        # MockLLMProvider.complete records the call and applies injected
+        # errors; it does not await, so setting the per-call values right
+        # before it cannot interleave with another call.
+        self._default_response = exchange.response
+        self._latency_ms = latency_ms
+        self._input_tokens = exchange.input_tokens
+        self._output_tokens = exchange.output_tokens
+        return await super().complete(
+            messages, model, max_tokens=max_tokens, temperature=temperature,
+            system_prompt=system_prompt,
+        )
+
+
+class ReplayLLMService(LoggingLLMService):
+    """LoggingLLMService that tells ReplayLLMProvider which prompt is calling."""
+
+    async def complete(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        token = current_prompt_id.set(kwargs.get("task_ref"))
+        try:
+            return await super().complete(messages, system_prompt=system_prompt, **kwargs)
+        finally:
+            current_prompt_id.reset(token)
+
+
+def create_replay_executors(
+    provider: ReplayLLMProvider,
+    db: Optional[AsyncSession] = None,
+) -> Dict[NodeType, NodeExecutor]:
+    """
+    Production node executors backed by a replay provider.
+
+    Args:
+        provider: Provider answering the LLM calls
+        db: Session for ADR-010 logging of the replayed calls (None: no logging)
+    """
+    execution_logger = None
+    if db is not None:
+        from app.domain.repositories.postgres_llm_log_repository import PostgresLLMLogRepository
+        from app.domain.services.llm_execution_logger import LLMExecutionLogger
+        execution_logger = LLMExecutionLogger(PostgresLLMLogRepository(db))
+
+    return build_llm_executors(
+        ReplayLLMService(provider=provider, execution_logger=execution_logger)
+    )
@@ -0,0 +1,107 @@
+"""Synthetic node executors for the load harness.
+
+Each executor waits for a latency drawn from a LatencyModel (standing in
+for the LLM call) and then takes the plan's happy path: the first of
+HAPPY_PATH_OUTCOMES that has a routing edge from the node, or else the
+first routed outcome. Task and PGC nodes produce a mock document, so the
+executor's document handling runs as in production. No user input is
+ever requested, so every execution runs to an end node.
+"""
+
+import asyncio
+import random
+from typing import Any, Dict, Optional, Tuple
+
+from app.domain.workflow.nodes.base import (
+    DocumentWorkflowContext,
+    NodeExecutor,
+    NodeResult,
+)
+from app.domain.workflow.nodes.mock_executors import MockEndExecutor, MockTaskExecutor
+from app.domain.workflow.plan_models import NodeType, WorkflowPlan
+from app.domain.workflow.plan_registry import PlanRegistry
+from app.loadtest.latency import LatencyModel
+
+HAPPY_PATH_OUTCOMES = ("success", "pass", "qualified")
+
+# Node types that make an LLM call in production
+LLM_NODE_TYPES = (NodeType.INTAKE_GATE, NodeType.TASK, NodeType.QA, NodeType.GATE, NodeType.PGC)
+
+
+def happy_path_outcome(plan: WorkflowPlan, node_id: str) -> str:
+    """The outcome a synthetic executor returns for a node."""
+    routed = [
+        edge.outcome for edge in plan.edges
+        if edge.from_node_id == node_id and edge.to_node_id and edge.outcome
+    ]
+    for outcome in HAPPY_PATH_OUTCOMES:
+        if outcome in routed:
+            return outcome
+    return routed[0] if routed else "success"
+
+
+class SyntheticNodeExecutor(NodeExecutor):
+    """Executor for one node type that simulates LLM latency."""
+
+    def __init__(
+        self,
+        node_type: NodeType,
+        plan_registry: PlanRegistry,
+        latency: LatencyModel,
+        rng: random.Random,
+    ):
+        self._node_type = node_type
+        self._registry = plan_registry
+        self._latency = latency
+        self._rng = rng
+        self._task = MockTaskExecutor()
+        self._outcomes: Dict[Tuple[str, str, str], str] = {}
+
+    def supported_node_type(self) -> NodeType:
+        return self._node_type
+
+    async def execute(
+        self,
+        node_id: str,
+        node_config: Dict[str, Any],
+        context: DocumentWorkflowContext,
+        state_snapshot: Dict[str, Any],
+    ) -> NodeResult:
+        await asyncio.sleep(self._latency.sample_ms(self._rng) / 1000)
+
+        outcome = self._outcome(context.document_type, node_id)
+        if self._node_type in (NodeType.TASK, NodeType.PGC):
+            result = await self._task.execute(node_id, node_config, context, state_snapshot)
+            result.outcome = outcome
+            return result
+        return NodeResult(outcome=outcome)
+
+    def _outcome(self, document_type: str, node_id: str) -> str:
+        plan = self._registry.get_by_document_type(document_type)
+        key = (plan.workflow_id, plan.version, node_id)
+        outcome = self._outcomes.get(key)
+        if outcome is None:
+            outcome = self._outcomes[key] = happy_path_outcome(plan, node_id)
+        return outcome
+
+
+def create_synthetic_executors(
+    plan_registry: PlanRegistry,
+    latency: LatencyModel,
+    seed: Optional[int] = None,
+) -> Dict[NodeType, NodeExecutor]:
+    """
+    Executors for every node type: synthetic LLM nodes plus the mock end executor.
+
+    Args:
+        plan_registry: Registry the executor runs plans from
+        latency: Simulated LLM latency per node
+        seed: Seed for latency sampling
+    """
+    rng = random.Random(seed)
+    executors: Dict[NodeType, NodeExecutor] = {
+        node_type: SyntheticNodeExecutor(node_type, plan_registry, latency, rng)
+        for node_type in LLM_NODE_TYPES
+    }
+    executors[NodeType.END] = MockEndExecutor()
+    return executors
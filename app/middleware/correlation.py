@@ -6,14 +6,15 @@ Stores as UUID in request.state for downstream use.
 """
 
 from uuid import UUID, uuid4
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 import logging
 
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
 logger = logging.getLogger(__name__)
 
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
+class CorrelationIDMiddleware:
     """
     Extract or generate correlation ID from request.
     
@@ -22,10 +23,21 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
     - Stores as UUID in request.state.correlation_id
     - Echoes back in response headers
     """
-    
-    async def dispatch(self, request: Request, call_next):
-        header_value = request.headers.get("X-Correlation-ID")
-        
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header_value = None
+        for key, value in scope.get("headers", ()):
+            if key == b"x-correlation-id":
+                header_value = value.decode("latin-1")
+                break
+
         if header_value:
             try:
                 correlation_id = UUID(header_value)
@@ -34,11 +46,12 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
                 correlation_id = uuid4()
         else:
             correlation_id = uuid4()
-        
-        request.state.correlation_id = correlation_id
-        
-        response = await call_next(request)
-        
-        response.headers["X-Correlation-ID"] = str(correlation_id)
-        
-        return response
+
+        scope.setdefault("state", {})["correlation_id"] = correlation_id
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Correlation-ID"] = str(correlation_id)
+            await send(message)
+
+        await self.app(scope, receive, send_with_id)
@@ -9,6 +9,7 @@ from app.observability.logging import (
 from app.observability.metrics import (
     ExecutionMetrics,
     WorkflowMetrics,
+    SecretScanMetrics,
     MetricsCollector,
     get_metrics_collector,
     reset_metrics_collector,
@@ -21,6 +22,17 @@ from app.observability.health import (
     make_database_check,
     make_http_check,
 )
+from app.observability.tracing import (
+    Span,
+    Tracer,
+    NoopTracer,
+    InMemorySpanCollector,
+    SpanHistogram,
+    create_tracer,
+    get_tracer,
+    set_tracer,
+    reset_tracer,
+)
 
 __all__ = [
     # Logging
@@ -31,6 +43,7 @@ __all__ = [
     # Metrics
     "ExecutionMetrics",
     "WorkflowMetrics",
+    "SecretScanMetrics",
     "MetricsCollector",
     "get_metrics_collector",
     "reset_metrics_collector",
@@ -41,4 +54,14 @@ __all__ = [
     "HealthChecker",
     "make_database_check",
     "make_http_check",
+    # Tracing
+    "Span",
+    "Tracer",
+    "NoopTracer",
+    "InMemorySpanCollector",
+    "SpanHistogram",
+    "create_tracer",
+    "get_tracer",
+    "set_tracer",
+    "reset_tracer",
 ]
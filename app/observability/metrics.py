@@ -69,6 +69,33 @@ class WorkflowMetrics:
         return self.total_cost_usd / self.completions
 
 
+@dataclass
+class SecretScanMetrics:
+    """HTTP ingress secret scan timings for one scan tier."""
+    tier: str
+    scans: int = 0
+    detected: int = 0
+    total_bytes: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    
+    @property
+    def avg_ms(self) -> float:
+        """Average scan time."""
+        if self.scans == 0:
+            return 0.0
+        return self.total_ms / self.scans
+    
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "scans": self.scans,
+            "detected": self.detected,
+            "total_bytes": self.total_bytes,
+            "avg_ms": round(self.avg_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
 @dataclass
 class HealthStatus:
     """Health check status for a component."""
@@ -90,6 +117,7 @@ class MetricsCollector:
         self._lock = Lock()
         self._metrics = ExecutionMetrics()
         self._workflow_metrics: Dict[str, WorkflowMetrics] = {}
+        self._secret_scans: Dict[str, SecretScanMetrics] = {}
         self._started_at = datetime.now(timezone.utc)
     
     def record_execution_start(self, workflow_id: str) -> None:
@@ -150,6 +178,40 @@ class MetricsCollector:
             if error:
                 self._metrics.llm_calls_failed += 1
     
+    def record_secret_scan(
+        self,
+        tier: str,
+        duration_ms: float,
+        size_bytes: int,
+        detected: bool = False,
+    ) -> None:
+        """Record one HTTP ingress secret scan."""
+        with self._lock:
+            sm = self._secret_scans.get(tier)
+            if sm is None:
+                sm = self._secret_scans[tier] = SecretScanMetrics(tier)
+            sm.scans += 1
+            sm.total_bytes += size_bytes
+            sm.total_ms += duration_ms
+            sm.max_ms = max(sm.max_ms, duration_ms)
+            if detected:
+                sm.detected += 1
+    
+    def get_secret_scan_metrics(self) -> Dict[str, SecretScanMetrics]:
+        """Get secret scan metrics by tier."""
+        with self._lock:
+            return {
+                tier: SecretScanMetrics(
+                    tier=sm.tier,
+                    scans=sm.scans,
+                    detected=sm.detected,
+                    total_bytes=sm.total_bytes,
+                    total_ms=sm.total_ms,
+                    max_ms=sm.max_ms,
+                )
+                for tier, sm in self._secret_scans.items()
+            }
+    
     def get_metrics(self) -> ExecutionMetrics:
         """Get current metrics snapshot."""
         with self._lock:
@@ -205,6 +267,7 @@ class MetricsCollector:
         with self._lock:
             self._metrics = ExecutionMetrics()
             self._workflow_metrics.clear()
+            self._secret_scans.clear()
             self._started_at = datetime.now(timezone.utc)
 
 
@@ -0,0 +1,377 @@
+"""Tracing spans for the PlanExecutor hot path.
+
+Spans wrap each phase of a workflow step (context building, node
+execution, LLM wait, response parsing, QA stages, conversation and state
+persistence, child document spawning). Spans follow the OpenTelemetry
+data model (trace/span IDs, parent links, unix-nano timestamps,
+attributes, status) and are handed to span processors when they end:
+
+- InMemorySpanCollector keeps the most recent spans and exports them as
+  OTLP/JSON
+- SpanHistogram aggregates durations per span name and renders them in
+  the Prometheus text exposition format
+
+The tracer is selected by TRACING_MODE (app/core/config.py). The default,
+"off", installs NoopTracer, whose span() returns one shared do-nothing
+context manager, so instrumented code pays a function call per span.
+"""
+
+import random
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter_ns, time_ns
+from typing import Any, Deque, Dict, List, Optional, Protocol, Sequence, Tuple, Type, TypeVar
+
+TRACING_OFF = "off"
+TRACING_COLLECT = "collect"
+
+# OTLP status codes
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+# Span attributes that become Prometheus labels (besides the span name).
+# Kept to low-cardinality values; IDs stay on the spans only.
+HISTOGRAM_LABELS = ("node_type",)
+
+# Seconds. Covers in-memory phases (sub-millisecond) through LLM waits.
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation, shaped after the OpenTelemetry span."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: Optional[str] = None
+    start_time_unix_nano: int = 0
+    end_time_unix_nano: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status_code: int = STATUS_UNSET
+    status_message: str = ""
+    duration_ns: int = 0
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.duration_ns / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, exc: BaseException) -> None:
+        self.status_code = STATUS_ERROR
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Convert to an OTLP/JSON span."""
+        data: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_time_unix_nano),
+            "endTimeUnixNano": str(self.end_time_unix_nano),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            data["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            data["status"]["message"] = self.status_message
+        return data
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class SpanProcessor(Protocol):
+    """Receives every span when it ends (e.g. a collector or exporter)."""
+
+    def on_end(self, span: Span) -> None:
+        ...
+
+
+P = TypeVar("P")
+
+
+class Tracer:
+    """Creates spans and passes finished spans to its processors.
+
+    The current span is tracked in a ContextVar, so spans opened in
+    concurrent asyncio tasks nest per task.
+    """
+
+    enabled = True
+
+    def __init__(self, processors: Sequence[SpanProcessor] = ()):
+        self._processors: List[SpanProcessor] = list(processors)
+
+    def add_processor(self, processor: SpanProcessor) -> None:
+        self._processors.append(processor)
+
+    def processor(self, processor_type: Type[P]) -> Optional[P]:
+        """Get the first processor of the given type."""
+        for processor in self._processors:
+            if isinstance(processor, processor_type):
+                return processor
+        return None
+
+    def span(self, name: str, **attributes: Any) -> "_ActiveSpan":
+        """Time the enclosed block as a child of the current span."""
+        return _ActiveSpan(self._processors, name, attributes)
+
+
+class _ActiveSpan:
+    """Context manager that opens a Span on enter and finishes it on exit."""
+
+    __slots__ = ("_processors", "_name", "_attributes", "_span", "_token", "_start")
+
+    def __init__(self, processors: List[SpanProcessor], name: str, attributes: Dict[str, Any]):
+        self._processors = processors
+        self._name = name
+        self._attributes = attributes
+
+    def __enter__(self) -> Span:
+        parent = _current_span.get()
+        span = self._span = Span(
+            name=self._name,
+            trace_id=parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_span_id=parent.span_id if parent else None,
+            start_time_unix_nano=time_ns(),
+            attributes=self._attributes,
+        )
+        self._token = _current_span.set(span)
+        self._start = perf_counter_ns()
+        return span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        span = self._span
+        span.duration_ns = perf_counter_ns() - self._start
+        span.end_time_unix_nano = span.start_time_unix_nano + span.duration_ns
+        if exc is not None:
+            span.record_error(exc)
+        _current_span.reset(self._token)
+        for processor in self._processors:
+            processor.on_end(span)
+
+
+class _NoopSpan:
+    """Shared span stand-in when tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class NoopTracer:
+    """Tracer that records nothing."""
+
+    enabled = False
+
+    def add_processor(self, processor: SpanProcessor) -> None:
+        pass
+
+    def processor(self, processor_type: Type[P]) -> Optional[P]:
+        return None
+
+    def span(self, name: str, **attributes: Any) -> _NoopSpan:
+        return _NOOP_SPAN
+
+
+class InMemorySpanCollector:
+    """Keeps the most recent finished spans (thread-safe)."""
+
+    def __init__(self, max_spans: int = 2048):
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._lock = Lock()
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def get_spans(self, name: Optional[str] = None, trace_id: Optional[str] = None) -> List[Span]:
+        """Get collected spans, oldest first, optionally filtered."""
+        with self._lock:
+            spans = list(self._spans)
+        return [
+            s for s in spans
+            if (name is None or s.name == name) and (trace_id is None or s.trace_id == trace_id)
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def to_otlp(self, service_name: str = "the-combine", limit: Optional[int] = None) -> Dict[str, Any]:
+        """Export collected spans as an OTLP/JSON ExportTraceServiceRequest."""
+        spans = self.get_spans()
+        if limit is not None:
+            spans = spans[-limit:] if limit > 0 else []
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": service_name}}],
+                },
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [s.to_otlp() for s in spans],
+                }],
+            }],
+        }
+
+
+@dataclass
+class _HistogramSeries:
+    bucket_counts: List[int]
+    count: int = 0
+    sum_seconds: float = 0.0
+    errors: int = 0
+
+
+class SpanHistogram:
+    """Per-span-name duration histograms in Prometheus form (thread-safe)."""
+
+    metric_name = "combine_span_duration_seconds"
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], _HistogramSeries] = {}
+        self._lock = Lock()
+
+    def on_end(self, span: Span) -> None:
+        key = (span.name,) + tuple(str(span.attributes.get(label, "")) for label in HISTOGRAM_LABELS)
+        seconds = span.duration_seconds
+        index = bisect_left(self._buckets, seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # One extra slot for observations above the last bucket (+Inf)
+                series = self._series[key] = _HistogramSeries([0] * (len(self._buckets) + 1))
+            series.bucket_counts[index] += 1
+            series.count += 1
+            series.sum_seconds += seconds
+            if span.status_code == STATUS_ERROR:
+                series.errors += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Count, total and mean duration per series."""
+        with self._lock:
+            items = [(key, s.count, s.sum_seconds, s.errors) for key, s in sorted(self._series.items())]
+        return [
+            {
+                "span": key[0],
+                **{label: value for label, value in zip(HISTOGRAM_LABELS, key[1:]) if value},
+                "count": count,
+                "errors": errors,
+                "total_ms": round(total * 1000, 3),
+                "avg_ms": round(total * 1000 / count, 3),
+            }
+            for key, count, total, errors in items
+        ]
+
+    def render(self) -> str:
+        """Render the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            items = [
+                (key, list(s.bucket_counts), s.count, s.sum_seconds, s.errors)
+                for key, s in sorted(self._series.items())
+            ]
+        name = self.metric_name
+        lines = [
+            f"# HELP {name} Duration of PlanExecutor hot-path spans.",
+            f"# TYPE {name} histogram",
+        ]
+        for key, bucket_counts, count, total, _ in items:
+            labels = _format_labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(self._buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {total}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+        lines.append("# HELP combine_span_errors_total Spans that ended with an exception.")
+        lines.append("# TYPE combine_span_errors_total counter")
+        for key, _, _, _, errors in items:
+            lines.append(f"combine_span_errors_total{{{_format_labels(key)}}} {errors}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(key: Tuple[str, ...]) -> str:
+    pairs = [("span", key[0])] + [
+        (label, value) for label, value in zip(HISTOGRAM_LABELS, key[1:]) if value
+    ]
+    return ",".join(f'{label}="{_escape_label(value)}"' for label, value in pairs)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def create_tracer(mode: str, max_spans: int = 2048) -> "Tracer | NoopTracer":
+    """Build a tracer for a TRACING_MODE value ("off" or "collect")."""
+    mode = mode.strip().lower()
+    if mode == TRACING_OFF:
+        return NoopTracer()
+    if mode == TRACING_COLLECT:
+        return Tracer([InMemorySpanCollector(max_spans), SpanHistogram()])
+    raise ValueError(f"Unknown tracing mode: {mode!r} (expected 'off' or 'collect')")
+
+
+# Global tracer instance
+_tracer: "Optional[Tracer | NoopTracer]" = None
+
+
+def get_tracer() -> "Tracer | NoopTracer":
+    """Get the global tracer, built from TRACING_MODE on first use."""
+    global _tracer
+    if _tracer is None:
+        from app.core.config import TRACING_MAX_SPANS, TRACING_MODE
+
+        _tracer = create_tracer(TRACING_MODE, max_spans=TRACING_MAX_SPANS)
+    return _tracer
+
+
+def set_tracer(tracer: "Tracer | NoopTracer") -> None:
+    """Install a tracer (e.g. one with extra processors, or for tests)."""
+    global _tracer
+    _tracer = tracer
+
+
+def reset_tracer() -> None:
+    """Reset the global tracer (for testing)."""
+    global _tracer
+    _tracer = None
@@ -4,7 +4,7 @@ LLM Thread Queue Repositories - ADR-035.
 Repository layer for durable LLM execution:
 - ThreadRepository: CRUD + find by idempotency key
 - WorkItemRepository: CRUD + claim next + update status
-- LedgerRepository: Append-only writes
+- LedgerRepository: Append-only writes + windowed reads by payload type
 """
 
 import hashlib
@@ -13,7 +13,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, and_, update
+from sqlalchemy import select, and_, func, literal_column, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.persistence.models import (
@@ -122,6 +122,7 @@ def _orm_to_ledger_entry(orm: LLMLedgerEntryModel) -> LLMLedgerEntry:
         payload=orm.payload,
         payload_hash=orm.payload_hash,
         created_at=orm.created_at,
+        seq=orm.seq,
     )
 
 
@@ -246,6 +247,14 @@ class WorkItemRepository:
         orm = result.scalar_one_or_none()
         return _orm_to_work_item(orm) if orm else None
     
+    async def next_sequence(self, thread_id: UUID) -> int:
+        """Next work item sequence number for a thread."""
+        stmt = select(func.max(LLMWorkItemModel.sequence)).where(
+            LLMWorkItemModel.thread_id == thread_id
+        )
+        result = await self.db.execute(stmt)
+        return (result.scalar() or 0) + 1
+    
     async def get_by_thread(self, thread_id: UUID) -> List[LLMWorkItem]:
         """Get all work items for a thread."""
         stmt = select(LLMWorkItemModel).where(
@@ -274,6 +283,11 @@ class WorkItemRepository:
 # Ledger Repository
 # =============================================================================
 
+# payload->>'type' with the key inline (not a bind parameter), so the
+# planner can match it to idx_ledger_thread_type_seq
+_PAYLOAD_TYPE = LLMLedgerEntryModel.payload.op("->>")(literal_column("'type'"))
+
+
 class LedgerRepository:
     """Repository for LLM ledger entries (append-only)."""
     
@@ -282,15 +296,18 @@ class LedgerRepository:
     
     async def append(self, entry: LLMLedgerEntry) -> LLMLedgerEntry:
         """Append a new ledger entry (immutable)."""
-        # Compute hash if not provided
-        if not entry.payload_hash:
-            payload_json = json.dumps(entry.payload, sort_keys=True)
-            entry.payload_hash = hashlib.sha256(payload_json.encode()).hexdigest()
-        
-        orm = _ledger_entry_to_orm(entry)
-        self.db.add(orm)
+        return (await self.append_many([entry]))[0]
+    
+    async def append_many(self, entries: List[LLMLedgerEntry]) -> List[LLMLedgerEntry]:
+        """Append ledger entries in order with a single flush."""
+        for entry in entries:
+            # Compute hash if not provided
+            if not entry.payload_hash:
+                payload_json = json.dumps(entry.payload, sort_keys=True)
+                entry.payload_hash = hashlib.sha256(payload_json.encode()).hexdigest()
+            self.db.add(_ledger_entry_to_orm(entry))
         await self.db.flush()
-        return entry
+        return entries
     
     async def get_by_thread(self, thread_id: UUID) -> List[LLMLedgerEntry]:
         """Get all ledger entries for a thread."""
@@ -309,3 +326,51 @@ class LedgerRepository:
         
         result = await self.db.execute(stmt)
         return [_orm_to_ledger_entry(orm) for orm in result.scalars().all()]
+    
+    async def get_by_payload_type(
+        self,
+        thread_id: UUID,
+        payload_type: str,
+        after_seq: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[LLMLedgerEntry]:
+        """
+        Get a thread's entries whose payload has the given "type".
+        
+        Args:
+            thread_id: Thread ID
+            payload_type: Value of payload["type"]
+            after_seq: Only entries appended after this seq
+            limit: Only the newest `limit` entries
+        
+        Returns:
+            Entries oldest first
+        """
+        stmt = select(LLMLedgerEntryModel).where(
+            LLMLedgerEntryModel.thread_id == thread_id,
+            _PAYLOAD_TYPE == payload_type,
+        )
+        if after_seq is not None:
+            stmt = stmt.where(LLMLedgerEntryModel.seq > after_seq)
+        stmt = stmt.order_by(LLMLedgerEntryModel.seq.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        
+        result = await self.db.execute(stmt)
+        return [_orm_to_ledger_entry(orm) for orm in reversed(result.scalars().all())]
+    
+    async def count_by_payload_type(
+        self,
+        thread_id: UUID,
+        payload_type: str,
+        after_seq: Optional[int] = None,
+    ) -> int:
+        """Count a thread's entries whose payload has the given "type"."""
+        stmt = select(func.count()).select_from(LLMLedgerEntryModel).where(
+            LLMLedgerEntryModel.thread_id == thread_id,
+            _PAYLOAD_TYPE == payload_type,
+        )
+        if after_seq is not None:
+            stmt = stmt.where(LLMLedgerEntryModel.seq > after_seq)
+        result = await self.db.execute(stmt)
+        return result.scalar() or 0
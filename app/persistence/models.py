@@ -156,6 +156,7 @@ class LedgerEntryType(str, Enum):
     PARSE_REPORT = "parse_report"
     MUTATION_REPORT = "mutation_report"
     ERROR = "error"
+    SUMMARY = "summary"
 
 
 class ErrorCode(str, Enum):
@@ -326,6 +327,7 @@ class LLMLedgerEntry:
     payload: Dict[str, Any]
     payload_hash: Optional[str] = None  # SHA256 for dedup/verification
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    seq: Optional[int] = None  # Append order, assigned by the database
     
     @classmethod
     def create(
@@ -6,6 +6,8 @@ from uuid import UUID
 
 from sqlalchemy import select, and_, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.persistence.models import (
     StoredDocument,
@@ -111,13 +113,18 @@ class PostgresDocumentRepository:
             
             await session.commit()
             await session.refresh(orm_doc)
+            # refresh() expires the deferred content column; it was just
+            # written, so restore it without another round trip.
+            set_committed_value(orm_doc, "content", document.content)
             
             return _orm_to_stored_document(orm_doc)
     
     async def get(self, document_id: UUID) -> Optional[StoredDocument]:
         """Get document by ID."""
         async with self._session_factory() as session:
-            orm_doc = await session.get(Document, document_id)
+            orm_doc = await session.get(
+                Document, document_id, options=[undefer(Document.content)]
+            )
             if orm_doc is None:
                 return None
             return _orm_to_stored_document(orm_doc)
@@ -131,7 +138,7 @@ class PostgresDocumentRepository:
     ) -> Optional[StoredDocument]:
         """Get document by scope and type. None version = latest."""
         async with self._session_factory() as session:
-            query = select(Document).where(
+            query = select(Document).options(undefer(Document.content)).where(
                 and_(
                     Document.space_type == scope_type,
                     Document.space_id == UUID(scope_id),
@@ -159,7 +166,7 @@ class PostgresDocumentRepository:
     ) -> List[StoredDocument]:
         """List documents in a scope, optionally filtered by type."""
         async with self._session_factory() as session:
-            query = select(Document).where(
+            query = select(Document).options(undefer(Document.content)).where(
                 and_(
                     Document.space_type == scope_type,
                     Document.space_id == UUID(scope_id),
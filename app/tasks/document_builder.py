@@ -23,6 +23,7 @@ from app.domain.workflow.plan_registry import get_plan_registry
 from app.domain.workflow.document_workflow_state import DocumentWorkflowStatus
 from app.api.models.document import Document
 from sqlalchemy import select, and_
+from sqlalchemy.orm import undefer
 
 logger = logging.getLogger(__name__)
 
@@ -179,7 +180,7 @@ async def run_workflow_build(
             # Load input document (concierge_intake for pm_discovery)
             if doc_type_id == "project_discovery":
                 intake_result = await db.execute(
-                    select(Document).where(
+                    select(Document).options(undefer(Document.content)).where(
                         and_(
                             Document.space_type == "project",
                             Document.space_id == project_id,
@@ -193,7 +194,7 @@ async def run_workflow_build(
                 if not intake_doc:
                     # Fallback: try project_discovery with intake schema (legacy)
                     intake_result = await db.execute(
-                        select(Document).where(
+                        select(Document).options(undefer(Document.content)).where(
                             and_(
                                 Document.space_type == "project",
                                 Document.space_id == project_id,
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Rebuild the llm_cost_daily rollup from llm_run.
+
+The rollup is incremented as runs start and complete. Rebuild a range after
+restoring data, after manual edits to llm_run, or if the dashboard and
+llm_run disagree.
+
+Usage:
+    python ops/scripts/backfill_cost_rollup.py                  # everything
+    python ops/scripts/backfill_cost_rollup.py --days 90        # last 90 days
+    python ops/scripts/backfill_cost_rollup.py --start 2026-01-01 --end 2026-01-31
+
+Exit codes:
+  0 = rollup rebuilt
+  1 = invalid arguments or database error
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def resolve_range(
+    start: Optional[str],
+    end: Optional[str],
+    days: Optional[int],
+    today: Optional[date] = None,
+) -> Tuple[Optional[date], Optional[date]]:
+    """Turn CLI arguments into an inclusive (start, end) date range.
+
+    Raises:
+        ValueError: If the arguments conflict or a date is malformed
+    """
+    if days is not None and (start or end):
+        raise ValueError("--days cannot be combined with --start/--end")
+    if days is not None:
+        if days < 1:
+            raise ValueError("--days must be at least 1")
+        today = today or datetime.now(timezone.utc).date()
+        return today - timedelta(days=days - 1), today
+
+    start_date = date.fromisoformat(start) if start else None
+    end_date = date.fromisoformat(end) if end else None
+    if start_date and end_date and start_date > end_date:
+        raise ValueError("--start is after --end")
+    return start_date, end_date
+
+
+async def run_backfill(start_date: Optional[date], end_date: Optional[date]) -> int:
+    from app.core.database import async_session_factory
+    from app.domain.services.llm_cost_rollup import backfill_cost_rollup
+
+    async with async_session_factory() as session:
+        written = await backfill_cost_rollup(session, start_date, end_date)
+        await session.commit()
+    return written
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild llm_cost_daily from llm_run.")
+    parser.add_argument("--start", help="First UTC day (YYYY-MM-DD)")
+    parser.add_argument("--end", help="Last UTC day, inclusive (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, help="Rebuild the last N days")
+    args = parser.parse_args(argv)
+
+    try:
+        start_date, end_date = resolve_range(args.start, args.end, args.days)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        written = asyncio.run(run_backfill(start_date, end_date))
+    except Exception as e:
+        print(f"Backfill failed: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Rebuilt llm_cost_daily {start_date or 'start'}..{end_date or 'today'}: {written} rows")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Cold-start import profile for The Combine API.
+
+Imports a module (app.api.main by default) in a fresh interpreter with
+``python -X importtime`` and reports where import time goes: the slowest
+modules by cumulative time and self time rolled up by package.
+
+Usage:
+    python ops/scripts/profile_startup.py
+    python ops/scripts/profile_startup.py --top 30 --depth 3
+    python ops/scripts/profile_startup.py --json > /tmp/startup.json
+    python ops/scripts/profile_startup.py --max-seconds 3   # exit 1 if slower
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# "import time:       200 |    2297284 |   app.api"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    """One line of -X importtime output."""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(text: str) -> List[ImportRecord]:
+    """Parse -X importtime output, ignoring any other lines.
+
+    Args:
+        text: stderr of ``python -X importtime ...``
+
+    Returns:
+        Records in output order (children before their parent)
+    """
+    records = []
+    for line in text.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append(ImportRecord(
+            module=module,
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            depth=max(0, (len(indent) - 1) // 2),
+        ))
+    return records
+
+
+def total_us(records: Sequence[ImportRecord]) -> int:
+    """Total import time: the sum of top-level cumulative times."""
+    return sum(r.cumulative_us for r in records if r.depth == 0)
+
+
+def group_by_package(records: Sequence[ImportRecord], depth: int = 2) -> Dict[str, int]:
+    """Roll self time up to dotted package prefixes.
+
+    Args:
+        records: Parsed import records
+        depth: Number of dotted components to keep (2: "app.api", "sqlalchemy.orm")
+
+    Returns:
+        Dict of package -> self time in microseconds, slowest first
+    """
+    totals: Dict[str, int] = defaultdict(int)
+    for record in records:
+        package = ".".join(record.module.split(".")[:depth])
+        totals[package] += record.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def slowest_modules(records: Sequence[ImportRecord], top: int = 20) -> List[ImportRecord]:
+    """Modules with the largest cumulative import time."""
+    return sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]
+
+
+def profile_import(
+    module: str,
+    python: str = sys.executable,
+    env: Optional[Dict[str, str]] = None,
+) -> Tuple[List[ImportRecord], str]:
+    """Import a module in a fresh interpreter and capture its import profile.
+
+    Args:
+        module: Dotted module name to import
+        python: Interpreter to run
+        env: Environment (defaults to the current one)
+
+    Returns:
+        (records, stdout of the child process)
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env if env is not None else os.environ.copy(),
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.splitlines()[-15:])
+        raise RuntimeError(f"Importing {module} failed:\n{tail}")
+    return parse_importtime(proc.stderr), proc.stdout
+
+
+def build_report(records: Sequence[ImportRecord], top: int = 20, depth: int = 2) -> dict:
+    """Summarize records as a JSON-serializable report."""
+    return {
+        "total_ms": round(total_us(records) / 1000, 1),
+        "modules_imported": len(records),
+        "slowest_modules": [
+            {
+                "module": r.module,
+                "cumulative_ms": round(r.cumulative_us / 1000, 1),
+                "self_ms": round(r.self_us / 1000, 1),
+            }
+            for r in slowest_modules(records, top)
+        ],
+        "by_package": [
+            {"package": package, "self_ms": round(us / 1000, 1)}
+            for package, us in list(group_by_package(records, depth).items())[:top]
+        ],
+    }
+
+
+def format_report(module: str, report: dict) -> str:
+    """Render a report as plain text."""
+    lines = [
+        f"Cold import of {module}: {report['total_ms']:.0f} ms "
+        f"({report['modules_imported']} modules)",
+        "",
+        f"{'cumulative ms':>14} {'self ms':>9}  module",
+    ]
+    for row in report["slowest_modules"]:
+        lines.append(f"{row['cumulative_ms']:>14.1f} {row['self_ms']:>9.1f}  {row['module']}")
+    lines += ["", f"{'self ms':>14}  package"]
+    for row in report["by_package"]:
+        lines.append(f"{row['self_ms']:>14.1f}  {row['package']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile cold-start import time.")
+    parser.add_argument("--module", default="app.api.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table")
+    parser.add_argument("--depth", type=int, default=2, help="Package grouping depth")
+    parser.add_argument("--json", action="store_true", help="Emit JSON")
+    parser.add_argument(
+        "--max-seconds", type=float, default=None,
+        help="Exit 1 if total import time exceeds this budget",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        records, _ = profile_import(args.module)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    report = build_report(records, top=args.top, depth=args.depth)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(args.module, report))
+
+    if args.max_seconds is not None and report["total_ms"] > args.max_seconds * 1000:
+        print(
+            f"Import time {report['total_ms']:.0f} ms exceeds budget "
+            f"{args.max_seconds * 1000:.0f} ms",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
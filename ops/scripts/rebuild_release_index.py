@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Rebuild the combine-config release index from git history.
+
+The release index (.git/combine/release_index.jsonl) normally maintains
+itself: GitService.commit appends new entries, and queries catch up on
+commits made outside the app. Run this after restoring a checkout, or to
+backfill the index on an existing repository before first use.
+
+Usage:
+    python ops/scripts/rebuild_release_index.py
+    python ops/scripts/rebuild_release_index.py --repo-path /path/to/repo
+
+Exit codes:
+  0 = index rebuilt
+  1 = git error
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.api.services.git_service import GitService, GitServiceError  # noqa: E402
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--repo-path", type=Path, default=None,
+                        help="Repository containing combine-config (default: this repo)")
+    args = parser.parse_args(argv)
+
+    try:
+        index = GitService(repo_path=args.repo_path).release_index
+        start = time.perf_counter()
+        written = index.rebuild()
+    except GitServiceError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"{index.path}: {written} entries up to {index.head[:7]} in {elapsed_ms:.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Full-config validation for CI.
+
+Runs ConfigValidator.validate_config() over every active package in
+combine-config/ (package rules plus activation checks) and prints the
+findings and a timing report.
+
+Usage:
+    python ops/scripts/validate_config.py
+    python ops/scripts/validate_config.py --workers 4
+    python ops/scripts/validate_config.py --json > /tmp/config-validation.json
+    python ops/scripts/validate_config.py --config-path /path/to/combine-config
+
+Exit codes:
+  0 = no errors (warnings allowed)
+  1 = one or more errors
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.api.services.config_validator import (  # noqa: E402
+    ConfigValidator,
+    ValidationReport,
+    ValidationTiming,
+)
+from app.config.package_loader import PackageLoader  # noqa: E402
+
+
+def format_report(report: ValidationReport, timing: ValidationTiming) -> List[str]:
+    """Human-readable findings and timing."""
+    lines = []
+    for label, results in (("ERROR", report.errors), ("WARNING", report.warnings)):
+        for result in results:
+            lines.append(f"{label:<8} {result.rule_id:<28} {result.message}")
+    if lines:
+        lines.append("")
+
+    lines.append(f"{'release':<48}{'ms':>10}")
+    for release, seconds in sorted(timing.releases.items(), key=lambda item: -item[1]):
+        lines.append(f"{release:<48}{seconds * 1000:>10.1f}")
+    lines.append("")
+    lines.append(
+        f"{len(timing.releases)} releases in {timing.total_seconds * 1000:.1f}ms "
+        f"({timing.workers} worker{'s' if timing.workers != 1 else ''}, "
+        f"{timing.references_resolved} shared references resolved)"
+    )
+    lines.append(
+        f"{'PASSED' if report.valid else 'FAILED'}: "
+        f"{len(report.errors)} errors, {len(report.warnings)} warnings"
+    )
+    return lines
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--config-path", type=Path, default=None,
+                        help="combine-config directory (default: the repo's)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes (default: 1, in-process)")
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    args = parser.parse_args(argv)
+
+    validator = ConfigValidator(PackageLoader(args.config_path))
+    report, timing = validator.validate_config(max_workers=args.workers)
+
+    if args.json:
+        print(json.dumps({
+            "valid": report.valid,
+            "errors": [
+                {"rule_id": e.rule_id, "message": e.message, "file_path": e.file_path}
+                for e in report.errors
+            ],
+            "warnings": [
+                {"rule_id": w.rule_id, "message": w.message, "file_path": w.file_path}
+                for w in report.warnings
+            ],
+            "timing": timing.to_dict(),
+        }, indent=2))
+    else:
+        print("\n".join(format_report(report, timing)))
+
+    return 0 if report.valid else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
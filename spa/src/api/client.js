@@ -158,6 +158,9 @@ export const api = {
     getExecutionTranscript: (executionId) =>
         request(`/executions/${executionId}/transcript`),
 
+    getTranscriptContent: (executionId, contentId) =>
+        request(`/executions/${executionId}/transcript/content/${contentId}`),
+
     getExecutionQACoverage: (executionId) =>
         request(`/executions/${executionId}/qa-coverage`),
 
@@ -226,7 +226,15 @@ function TranscriptSection({ transcript }) {
                                         Inputs ({entry.inputs.length})
                                     </div>
                                     {entry.inputs.map((inp, j) => (
-                                        <TranscriptBlock key={j} label={inp.kind} content={inp.content} size={inp.size} />
+                                        <TranscriptBlock
+                                            key={j}
+                                            executionId={transcript.execution_id}
+                                            label={inp.kind}
+                                            content={inp.content}
+                                            size={inp.size}
+                                            truncated={inp.truncated}
+                                            contentId={inp.content_id}
+                                        />
                                     ))}
                                 </div>
                             )}
@@ -240,8 +248,11 @@ function TranscriptSection({ transcript }) {
                                         <TranscriptBlock
                                             key={j}
                                             label={out.kind}
+                                            executionId={transcript.execution_id}
                                             content={out.content}
                                             size={out.size}
+                                            truncated={out.truncated}
+                                            contentId={out.content_id}
                                             parseStatus={out.parse_status}
                                             validationStatus={out.validation_status}
                                         />
@@ -259,8 +270,10 @@ function TranscriptSection({ transcript }) {
     );
 }
 
-function TranscriptBlock({ label, content, size, parseStatus, validationStatus }) {
+function TranscriptBlock({ executionId, label, content: inlineContent, size, truncated, contentId, parseStatus, validationStatus }) {
     const [collapsed, setCollapsed] = useState(false);
+    const [fullContent, setFullContent] = useState(null);
+    const content = fullContent ?? inlineContent;
     const hasContent = content && content.length > 0;
     const isLong = hasContent && content.length > 500;
 
@@ -319,6 +332,15 @@ function TranscriptBlock({ label, content, size, parseStatus, validationStatus }
                     {content}
                 </pre>
             )}
+            {truncated && fullContent === null && (
+                <button
+                    onClick={() => api.getTranscriptContent(executionId, contentId).then(r => setFullContent(r.content))}
+                    className="px-2 py-1 text-xs hover:opacity-80"
+                    style={{ color: 'var(--accent-primary)' }}
+                >
+                    Load full content
+                </button>
+            )}
             {!hasContent && (
                 <p className="px-2 py-1 text-xs" style={{ color: 'var(--text-muted)' }}>(empty)</p>
             )}
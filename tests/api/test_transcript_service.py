@@ -0,0 +1,267 @@
+"""
+Tests for the transcript service.
+
+Transcripts are loaded in a fixed number of batched queries, paginated,
+streamed in batches, and large bodies are truncated with range fetches.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.api.models.project import Project
+from app.api.services.transcript_service import (
+    get_execution_transcript,
+    get_transcript_content,
+    stream_execution_transcript,
+)
+from app.domain.models.llm_logging import (
+    LLMContent,
+    LLMRun,
+    LLMRunInputRef,
+    LLMRunOutputRef,
+)
+
+
+class FakeTranscriptDB:
+    """Async session stand-in that answers transcript queries and counts them."""
+
+    def __init__(self, runs=10, refs_per_run=4, content_chars=100):
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self.queries = 0
+        self.closed = False
+        self.contents = {}
+        self.refs = {LLMRunInputRef: [], LLMRunOutputRef: []}
+        self.runs = []
+        for i in range(runs):
+            run = SimpleNamespace(
+                id=uuid4(), role="PM", prompt_id="task", model_name="m", status="SUCCESS",
+                started_at=start + timedelta(seconds=i), ended_at=start + timedelta(seconds=i + 1),
+                total_tokens=10, cost_usd=0.5, project_id=uuid4(), artifact_type="doc",
+                run_metadata={"node_id": f"n{i}"},
+            )
+            self.runs.append(run)
+            for j in range(refs_per_run):
+                content_id = uuid4()
+                self.contents[content_id] = f"{i}:{j}:" + "x" * content_chars
+                ref_model = LLMRunInputRef if j % 2 == 0 else LLMRunOutputRef
+                self.refs[ref_model].append(SimpleNamespace(
+                    llm_run_id=run.id, kind=f"kind{j}",
+                    content_ref=f"db://llm_content/{content_id}",
+                    content_redacted=False, parse_status="ok", validation_status="valid",
+                ))
+
+    async def execute(self, stmt):
+        self.queries += 1
+        entity = stmt.column_descriptions[0]["entity"]
+        result = MagicMock()
+        if entity is LLMRun:
+            result.scalars.return_value.all.return_value = self.runs
+        elif entity is Project:
+            result.scalar_one_or_none.return_value = "Project X"
+        elif entity in self.refs:
+            run_ids = set(stmt.whereclause.right.value)
+            result.scalars.return_value.all.return_value = [
+                r for r in self.refs[entity] if r.llm_run_id in run_ids
+            ]
+        elif entity is LLMContent:
+            result.all.return_value = self._content_rows(stmt)
+        return result
+
+    async def close(self):
+        self.closed = True
+
+    def _content_rows(self, stmt):
+        limit = None
+        text_column = stmt.selected_columns[1].element
+        if text_column is not LLMContent.__table__.c.content_text and hasattr(text_column, "clauses"):
+            limit = list(text_column.clauses)[2].value
+        rows = []
+        for content_id in stmt.whereclause.right.value:
+            text = self.contents[content_id]
+            rows.append(SimpleNamespace(
+                id=content_id, text=text[:limit] if limit else text,
+                content_size=len(text.encode("utf-8")), length=len(text),
+            ))
+        return rows
+
+
+class TestGetExecutionTranscript:
+    """Tests for get_execution_transcript."""
+
+    @pytest.mark.asyncio
+    async def test_query_count_is_independent_of_run_count(self):
+        small, large = FakeTranscriptDB(runs=2), FakeTranscriptDB(runs=30)
+
+        await get_execution_transcript(small, "exec-1")
+        data = await get_execution_transcript(large, "exec-1")
+
+        assert small.queries == large.queries == 5
+        assert len(data["transcript"]) == 30
+        assert all(len(e["inputs"]) == 2 and len(e["outputs"]) == 2 for e in data["transcript"])
+
+    @pytest.mark.asyncio
+    async def test_entries_keep_content_and_ref_fields(self):
+        db = FakeTranscriptDB(runs=1, refs_per_run=2)
+
+        entry = (await get_execution_transcript(db, "exec-1"))["transcript"][0]
+
+        assert entry["inputs"][0]["content"].startswith("0:0:")
+        assert entry["inputs"][0]["redacted"] is False
+        assert entry["inputs"][0]["size"] == len(entry["inputs"][0]["content"])
+        assert entry["outputs"][0]["parse_status"] == "ok"
+        assert entry["node_id"] == "n0"
+
+    @pytest.mark.asyncio
+    async def test_pagination_keeps_execution_totals(self):
+        db = FakeTranscriptDB(runs=10)
+
+        data = await get_execution_transcript(db, "exec-1", offset=4, limit=3)
+
+        assert [e["run_number"] for e in data["transcript"]] == [5, 6, 7]
+        assert data["total_runs"] == 10
+        assert data["total_tokens"] == 100
+        assert data["has_more"] is True
+
+    @pytest.mark.asyncio
+    async def test_last_page_has_no_more(self):
+        db = FakeTranscriptDB(runs=5)
+
+        data = await get_execution_transcript(db, "exec-1", offset=3, limit=3)
+
+        assert len(data["transcript"]) == 2
+        assert data["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_large_content_is_truncated_with_content_id(self):
+        db = FakeTranscriptDB(runs=1, refs_per_run=1, content_chars=500)
+
+        data = await get_execution_transcript(db, "exec-1", max_inline_chars=50)
+        item = data["transcript"][0]["inputs"][0]
+
+        assert len(item["content"]) == 50
+        assert item["truncated"] is True
+        assert item["size"] == len(db.contents[next(iter(db.contents))])
+        assert item["content_id"] == str(next(iter(db.contents)))
+
+    @pytest.mark.asyncio
+    async def test_no_runs_returns_none(self):
+        db = FakeTranscriptDB(runs=0)
+
+        assert await get_execution_transcript(db, "exec-1") is None
+
+
+class TestStreamExecutionTranscript:
+    """Tests for stream_execution_transcript."""
+
+    @pytest.mark.asyncio
+    async def test_streams_header_then_entries_in_batches(self):
+        db = FakeTranscriptDB(runs=25)
+
+        events = [e async for e in stream_execution_transcript(db, "exec-1", batch_size=10)]
+
+        assert events[0]["type"] == "header"
+        assert events[0]["total_runs"] == 25
+        assert [e["entry"]["run_number"] for e in events[1:]] == list(range(1, 26))
+        # runs + project, then 3 queries per batch
+        assert db.queries == 2 + 3 * 3
+
+    @pytest.mark.asyncio
+    async def test_no_runs_streams_nothing(self):
+        db = FakeTranscriptDB(runs=0)
+
+        assert [e async for e in stream_execution_transcript(db, "exec-1")] == []
+
+
+class TestGetTranscriptContent:
+    """Tests for get_transcript_content."""
+
+    @pytest.mark.asyncio
+    async def test_returns_range_with_total_length(self):
+        db = MagicMock()
+        result = MagicMock()
+        result.one_or_none.return_value = SimpleNamespace(text="cdef", length=10)
+
+        async def execute(stmt):
+            return result
+        db.execute = execute
+
+        data = await get_transcript_content(db, "exec-1", uuid4(), offset=2, length=4)
+
+        assert data["content"] == "cdef"
+        assert data["offset"] == 2
+        assert data["length"] == 4
+        assert data["total_length"] == 10
+
+    @pytest.mark.asyncio
+    async def test_unreferenced_content_returns_none(self):
+        db = MagicMock()
+        result = MagicMock()
+        result.one_or_none.return_value = None
+
+        async def execute(stmt):
+            return result
+        db.execute = execute
+
+        assert await get_transcript_content(db, "exec-1", uuid4()) is None
+
+
+class TestTranscriptEndpoints:
+    """Tests for the transcript routes."""
+
+    def _client(self, db, monkeypatch=None):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.api.v1.routers import executions
+        from app.core.database import get_db
+
+        if monkeypatch is not None:
+            monkeypatch.setattr(executions, "async_session_factory", lambda: db)
+        app = FastAPI()
+        app.include_router(executions.router)
+        app.dependency_overrides[get_db] = lambda: db
+        return TestClient(app)
+
+    def test_transcript_page(self):
+        client = self._client(FakeTranscriptDB(runs=6))
+
+        body = client.get("/executions/exec-1/transcript?offset=2&limit=2&inline_chars=10").json()
+
+        assert [e["run_number"] for e in body["transcript"]] == [3, 4]
+        assert body["has_more"] is True
+        assert body["transcript"][0]["inputs"][0]["truncated"] is True
+
+    def test_stream_is_ndjson(self, monkeypatch):
+        import json
+
+        db = FakeTranscriptDB(runs=3)
+        client = self._client(db, monkeypatch)
+
+        response = client.get("/executions/exec-1/transcript/stream")
+        events = [json.loads(line) for line in response.text.splitlines()]
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert [e["type"] for e in events] == ["header", "entry", "entry", "entry"]
+        assert db.closed
+
+    def test_stream_missing_execution_is_404(self, monkeypatch):
+        db = FakeTranscriptDB(runs=0)
+        client = self._client(db, monkeypatch)
+
+        assert client.get("/executions/exec-1/transcript/stream").status_code == 404
+        assert db.closed
+
+    def test_stream_does_not_use_request_session(self, monkeypatch):
+        """The request-scoped session is closed before the body is sent."""
+        from app.api.v1.routers import executions
+
+        monkeypatch.setattr(executions, "async_session_factory", lambda: FakeTranscriptDB(runs=2))
+        request_db = MagicMock()
+        client = self._client(request_db)
+
+        response = client.get("/executions/exec-1/transcript/stream")
+
+        assert len(response.text.splitlines()) == 3
+        request_db.execute.assert_not_called()
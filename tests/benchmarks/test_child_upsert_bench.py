@@ -0,0 +1,133 @@
+"""Microbenchmark: spawning child documents, per-child upsert vs bulk upsert.
+
+The per-child path mints each display_id with two queries, builds an ORM
+Document and flushes one INSERT per child at commit. The bulk path
+reserves every display_id in one query and writes all children with one
+INSERT ... ON CONFLICT DO UPDATE. This records the statements each path
+issues for 10, 100 and 1000 new children, times the application side
+(row building, revision hashes, statement compilation), and estimates wall
+time at a fixed database round trip. The per-child figures leave out
+compiling the INSERTs the ORM would flush, so they favour that path. No
+PostgreSQL is available to the
+test suite, so server execution time is not included.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import gc
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+pytestmark = pytest.mark.slow
+
+SIZES = (10, 100, 1000)
+ROUND_TRIP_MS = 0.5
+
+
+class _Result:
+    def __init__(self, scalar, rows):
+        self._scalar = scalar
+        self._rows = rows
+
+    def scalar(self):
+        return self._scalar
+
+    def all(self):
+        return self._rows
+
+
+class RecordingDB:
+    """Async session stand-in: records statements and added objects."""
+
+    def __init__(self):
+        self.statements = []
+        self.added = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        # Compile as the driver would; this is part of the app-side cost.
+        stmt.compile(dialect=postgresql.dialect())
+        columns = [c.name for c in getattr(stmt, "selected_columns", ())]
+        prefix = "WP" if columns == ["display_prefix"] else None
+        return _Result(prefix, [("work_package", "WP", 0)])
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+    def flush_statements(self):
+        """INSERTs the ORM would emit for added objects at commit."""
+        return len(self.added)
+
+
+def _specs(n):
+    return [
+        {
+            "doc_type_id": "work_package",
+            "title": f"Work Package {i}",
+            "content": {
+                "work_package_id": f"wp_{i}",
+                "name": f"Work package {i}",
+                "scope_in": [f"Deliver capability {i}.{j}" for j in range(8)],
+                "definition_of_done": [f"Criterion {j}" for j in range(6)],
+                "_lineage": {"parent_document_type": "implementation_plan"},
+            },
+            "identifier": f"wp_{i}",
+        }
+        for i in range(n)
+    ]
+
+
+def _executor(db):
+    from app.domain.workflow.plan_executor import PlanExecutor
+
+    pe = PlanExecutor.__new__(PlanExecutor)
+    pe._db_session = db
+    return pe
+
+
+async def _run(method, n):
+    db = RecordingDB()
+    pe = _executor(db)
+    state = SimpleNamespace(project_id=str(uuid4()))
+    specs = _specs(n)
+    gc.collect()  # don't charge one path for the other's garbage
+    start = time.perf_counter()
+    await getattr(pe, method)(specs, {}, state, uuid4())
+    elapsed = time.perf_counter() - start
+    return len(db.statements) + db.flush_statements(), elapsed
+
+
+@pytest.mark.asyncio
+async def test_child_upsert():
+    print()
+    print(f"{'children':>8} {'per-child stmts':>16} {'bulk stmts':>11} "
+          f"{'per-child app':>14} {'bulk app':>10} {'est. per-child':>15} {'est. bulk':>10}")
+
+    with patch("app.domain.workflow.plan_executor.logger"):
+        # Warm up imports and SQLAlchemy's compiled caches
+        await _run("_run_upsert_loop", 2)
+        await _run("_bulk_upsert_children", 2)
+
+        for n in SIZES:
+            loop_stmts, loop_s = await _run("_run_upsert_loop", n)
+            bulk_stmts, bulk_s = await _run("_bulk_upsert_children", n)
+
+            loop_est = loop_s * 1000 + loop_stmts * ROUND_TRIP_MS
+            bulk_est = bulk_s * 1000 + bulk_stmts * ROUND_TRIP_MS
+            print(f"{n:>8} {loop_stmts:>16} {bulk_stmts:>11} "
+                  f"{loop_s * 1000:>12.1f}ms {bulk_s * 1000:>8.1f}ms "
+                  f"{loop_est:>13.1f}ms {bulk_est:>8.1f}ms")
+
+            assert loop_stmts == 3 * n
+            assert bulk_stmts <= 2
+    print(f"(estimates add {ROUND_TRIP_MS}ms per statement round trip)")
@@ -0,0 +1,123 @@
+"""Microbenchmark: cost dashboard over 1M llm_run rows, with and without the rollup.
+
+The previous dashboard materialized every llm_run row in its window and
+summed it in Python. The rollup is built once (the backfill, or one
+increment per completed run) and the dashboard then reads one row per day
+and artifact type. This measures the application-side work and the number
+of rows transferred. Database scan time is not included, because no
+PostgreSQL is available to the test suite.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import random
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytestmark = pytest.mark.slow
+
+ROWS = 1_000_000
+DAYS = 90
+ARTIFACT_TYPES = ["project_discovery", "technical_architecture", "epic_backlog", None]
+
+
+class Run:
+    __slots__ = ("started_at", "artifact_type", "cost_usd", "input_tokens", "output_tokens", "status")
+
+    def __init__(self, started_at, artifact_type, cost_usd, input_tokens, output_tokens, status):
+        self.started_at = started_at
+        self.artifact_type = artifact_type
+        self.cost_usd = cost_usd
+        self.input_tokens = input_tokens
+        self.output_tokens = output_tokens
+        self.status = status
+
+
+def _runs():
+    rng = random.Random(7)
+    start = datetime.now(timezone.utc) - timedelta(days=DAYS - 1)
+    return [
+        Run(
+            start + timedelta(seconds=rng.randrange(DAYS * 86400)),
+            rng.choice(ARTIFACT_TYPES),
+            rng.random() / 10,
+            rng.randrange(5000),
+            rng.randrange(2000),
+            "FAILED" if rng.random() < 0.02 else "SUCCESS",
+        )
+        for _ in range(ROWS)
+    ]
+
+
+def _legacy_dashboard(runs):
+    """The per-row loop get_cost_dashboard_data used to run."""
+    daily = defaultdict(lambda: {"cost": 0.0, "tokens": 0, "calls": 0, "errors": 0})
+    for run in runs:
+        if run.artifact_type is None:
+            continue
+        day = daily[run.started_at.strftime("%Y-%m-%d")]
+        day["cost"] += float(run.cost_usd or 0)
+        day["tokens"] += (run.input_tokens or 0) + (run.output_tokens or 0)
+        day["calls"] += 1
+        if run.status == "FAILED":
+            day["errors"] += 1
+    return daily
+
+
+def _build_rollup(runs):
+    """What the backfill (or the per-run increments) produce."""
+    rollup = defaultdict(lambda: [0, 0, 0, 0.0])
+    for run in runs:
+        row = rollup[(run.started_at.date(), run.artifact_type or "")]
+        row[0] += 1
+        row[1] += 1 if run.status == "FAILED" else 0
+        row[2] += run.input_tokens + run.output_tokens
+        row[3] += run.cost_usd
+    return rollup
+
+
+def _rollup_dashboard(rollup):
+    """get_document_daily_costs: one grouped read of the rollup."""
+    daily = defaultdict(lambda: {"cost": 0.0, "tokens": 0, "calls": 0, "errors": 0})
+    for (day, artifact_type), (calls, errors, tokens, cost) in rollup.items():
+        if not artifact_type:
+            continue
+        out = daily[day.strftime("%Y-%m-%d")]
+        out["cost"] += cost
+        out["tokens"] += tokens
+        out["calls"] += calls
+        out["errors"] += errors
+    return daily
+
+
+def test_rollup_dashboard_faster_than_row_scan():
+    runs = _runs()
+
+    start = time.perf_counter()
+    legacy = _legacy_dashboard(runs)
+    legacy_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rollup = _build_rollup(runs)
+    backfill_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = _rollup_dashboard(rollup)
+    current_s = time.perf_counter() - start
+
+    assert legacy.keys() == current.keys()
+    for day in legacy:
+        assert legacy[day]["calls"] == current[day]["calls"]
+        assert legacy[day]["tokens"] == current[day]["tokens"]
+        assert legacy[day]["cost"] == pytest.approx(current[day]["cost"])
+
+    print(
+        f"\n{ROWS:,} runs over {DAYS} days: row scan {legacy_s * 1e3:.0f}ms "
+        f"({ROWS:,} rows read), rollup read {current_s * 1e3:.2f}ms "
+        f"({len(rollup)} rows read, {legacy_s / current_s:.0f}x); "
+        f"one-off backfill {backfill_s * 1e3:.0f}ms"
+    )
+    assert current_s < legacy_s / 100
@@ -0,0 +1,123 @@
+"""Microbenchmark: DocumentCondenser on large markdown documents.
+
+Compares the previous implementation (per-line header regex, per-term
+lowercasing over a concatenated header+body copy, no caching) against the
+current one: first on a cold cache, then on repeated multi-document runs
+where every step condenses the same inputs again.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import random
+import re
+import time
+
+import pytest
+
+from app.llm.document_condenser import ROLE_FOCUS, CondenseConfig, DocumentCondenser
+
+pytestmark = pytest.mark.slow
+
+ITERATIONS = 20
+WORDS = (
+    "the system shall provide users with secure access to records and "
+    "report on data flows between services while meeting timeline and "
+    "budget expectations for every stakeholder group"
+).split()
+
+
+class LegacyCondenser(DocumentCondenser):
+    """The pre-optimization splitting and scoring, without caching."""
+
+    def __init__(self, config=None):
+        super().__init__(config, cache_size=0)
+
+    def _split_sections(self, content):
+        sections = []
+        current_header = None
+        current_content = []
+        for line in content.split("\n"):
+            header_match = re.match(r'^(#{1,3})\s+(.+)$', line)
+            if header_match:
+                if current_header is not None and current_content:
+                    sections.append({"header": current_header, "content": "\n".join(current_content)})
+                current_header = header_match.group(2)
+                current_content = []
+            else:
+                current_content.append(line)
+        if current_header is not None and current_content:
+            sections.append({"header": current_header, "content": "\n".join(current_content)})
+        return sections
+
+    def _score_sections(self, sections, focus_areas):
+        scored = []
+        for section in sections:
+            header_lower = section["header"].lower()
+            combined = header_lower + " " + section["content"].lower()
+            score = 0
+            for area in focus_areas:
+                if area.lower() in combined:
+                    score += 2 if area.lower() in header_lower else 1
+            scored.append({**section, "score": score, "tokens": self._estimate_tokens(section["content"])})
+        return sorted(scored, key=lambda x: x["score"], reverse=True)
+
+
+def _markdown_document(seed, sections=300, lines_per_section=12):
+    rng = random.Random(seed)
+    focus = [term for terms in ROLE_FOCUS.values() for term in terms]
+    parts = []
+    for index in range(sections):
+        level = "#" * rng.randint(1, 3)
+        title = rng.choice(focus) if rng.random() < 0.3 else f"Section {index}"
+        parts.append(f"{level} {title.title()}")
+        for _ in range(lines_per_section):
+            words = [rng.choice(WORDS) for _ in range(14)]
+            if rng.random() < 0.1:
+                words.append(rng.choice(focus))
+            parts.append(" ".join(words) + ".")
+    return "\n".join(parts)
+
+
+def _run(condenser, documents, role):
+    for _ in range(ITERATIONS):
+        condenser.condense_multiple(documents, role, total_max_tokens=6000)
+
+
+def test_condenser_faster_than_legacy():
+    documents = [
+        {"type": f"doc_{i}", "content": _markdown_document(i)} for i in range(4)
+    ]
+    config = CondenseConfig(max_tokens=3000)
+    size_kb = sum(len(d["content"]) for d in documents) / 1024
+
+    legacy, current = LegacyCondenser(config), DocumentCondenser(config)
+    for role in ROLE_FOCUS:
+        assert legacy.condense_multiple(documents, role) == current.condense_multiple(documents, role)
+
+    start = time.perf_counter()
+    for role in ROLE_FOCUS:
+        LegacyCondenser(config).condense_multiple(documents, role)
+    legacy_cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for role in ROLE_FOCUS:
+        DocumentCondenser(config).condense_multiple(documents, role)
+    current_cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _run(legacy, documents, "Developer")
+    legacy_warm = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _run(current, documents, "Developer")
+    current_warm = time.perf_counter() - start
+
+    print(
+        f"\n{len(documents)} docs ({size_kb:.0f} KiB), {len(ROLE_FOCUS)} roles cold: "
+        f"legacy {legacy_cold * 1e3:.1f}ms, current {current_cold * 1e3:.1f}ms "
+        f"({legacy_cold / current_cold:.1f}x)"
+        f"\n{ITERATIONS} repeated runs: legacy {legacy_warm * 1e3:.1f}ms, "
+        f"current {current_warm * 1e3:.2f}ms ({legacy_warm / current_warm:.0f}x)"
+    )
+    assert current_cold < legacy_cold
+    assert current_warm < legacy_warm
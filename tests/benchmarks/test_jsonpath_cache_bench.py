@@ -0,0 +1,85 @@
+"""Microbenchmark: compiled JSONPath vs per-call jsonpath-ng parsing.
+
+Runs every JSONPath referenced by the shipped mechanical operations in
+combine-config/mechanical_ops/ against a representative document, once
+with the previous parse-per-call approach and once with compile_jsonpath.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+from jsonpath_ng import parse as jsonpath_parse
+
+from app.api.services.mech_handlers.jsonpath_cache import (
+    collect_jsonpaths,
+    compile_jsonpath,
+)
+
+pytestmark = pytest.mark.slow
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+OPS_DIR = REPO_ROOT / "combine-config" / "mechanical_ops"
+ITERATIONS = 200
+
+
+def _real_operation_paths():
+    paths = []
+    for op_file in sorted(OPS_DIR.glob("*/releases/*/operation.yaml")):
+        config = (yaml.safe_load(op_file.read_text(encoding="utf-8")) or {}).get("config", {})
+        for path in collect_jsonpaths(config):
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+def _sample_document():
+    return {
+        "summary": "Build a widget tracker",
+        "goals": ["track", "report"],
+        "constraints": [{"id": f"C{i}", "text": "x" * 40} for i in range(20)],
+        "stakeholders": ["ops", "finance"],
+        "success_criteria": ["fast"],
+        "project_type": "greenfield",
+        "artifact_type": "web_application",
+        "audience": "internal",
+        "classification": "software",
+        "confidence": "high",
+        "project_summary": "Widget tracker",
+        "identified_constraints": ["budget"],
+        "scope_type": "mvp",
+        "urgency": "medium",
+        "intake_summary": "Tracker",
+        "decision": {"next_pow_ref": "pow:software_product_development@1.0.0", "confidence": "high"},
+        "qa": {"has_winner": True},
+    }
+
+
+def test_compiled_paths_faster_than_parse_per_call():
+    paths = _real_operation_paths()
+    assert paths, "expected JSONPaths in shipped mechanical operations"
+    doc = _sample_document()
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for path in paths:
+            [m.value for m in jsonpath_parse(path).find(doc)]
+    parse_per_call = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        for path in paths:
+            compile_jsonpath(path).find(doc)
+    compiled = time.perf_counter() - start
+
+    evaluations = ITERATIONS * len(paths)
+    print(
+        f"\n{len(paths)} paths x {ITERATIONS} iterations: "
+        f"parse-per-call {parse_per_call * 1e6 / evaluations:.1f}us/eval, "
+        f"compiled {compiled * 1e6 / evaluations:.2f}us/eval, "
+        f"speedup {parse_per_call / compiled:.0f}x"
+    )
+    assert compiled < parse_per_call
@@ -0,0 +1,72 @@
+"""Microbenchmark: single-pass JSON extraction vs the multi-strategy chain.
+
+Parses representative LLM responses (clean JSON, fenced JSON with
+commentary, truncated array) of several sizes with the previous
+Direct -> MarkdownFence -> FuzzyBoundary chain and with the default
+SinglePassStrategy.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import json
+import time
+
+import pytest
+
+from app.domain.services.llm_response_parser import (
+    DirectParseStrategy,
+    FuzzyBoundaryStrategy,
+    LLMResponseParser,
+    MarkdownFenceStrategy,
+)
+
+pytestmark = pytest.mark.slow
+
+ITERATIONS = 50
+
+
+def _document(items):
+    return {
+        "title": "Implementation plan",
+        "work_statements": [
+            {
+                "ws_id": f"WS-{i:03d}",
+                "title": f"Work statement {i}",
+                "description": "Implement the {component} and its [tests]. " * 4,
+                "acceptance_criteria": [f"Criterion {j} holds" for j in range(5)],
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def _responses(items):
+    body = json.dumps(_document(items), indent=2)
+    return {
+        "clean": body,
+        "fenced": "Here is the plan you asked for.\n\n```json\n" + body + "\n```\n\nLet me know {if} anything [changes].",
+        "truncated": body[: int(len(body) * 0.9)],
+    }
+
+
+def _time(fn, text):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(text)
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def test_parser_bench():
+    legacy = LLMResponseParser(
+        strategies=[DirectParseStrategy(), MarkdownFenceStrategy(), FuzzyBoundaryStrategy()]
+    )
+    single = LLMResponseParser()
+
+    print(f"\n{'response':<22}{'bytes':>10}{'chain ms':>12}{'single ms':>12}")
+    for items in (10, 100, 500):
+        for kind, text in _responses(items).items():
+            legacy_ms = _time(legacy.parse, text)
+            single_ms = _time(single.parse, text)
+
+            assert single.parse(text).data == legacy.parse(text).data
+            print(f"{kind + ' x' + str(items):<22}{len(text):>10}{legacy_ms:>12.3f}{single_ms:>12.3f}")
@@ -0,0 +1,171 @@
+"""Load test: BaseHTTPMiddleware stack vs pure ASGI middleware stack.
+
+Runs the same five custom layers main.py installs (error handling,
+request ID, body size, secret ingress, logging) in front of a small
+Starlette app, once as the previous BaseHTTPMiddleware classes
+(reproduced below) and once as the pure ASGI classes now in
+app/api/middleware, and reports p50/p99 latency per request under
+concurrent load for a polling GET and a 20 KB JSON POST. Requests go
+through httpx's in-process ASGI transport, so the figures are middleware
+and framework overhead only, with no network or database time.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import asyncio
+import gc
+import json
+import logging
+import statistics
+import time
+from uuid import uuid4
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.api.middleware.body_size import BodySizeMiddleware
+from app.api.middleware.error_handling import ErrorHandlingMiddleware
+from app.api.middleware.logging import LoggingMiddleware
+from app.api.middleware.request_id import RequestIDMiddleware
+from app.api.middleware.secret_ingress import SecretIngressMiddleware, scan_body
+
+pytestmark = pytest.mark.slow
+
+CONCURRENCY = 20
+REQUESTS = 1000
+MAX_BODY = 10 * 1024 * 1024
+
+PAYLOAD = json.dumps({
+    "answers": {f"question_{i}": f"Answer text for question {i}. " * 8 for i in range(80)},
+}).encode()
+
+
+# -----------------------------------------------------------------------------
+# Previous stack (BaseHTTPMiddleware), condensed from the old modules
+# -----------------------------------------------------------------------------
+
+class LegacyLogging(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start = time.time()
+        logging.getLogger(__name__).info(f"Request: {request.method} {request.url.path}")
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = f"{(time.time() - start) * 1000:.2f}ms"
+        return response
+
+
+class LegacyRequestID(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-ID") or str(uuid4())
+        request.state.request_id = request_id
+        request.state.correlation_id = request.headers.get("X-Correlation-ID") or request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        response.headers["X-Correlation-ID"] = request.state.correlation_id
+        return response
+
+
+class LegacyBodySize(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        if request.method in ("POST", "PUT", "PATCH"):
+            length = request.headers.get("content-length")
+            if length and int(length) > MAX_BODY:
+                return JSONResponse({"detail": "too large"}, status_code=413)
+            if len(await request.body()) > MAX_BODY:
+                return JSONResponse({"detail": "too large"}, status_code=413)
+        return await call_next(request)
+
+
+class LegacySecretIngress(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        if request.method not in ("POST", "PUT", "PATCH"):
+            return await call_next(request)
+        body = await request.body()
+        if body:
+            result = scan_body(body, request.headers.get("content-type", ""))
+            if result.verdict == "SECRET_DETECTED":
+                return JSONResponse({"error": "secret_detected"}, status_code=422)
+        return await call_next(request)
+
+
+# -----------------------------------------------------------------------------
+# App and load
+# -----------------------------------------------------------------------------
+
+async def status(request: Request):
+    return JSONResponse({"status": "running", "current_node": "pgc_gate"})
+
+
+async def submit(request: Request):
+    body = await request.json()
+    return JSONResponse({"accepted": len(body["answers"])})
+
+
+def _app(*middleware):
+    """App with middleware listed outermost first, as main.py orders them."""
+    app = Starlette(routes=[
+        Route("/api/v1/executions/x", status),
+        Route("/api/v1/executions/x/submit", submit, methods=["POST"]),
+    ])
+    for cls in reversed(middleware):
+        app.add_middleware(cls)
+    return app
+
+
+STACKS = {
+    "before": (ErrorHandlingMiddleware, LegacySecretIngress, LegacyBodySize,
+               LegacyRequestID, LegacyLogging),
+    "after": (ErrorHandlingMiddleware, RequestIDMiddleware, BodySizeMiddleware,
+              SecretIngressMiddleware, LoggingMiddleware),
+}
+
+
+async def _load(app, method, path, content=None):
+    latencies = []
+    headers = {"content-type": "application/json"} if content else {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            start = time.perf_counter()
+            response = await client.request(method, path, content=content, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
+
+        async def worker(n):
+            for _ in range(n):
+                await one()
+
+        await asyncio.gather(*(worker(CONCURRENCY) for _ in range(5)))  # warm up
+        latencies.clear()
+        gc.collect()
+        await asyncio.gather(*(worker(REQUESTS // CONCURRENCY) for _ in range(CONCURRENCY)))
+    return latencies
+
+
+def _pct(latencies, p):
+    return statistics.quantiles(latencies, n=100)[p - 1] * 1000
+
+
+@pytest.mark.asyncio
+async def test_middleware_stack_latency():
+    logging.getLogger("app.api.middleware").setLevel(logging.WARNING)
+    logging.getLogger(__name__).setLevel(logging.WARNING)
+
+    cases = [
+        ("GET poll", "GET", "/api/v1/executions/x", None),
+        ("POST 20KB", "POST", "/api/v1/executions/x/submit", PAYLOAD),
+    ]
+    print()
+    print(f"{CONCURRENCY} concurrent clients, {REQUESTS} requests per run")
+    print(f"{'request':>10} {'stack':>7} {'p50':>9} {'p99':>9}")
+    for label, method, path, content in cases:
+        results = {}
+        for name, stack in STACKS.items():
+            latencies = await _load(_app(*stack), method, path, content)
+            results[name] = (_pct(latencies, 50), _pct(latencies, 99))
+            print(f"{label:>10} {name:>7} {results[name][0]:>7.2f}ms {results[name][1]:>7.2f}ms")
+        assert results["after"][0] < results["before"][0]
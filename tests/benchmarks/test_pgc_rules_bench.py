@@ -0,0 +1,115 @@
+"""Microbenchmark: indexed keyword matching in the PGC validation rules.
+
+Runs PromotionValidator over synthetic discovery documents with hundreds
+of constraints, assumptions and guardrails against hundreds of PGC
+answers, and compares it with the previous pairwise set-based matching
+(reimplemented here), checking that both report the same issues.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import random
+import time
+
+import pytest
+
+from app.domain.workflow.validation import PromotionValidationInput, PromotionValidator
+from app.domain.workflow.validation.rules import (
+    extract_keywords,
+    jaccard_similarity,
+    keyword_overlap_ratio,
+)
+
+pytestmark = pytest.mark.slow
+
+SIZES = (50, 200, 500)
+WORDS = [f"{stem}{suffix}" for stem in (
+    "auth", "payment", "report", "export", "mobile", "offline", "audit", "tenant",
+    "search", "invoice", "schedule", "notify", "archive", "sync", "billing", "upload",
+) for suffix in ("", "ing", "er", "ed", "s", "ation")]
+
+
+def _sentence(rng, length=8):
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def _input(n, seed=3):
+    rng = random.Random(seed)
+    questions = [
+        {"id": f"Q{i}", "text": _sentence(rng), "priority": rng.choice(["must", "should", "could"])}
+        for i in range(n)
+    ]
+    answers = {q["id"]: _sentence(rng, 4) for q in questions}
+    constraints = [{"id": f"C{i}", "constraint": _sentence(rng)} for i in range(n)]
+    # Every tenth assumption restates a constraint (a contradiction)
+    assumptions = [
+        {"id": f"A{i}", "assumption": constraints[i]["constraint"] if i % 10 == 0 else _sentence(rng)}
+        for i in range(n)
+    ]
+    document = {
+        "known_constraints": constraints,
+        "assumptions": assumptions,
+        "mvp_guardrails": [{"id": f"G{i}", "guardrail": _sentence(rng)} for i in range(n)],
+    }
+    intake = {"description": _sentence(rng, 40)}
+    return PromotionValidationInput(
+        pgc_questions=questions, pgc_answers=answers,
+        generated_document=document, intake=intake,
+    )
+
+
+def _legacy_counts(data):
+    """Issue counts per check from the previous pairwise set comparisons."""
+    questions = {q["id"]: q for q in data.pgc_questions}
+
+    def sources(priorities):
+        return [
+            extract_keywords(f"{questions[q]['text']} {a}")
+            for q, a in data.pgc_answers.items()
+            if questions[q]["priority"] in priorities
+        ]
+
+    intake = extract_keywords(data.intake["description"])
+    doc = data.generated_document
+    must, should = sources({"must"}) + [intake], sources({"should", "could"})
+    grounding_sources = sources({"must", "should"}) + [intake]
+
+    promotion = 0
+    for c in doc["known_constraints"]:
+        kw = extract_keywords(c["constraint"])
+        if max((keyword_overlap_ratio(s, kw) for s in must), default=0.0) < 0.5:
+            promotion += 1
+            max((keyword_overlap_ratio(s, kw) for s in should), default=0.0)
+    contradiction = sum(
+        1
+        for c in doc["known_constraints"]
+        for a in doc["assumptions"]
+        if jaccard_similarity(extract_keywords(c["constraint"]), extract_keywords(a["assumption"])) > 0.5
+    )
+    grounding = sum(
+        1
+        for g in doc["mvp_guardrails"]
+        if max((keyword_overlap_ratio(s, extract_keywords(g["guardrail"])) for s in grounding_sources), default=0.0) < 0.5
+    )
+    return {"promotion": promotion, "contradiction": contradiction, "grounding": grounding}
+
+
+def test_pgc_rules_bench():
+    print(f"\n{'items':>6}{'pairwise ms':>14}{'indexed ms':>13}{'speedup':>9}  issues")
+    for n in SIZES:
+        data = _input(n)
+
+        start = time.perf_counter()
+        expected = _legacy_counts(data)
+        legacy_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        result = PromotionValidator().validate(data)
+        indexed_ms = (time.perf_counter() - start) * 1000
+
+        counts = {check: 0 for check in expected}
+        for issue in result.issues:
+            if issue.check_type in counts:
+                counts[issue.check_type] += 1
+        assert counts == expected
+        print(f"{n:>6}{legacy_ms:>14.1f}{indexed_ms:>13.1f}{legacy_ms / indexed_ms:>8.1f}x  {counts}")
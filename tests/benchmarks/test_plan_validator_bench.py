@@ -0,0 +1,117 @@
+"""Microbenchmark: full PlanValidator.validate vs IncrementalPlanValidator edits.
+
+The workbench editor changes one node or edge at a time. Full validation
+re-checks every schema and rebuilds the adjacency list; the incremental
+validator re-checks the edited item and updates its graph indexes. Measured
+on the largest shipped workflow (by node and edge count) and on a synthetic
+plan scaled up to show how each path grows with plan size. Node and edge
+edits cost the same at any size; retargeting the edge that holds the
+graph together is the worst case and pays for one reachability pass.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import copy
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from app.domain.workflow.incremental_plan_validator import IncrementalPlanValidator
+from app.domain.workflow.plan_validator import PlanValidator
+
+pytestmark = pytest.mark.slow
+
+ITERATIONS = 2000
+WORKFLOWS_DIR = Path(__file__).resolve().parents[2] / "combine-config" / "workflows"
+
+
+def _largest_shipped():
+    best = None
+    for path in WORKFLOWS_DIR.glob("*/releases/*/definition.json"):
+        raw = json.loads(path.read_text(encoding="utf-8-sig"))
+        if "nodes" not in raw or "edges" not in raw:
+            continue
+        size = len(raw["nodes"]) + len(raw["edges"])
+        if best is None or size > best[0]:
+            best = (size, path, raw)
+    return best[1], best[2]
+
+
+def _synthetic(node_count):
+    nodes = [{"node_id": f"n{i}", "type": "task", "description": f"step {i}"}
+             for i in range(node_count)]
+    nodes.append({"node_id": "done", "type": "end", "terminal_outcome": "stabilized"})
+    edges = [
+        {"edge_id": f"e{i}", "from_node_id": f"n{i}",
+         "to_node_id": f"n{i + 1}" if i + 1 < node_count else "done", "outcome": "success"}
+        for i in range(node_count)
+    ]
+    return {"workflow_id": "synthetic", "entry_node_ids": ["n0"], "nodes": nodes, "edges": edges}
+
+
+def _per_call_us(fn):
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        fn(i)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def _measure(raw):
+    node = copy.deepcopy(raw["nodes"][0])
+    edge = copy.deepcopy(raw["edges"][0])
+    full = PlanValidator()
+    incremental = IncrementalPlanValidator()
+    incremental.load(raw)
+
+    def full_edit(i):
+        node["description"] = f"edit {i}"
+        plan = dict(raw, nodes=[node] + raw["nodes"][1:])
+        full.validate(plan)
+
+    def node_edit(i):
+        node["description"] = f"edit {i}"
+        incremental.update_node(dict(node))
+
+    def edge_edit(i):
+        incremental.update_edge(dict(edge, outcome=f"outcome_{i % 2}"))
+
+    def edge_retarget(i):
+        # Worst case: dropping the only link to the rest of the graph
+        # forces the reachable set to be recomputed
+        target = edge["to_node_id"] if i % 2 else edge["from_node_id"]
+        incremental.update_edge(dict(edge, to_node_id=target))
+
+    results = {
+        "full validate": _per_call_us(full_edit),
+        "incremental node": _per_call_us(node_edit),
+        "incremental edge": _per_call_us(edge_edit),
+        "incremental retarget": _per_call_us(edge_retarget),
+    }
+    incremental.update_edge(edge)
+    assert incremental.result() == full.validate(incremental.plan)
+    return results
+
+
+def test_incremental_plan_validation():
+    path, shipped = _largest_shipped()
+    cases = [(f"{path.parts[-4]} {path.parts[-2]}", shipped)]
+    cases += [(f"synthetic {n}", _synthetic(n)) for n in (100, 1000)]
+
+    print()
+    print(
+        f"{'plan':<28}{'nodes':>7}{'edges':>7}  "
+        f"{'full us':>9}{'node us':>9}{'edge us':>9}{'retarget us':>13}"
+    )
+    for name, raw in cases:
+        timings = _measure(raw)
+        print(
+            f"{name:<28}{len(raw['nodes']):>7}{len(raw['edges']):>7}  "
+            f"{timings['full validate']:>9.1f}{timings['incremental node']:>9.1f}"
+            f"{timings['incremental edge']:>9.1f}{timings['incremental retarget']:>13.1f}"
+        )
+        if name.startswith(path.parts[-4]):
+            assert timings["incremental node"] < 1000
+            assert timings["incremental edge"] < 1000
+            assert timings["incremental retarget"] < 1000
@@ -0,0 +1,146 @@
+"""Microbenchmark: bytes transferred by list endpoints, full rows vs projections.
+
+Document.content, WorkflowExecution.execution_log and context_state are
+now deferred, and the list endpoints select summary columns instead of
+whole rows. This records the statements each endpoint issues and
+estimates the bytes one page of results would transfer, using synthetic
+sizes for the large JSONB columns, and times decoding those bytes as JSON
+the way the driver would. No PostgreSQL is available to the test suite, so
+database scan time is not included.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy.dialects import postgresql
+
+pytestmark = pytest.mark.slow
+
+ROWS = 50
+
+# Typical sizes (bytes) of the large columns on a mature project
+HEAVY_COLUMNS = {
+    ("documents", "content"): 200_000,
+    ("documents", "search_vector"): 20_000,
+    ("workflow_executions", "execution_log"): 300_000,
+    ("workflow_executions", "context_state"): 150_000,
+}
+SMALL_COLUMN = 48
+MEASURED_TABLES = {"documents", "workflow_executions"}
+
+
+class RecordingDB:
+    """Async session stand-in: records statements, finds a project, returns no rows."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = SimpleNamespace(id=uuid4())
+        result.all.return_value = []
+        result.scalars.return_value.all.return_value = []
+        return result
+
+
+def _column_bytes(column) -> int:
+    return HEAVY_COLUMNS.get((column.table.name, column.name), SMALL_COLUMN)
+
+
+def _row_bytes(stmt):
+    """(projected, full-row) bytes per row for a statement."""
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    projected = 0
+    # _result_columns is private but is the only place the compiled
+    # statement records which objects each result column came from.
+    for _key, _name, objects, _type in compiled._result_columns:
+        columns = [obj for obj in objects if isinstance(obj, Column)]
+        projected += _column_bytes(columns[0]) if columns else SMALL_COLUMN
+    full = sum(
+        _column_bytes(column)
+        for table in stmt.get_final_froms()
+        for column in table.columns
+    )
+    return projected, full
+
+
+def _measured(statements):
+    return [
+        stmt for stmt in statements
+        if {t.name for t in stmt.get_final_froms()} & MEASURED_TABLES
+    ]
+
+
+async def _get_pending(db):
+    from app.domain.workflow.interrupt_registry import InterruptRegistry
+    await InterruptRegistry(db).get_pending(str(uuid4()))
+
+
+async def _list_executions(db):
+    from app.domain.workflow.pg_state_persistence import PgStatePersistence
+    await PgStatePersistence(db).list_executions()
+
+
+async def _list_candidates(db):
+    from app.api.v1.routers.work_binder import list_candidates
+    await list_candidates(str(uuid4()), db=db)
+
+
+async def _list_work_packages(db):
+    from app.api.v1.routers.projects import list_work_packages
+    await list_work_packages(str(uuid4()), db=db, current_user=None)
+
+
+ENDPOINTS = {
+    "interrupts.get_pending": _get_pending,
+    "executions.list": _list_executions,
+    "work_binder.list_candidates": _list_candidates,
+    "projects.list_work_packages": _list_work_packages,
+}
+
+
+def _decode_time(nbytes: int) -> float:
+    """Seconds to json-decode nbytes of JSONB payload."""
+    item = {"id": "x" * 20, "text": "y" * 200}
+    payload = json.dumps([item] * max(1, nbytes // len(json.dumps(item))))
+    start = time.perf_counter()
+    json.loads(payload)
+    return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_projection_bytes():
+    print()
+    print(f"{'endpoint':<30} {'full rows':>12} {'projected':>12} {'reduction':>10}")
+
+    total_full = total_projected = 0
+    for name, call in ENDPOINTS.items():
+        db = RecordingDB()
+        await call(db)
+        statements = _measured(db.statements)
+        assert statements, f"{name} issued no document/execution queries"
+
+        # The first such statement is the list query; later ones are
+        # single-row lookups on the empty-list path.
+        p, f = _row_bytes(statements[0])
+        projected, full = p * ROWS, f * ROWS
+        total_full += full
+        total_projected += projected
+
+        print(f"{name:<30} {full / 1e6:>10.1f}MB {projected / 1e3:>10.1f}KB "
+              f"{full / projected:>9.0f}x")
+        assert projected * 20 < full, f"{name} still transfers large columns"
+
+    full_decode = _decode_time(total_full)
+    projected_decode = _decode_time(total_projected)
+    print(f"{'total':<30} {total_full / 1e6:>10.1f}MB {total_projected / 1e3:>10.1f}KB")
+    print(f"json decode: {full_decode * 1000:.1f}ms full rows, "
+          f"{projected_decode * 1000:.2f}ms projected")
@@ -0,0 +1,123 @@
+"""Microbenchmark: RenderModelBuilder with and without cached render plans.
+
+Compiling a plan per request (sorting sections, fetching every component
+and schema, hashing the schema bundle and re-parsing pointers) is what
+build() used to do on every call. The cached path fetches the docdef and
+renders from the precompiled plan. Registry reads cost a simulated 0.2ms
+round trip so the query savings show up in wall time.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.domain.services.render_model_builder import (
+    RenderModelBuilder,
+    invalidate_render_plans,
+)
+
+pytestmark = pytest.mark.slow
+
+ITERATIONS = 200
+SECTIONS = 12
+QUERY_LATENCY = 0.0002
+
+
+class CountingService:
+    """Async registry stand-in that counts reads and sleeps per read."""
+
+    def __init__(self, lookup):
+        self.lookup = lookup
+        self.queries = 0
+
+    async def _read(self, key):
+        self.queries += 1
+        await asyncio.sleep(QUERY_LATENCY)
+        return self.lookup(key)
+
+    async def get(self, key):
+        return await self._read(key)
+
+    async def get_by_id(self, key):
+        return await self._read(key)
+
+
+def _docdef():
+    sections = []
+    for index in range(SECTIONS):
+        shape = ("single", "list", "container")[index % 3]
+        sections.append({
+            "section_id": f"sec_{index}",
+            "order": SECTIONS - index,
+            "component_id": f"component:Bench{index % 4}V1:1.0.0",
+            "shape": shape,
+            "source_pointer": f"/sections/{index}/{'value' if shape == 'single' else 'items'}",
+        })
+    return SimpleNamespace(
+        id=uuid4(), document_def_id="docdef:Bench:1.0.0", status="accepted", sections=sections,
+    )
+
+
+def _document():
+    return {
+        "title": "Bench",
+        "sections": [
+            {"value": {"text": f"section {i}"}, "items": [{"n": n} for n in range(20)]}
+            for i in range(SECTIONS)
+        ],
+    }
+
+
+def _builder(docdef):
+    docdef_service = CountingService(lambda _: docdef)
+    component_service = CountingService(lambda cid: SimpleNamespace(
+        component_id=cid, schema_id=f"schema:{cid.split(':')[1]}", status="accepted",
+    ))
+    schema_service = CountingService(lambda sid: SimpleNamespace(schema_json={"$id": sid}))
+    builder = RenderModelBuilder(docdef_service, component_service, schema_service)
+    return builder, (docdef_service, component_service, schema_service)
+
+
+async def _per_call(builder, data):
+    """The old shape of build(): compile on every request."""
+    docdef = await builder.docdef_service.get("docdef:Bench:1.0.0")
+    plan, _ = await builder.compile_plan("docdef:Bench:1.0.0", docdef)
+    return plan.render(data, document_id="bench")
+
+
+async def _timed(render, builder, services, data):
+    start = time.perf_counter()
+    results = [await render(builder, data) for _ in range(ITERATIONS)]
+    elapsed = time.perf_counter() - start
+    return results[-1], elapsed, sum(s.queries for s in services)
+
+
+def test_cached_plan_faster_than_per_call_compile():
+    invalidate_render_plans()
+    docdef, data = _docdef(), _document()
+
+    async def cached(builder, data):
+        return await builder.build("docdef:Bench:1.0.0", data, document_id="bench")
+
+    async def run():
+        legacy = await _timed(_per_call, *_builder(docdef), data)
+        current = await _timed(cached, *_builder(docdef), data)
+        return legacy, current
+
+    (legacy_model, legacy_s, legacy_q), (current_model, current_s, current_q) = asyncio.run(run())
+    invalidate_render_plans()
+
+    assert legacy_model.to_dict() == current_model.to_dict()
+    print(
+        f"\n{ITERATIONS} builds, {SECTIONS} sections: "
+        f"per-call compile {legacy_s * 1e3:.1f}ms ({legacy_q / ITERATIONS:.1f} queries/build), "
+        f"cached plan {current_s * 1e3:.1f}ms ({current_q / ITERATIONS:.2f} queries/build) "
+        f"({legacy_s / current_s:.1f}x)"
+    )
+    assert current_q < legacy_q
+    assert current_s < legacy_s
@@ -0,0 +1,78 @@
+"""Microbenchmark: cost of hot-path tracing spans, off vs collect.
+
+Times one span around an empty block for NoopTracer (TRACING_MODE=off)
+and for a collecting Tracer (in-memory collector plus Prometheus
+histograms), then runs the same synthetic in-memory workflow load under
+both tracers to show the per-step difference. A step opens about seven
+spans, so the no-op figure times seven is the whole cost of leaving the
+instrumentation in place.
+
+Excluded from default runs. Run explicitly: pytest -m slow -s
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.domain.workflow.plan_registry import get_plan_registry
+from app.loadtest.harness import run_load
+from app.loadtest.latency import LatencyModel
+from app.loadtest.synthetic import create_synthetic_executors
+from app.observability.tracing import create_tracer, reset_tracer, set_tracer
+
+pytestmark = pytest.mark.slow
+
+ITERATIONS = 200_000
+EXECUTIONS = 400
+
+
+def _per_span_ns(tracer):
+    start = time.perf_counter_ns()
+    for _ in range(ITERATIONS):
+        with tracer.span("bench", node_type="task"):
+            pass
+    return (time.perf_counter_ns() - start) / ITERATIONS
+
+
+def _baseline_ns():
+    start = time.perf_counter_ns()
+    for _ in range(ITERATIONS):
+        pass
+    return (time.perf_counter_ns() - start) / ITERATIONS
+
+
+def _load(tracer):
+    registry = get_plan_registry()
+    executors = create_synthetic_executors(registry, LatencyModel.parse("constant:0"), seed=1)
+    set_tracer(tracer)
+    try:
+        return asyncio.run(run_load(
+            lambda db: executors, ["project_discovery", "work_statement"],
+            executions=EXECUTIONS, concurrency=20, trace_memory=False,
+        ))
+    finally:
+        reset_tracer()
+
+
+def test_tracing_overhead():
+    baseline = _baseline_ns()
+    noop = _per_span_ns(create_tracer("off")) - baseline
+    collect = _per_span_ns(create_tracer("collect")) - baseline
+
+    print()
+    print(f"{'tracer':<10}{'ns/span':>10}")
+    print(f"{'off':<10}{noop:>10.0f}")
+    print(f"{'collect':<10}{collect:>10.0f}")
+
+    print(f"{'tracer':<10}{'steps/sec':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    for mode in ("off", "collect"):
+        report = _load(create_tracer(mode))
+        print(
+            f"{mode:<10}{report.steps_per_second:>12.0f}"
+            f"{report.p50_step_ms:>10.3f}{report.p99_step_ms:>10.3f}"
+        )
+        assert report.statuses == {"completed": EXECUTIONS}
+
+    # A no-op span must stay well under a microsecond
+    assert noop < 1000
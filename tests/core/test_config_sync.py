@@ -0,0 +1,251 @@
+"""Tests for cross-worker config sync."""
+
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.config_sync import (
+    ConfigSyncWorker,
+    bump_config_generation,
+    get_config_sync,
+    reset_config_sync,
+    signal_config_changed,
+)
+
+
+class FakeCluster:
+    """Config generation shared by workers (stands in for Postgres)."""
+
+    def __init__(self, generation=0):
+        self.generation = generation
+        self.reasons = []
+
+    async def read(self):
+        return self.generation
+
+    async def publish(self, reason):
+        self.generation += 1
+        self.reasons.append(reason)
+        return self.generation
+
+
+def _worker(cluster, reloads, poll_seconds=0):
+    return ConfigSyncWorker(
+        poll_seconds=poll_seconds,
+        read_generation=cluster.read,
+        publish=cluster.publish,
+        reload=lambda: reloads.append(threading.get_ident()),
+        listen=False,
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_sync():
+    reset_config_sync()
+    yield
+    reset_config_sync()
+
+
+class TestSync:
+    """Tests for ConfigSyncWorker.sync."""
+
+    def test_start_adopts_current_generation_without_reload(self):
+        """A freshly started worker has just loaded config: no reload."""
+        cluster, reloads = FakeCluster(generation=7), []
+
+        async def run():
+            worker = _worker(cluster, reloads)
+            await worker.start()
+            reloaded = await worker.sync()
+            await worker.stop()
+            return worker, reloaded
+
+        worker, reloaded = asyncio.run(run())
+        assert worker.generation == 7
+        assert reloaded is False
+        assert reloads == []
+
+    def test_newer_generation_reloads_in_thread(self):
+        """A bump elsewhere triggers one reload, off the event loop thread."""
+        cluster, reloads = FakeCluster(), []
+
+        async def run():
+            worker = _worker(cluster, reloads)
+            await worker.start()
+            cluster.generation = 3
+            first = await worker.sync()
+            second = await worker.sync()
+            await worker.stop()
+            return worker, first, second
+
+        worker, first, second = asyncio.run(run())
+        assert (first, second) == (True, False)
+        assert worker.generation == 3
+        assert worker.reloads == 1
+        assert reloads[0] != threading.get_ident()
+
+    def test_stale_notification_ignored(self):
+        """A notification for a generation already seen does not reload."""
+        cluster, reloads = FakeCluster(generation=5), []
+
+        async def run():
+            worker = _worker(cluster, reloads)
+            await worker.start()
+            reloaded = await worker.sync(4)
+            await worker.stop()
+            return reloaded
+
+        assert asyncio.run(run()) is False
+        assert reloads == []
+
+    def test_concurrent_notifications_reload_once(self):
+        """Overlapping notifications for one bump are serialized into one reload."""
+        cluster, reloads = FakeCluster(), []
+
+        async def run():
+            worker = _worker(cluster, reloads)
+            await worker.start()
+            worker._on_notification("1")
+            worker._on_notification("1")
+            await asyncio.gather(*worker._pending)
+            await worker.stop()
+
+        asyncio.run(run())
+        assert len(reloads) == 1
+
+    def test_polling_picks_up_missed_bump(self):
+        """With no notification, the poll loop still reloads."""
+        cluster, reloads = FakeCluster(), []
+
+        async def run():
+            worker = _worker(cluster, reloads, poll_seconds=0.01)
+            await worker.start()
+            cluster.generation = 1
+            for _ in range(100):
+                if reloads:
+                    break
+                await asyncio.sleep(0.01)
+            await worker.stop()
+
+        asyncio.run(run())
+        assert len(reloads) == 1
+
+    def test_reload_failure_is_recorded(self):
+        """A failing reload is logged, not raised into the listener."""
+        cluster = FakeCluster()
+
+        def broken():
+            raise RuntimeError("disk gone")
+
+        async def run():
+            worker = ConfigSyncWorker(
+                poll_seconds=0, read_generation=cluster.read,
+                publish=cluster.publish, reload=broken, listen=False,
+            )
+            await worker.start()
+            cluster.generation = 1
+            await worker._sync_safely()
+            await worker.stop()
+            return worker
+
+        worker = asyncio.run(run())
+        assert worker.last_error == "disk gone"
+        assert worker.generation == 0
+
+
+class TestSignalConfigChanged:
+    """Tests for publishing a change."""
+
+    def test_noop_when_not_running(self):
+        """Scripts and tests without a running worker publish nothing."""
+        signal_config_changed("commit")
+        assert not get_config_sync().running
+
+    def test_publish_reaches_other_worker(self):
+        """A change signalled on one worker reloads another."""
+        cluster, reloads_a, reloads_b = FakeCluster(), [], []
+
+        async def run():
+            a = _worker(cluster, reloads_a)
+            b = _worker(cluster, reloads_b)
+            await a.start()
+            await b.start()
+            a.notify_changed("Activate test_plan 1.1.0")
+            await asyncio.gather(*a._pending)
+            await b.sync()
+            await a.stop()
+            await b.stop()
+
+        asyncio.run(run())
+        assert cluster.reasons == ["Activate test_plan 1.1.0"]
+        assert len(reloads_b) == 1
+
+    def test_publish_from_worker_thread(self):
+        """Sync route handlers run in a threadpool; publishing still works."""
+        cluster, reloads = FakeCluster(), []
+
+        async def run():
+            worker = _worker(cluster, reloads)
+            await worker.start()
+            await asyncio.to_thread(worker.notify_changed, "from thread")
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in list(worker._pending)))
+            await worker.stop()
+
+        asyncio.run(run())
+        assert cluster.reasons == ["from thread"]
+
+    def test_failed_publish_reloads_locally(self):
+        """If the bump fails, this worker still reloads its own caches."""
+        reloads = []
+
+        async def failing_publish(reason):
+            raise ConnectionError("db down")
+
+        async def run():
+            worker = ConfigSyncWorker(
+                poll_seconds=0, read_generation=FakeCluster().read,
+                publish=failing_publish, reload=lambda: reloads.append(1), listen=False,
+            )
+            await worker.start()
+            worker.notify_changed("commit")
+            await asyncio.gather(*worker._pending)
+            await worker.stop()
+            return worker
+
+        worker = asyncio.run(run())
+        assert reloads == [1]
+        assert worker.last_error == "db down"
+
+
+class TestBumpConfigGeneration:
+    """Tests for the generation bump statements."""
+
+    def test_upserts_and_notifies(self):
+        """One upsert returning the generation, then pg_notify, then commit."""
+
+        class Result:
+            def scalar_one(self):
+                return 4
+
+        class RecordingDB:
+            def __init__(self):
+                self.sql = []
+                self.committed = False
+
+            async def execute(self, stmt):
+                self.sql.append(str(stmt.compile(dialect=postgresql.dialect())))
+                return Result()
+
+            async def commit(self):
+                self.committed = True
+
+        db = RecordingDB()
+        generation = asyncio.run(bump_config_generation(db, "commit"))
+
+        assert generation == 4
+        assert "ON CONFLICT (id) DO UPDATE" in db.sql[0]
+        assert "RETURNING config_generation.generation" in db.sql[0]
+        assert "pg_notify" in db.sql[1]
+        assert db.committed
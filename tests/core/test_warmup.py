@@ -0,0 +1,161 @@
+"""Tests for startup registry warm-up."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.warmup import (
+    DEFAULT_LOADERS,
+    WarmupState,
+    get_warmup_state,
+    reset_warmup_state,
+    run_warmup,
+    start_warmup,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    reset_warmup_state()
+    yield
+    reset_warmup_state()
+
+
+class TestRunWarmup:
+    """Tests for run_warmup."""
+
+    def test_records_items_and_timings(self):
+        """Each loader's item count and duration are recorded."""
+        state = asyncio.run(run_warmup({"plans": lambda: 6, "schemas": lambda: 9}))
+
+        assert state.status == "ready"
+        assert state.complete
+        assert state.tasks["plans"].items == 6
+        assert state.tasks["schemas"].items == 9
+        assert state.tasks["plans"].duration_ms is not None
+        assert state is get_warmup_state()
+
+    def test_failed_loader_does_not_stop_others(self):
+        """A failing loader is reported; the rest still load."""
+        def broken():
+            raise ValueError("bad config")
+
+        state = asyncio.run(run_warmup({"broken": broken, "plans": lambda: 2}))
+
+        assert state.status == "failed"
+        assert state.complete
+        assert state.tasks["broken"].error == "bad config"
+        assert state.tasks["plans"].status == "ready"
+
+    def test_loaders_run_concurrently(self):
+        """Loaders run in parallel worker threads."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def loader():
+            barrier.wait()  # deadlocks (then times out) if run serially
+            return 1
+
+        state = asyncio.run(run_warmup({"a": loader, "b": loader}, state=WarmupState()))
+
+        assert state.status == "ready"
+
+    def test_start_warmup_reports_running_immediately(self):
+        """Background warm-up is visible as running before it completes."""
+        release = threading.Event()
+
+        async def scenario():
+            task = start_warmup({"slow": lambda: release.wait(5) and 1})
+            assert get_warmup_state().status == "running"
+            release.set()
+            return await task
+
+        state = asyncio.run(scenario())
+
+        assert state.status == "ready"
+
+    def test_to_dict(self):
+        """State serializes for the health endpoint."""
+        assert WarmupState().to_dict() == {"status": "not_started", "duration_ms": None, "tasks": {}}
+
+
+class TestDefaultLoaders:
+    """Default loaders against the shipped combine-config/."""
+
+    def test_default_loaders_load_shipped_config(self):
+        """All registries warm from the repository's config."""
+        state = asyncio.run(run_warmup(state=WarmupState()))
+
+        assert set(state.tasks) == set(DEFAULT_LOADERS)
+        for task in state.tasks.values():
+            assert task.status == "ready", (task.name, task.error)
+        assert state.tasks["plans"].items > 0
+        assert state.tasks["mechanical_ops"].items > 0
+
+
+class TestSingletonsUnderConcurrentWarmup:
+    """Warm-up threads share the process-wide registries."""
+
+    def test_plan_registry_is_published_fully_loaded(self, monkeypatch):
+        """A concurrent caller waits for the load instead of seeing an empty registry."""
+        from app.domain.workflow import plan_registry
+
+        loading = threading.Event()
+        release = threading.Event()
+        load_from_directory = plan_registry.PlanRegistry.load_from_directory
+
+        def slow_load(self, directory):
+            loading.set()
+            release.wait(5)
+            return load_from_directory(self, directory)
+
+        monkeypatch.setattr(plan_registry.PlanRegistry, "load_from_directory", slow_load)
+        plan_registry.reset_plan_registry()
+        try:
+            results = []
+            first = threading.Thread(target=lambda: results.append(plan_registry.get_plan_registry()))
+            first.start()
+            assert loading.wait(5)
+            seen_ids = []
+            second = threading.Thread(
+                target=lambda: seen_ids.extend(plan_registry.get_plan_registry().list_ids())
+            )
+            second.start()
+            release.set()
+            first.join(5)
+            second.join(5)
+
+            assert seen_ids
+            assert seen_ids == results[0].list_ids()
+        finally:
+            plan_registry.reset_plan_registry()
+
+    def test_package_loader_created_once(self, monkeypatch):
+        """Concurrent first calls build a single PackageLoader."""
+        from app.config import package_loader
+
+        created = []
+        barrier = threading.Barrier(3, timeout=5)
+
+        class CountingLoader:
+            def __init__(self, config_path=None):
+                created.append(self)
+                time.sleep(0.05)  # a full config scan, in miniature
+
+        monkeypatch.setattr(package_loader, "PackageLoader", CountingLoader)
+        package_loader.reset_package_loader()
+        try:
+            def call():
+                barrier.wait()
+                return package_loader.get_package_loader()
+
+            threads = [threading.Thread(target=call) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+            assert len(created) == 1
+        finally:
+            package_loader.reset_package_loader()
@@ -1,38 +1,62 @@
 """
 Tests for Phase 4: Staleness Propagation (WS-DOCUMENT-SYSTEM-CLEANUP)
 
-Tests the StalenessService and DOCUMENT_TYPE_DEPENDENCIES graph.
+Tests the StalenessService and the package-derived dependency graph.
 """
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 
 # =============================================================================
 # TESTS: Dependency graph
 # =============================================================================
 
-class TestDocumentTypeDependencies:
-    """Tests for DOCUMENT_TYPE_DEPENDENCIES configuration."""
-    
-    def test_dependency_graph_exists(self):
-        """Verify DOCUMENT_TYPE_DEPENDENCIES dict exists."""
-        from app.domain.services.staleness_service import DOCUMENT_TYPE_DEPENDENCIES
-        
-        assert isinstance(DOCUMENT_TYPE_DEPENDENCIES, dict)
-    
-    def test_project_discovery_has_dependents(self):
-        """Verify project_discovery has downstream dependents."""
-        from app.domain.services.staleness_service import DOCUMENT_TYPE_DEPENDENCIES
-        
-        assert "project_discovery" in DOCUMENT_TYPE_DEPENDENCIES
-        assert len(DOCUMENT_TYPE_DEPENDENCIES["project_discovery"]) > 0
-    
-    def test_technical_architecture_depends_on_project_discovery(self):
-        """Verify technical_architecture is a dependent of project_discovery."""
-        from app.domain.services.staleness_service import DOCUMENT_TYPE_DEPENDENCIES
+class TestDependencyGraph:
+    """Tests for the graph compiled from package required_inputs."""
+
+    def test_build_inverts_required_inputs(self):
+        """Dependents are the types that list a type as required input."""
+        from app.domain.services.staleness_service import build_dependency_graph
+
+        graph = build_dependency_graph({
+            "a": [],
+            "b": ["a"],
+            "c": ["a", "b"],
+        })
+
+        assert graph.dependents["a"] == {"b", "c"}
+        assert graph.dependents["b"] == {"c"}
+        assert graph.upstream["c"] == {"a", "b"}
+
+    def test_closure_is_transitive(self):
+        """Closure reaches dependents of dependents."""
+        from app.domain.services.staleness_service import build_dependency_graph
+
+        graph = build_dependency_graph({"b": ["a"], "c": ["b"], "d": ["c"]})
+
+        assert graph.downstream("a") == {"b"}
+        assert graph.downstream("a", transitive=True) == {"b", "c", "d"}
+        assert graph.downstream("d", transitive=True) == frozenset()
+
+    def test_cycles_terminate(self):
+        """A cycle does not loop forever."""
+        from app.domain.services.staleness_service import build_dependency_graph
+
+        graph = build_dependency_graph({"a": ["b"], "b": ["a"]})
+
+        assert graph.downstream("a", transitive=True) == {"a", "b"}
+
+    def test_active_packages_graph(self):
+        """The active config's graph comes from package manifests."""
+        from app.domain.services.staleness_service import get_dependency_graph
 
-        assert "technical_architecture" in DOCUMENT_TYPE_DEPENDENCIES["project_discovery"]
+        graph = get_dependency_graph()
+
+        assert "technical_architecture" in graph.dependents["project_discovery"]
+        assert "work_statement" in graph.downstream("project_discovery", transitive=True)
+        assert "work_statement" not in graph.downstream("project_discovery")
 
 
 # =============================================================================
@@ -63,7 +87,7 @@ class TestGetDownstreamTypes:
         """Verify leaf node type has no dependents."""
         from app.domain.services.staleness_service import get_downstream_types
 
-        result = get_downstream_types("technical_architecture")
+        result = get_downstream_types("work_statement")
 
         assert result == []
 
@@ -110,4 +134,127 @@ class TestStalenessServiceGetUpstreamDependencies:
         
         result = await service.get_upstream_dependencies("project_discovery")
         
-        assert result == []
\ No newline at end of file
+        assert result == []
+
+
+# =============================================================================
+# TESTS: Batched propagation
+# =============================================================================
+
+def _graph():
+    from app.domain.services.staleness_service import build_dependency_graph
+    return build_dependency_graph({
+        "discovery": [],
+        "plan": ["discovery"],
+        "architecture": ["discovery", "plan"],
+        "work_package": ["architecture"],
+    })
+
+
+def _doc(doc_type_id, space_id):
+    doc = MagicMock()
+    doc.space_type = "project"
+    doc.space_id = space_id
+    doc.doc_type_id = doc_type_id
+    return doc
+
+
+class TestPlanStalenessTargets:
+    """Tests for grouping queued sources into UPDATE targets."""
+
+    def test_groups_by_space(self):
+        from app.domain.services.staleness_service import plan_staleness_targets
+
+        p1, p2 = uuid4(), uuid4()
+        targets = plan_staleness_targets(
+            [("project", p1, "discovery"), ("project", p2, "architecture")],
+            _graph(),
+        )
+
+        assert targets == {
+            ("project", p1): {"plan", "architecture"},
+            ("project", p2): {"work_package"},
+        }
+
+    def test_types_saved_in_batch_are_not_marked(self):
+        from app.domain.services.staleness_service import plan_staleness_targets
+
+        p1 = uuid4()
+        targets = plan_staleness_targets(
+            [("project", p1, "discovery"), ("project", p1, "plan")],
+            _graph(),
+        )
+
+        assert targets == {("project", p1): {"architecture"}}
+
+    def test_transitive(self):
+        from app.domain.services.staleness_service import plan_staleness_targets
+
+        p1 = uuid4()
+        targets = plan_staleness_targets([("project", p1, "discovery")], _graph(), True)
+
+        assert targets[("project", p1)] == {"plan", "architecture", "work_package"}
+
+    def test_leaf_sources_produce_no_targets(self):
+        from app.domain.services.staleness_service import plan_staleness_targets
+
+        assert plan_staleness_targets([("project", uuid4(), "work_package")], _graph()) == {}
+
+
+class TestStalenessServiceFlush:
+    """Tests for queue/flush batching."""
+
+    @pytest.mark.asyncio
+    async def test_many_sources_one_update(self):
+        from app.domain.services.staleness_service import StalenessService
+
+        mock_db = AsyncMock()
+        mock_db.execute.return_value = MagicMock(rowcount=3)
+        service = StalenessService(mock_db, graph=_graph())
+
+        for _ in range(50):
+            service.queue(_doc("discovery", uuid4()))
+        count = await service.flush()
+
+        assert count == 3
+        assert mock_db.execute.await_count == 1
+        assert service.pending_count == 0
+        sql = str(mock_db.execute.await_args.args[0])
+        assert sql.startswith("UPDATE documents")
+
+    @pytest.mark.asyncio
+    async def test_flush_without_targets_skips_query(self):
+        from app.domain.services.staleness_service import StalenessService
+
+        mock_db = AsyncMock()
+        service = StalenessService(mock_db, graph=_graph())
+
+        service.queue(_doc("work_package", uuid4()))
+
+        assert await service.flush() == 0
+        mock_db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_propagate_staleness_flushes_immediately(self):
+        from app.domain.services.staleness_service import StalenessService
+
+        mock_db = AsyncMock()
+        mock_db.execute.return_value = MagicMock(rowcount=1)
+        service = StalenessService(mock_db, graph=_graph())
+
+        count = await service.propagate_staleness(_doc("plan", uuid4()))
+
+        assert count == 1
+        assert mock_db.execute.await_count == 1
+
+    def test_update_statement_filters_staleable_latest(self):
+        from sqlalchemy.dialects import postgresql
+        from app.domain.services.staleness_service import build_staleness_update
+
+        stmt = build_staleness_update({("project", uuid4()): frozenset({"plan"})})
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "documents.space_id" in sql
+        assert "documents.doc_type_id IN" in sql
+        assert "documents.is_latest = true" in sql
+        assert "documents.lifecycle_state IN" in sql
@@ -0,0 +1,165 @@
+"""
+Tests for the daily LLM cost rollup and the cost dashboard that reads it.
+"""
+
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.api.services.cost_service import get_cost_dashboard_data
+from app.domain.services.llm_cost_rollup import (
+    backfill_cost_rollup,
+    build_run_completed_statement,
+    build_run_started_statement,
+    get_document_daily_costs,
+    subtract_runs_from_cost_rollup,
+)
+from app.domain.models.llm_logging import LLMRun
+from app.llm.telemetry import CostSummary
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class RecordingDB:
+    """Async session stand-in that records statements and returns canned rows."""
+
+    def __init__(self, rows=None, rowcount=0):
+        self.statements = []
+        self.rows = rows or []
+        self.rowcount = rowcount
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.all.return_value = self.rows
+        result.rowcount = self.rowcount
+        return result
+
+
+class TestIncrementStatement:
+    """Tests for the per-run rollup increment."""
+
+    def test_started_run_counts_one_call(self):
+        sql = _sql(build_run_started_statement(uuid4()))
+
+        assert sql.startswith("INSERT INTO llm_cost_daily")
+        assert "FROM llm_run" in sql
+        assert "ON CONFLICT (day, artifact_type) DO UPDATE" in sql
+        assert "llm_cost_daily.run_count + excluded.run_count" in sql
+        assert "timezone(" in sql
+        assert "cost_usd" not in sql.split("FROM llm_run")[0].split("SELECT")[1]
+
+    def test_completed_run_adds_usage_not_a_call(self):
+        sql = _sql(build_run_completed_statement(uuid4()))
+
+        select_list = sql.split("FROM llm_run")[0].split("SELECT")[1]
+        assert "ON CONFLICT (day, artifact_type) DO UPDATE" in sql
+        assert "llm_run.status" in select_list
+        assert "llm_run.cost_usd" in select_list
+        assert "llm_cost_daily.cost_usd + excluded.cost_usd" in sql
+
+
+class TestSubtractRuns:
+    """Tests for taking deleted runs back out of the rollup."""
+
+    @pytest.mark.asyncio
+    async def test_subtracts_grouped_runs_then_drops_empty_days(self):
+        db = RecordingDB(rowcount=2)
+        execution_ids = ["exec-1", "exec-2"]
+
+        updated = await subtract_runs_from_cost_rollup(
+            db, LLMRun.workflow_execution_id.in_(execution_ids)
+        )
+
+        update_sql, delete_sql = (_sql(s) for s in db.statements)
+        assert updated == 2
+        assert update_sql.startswith("UPDATE llm_cost_daily SET")
+        assert "run_count=(llm_cost_daily.run_count - anon_1.run_count)" in update_sql
+        assert "cost_usd=(llm_cost_daily.cost_usd - anon_1.cost_usd)" in update_sql
+        assert "ended_at" not in update_sql
+        assert "llm_run.workflow_execution_id IN" in update_sql
+        assert "GROUP BY" in update_sql
+        assert delete_sql.startswith("DELETE FROM llm_cost_daily WHERE llm_cost_daily.run_count <=")
+
+
+class TestBackfill:
+    """Tests for backfill_cost_rollup."""
+
+    @pytest.mark.asyncio
+    async def test_range_deletes_then_regroups(self):
+        db = RecordingDB(rowcount=12)
+
+        written = await backfill_cost_rollup(db, date(2026, 1, 1), date(2026, 1, 31))
+
+        delete_sql, insert_sql = (_sql(s) for s in db.statements)
+        assert written == 12
+        assert delete_sql.startswith("DELETE FROM llm_cost_daily")
+        assert "llm_cost_daily.day >=" in delete_sql and "llm_cost_daily.day <=" in delete_sql
+        assert "GROUP BY" in insert_sql
+        assert "ended_at" not in insert_sql
+        assert "llm_run.started_at <" in insert_sql
+
+    @pytest.mark.asyncio
+    async def test_full_rebuild_has_no_day_filter(self):
+        db = RecordingDB()
+
+        await backfill_cost_rollup(db)
+
+        assert "WHERE" not in _sql(db.statements[0])
+
+
+class TestDocumentDailyCosts:
+    """Tests for get_document_daily_costs."""
+
+    @pytest.mark.asyncio
+    async def test_one_grouped_query_excluding_untyped_runs(self):
+        db = RecordingDB(rows=[
+            SimpleNamespace(day=date(2026, 3, 1), cost=Decimal("1.5"), tokens=300, calls=3, errors=1),
+        ])
+
+        days = await get_document_daily_costs(db, date(2026, 2, 1))
+
+        assert len(db.statements) == 1
+        sql = _sql(db.statements[0])
+        assert "FROM llm_cost_daily" in sql and "GROUP BY llm_cost_daily.day" in sql
+        assert "llm_cost_daily.artifact_type !=" in sql
+        assert days == {"2026-03-01": {"cost": 1.5, "tokens": 300, "calls": 3, "errors": 1}}
+
+
+class TestCostDashboard:
+    """Tests for get_cost_dashboard_data."""
+
+    @pytest.mark.asyncio
+    async def test_combines_rollup_with_workflow_telemetry(self):
+        today = datetime.now(timezone.utc).date()
+        db = RecordingDB(rows=[
+            SimpleNamespace(day=today, cost=Decimal("2"), tokens=100, calls=4, errors=1),
+            SimpleNamespace(day=today - timedelta(days=1), cost=Decimal("1"), tokens=50, calls=2, errors=0),
+        ])
+        telemetry = MagicMock()
+        telemetry.get_daily_summary = AsyncMock(return_value=CostSummary.empty())
+
+        data = await get_cost_dashboard_data(db, telemetry, days=7)
+
+        assert len(db.statements) == 1
+        assert data["summary"]["total_calls"] == 6
+        assert data["summary"]["total_cost"] == pytest.approx(3.0)
+        by_day = {d["date"]: d for d in data["daily_data"]}
+        assert by_day[today.strftime("%Y-%m-%d")]["document_cost"] == pytest.approx(2.0)
+
+    @pytest.mark.asyncio
+    async def test_workflows_filter_skips_rollup(self):
+        db = RecordingDB()
+        telemetry = MagicMock()
+        telemetry.get_daily_summary = AsyncMock(return_value=CostSummary.empty())
+
+        await get_cost_dashboard_data(db, telemetry, days=3, source="workflows")
+
+        assert db.statements == []
@@ -5,12 +5,16 @@ Per WS-ADR-034-POC Phase 8.3: Tests for render model builder service.
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
 
 from app.domain.services.render_model_builder import (
+    ComponentNotFoundError,
     RenderModelBuilder,
     RenderBlock,
     RenderModel,
+    invalidate_render_plans,
 )
 
 
@@ -386,3 +390,127 @@ class TestRenderModelBuilder:
 
 
 
+
+
+class TestRenderPlanCache:
+    """Tests for compiled, cached render plans."""
+
+    @pytest.fixture(autouse=True)
+    def clear_plans(self):
+        invalidate_render_plans()
+        yield
+        invalidate_render_plans()
+
+    @pytest.fixture
+    def accepted_docdef(self):
+        return SimpleNamespace(
+            id=uuid4(),
+            document_def_id="docdef:PlanCache:1.0.0",
+            status="accepted",
+            sections=[
+                {
+                    "section_id": "items",
+                    "order": 20,
+                    "component_id": "component:TestV1:1.0.0",
+                    "shape": "list",
+                    "source_pointer": "/items",
+                },
+                {
+                    "section_id": "summary",
+                    "order": 10,
+                    "component_id": "component:TestV1:1.0.0",
+                    "shape": "single",
+                    "source_pointer": "/summary",
+                },
+            ],
+        )
+
+    @pytest.fixture
+    def accepted_component(self):
+        return SimpleNamespace(
+            component_id="component:TestV1:1.0.0",
+            schema_id="schema:TestV1",
+            status="accepted",
+        )
+
+    def _builder(self, docdef, component):
+        docdef_service = AsyncMock()
+        docdef_service.get.return_value = docdef
+        component_service = AsyncMock()
+        component_service.get.return_value = component
+        builder = RenderModelBuilder(
+            docdef_service=docdef_service,
+            component_service=component_service,
+        )
+        return builder, component_service
+
+    @pytest.mark.asyncio
+    async def test_plan_sorts_sections_and_fetches_each_component_once(self, accepted_docdef, accepted_component):
+        builder, component_service = self._builder(accepted_docdef, accepted_component)
+
+        plan = await builder.get_plan("docdef:PlanCache:1.0.0")
+
+        assert [s.section_id for s in plan.sections] == ["summary", "items"]
+        assert plan.section_count == 2
+        assert component_service.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_accepted_plan_is_reused_across_builders(self, accepted_docdef, accepted_component):
+        first, first_components = self._builder(accepted_docdef, accepted_component)
+        second, second_components = self._builder(accepted_docdef, accepted_component)
+        data = {"summary": {"text": "s"}, "items": [{"a": 1}, {"a": 2}]}
+
+        r1 = await first.build("docdef:PlanCache:1.0.0", data)
+        r2 = await second.build("docdef:PlanCache:1.0.0", data)
+
+        assert r1.to_dict() == r2.to_dict()
+        assert [s.section_id for s in r2.sections] == ["summary", "items"]
+        assert first_components.get.await_count == 1
+        assert second_components.get.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_draft_docdef_is_not_cached(self, accepted_docdef, accepted_component):
+        accepted_docdef.status = "draft"
+        builder, component_service = self._builder(accepted_docdef, accepted_component)
+
+        await builder.build("docdef:PlanCache:1.0.0", {"items": []})
+        await builder.build("docdef:PlanCache:1.0.0", {"items": []})
+
+        assert component_service.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_draft_component_is_not_cached(self, accepted_docdef, accepted_component):
+        accepted_component.status = "draft"
+        builder, component_service = self._builder(accepted_docdef, accepted_component)
+
+        await builder.get_plan("docdef:PlanCache:1.0.0")
+        await builder.get_plan("docdef:PlanCache:1.0.0")
+
+        assert component_service.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_recompile(self, accepted_docdef, accepted_component):
+        builder, component_service = self._builder(accepted_docdef, accepted_component)
+
+        await builder.get_plan("docdef:PlanCache:1.0.0")
+        invalidate_render_plans()
+        await builder.get_plan("docdef:PlanCache:1.0.0")
+
+        assert component_service.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reseeded_docdef_row_gets_new_plan(self, accepted_docdef, accepted_component):
+        builder, component_service = self._builder(accepted_docdef, accepted_component)
+
+        await builder.get_plan("docdef:PlanCache:1.0.0")
+        accepted_docdef.id = uuid4()
+        await builder.get_plan("docdef:PlanCache:1.0.0")
+
+        assert component_service.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_component_raises_at_compile(self, accepted_docdef):
+        builder, _ = self._builder(accepted_docdef, None)
+
+        with pytest.raises(ComponentNotFoundError):
+            await builder.get_plan("docdef:PlanCache:1.0.0")
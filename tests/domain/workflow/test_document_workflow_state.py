@@ -170,6 +170,7 @@ class TestDocumentWorkflowState:
         state.increment_retry("generation")
         state.set_completed("stabilized", "qualified")
         state.thread_id = "thread-789"
+        state.workflow_version = "1.4.0"
 
         data = state.to_dict()
         restored = DocumentWorkflowState.from_dict(data)
@@ -183,6 +184,7 @@ class TestDocumentWorkflowState:
         assert restored.terminal_outcome == "stabilized"
         assert restored.gate_outcome == "qualified"
         assert restored.thread_id == "thread-789"
+        assert restored.workflow_version == "1.4.0"
 
     def test_json_roundtrip(self, state):
         """State serializes to JSON and back."""
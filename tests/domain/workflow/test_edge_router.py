@@ -2,7 +2,11 @@
 
 import pytest
 
-from app.domain.workflow.edge_router import EdgeRouter
+from app.domain.workflow.edge_router import (
+    EdgeRouter,
+    compile_routing_table,
+    get_routing_table,
+)
 from app.domain.workflow.plan_models import (
     ConditionOperator,
     Edge,
@@ -460,3 +464,102 @@ class TestNonAdvancingEdges:
         assert next_node is None
         assert matched_edge is not None
         assert matched_edge.escalation_options == ["retry", "abandon"]
+
+
+class TestRoutingTable:
+    """Tests for the compiled routing table."""
+
+    @pytest.fixture
+    def plan(self):
+        nodes = [
+            make_node("qa", NodeType.QA),
+            make_node("start", NodeType.TASK),
+            make_node("end", NodeType.END, terminal_outcome="stabilized", gate_outcome="qualified"),
+        ]
+        edges = [
+            make_edge("retry", "qa", "failed", "start", conditions=[
+                EdgeCondition(type="retry_count", operator=ConditionOperator.LT, value=2),
+                EdgeCondition(type="status", operator=ConditionOperator.EQ, value="running"),
+            ]),
+            make_edge("escalate", "qa", "failed", None),
+            make_edge("done", "qa", "success", "end"),
+        ]
+        return make_plan(nodes=nodes, edges=edges)
+
+    def _state(self, retries=0):
+        state = DocumentWorkflowState(
+            execution_id="e1",
+            workflow_id="test_workflow",
+            project_id="proj-1",
+            document_type="test_doc",
+            current_node_id="qa",
+            status=DocumentWorkflowStatus.RUNNING,
+            generating_node_id="start",
+        )
+        for _ in range(retries):
+            state.increment_retry("start")
+        return state
+
+    def test_routes_indexed_by_node_and_outcome(self, plan):
+        """Edges are grouped by (node, outcome) in definition order."""
+        table = compile_routing_table(plan)
+
+        assert [c.edge.edge_id for c in table.routes[("qa", "failed")]] == ["retry", "escalate"]
+        assert table.routes[("qa", "success")][0].predicate is None
+        assert set(table.end_nodes) == {"end"}
+
+    def test_table_compiled_once_per_plan(self, plan):
+        """Routers for the same plan share one table."""
+        assert EdgeRouter(plan).table is EdgeRouter(plan).table
+        assert get_routing_table(plan) is EdgeRouter(plan).table
+
+    def test_table_is_immutable(self, plan):
+        """The shared table cannot be modified by one execution."""
+        table = get_routing_table(plan)
+        with pytest.raises(TypeError):
+            table.routes[("qa", "other")] = ()
+
+    def test_compiled_conditions_all_must_pass(self, plan):
+        """Compiled predicates keep AND semantics and generating-node retry scope."""
+        router = EdgeRouter(plan)
+
+        assert router.get_next_node("qa", "failed", self._state(retries=1))[1].edge_id == "retry"
+        assert router.get_next_node("qa", "failed", self._state(retries=2))[1].edge_id == "escalate"
+
+    def test_unknown_condition_type_never_matches(self):
+        """An unknown condition type fails closed, as before compilation."""
+        edge = make_edge("e1", "start", "success", "end", conditions=[
+            EdgeCondition(type="mystery", operator=ConditionOperator.EQ, value=1),
+        ])
+        plan = make_plan(nodes=[make_node("start", NodeType.TASK)], edges=[edge])
+
+        assert EdgeRouter(plan).get_next_node("start", "success", self._state()) == (None, None)
+
+    def test_loader_compiles_at_load_time(self):
+        """Plans from PlanLoader arrive with their routing table built."""
+        from app.domain.workflow.plan_loader import PlanLoader
+
+        plan = PlanLoader().load_dict({
+            "workflow_id": "test",
+            "version": "1.0.0",
+            "name": "Test",
+            "description": "Test",
+            "scope_type": "document",
+            "document_type": "test_doc",
+            "entry_node_ids": ["start"],
+            "nodes": [
+                {"node_id": "start", "type": "task", "description": "Start"},
+                {"node_id": "end", "type": "end", "description": "End",
+                 "terminal_outcome": "stabilized"},
+            ],
+            "edges": [
+                {"edge_id": "e1", "from_node_id": "start", "to_node_id": "end",
+                 "outcome": "success"},
+            ],
+            "outcome_mapping": {"mappings": []},
+            "thread_ownership": {"owns_thread": False},
+            "governance": {},
+        })
+
+        assert plan._routing_table is not None
+        assert ("start", "success") in plan._routing_table.routes
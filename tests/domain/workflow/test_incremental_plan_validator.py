@@ -0,0 +1,239 @@
+"""Tests for incremental workflow plan validation (ADR-039)."""
+
+import copy
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from app.domain.workflow.incremental_plan_validator import IncrementalPlanValidator
+from app.domain.workflow.plan_validator import (
+    PlanValidationErrorCode,
+    PlanValidator,
+)
+
+WORKFLOWS_DIR = Path(__file__).resolve().parents[3] / "combine-config" / "workflows"
+
+
+@pytest.fixture
+def plan():
+    return {
+        "workflow_id": "test_plan",
+        "version": "1.0.0",
+        "entry_node_ids": ["start"],
+        "nodes": [
+            {"node_id": "start", "type": "task"},
+            {"node_id": "review", "type": "gate", "gate_outcomes": ["ok", "redo"]},
+            {"node_id": "end", "type": "end", "terminal_outcome": "stabilized"},
+        ],
+        "edges": [
+            {"edge_id": "e1", "from_node_id": "start", "to_node_id": "review", "outcome": "success"},
+            {"edge_id": "e2", "from_node_id": "review", "to_node_id": "end", "outcome": "ok"},
+            {"edge_id": "e3", "from_node_id": "review", "to_node_id": "start", "outcome": "redo"},
+        ],
+        "outcome_mapping": {"mappings": [
+            {"gate_outcome": "ok", "terminal_outcome": "stabilized"},
+            {"gate_outcome": "redo", "terminal_outcome": "blocked"},
+        ]},
+    }
+
+
+def assert_matches_full(incremental, result):
+    """The incremental result equals a full validation of the current plan."""
+    expected = PlanValidator().validate(copy.deepcopy(incremental.plan))
+    assert result == expected
+
+
+def codes(items):
+    return [e.code for e in items]
+
+
+class TestEquivalence:
+    """Incremental results match PlanValidator.validate."""
+
+    def test_shipped_workflows(self):
+        """Every shipped graph workflow validates the same both ways."""
+        paths = sorted(WORKFLOWS_DIR.glob("*/releases/*/definition.json"))
+        checked = 0
+        for path in paths:
+            raw = json.loads(path.read_text(encoding="utf-8-sig"))
+            if "nodes" not in raw or "edges" not in raw:
+                continue
+            validator = IncrementalPlanValidator()
+            assert_matches_full(validator, validator.load(raw))
+            checked += 1
+        assert checked > 0
+
+    def test_random_edits(self, plan):
+        """A seeded sequence of edits stays identical to full validation."""
+        rng = random.Random(7)
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+        ids = ["start", "review", "end", "extra", "ghost"]
+        types = ["task", "gate", "end", "qa", "bogus"]
+
+        for step in range(300):
+            op = rng.randrange(6)
+            if op == 0:
+                node = {"node_id": rng.choice(ids), "type": rng.choice(types)}
+                if node["type"] == "end" and rng.random() < 0.8:
+                    node["terminal_outcome"] = "stabilized"
+                if node["type"] == "gate":
+                    node["gate_outcomes"] = rng.sample(["ok", "redo", "skip"], 2)
+                result = validator.update_node(node)
+            elif op == 1 and validator.plan["nodes"]:
+                result = validator.remove_node(rng.choice(validator.plan["nodes"])["node_id"])
+            elif op == 2:
+                edge = {
+                    "edge_id": f"e{rng.randrange(6)}",
+                    "from_node_id": rng.choice(ids),
+                    "to_node_id": rng.choice(ids + [None]),
+                    "outcome": "success",
+                }
+                if rng.random() < 0.1:
+                    edge["kind"] = "bogus"
+                result = validator.update_edge(edge)
+            elif op == 3 and validator.plan["edges"]:
+                result = validator.remove_edge(rng.choice(validator.plan["edges"])["edge_id"])
+            elif op == 4:
+                result = validator.set_field("entry_node_ids", rng.sample(ids, rng.randrange(3)))
+            else:
+                edited = copy.deepcopy(validator.plan)
+                if edited["nodes"]:
+                    edited["nodes"][rng.randrange(len(edited["nodes"]))]["description"] = str(step)
+                result = validator.sync(edited)
+            assert_matches_full(validator, result)
+
+
+class TestIncrementalWork:
+    """Only the affected items are re-checked."""
+
+    def test_unchanged_content_is_not_rechecked(self, plan, monkeypatch):
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+        checked = []
+        original = validator._validate_node_schema
+        monkeypatch.setattr(
+            validator, "_validate_node_schema",
+            lambda node, index, errors: (checked.append(node["node_id"]), original(node, index, errors)),
+        )
+
+        validator.update_node({"node_id": "start", "type": "task"})
+        validator.update_node({"node_id": "end", "type": "qa"})
+
+        assert checked == ["end"]
+
+    def test_sync_rechecks_changed_items_only(self, plan, monkeypatch):
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+        checked = []
+        original = validator._validate_edge_schema
+        monkeypatch.setattr(
+            validator, "_validate_edge_schema",
+            lambda edge, index, errors: (checked.append(edge["edge_id"]), original(edge, index, errors)),
+        )
+
+        edited = copy.deepcopy(plan)
+        edited["edges"][1]["kind"] = "user_choice"
+        result = validator.sync(edited)
+
+        assert checked == ["e2"]
+        assert_matches_full(validator, result)
+
+
+class TestGraphChanges:
+    """Reachability and integrity follow edits."""
+
+    def test_removing_edge_orphans_downstream(self, plan):
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+
+        result = validator.remove_edge("e1")
+
+        assert codes(result.warnings) == [
+            PlanValidationErrorCode.ORPHAN_NODE,
+            PlanValidationErrorCode.ORPHAN_NODE,
+        ]
+        assert_matches_full(validator, result)
+
+    def test_adding_edge_reconnects(self, plan):
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+        validator.remove_edge("e1")
+
+        result = validator.update_edge(
+            {"edge_id": "e1", "from_node_id": "start", "to_node_id": "review", "outcome": "success"}
+        )
+
+        assert result.valid is True
+        assert result.warnings == []
+
+    def test_removing_node_breaks_edges(self, plan):
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+
+        result = validator.remove_node("end")
+
+        assert codes(result.errors) == [PlanValidationErrorCode.EDGE_TARGET_NOT_FOUND]
+        assert_matches_full(validator, result)
+
+    def test_renaming_node(self, plan):
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+
+        result = validator.update_node({"node_id": "begin", "type": "task"}, node_id="start")
+
+        assert PlanValidationErrorCode.ENTRY_NODE_NOT_FOUND in codes(result.errors)
+        assert [n["node_id"] for n in validator.plan["nodes"]] == ["begin", "review", "end"]
+        assert_matches_full(validator, result)
+
+    def test_gate_outcome_change_rechecks_mapping(self, plan):
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+
+        result = validator.update_node(
+            {"node_id": "review", "type": "gate", "gate_outcomes": ["ok", "escalate"]}
+        )
+
+        assert codes(result.errors) == [PlanValidationErrorCode.INCOMPLETE_OUTCOME_MAPPING]
+
+
+class TestSchemaChanges:
+    """Schema errors and their paths."""
+
+    def test_removal_shifts_error_paths(self, plan):
+        validator = IncrementalPlanValidator()
+        plan["edges"][2]["kind"] = "bogus"
+        validator.load(plan)
+
+        result = validator.remove_edge("e1")
+
+        assert [e.path for e in result.errors] == ["$.edges[1].kind"]
+        assert_matches_full(validator, result)
+
+    def test_schema_error_hides_graph_checks(self, plan):
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+
+        result = validator.update_node({"node_id": "end", "type": "end"})
+
+        assert codes(result.errors) == [PlanValidationErrorCode.MISSING_REQUIRED_FIELD]
+        assert result.warnings == []
+
+    def test_non_array_nodes_fall_back_to_full_validation(self, plan):
+        validator = IncrementalPlanValidator()
+        plan["nodes"] = {"start": {}}
+
+        result = validator.load(plan)
+
+        assert codes(result.errors) == [PlanValidationErrorCode.INVALID_FIELD_TYPE]
+        with pytest.raises(ValueError):
+            validator.update_node({"node_id": "start", "type": "task"})
+
+    def test_unknown_id_raises(self, plan):
+        validator = IncrementalPlanValidator()
+        validator.load(plan)
+
+        with pytest.raises(KeyError):
+            validator.remove_node("missing")
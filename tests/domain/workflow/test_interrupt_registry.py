@@ -0,0 +1,125 @@
+"""Tests for InterruptRegistry pending-interrupt listing."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.workflow.interrupt_registry import (
+    INTERRUPT_CONTEXT_KEYS,
+    InterruptRegistry,
+    PausedExecutionSummary,
+    _determine_interrupt_type,
+)
+
+
+class RecordingDB:
+    """Async session stand-in that records statements and returns canned rows."""
+
+    def __init__(self, rows):
+        self.statements = []
+        self.rows = rows
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.all.return_value = self.rows
+        return result
+
+
+def _row(**overrides):
+    row = {
+        "execution_id": "exec-1",
+        "document_type": "project_discovery",
+        "workflow_id": "pd_v1",
+        "current_node_id": "pgc",
+        "pending_user_input_rendered": "Answer the questions",
+        "pending_choices": None,
+        "pending_user_input_payload": {"questions": [{"id": "Q1"}]},
+        "pending_user_input_schema_ref": "pgc_questions.v1",
+        "context_state": {
+            "escalation_active": None,
+            "constraint_conflict": None,
+            "escalation_options": None,
+        },
+    }
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+class TestGetPending:
+    """get_pending selects summary columns, not full executions."""
+
+    @pytest.mark.asyncio
+    async def test_projects_context_keys_only(self):
+        db = RecordingDB([])
+        await InterruptRegistry(db).get_pending(str(uuid4()))
+
+        sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        assert "jsonb_build_object" in sql
+        assert "workflow_executions.execution_log" not in sql
+        assert "workflow_executions.context_state," not in sql
+
+    @pytest.mark.asyncio
+    async def test_maps_rows_to_interrupts(self):
+        project_id = str(uuid4())
+        db = RecordingDB([_row()])
+
+        interrupts = await InterruptRegistry(db).get_pending(project_id)
+
+        assert len(interrupts) == 1
+        interrupt = interrupts[0]
+        assert interrupt.execution_id == "exec-1"
+        assert interrupt.project_id == project_id
+        assert interrupt.interrupt_type == "clarification"
+        assert interrupt.payload == {
+            "prompt": "Answer the questions",
+            "data": {"questions": [{"id": "Q1"}]},
+            "schema_ref": "pgc_questions.v1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_escalation_from_projected_context(self):
+        db = RecordingDB([_row(
+            current_node_id="generate",
+            context_state={
+                "escalation_active": True,
+                "constraint_conflict": None,
+                "escalation_options": ["retry", "abandon"],
+            },
+        )])
+
+        interrupts = await InterruptRegistry(db).get_pending(str(uuid4()))
+
+        assert interrupts[0].interrupt_type == "escalation"
+        assert interrupts[0].payload["escalation_options"] == ["retry", "abandon"]
+
+
+class TestDetermineInterruptType:
+    """_determine_interrupt_type accepts PausedExecutionSummary."""
+
+    def test_constraint_conflict(self):
+        summary = PausedExecutionSummary(
+            execution_id="exec-1",
+            document_type="x",
+            workflow_id="wf",
+            current_node_id="qa",
+            context_state={"constraint_conflict": True},
+        )
+        assert _determine_interrupt_type(summary) == "constraint_conflict"
+
+    def test_qa_node_without_context(self):
+        summary = PausedExecutionSummary(
+            execution_id="exec-1",
+            document_type="x",
+            workflow_id="wf",
+            current_node_id="qa_gate",
+        )
+        assert _determine_interrupt_type(summary) == "audit_review"
+
+    def test_context_keys_cover_interrupt_readers(self):
+        assert set(INTERRUPT_CONTEXT_KEYS) == {
+            "escalation_active", "constraint_conflict", "escalation_options",
+        }
@@ -311,6 +311,28 @@ class TestPlanExecutorExecuteStep:
         assert state.status == DocumentWorkflowStatus.COMPLETED
         assert state.terminal_outcome == "stabilized"
 
+    @pytest.mark.asyncio
+    async def test_execute_step_uses_pinned_plan_version(self, executor, registry, mock_executors):
+        """A plan version activated mid-execution does not affect it."""
+        from dataclasses import replace
+
+        state = await executor.start_execution(
+            project_id="proj-123",
+            document_type="test_doc",
+        )
+        assert state.workflow_version == "1.0.0"
+
+        v1 = make_simple_plan()
+        registry.replace(replace(
+            v1,
+            version="2.0.0",
+            edges=[replace(edge, to_node_id="end_failed") for edge in v1.edges],
+        ))
+
+        state = await executor.execute_step(state.execution_id)
+
+        assert state.terminal_outcome == "stabilized"
+
     @pytest.mark.asyncio
     async def test_execute_step_records_history(self, executor, persistence, mock_executors):
         """Execute step records execution in history."""
@@ -839,6 +861,41 @@ class TestInMemoryStatePersistence:
         loaded = await persistence.load("nonexistent")
         assert loaded is None
 
+    @pytest.mark.asyncio
+    async def test_list_executions_returns_summaries(self):
+        """List returns summaries filtered by status, newest first."""
+        persistence = InMemoryStatePersistence()
+
+        from app.domain.workflow.document_workflow_state import (
+            DocumentWorkflowState,
+            DocumentWorkflowStatus,
+            ExecutionSummary,
+        )
+
+        for i, status in enumerate([
+            DocumentWorkflowStatus.RUNNING,
+            DocumentWorkflowStatus.PAUSED,
+            DocumentWorkflowStatus.COMPLETED,
+        ]):
+            state = DocumentWorkflowState(
+                execution_id=f"exec-{i}",
+                workflow_id="wf-1",
+                project_id="proj-456",
+                document_type="test",
+                current_node_id="start",
+                status=status,
+            )
+            state.record_execution("start", "success")
+            await persistence.save(state)
+
+        summaries = await persistence.list_executions(
+            status_filter=[DocumentWorkflowStatus.RUNNING, DocumentWorkflowStatus.PAUSED],
+        )
+
+        assert [s.execution_id for s in summaries] == ["exec-1", "exec-0"]
+        assert all(isinstance(s, ExecutionSummary) for s in summaries)
+        assert summaries[0].step_count == 1
+
 
 class TestPinInvariantsToKnownConstraints:
     """Tests for _pin_invariants_to_known_constraints transformation.
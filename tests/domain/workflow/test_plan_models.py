@@ -350,3 +350,25 @@ class TestWorkflowPlan:
         # Verify internal indexes exist and are populated
         assert "start" in plan._nodes_by_id
         assert "start" in plan._edges_by_from
+
+    def test_station_lookups_precomputed(self):
+        """Stations (including internals of a gate) are indexed at init."""
+        station = {"id": "qa", "label": "QA", "order": 2}
+        plan = WorkflowPlan.from_dict({
+            "workflow_id": "test",
+            "entry_node_ids": ["draft"],
+            "nodes": [
+                {"node_id": "draft", "type": "task", "description": "Draft",
+                 "station": {"id": "draft", "label": "DRAFT", "order": 1}},
+                {"node_id": "qa_gate", "type": "gate", "description": "QA",
+                 "internals": {"pass_a": {}, "draft": {}}, "station": station},
+                {"node_id": "end", "type": "end", "description": "End"},
+            ],
+            "edges": [],
+        })
+
+        assert plan.get_node_station("pass_a").id == "qa"
+        # A node's own station wins over a gate listing it as internal
+        assert plan.get_node_station("draft").id == "draft"
+        assert plan.get_node_station("end") is None
+        assert [s["id"] for s in plan.get_stations()] == ["draft", "qa"]
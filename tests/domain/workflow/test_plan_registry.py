@@ -212,6 +212,130 @@ class TestPlanRegistryLoadFromDirectory:
         assert count == 0
 
 
+def _write_release(root, plan_dict, version):
+    """Write a versioned plan under root/workflows and activate it."""
+    plan_dict = dict(plan_dict, version=version)
+    workflows = root / "workflows"
+    release = workflows / plan_dict["workflow_id"] / "releases" / version
+    release.mkdir(parents=True, exist_ok=True)
+    (release / "definition.json").write_text(json.dumps(plan_dict))
+    _activate(root, {plan_dict["workflow_id"]: version})
+    return workflows
+
+
+def _activate(root, workflows):
+    active = root / "_active"
+    active.mkdir(exist_ok=True)
+    (active / "active_releases.json").write_text(json.dumps({"workflows": workflows}))
+
+
+class TestPlanRegistryReloadChanged:
+    """Tests for reloading changed plans in place."""
+
+    def test_unchanged_plans_are_reused(self, registry, valid_plan_dict, tmp_path):
+        """Nothing changed: no reload, same plan objects."""
+        workflows = _write_release(tmp_path, valid_plan_dict, "1.0.0")
+        registry.load_from_directory(workflows)
+        before = registry.get("test_plan")
+
+        assert registry.reload_changed() == []
+        assert registry.get("test_plan") is before
+
+    def test_activated_version_is_swapped_in(self, registry, valid_plan_dict, tmp_path):
+        """A newly activated version replaces the plan and its document type."""
+        workflows = _write_release(tmp_path, valid_plan_dict, "1.0.0")
+        registry.load_from_directory(workflows)
+        _write_release(tmp_path, valid_plan_dict, "1.1.0")
+
+        assert registry.reload_changed() == ["test_plan"]
+        assert registry.get("test_plan").version == "1.1.0"
+        assert registry.get_by_document_type("test_document").version == "1.1.0"
+
+    def test_only_changed_plans_reloaded(self, registry, valid_plan_dict, tmp_path):
+        """Editing one definition leaves other plans untouched."""
+        other = dict(valid_plan_dict, workflow_id="other_plan", document_type="other_document")
+        _write_release(tmp_path, other, "1.0.0")
+        workflows = _write_release(tmp_path, valid_plan_dict, "1.0.0")
+        _activate(tmp_path, {"test_plan": "1.0.0", "other_plan": "1.0.0"})
+        registry.load_from_directory(workflows)
+        untouched = registry.get("other_plan")
+
+        edited = dict(valid_plan_dict, name="Edited Test Plan")
+        (workflows / "test_plan" / "releases" / "1.0.0" / "definition.json").write_text(
+            json.dumps(edited)
+        )
+
+        assert registry.reload_changed() == ["test_plan"]
+        assert registry.get("test_plan").name == "Edited Test Plan"
+        assert registry.get("other_plan") is untouched
+
+    def test_deactivated_plan_is_removed(self, registry, valid_plan_dict, tmp_path):
+        """A workflow dropped from active_releases.json is unregistered."""
+        workflows = _write_release(tmp_path, valid_plan_dict, "1.0.0")
+        registry.load_from_directory(workflows)
+        _activate(tmp_path, {})
+        # An empty manifest is treated as "nothing to diff"
+        assert registry.reload_changed() == []
+
+        other = dict(valid_plan_dict, workflow_id="other_plan", document_type="other_document")
+        _write_release(tmp_path, other, "1.0.0")
+
+        assert registry.reload_changed() == ["other_plan", "test_plan"]
+        assert not registry.has("test_plan")
+        assert registry.get_by_document_type("test_document") is None
+
+    def test_invalid_definition_keeps_previous_plan(self, registry, valid_plan_dict, tmp_path):
+        """A broken new version is logged and the old plan kept."""
+        workflows = _write_release(tmp_path, valid_plan_dict, "1.0.0")
+        registry.load_from_directory(workflows)
+        release = workflows / "test_plan" / "releases" / "2.0.0"
+        release.mkdir(parents=True)
+        (release / "definition.json").write_text("{not json")
+        _activate(tmp_path, {"test_plan": "2.0.0"})
+
+        assert registry.reload_changed() == []
+        assert registry.get("test_plan").version == "1.0.0"
+
+    def test_without_directory_is_noop(self, registry, sample_plan):
+        """Registries not loaded from a directory have nothing to reload."""
+        registry.register(sample_plan)
+        assert registry.reload_changed() == []
+
+
+class TestPlanRegistryVersionPinning:
+    """Tests for get() with a pinned version."""
+
+    def test_pinned_version_survives_reload(self, registry, valid_plan_dict, tmp_path):
+        """An execution pinned to 1.0.0 keeps getting it after 1.1.0 is active."""
+        workflows = _write_release(tmp_path, valid_plan_dict, "1.0.0")
+        registry.load_from_directory(workflows)
+        original = registry.get("test_plan")
+        _write_release(tmp_path, valid_plan_dict, "1.1.0")
+        registry.reload_changed()
+
+        assert registry.get("test_plan", version="1.0.0") is original
+        assert registry.get("test_plan").version == "1.1.0"
+
+    def test_inactive_version_loaded_from_disk(self, registry, valid_plan_dict, tmp_path):
+        """A pinned version not loaded in this process is read from its release."""
+        _write_release(tmp_path, valid_plan_dict, "1.0.0")
+        workflows = _write_release(tmp_path, valid_plan_dict, "1.1.0")
+        registry.load_from_directory(workflows)
+
+        assert registry.get("test_plan", version="1.0.0").version == "1.0.0"
+
+    def test_unknown_version_falls_back_to_current(self, registry, sample_plan):
+        """A pinned version that no longer exists falls back to the current plan."""
+        registry.register(sample_plan)
+
+        assert registry.get("test_plan", version="0.9.0") is sample_plan
+
+    def test_unknown_plan_still_raises(self, registry):
+        """Pinning does not hide missing plans."""
+        with pytest.raises(PlanNotFoundError):
+            registry.get("missing", version="1.0.0")
+
+
 class TestPlanRegistryLoadFile:
     """Tests for loading single plan file."""
 
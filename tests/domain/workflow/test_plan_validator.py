@@ -158,6 +158,26 @@ class TestSchemaValidation:
 
         assert result.valid is False
 
+    @pytest.mark.parametrize("budget", [0, -5, "4000", True])
+    def test_invalid_context_budget_tokens(self, validator, valid_plan, budget):
+        """Non-positive or non-integer context budget fails validation."""
+        valid_plan["nodes"][0]["context_budget_tokens"] = budget
+        result = validator.validate(valid_plan)
+
+        assert result.valid is False
+        assert any(
+            e.code == PlanValidationErrorCode.INVALID_FIELD_TYPE
+            and e.path.endswith("context_budget_tokens")
+            for e in result.errors
+        )
+
+    def test_valid_context_budget_tokens(self, validator, valid_plan):
+        """Positive integer context budget passes validation."""
+        valid_plan["nodes"][0]["context_budget_tokens"] = 4000
+        result = validator.validate(valid_plan)
+
+        assert result.valid is True
+
 
 class TestGraphIntegrityValidation:
     """Tests for graph integrity validation."""
@@ -0,0 +1,267 @@
+"""Tests for ThreadManager conversation history (windowed, checkpointed)."""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.workflow.thread_manager import ThreadManager, summarize_turns
+from app.persistence.llm_thread_repositories import LedgerRepository
+from app.persistence.models import LedgerEntryType, LLMLedgerEntry
+
+
+class FakeThreadService:
+    """ThreadExecutionService stand-in: in-memory ledger with seq numbers."""
+
+    def __init__(self):
+        self.entries = []
+        self.work_items = []
+        self.queries = 0
+
+    async def create_work_item(self, thread_id, lock_scope=None):
+        item = SimpleNamespace(id=uuid4(), thread_id=thread_id)
+        self.work_items.append(item)
+        return item
+
+    async def record_entries(self, thread_id, work_item_id, entries):
+        for entry_type, payload in entries:
+            entry = LLMLedgerEntry.create(thread_id, entry_type, payload, work_item_id=work_item_id)
+            entry.seq = len(self.entries) + 1
+            self.entries.append(entry)
+
+    def _matching(self, thread_id, payload_type, after_seq):
+        return [
+            e for e in self.entries
+            if e.thread_id == thread_id
+            and e.payload.get("type") == payload_type
+            and (after_seq is None or e.seq > after_seq)
+        ]
+
+    async def get_ledger_entries_by_type(self, thread_id, payload_type, after_seq=None, limit=None):
+        self.queries += 1
+        rows = self._matching(thread_id, payload_type, after_seq)
+        return rows[-limit:] if limit else rows
+
+    async def count_ledger_entries_by_type(self, thread_id, payload_type, after_seq=None):
+        self.queries += 1
+        return len(self._matching(thread_id, payload_type, after_seq))
+
+    async def get_ledger_entries(self, thread_id):
+        raise AssertionError("history must not load the whole ledger")
+
+
+class FakeSession:
+    """AsyncSession stand-in that records savepoints."""
+
+    def __init__(self):
+        self.savepoints = []
+
+    def begin_nested(self):
+        session = self
+
+        class Savepoint:
+            async def __aenter__(self):
+                session.savepoints.append("open")
+
+            async def __aexit__(self, exc_type, exc, tb):
+                session.savepoints[-1] = "rolled_back" if exc_type else "released"
+                return False
+
+        return Savepoint()
+
+
+def _manager(**kwargs):
+    kwargs.setdefault("max_tokens", None)
+    manager = ThreadManager(db=FakeSession(), **kwargs)
+    manager._service = FakeThreadService()
+    return manager
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def thread_id():
+    return str(uuid4())
+
+
+class TestRecordTurns:
+    """Tests for turn recording."""
+
+    def test_one_work_item_per_node_execution(self, thread_id):
+        manager = _manager()
+        turns = [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "hi"},
+            {"role": "assistant", "content": "what next?"},
+        ]
+
+        _run(manager.record_conversation_turns(thread_id, turns, node_id="concierge"))
+
+        service = manager._service
+        assert len(service.work_items) == 1
+        assert [e.entry_type for e in service.entries] == [
+            LedgerEntryType.PROMPT, LedgerEntryType.RESPONSE, LedgerEntryType.RESPONSE,
+        ]
+        assert {e.work_item_id for e in service.entries} == {service.work_items[0].id}
+        assert service.entries[0].payload["node_id"] == "concierge"
+
+    def test_no_turns_records_nothing(self, thread_id):
+        manager = _manager()
+        _run(manager.record_conversation_turns(thread_id, []))
+        assert manager._service.work_items == []
+
+    def test_single_turn_wrapper(self, thread_id):
+        manager = _manager()
+        _run(manager.record_conversation_turn(thread_id, "user", "hello", turn_number=3))
+
+        payload = manager._service.entries[0].payload
+        assert payload["type"] == ThreadManager.CONVERSATION_TURN_TYPE
+        assert payload["turn_number"] == 3
+
+
+class TestLoadHistory:
+    """Tests for bounded history loading."""
+
+    def _record(self, manager, thread_id, n):
+        async def run():
+            for i in range(n):
+                role = "user" if i % 2 == 0 else "assistant"
+                await manager.record_conversation_turn(thread_id, role, f"turn {i}")
+        _run(run())
+
+    def test_ordered_by_seq(self, thread_id):
+        manager = _manager()
+        self._record(manager, thread_id, 4)
+
+        history = _run(manager.load_conversation_history(thread_id))
+        assert [m["content"] for m in history] == ["turn 0", "turn 1", "turn 2", "turn 3"]
+        assert history[0] == {"role": "user", "content": "turn 0"}
+
+    def test_window_by_count(self, thread_id):
+        manager = _manager(max_messages=3)
+        self._record(manager, thread_id, 10)
+
+        history = _run(manager.load_conversation_history(thread_id))
+        assert [m["content"] for m in history] == ["turn 7", "turn 8", "turn 9"]
+
+    def test_window_by_token_budget(self, thread_id):
+        manager = _manager()
+        self._record(manager, thread_id, 10)
+
+        history = _run(manager.load_conversation_history(thread_id, max_tokens=6))
+        assert 0 < len(history) < 10
+        assert history[-1]["content"] == "turn 9"
+
+    def test_newest_turn_kept_over_budget(self, thread_id):
+        manager = _manager()
+        self._record(manager, thread_id, 2)
+        _run(manager.record_conversation_turn(thread_id, "user", "pasted document " * 500))
+
+        history = _run(manager.load_conversation_history(thread_id, max_tokens=50))
+        assert [m["content"][:15] for m in history] == ["pasted document"]
+
+    def test_other_threads_ignored(self, thread_id):
+        manager = _manager()
+        self._record(manager, thread_id, 2)
+        self._record(manager, str(uuid4()), 5)
+
+        assert len(_run(manager.load_conversation_history(thread_id))) == 2
+
+
+class TestSummaryCheckpoints:
+    """Tests for periodic summary checkpoints."""
+
+    def _record(self, manager, thread_id, n, start=0):
+        async def run():
+            for i in range(start, start + n):
+                await manager.record_conversation_turn(thread_id, "user", f"turn {i}")
+        _run(run())
+
+    def test_checkpoint_covers_older_turns(self, thread_id):
+        manager = _manager(summary_interval=20)
+        self._record(manager, thread_id, 29)
+        assert not [e for e in manager._service.entries if e.entry_type == LedgerEntryType.SUMMARY]
+
+        self._record(manager, thread_id, 1, start=29)
+        summaries = [e for e in manager._service.entries if e.entry_type == LedgerEntryType.SUMMARY]
+        assert len(summaries) == 1
+        payload = summaries[0].payload
+        assert payload["turn_count"] == 20
+        assert "user: turn 0" in payload["summary"]
+
+        history = _run(manager.load_conversation_history(thread_id))
+        assert history[0]["role"] == "system"
+        assert "turn 19" in history[0]["content"]
+        assert [m["content"] for m in history[1:]] == [f"turn {i}" for i in range(20, 30)]
+
+    def test_checkpoints_chain(self, thread_id):
+        manager = _manager(summary_interval=20)
+        self._record(manager, thread_id, 50)
+
+        summaries = [e for e in manager._service.entries if e.entry_type == LedgerEntryType.SUMMARY]
+        assert len(summaries) == 2
+        assert summaries[-1].payload["turn_count"] == 40
+        assert "user: turn 0" in summaries[-1].payload["summary"]
+        assert "user: turn 39" in summaries[-1].payload["summary"]
+
+    def test_failed_checkpoint_rolls_back_savepoint_only(self, thread_id):
+        def failing_summarizer(previous, turns):
+            raise RuntimeError("summary insert failed")
+
+        manager = _manager(summary_interval=20, summarizer=failing_summarizer)
+        self._record(manager, thread_id, 30)
+
+        turns = [e for e in manager._service.entries if e.entry_type != LedgerEntryType.SUMMARY]
+        assert len(turns) == 30
+        assert manager.db.savepoints[-1] == "rolled_back"
+        assert manager.db.savepoints[0] == "released"
+
+    def test_resume_cost_does_not_grow(self, thread_id):
+        """Loading reads two bounded windows whatever the thread length."""
+        manager = _manager(summary_interval=20)
+        self._record(manager, thread_id, 200)
+
+        service = manager._service
+        service.queries = 0
+        history = _run(manager.load_conversation_history(thread_id))
+        assert service.queries == 2
+        assert len(history) <= manager.max_messages + 1
+
+
+class TestSummarizeTurns:
+    def test_lines_truncated_and_summary_capped(self):
+        summary = summarize_turns("earlier", [{"role": "user", "content": "x" * 500}])
+        assert summary.startswith("earlier\nuser: ")
+        assert summary.endswith("...")
+
+        long = summarize_turns(None, [{"role": "user", "content": f"turn {i}"} for i in range(2000)])
+        assert len(long) <= 4000
+        assert long.endswith("user: turn 1999")
+
+
+class TestLedgerQueries:
+    """The history queries filter on the indexed expression, in seq order."""
+
+    def test_window_query(self):
+        captured = []
+
+        class Result:
+            def scalars(self):
+                return SimpleNamespace(all=lambda: [])
+
+        class DB:
+            async def execute(self, stmt):
+                captured.append(str(stmt.compile(dialect=postgresql.dialect())))
+                return Result()
+
+        _run(LedgerRepository(DB()).get_by_payload_type(uuid4(), "conversation_turn", after_seq=5, limit=10))
+
+        sql = captured[0]
+        assert "(llm_ledger_entries.payload ->> 'type') = " in sql
+        assert "llm_ledger_entries.seq > %(seq_1)s" in sql
+        assert "ORDER BY llm_ledger_entries.seq DESC" in sql
+        assert "LIMIT" in sql
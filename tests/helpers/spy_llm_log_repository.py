@@ -86,6 +86,12 @@ class SpyLLMLogRepository:
     ) -> None:
         self._record("bump_error_summary", run_id=run_id, error_code=error_code, message=message)
     
+    async def add_run_to_cost_rollup(self, run_id: UUID) -> None:
+        self._record("add_run_to_cost_rollup", run_id)
+    
+    async def add_run_usage_to_cost_rollup(self, run_id: UUID) -> None:
+        self._record("add_run_usage_to_cost_rollup", run_id)
+    
     async def get_run(self, run_id: UUID) -> Optional[LLMRunRecord]:
         self._record("get_run", run_id)
         return None
@@ -0,0 +1,119 @@
+"""Tests for token estimation and budgeted context packing."""
+
+import json
+
+import pytest
+
+from app.llm.context_packer import (
+    HIGH,
+    LOW,
+    NORMAL,
+    ContextPacker,
+    compact_json,
+    field_priority,
+)
+from app.llm.token_estimator import (
+    TokenEstimator,
+    create_token_estimator,
+    heuristic_token_count,
+)
+
+
+def _packer():
+    return ContextPacker(TokenEstimator(counter=heuristic_token_count))
+
+
+class TestTokenEstimator:
+    """Tests for TokenEstimator."""
+
+    def test_empty_text(self):
+        assert TokenEstimator(counter=heuristic_token_count).count("") == 0
+
+    def test_heuristic_charges_indentation(self):
+        doc = {"a": {"b": [1, 2, 3]}}
+        pretty = json.dumps(doc, indent=2)
+        assert heuristic_token_count(pretty) > heuristic_token_count(compact_json(doc))
+
+    def test_default_backend_is_heuristic(self):
+        assert TokenEstimator().backend == "heuristic"
+        assert create_token_estimator(" Heuristic ").backend == "heuristic"
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError, match="Unknown token estimator backend"):
+            create_token_estimator("len4")
+
+    def test_counts_are_cached(self):
+        calls = []
+
+        def counter(text):
+            calls.append(text)
+            return len(text)
+
+        estimator = TokenEstimator(counter=counter)
+        assert estimator.count("hello world") == 11
+        assert estimator.count("hello world") == 11
+        assert len(calls) == 1
+        assert estimator.hits == 1
+        assert estimator.misses == 1
+
+    def test_cache_is_bounded(self):
+        estimator = TokenEstimator(counter=len, cache_size=2)
+        for text in ("a", "bb", "ccc"):
+            estimator.count(text)
+        assert len(estimator._cache) == 2
+
+
+class TestFieldPriority:
+    """Tests for field_priority."""
+
+    def test_levels(self):
+        assert field_priority("title") == HIGH
+        assert field_priority("metadata") == LOW
+        assert field_priority("_internal") == LOW
+        assert field_priority("work_packages") == NORMAL
+
+
+class TestContextPacker:
+    """Tests for ContextPacker."""
+
+    def test_compact_without_budget(self):
+        doc = {"title": "Plan", "items": [1, 2]}
+        text, stats = _packer().pack_document("doc", doc)
+        assert text == '{"title":"Plan","items":[1,2]}'
+        assert stats.tokens_saved == 0
+        assert stats.omitted_fields == []
+
+    def test_low_priority_fields_omitted_first(self):
+        doc = {
+            "title": "Plan",
+            "work_packages": ["wp " * 50],
+            "metadata": {"trace": "x " * 200},
+        }
+        packer = _packer()
+        full = packer.count_tokens(compact_json(doc))
+        meta = packer.count_tokens(compact_json(doc["metadata"]))
+        text, stats = packer.pack_document("doc", doc, budget_tokens=full - meta + 20)
+        packed = json.loads(text)
+        assert packed["metadata"].startswith("[omitted:")
+        assert packed["work_packages"] == doc["work_packages"]
+        assert stats.omitted_fields == ["doc.metadata"]
+        assert stats.unpacked_tokens == full
+        assert stats.tokens_saved == full - stats.tokens > 0
+
+    def test_high_priority_fields_never_omitted(self):
+        doc = {"title": "Plan " * 100, "notes": "n " * 100}
+        text, _ = _packer().pack_document("doc", doc, budget_tokens=1)
+        packed = json.loads(text)
+        assert packed["title"] == doc["title"]
+        assert packed["notes"].startswith("[omitted:")
+
+    def test_shared_budget_spares_small_documents(self):
+        documents = {
+            "big": {"body": "word " * 400},
+            "small": {"body": "tiny"},
+        }
+        packed, stats = _packer().pack_documents(documents, budget_tokens=60)
+        assert list(packed) == ["big", "small"]
+        assert json.loads(packed["small"]) == documents["small"]
+        assert stats.omitted_fields == ["big.body"]
+        assert stats.to_dict()["tokens_saved"] == stats.tokens_saved
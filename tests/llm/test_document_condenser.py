@@ -1,13 +1,34 @@
 """Tests for document condenser."""
 
+import re
 
 from app.llm.document_condenser import (
     DocumentCondenser,
     CondenseConfig,
+    FocusMatcher,
     ROLE_FOCUS,
 )
 
 
+def _split_by_lines(content):
+    """Line-by-line reference splitter (the original algorithm)."""
+    sections = []
+    current_header = None
+    current_content = []
+    for line in content.split("\n"):
+        header_match = re.match(r'^(#{1,3})\s+(.+)$', line)
+        if header_match:
+            if current_header is not None and current_content:
+                sections.append({"header": current_header, "content": "\n".join(current_content)})
+            current_header = header_match.group(2)
+            current_content = []
+        else:
+            current_content.append(line)
+    if current_header is not None and current_content:
+        sections.append({"header": current_header, "content": "\n".join(current_content)})
+    return sections
+
+
 class TestDocumentCondenser:
     """Tests for DocumentCondenser."""
     
@@ -129,3 +150,98 @@ class TestRoleFocus:
         
         assert "test cases" in qa_focus
         assert "acceptance criteria" in qa_focus
+
+
+class TestSectionSplitting:
+    """Tests for single-pass section splitting."""
+
+    def test_matches_line_by_line_splitting(self):
+        """Single-pass split matches the line-by-line algorithm on edge cases."""
+        condenser = DocumentCondenser()
+        samples = [
+            "",
+            "no headers at all\nstill none",
+            "preamble\n# One\nbody one\n## Two\nbody two",
+            "# Trailing header",
+            "# Header then newline\n",
+            "# A\n# B\nonly b has body",
+            "# A\n\n# B\n",
+            "##\nnot a header\n#### too deep\n# Real\nx",
+            "#\tTabbed\r\nwindows line\r\n### Three\r\n",
+            "# Multi  spaced   title \nbody\n\n\n",
+        ]
+        for sample in samples:
+            assert condenser._split_sections(sample) == _split_by_lines(sample), sample
+
+
+class TestFocusMatcher:
+    """Tests for FocusMatcher scoring."""
+
+    def test_header_scores_two_body_scores_one(self):
+        """Header matches score 2, body-only matches score 1."""
+        matcher = FocusMatcher(["Requirements", "risks"])
+
+        assert matcher.score("requirements", "no match") == 2
+        assert matcher.score("overview", "key risks and requirements") == 2
+        assert matcher.score("requirements", "risks") == 3
+
+    def test_term_spanning_header_and_body(self):
+        """A term split across the header/body join still counts."""
+        matcher = FocusMatcher(["edge cases"])
+
+        assert matcher.score("known edge", "cases follow") == 1
+        assert matcher.score("known", "edge-cases") == 0
+
+
+class TestCondenseCache:
+    """Tests for the condensed-output LRU."""
+
+    LONG_DOC = "# Requirements\n" + "must do things. " * 200 + "\n# Other\n" + "filler. " * 200
+
+    def test_repeat_condense_hits_cache(self):
+        """Condensing the same content for the same role reuses the result."""
+        condenser = DocumentCondenser(CondenseConfig(max_tokens=100))
+
+        first = condenser.condense(self.LONG_DOC, "PM")
+        second = condenser.condense(self.LONG_DOC, "PM")
+
+        assert first == second
+        assert condenser.cache_hits == 1
+
+    def test_cache_keyed_by_role(self):
+        """Different roles are cached separately."""
+        condenser = DocumentCondenser(CondenseConfig(max_tokens=100))
+
+        condenser.condense(self.LONG_DOC, "PM")
+        condenser.condense(self.LONG_DOC, "QA")
+
+        assert condenser.cache_hits == 0
+
+    def test_condense_multiple_reuses_results(self):
+        """Repeated multi-document runs hit the cache for every document."""
+        condenser = DocumentCondenser(CondenseConfig(max_tokens=100))
+        docs = [{"type": "A", "content": self.LONG_DOC}, {"type": "B", "content": "short"}]
+
+        first = condenser.condense_multiple(docs, "PM", total_max_tokens=120)
+        hits = condenser.cache_hits
+        second = condenser.condense_multiple(docs, "PM", total_max_tokens=120)
+
+        assert first == second
+        assert condenser.cache_hits == hits + 2
+
+    def test_cache_is_bounded(self):
+        """The cache evicts least recently used entries."""
+        condenser = DocumentCondenser(CondenseConfig(max_tokens=10), cache_size=2)
+        for i in range(3):
+            condenser.condense(f"# H\n{i}" + "x" * 200, "PM")
+
+        assert len(condenser._cache) == 2
+
+    def test_cache_disabled(self):
+        """cache_size=0 disables caching."""
+        condenser = DocumentCondenser(CondenseConfig(max_tokens=100), cache_size=0)
+        condenser.condense(self.LONG_DOC, "PM")
+        condenser.condense(self.LONG_DOC, "PM")
+
+        assert condenser.cache_hits == 0
+        assert len(condenser._cache) == 0
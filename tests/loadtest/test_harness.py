@@ -0,0 +1,185 @@
+"""Tests for the PlanExecutor load harness (in-memory persistence)."""
+
+import json
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.workflow.plan_registry import get_plan_registry
+from app.loadtest.__main__ import main
+from app.loadtest.harness import LoadReport, _Batch, delete_run_data, percentile, run_load
+from app.loadtest.latency import LatencyModel
+from app.loadtest.synthetic import create_synthetic_executors, happy_path_outcome
+
+NO_LATENCY = LatencyModel.parse("constant:0")
+
+
+def shipped_document_types():
+    return sorted(plan.document_type for plan in get_plan_registry().list_plans())
+
+
+class TestSynthetic:
+
+    def test_happy_path_prefers_success_outcomes(self):
+        plan = get_plan_registry().get_by_document_type("project_discovery")
+
+        assert happy_path_outcome(plan, "pgc_gate") == "qualified"
+        assert happy_path_outcome(plan, "qa_gate") == "pass"
+
+    @pytest.mark.asyncio
+    async def test_every_shipped_workflow_completes(self):
+        registry = get_plan_registry()
+        executors = create_synthetic_executors(registry, NO_LATENCY, seed=1)
+        document_types = shipped_document_types()
+
+        report = await run_load(
+            lambda db: executors, document_types,
+            executions=len(document_types) * 2, concurrency=4, trace_memory=False,
+        )
+
+        assert report.statuses == {"completed": len(document_types) * 2}
+        assert report.errors == []
+        assert report.steps == len(report.step_latencies_ms) > 0
+        assert report.db_round_trips is None
+
+
+class RecordingSession:
+    """Async session stand-in that records the SQL it is sent."""
+
+    def __init__(self):
+        self.statements = []
+        self.committed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return MagicMock(rowcount=0)
+
+    async def commit(self):
+        self.committed = True
+
+
+class TestDatabaseData:
+
+    @pytest.mark.asyncio
+    async def test_project_ids_are_uuids(self):
+        """PlanExecutor persists documents under UUID(project_id)."""
+        registry = get_plan_registry()
+        executors = create_synthetic_executors(registry, NO_LATENCY)
+        report = LoadReport(mode="test", executions=2, concurrency=2, run_id="r1")
+        batch = _Batch(lambda db: executors, ["project_discovery"], report, engine=None,
+                       plan_registry=registry, max_steps=100, answer_pauses=True)
+
+        project_ids = await batch.new_projects(2)
+        await batch.run(project_ids, 2, report)
+
+        assert [str(uuid.UUID(project_id)) for project_id in project_ids] == project_ids
+        assert report.statuses == {"completed": 2}
+        assert report.project_ids == []  # nothing inserted without a database
+
+    @pytest.mark.asyncio
+    async def test_delete_run_data_removes_everything_in_one_transaction(self, monkeypatch):
+        session = RecordingSession()
+        monkeypatch.setattr(
+            "app.loadtest.harness.async_sessionmaker", lambda *args, **kwargs: lambda: session
+        )
+        report = LoadReport(mode="test", executions=1, concurrency=1, run_id="r1")
+        report.execution_ids = ["exec-1"]
+        report.project_ids = [str(uuid.uuid4())]
+
+        await delete_run_data(object(), report)
+
+        tables = [sql.split(" WHERE")[0].split(" SET")[0] for sql in session.statements]
+        assert tables == [
+            "UPDATE llm_cost_daily",
+            "DELETE FROM llm_cost_daily",
+            "DELETE FROM llm_run",
+            "DELETE FROM pgc_answers",
+            "UPDATE documents",
+            "DELETE FROM documents",
+            "DELETE FROM workflow_executions",
+            "DELETE FROM projects",
+        ]
+        assert "documents.space_type =" in session.statements[5]
+        assert session.committed
+
+
+class TestReport:
+
+    def test_percentile(self):
+        assert percentile([], 50) == 0.0
+        assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+        assert percentile([1.0, 2.0, 3.0, 4.0], 99) == pytest.approx(3.97)
+
+    @pytest.mark.asyncio
+    async def test_memory_batch_and_errors(self):
+        registry = get_plan_registry()
+        executors = create_synthetic_executors(registry, NO_LATENCY)
+
+        report = await run_load(
+            lambda db: executors, ["project_discovery", "no_such_document"],
+            executions=4, concurrency=2,
+        )
+
+        assert report.statuses == {"completed": 2, "error": 2}
+        assert "no_such_document: PlanExecutorError" in report.errors[0]
+        assert report.memory_per_execution_bytes > 0
+        assert "memory/execution" in "\n".join(report.format_lines())
+
+
+class TestMain:
+
+    def test_json_report(self, capsys):
+        exit_code = main([
+            "--in-memory", "--executions", "3", "--concurrency", "3",
+            "--document-type", "work_statement", "--latency", "constant:0",
+            "--no-memory", "--json",
+        ])
+
+        data = json.loads(capsys.readouterr().out)
+        assert exit_code == 0
+        assert data["statuses"] == {"completed": 3}
+        assert data["steps"] > 0
+        assert data["round_trips_per_step"] is None
+
+    def test_replay_from_file_runs_real_executors(self, tmp_path, capsys):
+        recordings = tmp_path / "recordings.jsonl"
+        recordings.write_text(json.dumps({
+            "prompt_id": "any", "response": json.dumps({"title": "Doc"}), "latency_ms": 1,
+        }) + "\n")
+
+        exit_code = main([
+            "--in-memory", "--replay", str(recordings), "--executions", "2",
+            "--document-type", "work_statement", "--no-memory", "--json",
+        ])
+
+        data = json.loads(capsys.readouterr().out)
+        assert exit_code == 0
+        assert data["mode"].startswith("replay (1 exchanges")
+        assert data["steps"] > 0
+
+    def test_spans_report(self, capsys):
+        from app.observability.tracing import reset_tracer
+
+        try:
+            exit_code = main([
+                "--in-memory", "--executions", "2", "--document-type", "work_statement",
+                "--latency", "constant:0", "--no-memory", "--spans", "--json",
+            ])
+        finally:
+            reset_tracer()
+
+        data = json.loads(capsys.readouterr().out)
+        assert exit_code == 0
+        assert "plan_executor.step" in {series["span"] for series in data["spans"]}
+
+    def test_recorded_latency_needs_recordings(self, capsys):
+        assert main(["--in-memory", "--latency", "recorded"]) == 2
+        assert "needs --replay" in capsys.readouterr().err
@@ -0,0 +1,107 @@
+"""Tests for the load harness latency models and recorded-exchange replay."""
+
+import random
+
+import pytest
+
+from app.llm.models import Message, MessageRole
+from app.loadtest.latency import LatencyModel
+from app.loadtest.replay import (
+    RecordedExchange,
+    ReplayLLMProvider,
+    ReplayLLMService,
+    load_recordings,
+    save_recordings,
+)
+
+
+def exchange(prompt_id, response, latency_ms=0.0):
+    return RecordedExchange(prompt_id=prompt_id, response=response, latency_ms=latency_ms,
+                            input_tokens=10, output_tokens=20)
+
+
+class TestLatencyModel:
+
+    def test_parse_and_sample(self):
+        rng = random.Random(1)
+
+        assert LatencyModel.parse("constant:200").sample_ms(rng) == 200
+        assert 50 <= LatencyModel.parse("uniform:50,400").sample_ms(rng) <= 400
+        assert LatencyModel.parse("recorded").sample_ms(rng, recorded_ms=42) == 42
+        assert LatencyModel.parse("constant:200", scale=0.5).sample_ms(rng) == 100
+
+    def test_lognormal_matches_requested_percentiles(self):
+        model = LatencyModel.parse("lognormal:800,4000")
+        rng = random.Random(7)
+
+        samples = sorted(model.sample_ms(rng) for _ in range(20000))
+
+        assert samples[10000] == pytest.approx(800, rel=0.05)
+        assert samples[19800] == pytest.approx(4000, rel=0.1)
+
+    @pytest.mark.parametrize("spec", ["normal:1", "constant", "uniform:1", "lognormal:500,100"])
+    def test_invalid_specs(self, spec):
+        with pytest.raises(ValueError):
+            LatencyModel.parse(spec)
+
+
+class TestRecordings:
+
+    def test_jsonl_round_trip(self, tmp_path):
+        path = tmp_path / "recordings.jsonl"
+        exchanges = [exchange("a", '{"x": 1}', 12.5), exchange("b", "text")]
+
+        assert save_recordings(path, exchanges) == 2
+        assert load_recordings(path) == exchanges
+
+
+class TestReplayLLMProvider:
+
+    @pytest.mark.asyncio
+    async def test_service_routes_calls_by_task_ref(self):
+        provider = ReplayLLMProvider(
+            [exchange("task_a", "a1"), exchange("task_b", "b1"), exchange("task_a", "a2")],
+            latency=LatencyModel.parse("constant:0"),
+        )
+        service = ReplayLLMService(provider=provider)
+        messages = [{"role": "user", "content": "hi"}]
+
+        responses = [
+            await service.complete(messages, task_ref="task_a"),
+            await service.complete(messages, task_ref="task_b"),
+            await service.complete(messages, task_ref="task_a"),
+            await service.complete(messages, task_ref="task_a"),
+        ]
+
+        assert responses == ["a1", "b1", "a2", "a1"]
+        assert provider.call_count == 4
+        assert provider.unmatched_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_prompt_uses_whole_pool(self):
+        provider = ReplayLLMProvider([exchange("task_a", "a1")])
+
+        response = await provider.complete(
+            [Message(role=MessageRole.USER, content="hi")], model="m"
+        )
+
+        assert response.content == "a1"
+        assert (response.input_tokens, response.output_tokens) == (10, 20)
+        assert provider.unmatched_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_recorded_latency_is_scaled(self):
+        provider = ReplayLLMProvider(
+            [exchange("task_a", "a1", latency_ms=1000)],
+            latency=LatencyModel.parse("recorded", scale=0.001),
+        )
+
+        response = await provider.complete(
+            [Message(role=MessageRole.USER, content="hi")], model="m"
+        )
+
+        assert response.latency_ms == pytest.approx(1.0)
+
+    def test_requires_recordings(self):
+        with pytest.raises(ValueError):
+            ReplayLLMProvider([])
@@ -165,6 +165,20 @@ class TestMetricsCollector:
         metrics = collector.get_metrics()
         assert metrics.executions_started == 0
         assert metrics.llm_calls_total == 0
+    
+    def test_record_secret_scan(self, collector):
+        """Secret scans aggregate per tier."""
+        collector.record_secret_scan("inline", 1.0, 100)
+        collector.record_secret_scan("inline", 3.0, 300, detected=True)
+        collector.record_secret_scan("stream", 40.0, 5_000_000)
+        
+        scans = collector.get_secret_scan_metrics()
+        
+        assert scans["inline"].scans == 2
+        assert scans["inline"].detected == 1
+        assert scans["inline"].avg_ms == 2.0
+        assert scans["inline"].max_ms == 3.0
+        assert scans["stream"].total_bytes == 5_000_000
 
 
 class TestGlobalCollector:
@@ -0,0 +1,169 @@
+"""Tests for hot-path tracing spans."""
+
+import asyncio
+
+import pytest
+
+from app.domain.workflow.nodes.llm_executors import LoggingLLMService
+from app.domain.workflow.plan_executor import InMemoryStatePersistence, PlanExecutor
+from app.domain.workflow.plan_registry import get_plan_registry
+from app.llm.providers.mock import MockLLMProvider
+from app.loadtest.latency import LatencyModel
+from app.loadtest.synthetic import create_synthetic_executors
+from app.observability.tracing import (
+    STATUS_ERROR,
+    InMemorySpanCollector,
+    NoopTracer,
+    SpanHistogram,
+    Tracer,
+    create_tracer,
+    get_tracer,
+    reset_tracer,
+    set_tracer,
+)
+
+
+@pytest.fixture
+def tracer():
+    tracer = create_tracer("collect")
+    set_tracer(tracer)
+    yield tracer
+    reset_tracer()
+
+
+def spans_by_name(tracer):
+    return {span.name: span for span in tracer.processor(InMemorySpanCollector).get_spans()}
+
+
+class TestTracer:
+
+    def test_nested_spans_share_trace(self, tracer):
+        with tracer.span("outer", node_id="n1") as outer:
+            with tracer.span("inner") as inner:
+                pass
+
+        assert inner.trace_id == outer.trace_id
+        assert inner.parent_span_id == outer.span_id
+        assert outer.parent_span_id is None
+        assert outer.attributes == {"node_id": "n1"}
+        assert outer.duration_ns >= inner.duration_ns > 0
+
+    def test_exception_marks_span_failed(self, tracer):
+        with pytest.raises(RuntimeError):
+            with tracer.span("boom"):
+                raise RuntimeError("bad")
+
+        span = spans_by_name(tracer)["boom"]
+        assert span.status_code == STATUS_ERROR
+        assert span.status_message == "RuntimeError: bad"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_keep_separate_parents(self, tracer):
+        async def step(name):
+            with tracer.span(name) as parent:
+                await asyncio.sleep(0)
+                with tracer.span(f"{name}.child") as child:
+                    await asyncio.sleep(0)
+            return parent, child
+
+        (a, a_child), (b, b_child) = await asyncio.gather(step("a"), step("b"))
+
+        assert a_child.parent_span_id == a.span_id
+        assert b_child.parent_span_id == b.span_id
+        assert a.trace_id != b.trace_id
+
+    def test_noop_tracer_records_nothing(self):
+        tracer = NoopTracer()
+
+        with tracer.span("x", node_id="n1") as span:
+            span.set_attribute("k", "v")
+
+        assert tracer.span("y") is span
+        assert tracer.processor(InMemorySpanCollector) is None
+
+    def test_mode_selection(self, monkeypatch):
+        assert isinstance(create_tracer("off"), NoopTracer)
+        assert isinstance(create_tracer(" Collect "), Tracer)
+        with pytest.raises(ValueError):
+            create_tracer("verbose")
+
+        reset_tracer()
+        monkeypatch.setattr("app.core.config.TRACING_MODE", "off")
+        assert isinstance(get_tracer(), NoopTracer)
+        reset_tracer()
+
+
+class TestExport:
+
+    def test_collector_is_bounded_and_exports_otlp(self):
+        collector = InMemorySpanCollector(max_spans=2)
+        tracer = Tracer([collector])
+
+        for name in ("a", "b", "c"):
+            with tracer.span(name, count=3, ratio=0.5, ok=True):
+                pass
+
+        otlp = collector.to_otlp()
+        spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert [s["name"] for s in spans] == ["b", "c"]
+        assert len(spans[0]["traceId"]) == 32 and len(spans[0]["spanId"]) == 16
+        assert spans[0]["attributes"] == [
+            {"key": "count", "value": {"intValue": "3"}},
+            {"key": "ratio", "value": {"doubleValue": 0.5}},
+            {"key": "ok", "value": {"boolValue": True}},
+        ]
+        assert int(spans[0]["endTimeUnixNano"]) >= int(spans[0]["startTimeUnixNano"])
+
+    def test_histogram_renders_prometheus_text(self):
+        histogram = SpanHistogram(buckets=(0.001, 1.0))
+        tracer = Tracer([histogram])
+
+        with tracer.span("plan_executor.step", node_type="task"):
+            pass
+        with pytest.raises(ValueError):
+            with tracer.span("plan_executor.step", node_type="task"):
+                raise ValueError()
+
+        text = histogram.render()
+        labels = 'span="plan_executor.step",node_type="task"'
+        assert "# TYPE combine_span_duration_seconds histogram" in text
+        assert f'combine_span_duration_seconds_bucket{{{labels},le="0.001"}} 2' in text
+        assert f'combine_span_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"combine_span_duration_seconds_count{{{labels}}} 2" in text
+        assert f"combine_span_errors_total{{{labels}}} 1" in text
+        assert histogram.snapshot()[0]["count"] == 2
+
+
+class TestInstrumentation:
+
+    @pytest.mark.asyncio
+    async def test_step_phases_are_children_of_step_span(self, tracer):
+        registry = get_plan_registry()
+        executors = create_synthetic_executors(registry, LatencyModel.parse("constant:0"))
+        executor = PlanExecutor(InMemoryStatePersistence(), registry, executors=executors)
+
+        state = await executor.start_execution("proj-trace", "project_discovery")
+        tracer.processor(InMemorySpanCollector).clear()
+        await executor.execute_step(state.execution_id)
+
+        spans = spans_by_name(tracer)
+        step = spans["plan_executor.step"]
+        assert step.attributes["execution_id"] == state.execution_id
+        assert step.attributes["node_type"] == spans["plan_executor.execute_node"].attributes["node_type"]
+        for name in (
+            "plan_executor.build_context",
+            "plan_executor.execute_node",
+            "plan_executor.persist_conversation",
+            "plan_executor.handle_result",
+            "persistence.save",
+        ):
+            assert spans[name].parent_span_id == step.span_id, name
+
+    @pytest.mark.asyncio
+    async def test_llm_wait_span(self, tracer):
+        service = LoggingLLMService(provider=MockLLMProvider(latency_ms=0))
+
+        await service.complete([{"role": "user", "content": "hi"}], task_ref="task_a")
+
+        span = spans_by_name(tracer)["llm.wait"]
+        assert span.attributes["task_ref"] == "task_a"
@@ -139,3 +139,146 @@ class TestDetailedHealth:
         
         data = response.json()
         assert "PostgreSQL" in data["checks"]["database"]["version"]
+
+
+class TestWarmupProbe:
+    """Tests for startup warm-up reporting."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_state(self):
+        from app.core.warmup import reset_warmup_state
+        reset_warmup_state()
+        yield
+        reset_warmup_state()
+
+    @staticmethod
+    def _override_db(app):
+        mock_db = AsyncMock()
+        mock_result = MagicMock()
+        mock_result.scalar.return_value = 1
+        mock_db.execute.return_value = mock_result
+
+        async def mock_get_db():
+            yield mock_db
+
+        from app.core.database import get_db
+        app.dependency_overrides[get_db] = mock_get_db
+
+    def test_warmup_not_started_returns_503(self, client):
+        """Warm-up endpoint is 503 until warm-up has run."""
+        response = client.get("/health/warmup")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "not_started"
+
+    def test_warmup_complete_returns_tasks(self, client):
+        """Warm-up endpoint reports each registry once complete."""
+        import asyncio
+        from app.core.warmup import run_warmup
+
+        asyncio.run(run_warmup({"plans": lambda: 3, "schemas": lambda: 5}))
+        response = client.get("/health/warmup")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "ready"
+        assert data["tasks"]["plans"]["items"] == 3
+        assert data["tasks"]["schemas"]["status"] == "ready"
+
+    def test_readiness_waits_for_running_warmup(self, app):
+        """Readiness is 503 while warm-up is still running."""
+        import time
+        from app.core.warmup import get_warmup_state
+
+        get_warmup_state().started_at = time.perf_counter()
+        self._override_db(app)
+
+        response = TestClient(app).get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["warmup"] == "running"
+        assert response.json()["database"] == "connected"
+
+    def test_readiness_ready_after_warmup(self, app):
+        """Readiness is 200 once warm-up has finished."""
+        import asyncio
+        from app.core.warmup import run_warmup
+
+        asyncio.run(run_warmup({"plans": lambda: 1}))
+        self._override_db(app)
+
+        response = TestClient(app).get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["warmup"] == "ready"
+
+
+class TestConfigCacheProbe:
+    """Tests for config cache metrics reporting."""
+
+    def test_reports_per_kind_stats(self, client):
+        from app.config.package_loader import get_package_loader
+
+        get_package_loader().get_document_type("project_discovery")
+        response = client.get("/health/config-cache")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "generation" in data
+        assert data["caches"]["package"]["entries"] >= 1
+        assert {"hits", "misses", "evictions", "invalidations", "bytes"} <= set(data["caches"]["role"])
+        assert {"running", "generation", "reloads"} <= set(data["sync"])
+
+
+class TestSecretScanProbe:
+    """Tests for /health/secret-scan endpoint."""
+
+    def test_secret_scan_reports_tiers(self, client):
+        """Reports scan timings recorded by the ingress middleware."""
+        from app.observability.metrics import get_metrics_collector, reset_metrics_collector
+
+        reset_metrics_collector()
+        get_metrics_collector().record_secret_scan("pool", 12.5, 200_000)
+        response = client.get("/health/secret-scan")
+        reset_metrics_collector()
+
+        assert response.status_code == 200
+        pool = response.json()["tiers"]["pool"]
+        assert pool["scans"] == 1
+        assert pool["avg_ms"] == 12.5
+
+
+class TestSpansProbe:
+    """Tests for /health/spans and /metrics endpoints."""
+
+    def test_tracing_off_reports_nothing(self, client):
+        """Default NoopTracer exposes no spans or histograms."""
+        from app.observability.tracing import NoopTracer, reset_tracer, set_tracer
+
+        set_tracer(NoopTracer())
+        spans = client.get("/health/spans").json()
+        metrics = client.get("/metrics")
+        reset_tracer()
+
+        assert spans == {"enabled": False, "summary": [], "otlp": None}
+        assert metrics.status_code == 200
+        assert metrics.text == ""
+
+    def test_collect_mode_exposes_spans_and_histograms(self, client):
+        """Collected spans appear as OTLP/JSON and Prometheus histograms."""
+        from app.observability.tracing import create_tracer, reset_tracer, set_tracer
+
+        tracer = create_tracer("collect")
+        set_tracer(tracer)
+        with tracer.span("plan_executor.step", node_type="task"):
+            pass
+        spans = client.get("/health/spans").json()
+        metrics = client.get("/metrics")
+        reset_tracer()
+
+        assert spans["enabled"] is True
+        assert spans["summary"][0]["span"] == "plan_executor.step"
+        otlp_spans = spans["otlp"]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert otlp_spans[0]["name"] == "plan_executor.step"
+        assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'combine_span_duration_seconds_count{span="plan_executor.step",node_type="task"} 1' in metrics.text
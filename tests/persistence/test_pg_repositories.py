@@ -173,3 +173,43 @@ class TestPostgresExecutionRepository:
         assert hasattr(repo, 'list_by_scope')
         assert hasattr(repo, 'list_active')
         assert hasattr(repo, 'delete')
+
+
+class TestDeferredColumns:
+    """Large JSONB columns are deferred; readers opt in with undefer()."""
+
+    def _sql(self, stmt) -> str:
+        from sqlalchemy.dialects import postgresql
+        return str(stmt.compile(dialect=postgresql.dialect()))
+
+    def test_document_select_omits_content(self):
+        """select(Document) does not load content or search_vector."""
+        from sqlalchemy import select
+        from app.api.models.document import Document
+
+        sql = self._sql(select(Document))
+
+        assert "documents.doc_type_id" in sql
+        assert "documents.content" not in sql
+        assert "documents.search_vector" not in sql
+
+    def test_document_undefer_content(self):
+        """undefer(Document.content) loads content."""
+        from sqlalchemy import select
+        from sqlalchemy.orm import undefer
+        from app.api.models.document import Document
+
+        sql = self._sql(select(Document).options(undefer(Document.content)))
+
+        assert "documents.content" in sql
+
+    def test_execution_select_omits_log_and_context(self):
+        """select(WorkflowExecution) does not load execution_log or context_state."""
+        from sqlalchemy import select
+        from app.api.models.workflow_execution import WorkflowExecution
+
+        sql = self._sql(select(WorkflowExecution))
+
+        assert "workflow_executions.current_node_id" in sql
+        assert "workflow_executions.execution_log" not in sql
+        assert "workflow_executions.context_state" not in sql
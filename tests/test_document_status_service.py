@@ -14,9 +14,12 @@ from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.api.services.document_status_service import (
+    DocumentStatus,
     DocumentStatusService,
     ReadinessStatus,
     AcceptanceState,
+    compute_status_etag,
+    etag_matches,
 )
 
 
@@ -864,6 +867,238 @@ class TestDocumentStatusDataclass:
         assert isinstance(result["document_id"], str)  # UUID serialized
 
 
+# =============================================================================
+# MATERIALIZED SNAPSHOT TESTS
+# =============================================================================
+
+def make_result(row=None, scalar=None, rowcount=1):
+    """Mock query result for snapshot reads and writes."""
+    result = MagicMock()
+    result.one_or_none.return_value = row
+    result.scalar_one_or_none.return_value = scalar
+    result.rowcount = rowcount
+    return result
+
+
+def make_status_dict(doc_type_id="project_discovery"):
+    return {
+        "doc_type_id": doc_type_id,
+        "document_id": str(uuid4()),
+        "title": "Product Discovery",
+        "icon": "search",
+        "readiness": "produced",
+        "acceptance_state": None,
+        "subtitle": None,
+        "can_build": False,
+        "can_rebuild": False,
+        "can_accept": False,
+        "can_reject": False,
+        "can_use_as_input": True,
+        "missing_inputs": [],
+        "display_order": 1,
+    }
+
+
+class TestEtags:
+    """Test entity tag helpers."""
+
+    def test_etag_is_stable_and_content_based(self):
+        payload = [make_status_dict()]
+        assert compute_status_etag(payload) == compute_status_etag([dict(payload[0])])
+        changed = [dict(payload[0], readiness="stale")]
+        assert compute_status_etag(payload) != compute_status_etag(changed)
+
+    def test_etag_matches_forms(self):
+        assert etag_matches('"abc"', "abc")
+        assert etag_matches('W/"abc"', "abc")
+        assert etag_matches('"xyz", "abc"', "abc")
+        assert etag_matches("*", "abc")
+        assert not etag_matches('"xyz"', "abc")
+        assert not etag_matches(None, "abc")
+        assert not etag_matches('"abc"', None)
+
+    def test_from_dict_round_trip(self):
+        data = make_status_dict()
+        assert DocumentStatus.from_dict(data).to_dict() == data
+
+
+class TestProjectSnapshot:
+    """Test get_project_snapshot read, rebuild and store paths."""
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_and_stores_when_no_row(self, status_service):
+        project_id = uuid4()
+        db = AsyncMock()
+        db.execute.side_effect = [make_result(row=None), make_result(rowcount=1)]
+
+        with patch.object(
+            status_service, "get_project_document_statuses", new_callable=AsyncMock
+        ) as mock_derive:
+            mock_derive.return_value = [DocumentStatus.from_dict(make_status_dict())]
+            snapshot = await status_service.get_project_snapshot(db, project_id)
+
+        assert mock_derive.await_count == 1
+        assert db.execute.await_count == 2  # version read + insert
+        assert snapshot.generation == 0
+        assert snapshot.etag == compute_status_etag([s.to_dict() for s in snapshot.statuses])
+        assert status_service._get_cached(project_id) is snapshot
+
+    @pytest.mark.asyncio
+    async def test_serves_memory_when_row_version_matches(self, status_service):
+        project_id = uuid4()
+        db = AsyncMock()
+        db.execute.side_effect = [make_result(row=None), make_result(rowcount=1)]
+        with patch.object(
+            status_service, "get_project_document_statuses", new_callable=AsyncMock
+        ) as mock_derive:
+            mock_derive.return_value = [DocumentStatus.from_dict(make_status_dict())]
+            first = await status_service.get_project_snapshot(db, project_id)
+
+        db = AsyncMock()
+        db.execute.return_value = make_result(
+            row=MagicMock(generation=first.generation, etag=first.etag)
+        )
+        second = await status_service.get_project_snapshot(db, project_id)
+
+        assert second is first
+        assert db.execute.await_count == 1  # single-row version read only
+
+    @pytest.mark.asyncio
+    async def test_reads_stored_statuses_when_not_in_memory(self, status_service):
+        project_id = uuid4()
+        payload = [make_status_dict()]
+        etag = compute_status_etag(payload)
+        db = AsyncMock()
+        db.execute.side_effect = [
+            make_result(row=MagicMock(generation=4, etag=etag)),
+            make_result(scalar=payload),
+        ]
+
+        with patch.object(
+            status_service, "get_project_document_statuses", new_callable=AsyncMock
+        ) as mock_derive:
+            snapshot = await status_service.get_project_snapshot(db, project_id)
+
+        mock_derive.assert_not_awaited()
+        assert snapshot.generation == 4
+        assert snapshot.etag == etag
+        assert [s.to_dict() for s in snapshot.statuses] == payload
+
+    @pytest.mark.asyncio
+    async def test_invalidated_row_is_rebuilt_at_its_generation(self, status_service):
+        project_id = uuid4()
+        db = AsyncMock()
+        db.execute.side_effect = [
+            make_result(row=MagicMock(generation=7, etag=None)),
+            make_result(rowcount=1),
+        ]
+
+        with patch.object(
+            status_service, "get_project_document_statuses", new_callable=AsyncMock
+        ) as mock_derive:
+            mock_derive.return_value = [DocumentStatus.from_dict(make_status_dict())]
+            snapshot = await status_service.get_project_snapshot(db, project_id)
+
+        assert snapshot.generation == 7
+        update_sql = str(db.execute.await_args_list[1].args[0])
+        assert "UPDATE project_document_status" in update_sql
+        assert "project_document_status.generation" in update_sql
+
+    @pytest.mark.asyncio
+    async def test_superseded_rebuild_is_not_cached(self, status_service):
+        """A write that bumped the generation mid-rebuild wins."""
+        project_id = uuid4()
+        db = AsyncMock()
+        db.execute.side_effect = [
+            make_result(row=MagicMock(generation=2, etag=None)),
+            make_result(rowcount=0),
+        ]
+        with patch.object(
+            status_service, "get_project_document_statuses", new_callable=AsyncMock
+        ) as mock_derive:
+            mock_derive.return_value = [DocumentStatus.from_dict(make_status_dict())]
+            await status_service.get_project_snapshot(db, project_id)
+
+        assert status_service._get_cached(project_id) is None
+
+    @pytest.mark.asyncio
+    async def test_get_document_status_uses_snapshot(self, status_service):
+        project_id = uuid4()
+        payload = [make_status_dict("project_discovery")]
+        db = AsyncMock()
+        db.execute.side_effect = [
+            make_result(row=MagicMock(generation=1, etag=compute_status_etag(payload))),
+            make_result(scalar=payload),
+        ]
+
+        status = await status_service.get_document_status(
+            db, "project_discovery", "project", project_id
+        )
+
+        assert status.doc_type_id == "project_discovery"
+        assert db.execute.await_count == 2
+
+
+class TestStatusEndpointEtag:
+    """GET /projects/{id}/document-statuses honours If-None-Match."""
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_304_without_snapshot(self):
+        from app.api.routers import document_status_router as router_module
+
+        request = MagicMock(headers={"if-none-match": '"abc"'})
+        with patch.object(router_module, "document_status_service") as service:
+            service.get_project_etag = AsyncMock(return_value="abc")
+            service.get_project_snapshot = AsyncMock()
+            response = await router_module.get_project_document_statuses(
+                uuid4(), request, MagicMock(headers={}), db=AsyncMock()
+            )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == '"abc"'
+        service.get_project_snapshot.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_returns_statuses_with_new_etag(self):
+        from app.api.routers import document_status_router as router_module
+        from app.api.services.document_status_service import ProjectStatusSnapshot
+
+        project_id = uuid4()
+        snapshot = ProjectStatusSnapshot(
+            project_id=project_id,
+            generation=1,
+            etag="new",
+            statuses=[DocumentStatus.from_dict(make_status_dict())],
+        )
+        request = MagicMock(headers={"if-none-match": '"old"'})
+        response = MagicMock(headers={})
+        with patch.object(router_module, "document_status_service") as service:
+            service.get_project_etag = AsyncMock(return_value="new")
+            service.get_project_snapshot = AsyncMock(return_value=snapshot)
+            body = await router_module.get_project_document_statuses(
+                project_id, request, response, db=AsyncMock()
+            )
+
+        assert response.headers["ETag"] == '"new"'
+        assert [d.doc_type_id for d in body.documents] == ["project_discovery"]
+
+
+class TestInvalidationTriggers:
+    """The documents trigger watches columns that exist and feed the derivation."""
+
+    def test_trigger_columns_exist_on_documents(self):
+        import re
+        from app.api.models.document import Document
+        from app.api.models.project_document_status import INVALIDATE_DDL
+
+        trigger = next(ddl for ddl in INVALIDATE_DDL if "CREATE TRIGGER documents_" in ddl)
+        columns = re.search(r"UPDATE OF\s+(.*?)\s+ON documents", trigger, re.S).group(1)
+        watched = {c.strip() for c in columns.split(",")}
+
+        assert watched <= set(Document.__table__.c.keys())
+        assert {"is_latest", "is_stale", "accepted_at", "rejected_at"} <= watched
+
+
 # =============================================================================
 # EDGE CASES
 # =============================================================================
@@ -571,7 +571,7 @@ class TestTier1ValidationCoverage:
         # Point config_path to tmp_path
         mock_git_service.config_path = tmp_path
 
-        with patch("app.domain.workflow.plan_validator.PlanValidator") as MockPV:
+        with patch("app.api.services.workspace_service.IncrementalPlanValidator") as MockPV:
             mock_pv_instance = Mock()
             MockPV.return_value = mock_pv_instance
 
@@ -580,7 +580,7 @@ class TestTier1ValidationCoverage:
                 valid: bool
                 errors: list = field(default_factory=list)
 
-            mock_pv_instance.validate.return_value = MockPVResult(valid=True)
+            mock_pv_instance.sync.return_value = MockPVResult(valid=True)
 
             report = service._run_tier1_validation(["workflow:test_wf:1.0.0:definition"])
 
@@ -601,7 +601,7 @@ class TestTier1ValidationCoverage:
 
         mock_git_service.config_path = tmp_path
 
-        with patch("app.domain.workflow.plan_validator.PlanValidator") as MockPV:
+        with patch("app.api.services.workspace_service.IncrementalPlanValidator") as MockPV:
             mock_pv_instance = Mock()
             MockPV.return_value = mock_pv_instance
 
@@ -615,7 +615,7 @@ class TestTier1ValidationCoverage:
                 valid: bool
                 errors: list = field(default_factory=list)
 
-            mock_pv_instance.validate.return_value = MockPVResult(
+            mock_pv_instance.sync.return_value = MockPVResult(
                 valid=False,
                 errors=[MockPVError(code="ENTRY_NODE_NOT_FOUND", message="Entry node 'missing' not found")]
             )
@@ -640,7 +640,7 @@ class TestTier1ValidationCoverage:
 
         mock_git_service.config_path = tmp_path
 
-        with patch("app.domain.workflow.plan_validator.PlanValidator") as MockPV:
+        with patch("app.api.services.workspace_service.IncrementalPlanValidator") as MockPV:
             mock_pv_instance = Mock()
             MockPV.return_value = mock_pv_instance
 
@@ -657,7 +657,7 @@ class TestTier1ValidationCoverage:
             mock_error.code = mock_code
             mock_error.message = "Orphan node detected"
 
-            mock_pv_instance.validate.return_value = MockPVResult(
+            mock_pv_instance.sync.return_value = MockPVResult(
                 valid=False,
                 errors=[mock_error]
             )
@@ -744,7 +744,7 @@ class TestTier1ValidationCoverage:
 
         mock_git_service.config_path = tmp_path
 
-        with patch("app.domain.workflow.plan_validator.PlanValidator"):
+        with patch("app.api.services.workspace_service.IncrementalPlanValidator"):
             report = service._run_tier1_validation([
                 "doctype:test_doc:1.0.0:task_prompt",
                 "workflow:my_wf:2.0.0:definition",
@@ -781,7 +781,7 @@ class TestTier1ValidationCoverage:
 
         mock_git_service.config_path = tmp_path
 
-        with patch("app.domain.workflow.plan_validator.PlanValidator") as MockPV:
+        with patch("app.api.services.workspace_service.IncrementalPlanValidator") as MockPV:
             mock_pv_instance = Mock()
             MockPV.return_value = mock_pv_instance
 
@@ -798,7 +798,7 @@ class TestTier1ValidationCoverage:
             err2.code = "ERR_TWO"
             err2.message = "Second error"
 
-            mock_pv_instance.validate.return_value = MockPVResult(
+            mock_pv_instance.sync.return_value = MockPVResult(
                 valid=False,
                 errors=[err1, err2]
             )
@@ -811,6 +811,73 @@ class TestTier1ValidationCoverage:
         assert "ERR_TWO" in fail_ids
         assert len(fail_ids) == 2
 
+    def test_tier1_workflow_unchanged_definition_not_revalidated(self, service, mock_git_service, tmp_path):
+        """Polling an unchanged graph workflow reuses the previous result; an edit syncs the same validator."""
+        wf_dir = tmp_path / "workflows" / "poll_wf" / "releases" / "1.0.0"
+        wf_dir.mkdir(parents=True)
+        wf_file = wf_dir / "definition.json"
+        definition = {
+            "workflow_id": "poll_wf",
+            "nodes": [],
+            "edges": [],
+            "entry_node_ids": ["start"],
+        }
+        wf_file.write_text(json.dumps(definition))
+
+        mock_git_service.config_path = tmp_path
+
+        with patch("app.api.services.workspace_service.IncrementalPlanValidator") as MockPV:
+            @dataclass
+            class MockPVResult:
+                valid: bool
+                errors: list = field(default_factory=list)
+
+            MockPV.return_value.sync.return_value = MockPVResult(valid=True)
+
+            service._run_tier1_validation(["workflow:poll_wf:1.0.0:definition"])
+            service._run_tier1_validation(["workflow:poll_wf:1.0.0:definition"])
+            assert MockPV.return_value.sync.call_count == 1
+
+            definition["entry_node_ids"] = ["other"]
+            wf_file.write_text(json.dumps(definition))
+            report = service._run_tier1_validation(["workflow:poll_wf:1.0.0:definition"])
+
+        assert MockPV.return_value.sync.call_count == 2
+        assert MockPV.call_count == 1
+        assert report.passed is True
+
+    def test_tier1_workflow_edited_definition_matches_full_validation(self, service, mock_git_service, tmp_path):
+        """The held validator reports what PlanValidator reports for each edit."""
+        from app.domain.workflow.plan_validator import PlanValidator
+
+        wf_dir = tmp_path / "workflows" / "edit_wf" / "releases" / "1.0.0"
+        wf_dir.mkdir(parents=True)
+        wf_file = wf_dir / "definition.json"
+        definition = {
+            "workflow_id": "edit_wf",
+            "nodes": [
+                {"node_id": "start", "type": "task", "task_ref": "t"},
+                {"node_id": "done", "type": "end", "terminal_outcome": "stabilized"},
+            ],
+            "edges": [
+                {"edge_id": "e1", "from_node_id": "start", "to_node_id": "done", "outcome": "success"},
+            ],
+            "entry_node_ids": ["start"],
+        }
+        mock_git_service.config_path = tmp_path
+
+        for to_node_id in ("done", "missing", "done"):
+            definition["edges"][0]["to_node_id"] = to_node_id
+            wf_file.write_text(json.dumps(definition))
+
+            report = service._run_tier1_validation(["workflow:edit_wf:1.0.0:definition"])
+
+            expected = PlanValidator().validate(definition)
+            assert report.passed is expected.valid
+            assert [r.rule_id for r in report.results if r.status == "fail"] == [
+                e.code.value for e in expected.errors
+            ]
+
 
 # =============================================================================
 # Commit and Discard Tests
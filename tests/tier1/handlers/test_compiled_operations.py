@@ -0,0 +1,231 @@
+"""
+Tests for compiled mechanical operations and fused pipelines.
+
+Covers compile_operation (handler resolution, validation, prepared config),
+execute_operation dispatch of compiled operations, fuse_operations /
+CompiledPipeline, and MechanicalOpsService compiled caching.
+"""
+
+import pytest
+
+from app.api.services.mech_handlers import (
+    CompiledOperation,
+    OperationConfigError,
+    compile_operation,
+    execute_operation,
+    fuse_operations,
+)
+from app.api.services.mechanical_ops_service import MechanicalOpsService
+from app.config.package_loader import PackageLoader, PackageLoaderError
+
+
+EXTRACTOR = {
+    "id": "ctx_extractor",
+    "version": "1.0.0",
+    "type": "extractor",
+    "config": {"field_paths": [{"path": "$.summary", "as": "summary"}]},
+}
+
+INVARIANTS = [
+    {
+        "id": "Q1",
+        "binding": True,
+        "invariant_kind": "exclusion",
+        "canonical_tags": ["mobile"],
+        "user_answer_label": "No mobile app",
+        "normalized_text": "No mobile app",
+    },
+]
+
+
+# =========================================================================
+# compile_operation
+# =========================================================================
+
+
+class TestCompileOperation:
+    """Tests for compile_operation."""
+
+    def test_resolves_handler_and_paths(self):
+        op = compile_operation(EXTRACTOR)
+        assert op.op_type == "extractor"
+        assert op.handler.operation_type == "extractor"
+        assert list(op.paths) == ["$.summary"]
+        assert op.config["op_id"] == "ctx_extractor"
+
+    def test_config_is_read_only(self):
+        op = compile_operation(EXTRACTOR)
+        with pytest.raises(TypeError):
+            op.config["field_paths"] = []
+
+    def test_config_is_detached_from_source(self):
+        source = {**EXTRACTOR, "config": {"field_paths": [{"path": "$.a", "as": "a"}]}}
+        op = compile_operation(source)
+        source["config"]["field_paths"].append({"path": "$.b", "as": "b"})
+        assert len(op.config["field_paths"]) == 1
+
+    def test_missing_type(self):
+        with pytest.raises(OperationConfigError) as exc:
+            compile_operation({"id": "x", "config": {}})
+        assert exc.value.error_code == "config_error"
+
+    def test_unknown_handler(self):
+        with pytest.raises(OperationConfigError) as exc:
+            compile_operation({"id": "x", "type": "nope", "config": {}})
+        assert exc.value.error_code == "handler_not_found"
+
+    def test_validate_config_runs_once_at_compile(self):
+        with pytest.raises(OperationConfigError, match="field_paths is required"):
+            compile_operation({"id": "x", "type": "extractor", "config": {}})
+
+    def test_invalid_path_rejected_when_validating(self):
+        bad = {**EXTRACTOR, "config": {"field_paths": [{"path": "$[invalid", "as": "a"}]}}
+        with pytest.raises(OperationConfigError, match="Invalid JSONPath"):
+            compile_operation(bad)
+
+    def test_unvalidated_compile_tolerates_bad_config(self):
+        op = compile_operation({"id": "x", "type": "extractor", "config": {}}, validate=False)
+        assert isinstance(op, CompiledOperation)
+
+    def test_router_route_table_precomputed(self):
+        op = compile_operation({
+            "id": "route",
+            "type": "router",
+            "config": {"routes": [
+                {"pow_ref": "pow:a@1.0.0", "match": {"project_type": "greenfield"}},
+            ]},
+        })
+        assert op.config["routes"][0]["match"] == {"project_type": ["greenfield"]}
+
+    def test_purity_from_handler(self):
+        assert compile_operation(EXTRACTOR).pure
+        entry = compile_operation(
+            {"id": "e", "type": "entry", "config": {"renders": "r", "captures": "c"}},
+            validate=False,
+        )
+        assert not entry.pure
+
+
+# =========================================================================
+# execute_operation
+# =========================================================================
+
+
+class TestExecuteCompiled:
+    """execute_operation accepts compiled operations and raw definitions."""
+
+    @pytest.mark.asyncio
+    async def test_compiled_operation(self):
+        op = compile_operation(EXTRACTOR)
+        result = await execute_operation(op, {"source_document": {"summary": "hi"}})
+        assert result.success
+        assert result.output == {"summary": "hi"}
+
+    @pytest.mark.asyncio
+    async def test_raw_definition_still_supported(self):
+        result = await execute_operation(EXTRACTOR, {"source_document": {"summary": "hi"}})
+        assert result.output == {"summary": "hi"}
+
+    @pytest.mark.asyncio
+    async def test_raw_definition_error_codes_preserved(self):
+        result = await execute_operation({"id": "x", "type": "nope"}, {})
+        assert not result.success
+        assert result.error_code == "handler_not_found"
+
+
+# =========================================================================
+# fuse_operations / CompiledPipeline
+# =========================================================================
+
+
+def _pinner():
+    return compile_operation({"id": "pin", "type": "invariant_pinner", "config": {}})
+
+
+def _filter():
+    return compile_operation({"id": "filter", "type": "exclusion_filter", "config": {}})
+
+
+class TestPipeline:
+    """Tests for fused pipelines."""
+
+    def test_rejects_impure_operations(self):
+        entry = compile_operation(
+            {"id": "e", "type": "entry", "config": {}}, validate=False,
+        )
+        with pytest.raises(OperationConfigError, match="side effects"):
+            fuse_operations([_pinner(), entry], carry="document")
+
+    def test_rejects_empty(self):
+        with pytest.raises(OperationConfigError):
+            fuse_operations([], carry="document")
+
+    @pytest.mark.asyncio
+    async def test_threads_carry_through_stages(self):
+        pipeline = fuse_operations([_pinner(), _filter()], carry="document")
+        document = {
+            "known_constraints": [],
+            "recommendations": [{"title": "Build a mobile app", "mobile": True}],
+        }
+        run = await pipeline.run({"document": document, "invariants": INVARIANTS})
+        assert run.success
+        assert pipeline.op_ids == ("pin", "filter")
+        assert len(run.outputs) == 2
+        pinned, filtered = run.outputs
+        assert any(c.get("source") == "user_clarification" for c in pinned["known_constraints"])
+        assert run.result.output is filtered
+
+    @pytest.mark.asyncio
+    async def test_stops_at_first_failure(self):
+        pipeline = fuse_operations([_pinner(), _filter()], carry="document")
+        run = await pipeline.run({"document": "not a dict", "invariants": INVARIANTS})
+        assert not run.success
+        assert run.failed_op == "pin"
+        assert run.outputs == ()
+
+
+# =========================================================================
+# MechanicalOpsService compiled cache
+# =========================================================================
+
+
+class TestServiceCompiledCache:
+    """Compiled operations are cached until config reload."""
+
+    def test_compiled_operation_cached(self):
+        service = MechanicalOpsService(loader=PackageLoader())
+        op = service.get_compiled_operation("discovery_invariant_pinner")
+        assert op.version == "1.0.0"
+        assert service.get_compiled_operation("discovery_invariant_pinner") is op
+
+    def test_loader_reload_drops_compiled(self):
+        loader = PackageLoader()
+        service = MechanicalOpsService(loader=loader)
+        op = service.get_compiled_operation("intake_route")
+        loader.clear_cache()
+        assert service.get_compiled_operation("intake_route") is not op
+
+    def test_service_invalidate_drops_compiled(self):
+        service = MechanicalOpsService(loader=PackageLoader())
+        pipeline = service.get_compiled_pipeline(
+            ["discovery_invariant_pinner", "discovery_exclusion_filter"],
+            carry="document",
+        )
+        service.invalidate_cache()
+        assert service.get_compiled_pipeline(
+            ["discovery_invariant_pinner", "discovery_exclusion_filter"],
+            carry="document",
+        ) is not pipeline
+
+    def test_impure_pipeline_rejected(self):
+        service = MechanicalOpsService(loader=PackageLoader())
+        with pytest.raises(PackageLoaderError):
+            service.get_compiled_pipeline(["intake_route", "spawn_pow_instance"], carry="x")
+
+    def test_compile_active_operations_warms_cache(self):
+        service = MechanicalOpsService(loader=PackageLoader())
+        count = service.compile_active_operations()
+        assert count > 0
+        assert len(service._compiled_cache) == count
+        op = service.get_compiled_operation("intake_route")
+        assert service._compiled_cache[(op.op_id, op.version)] is op
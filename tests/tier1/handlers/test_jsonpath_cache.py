@@ -0,0 +1,170 @@
+"""
+Tests for compiled JSONPath expressions (mech_handlers.jsonpath_cache).
+
+Covers the simple-path fast path (parity with jsonpath-ng), fallback to
+jsonpath-ng for complex expressions, config path collection, and
+load-time validation in MechanicalOpsService.
+"""
+
+import pytest
+import yaml
+from jsonpath_ng import parse as jsonpath_parse
+
+from app.api.services.mech_handlers.base import TransformError
+from app.api.services.mech_handlers.jsonpath_cache import (
+    collect_jsonpaths,
+    compile_jsonpath,
+    compile_operation_paths,
+    parse_simple_path,
+)
+from app.api.services.mechanical_ops_service import MechanicalOpsService
+from app.config.package_loader import PackageLoaderError
+
+
+DOC = {
+    "name": "test",
+    "decision": {"next_pow_ref": "pow:x@1.0.0", "confidence": None},
+    "items": [{"id": 1}, {"id": 2}],
+    "tags": ["a", "b"],
+    "label": "abc",
+    "empty": [],
+}
+
+
+# =========================================================================
+# parse_simple_path
+# =========================================================================
+
+
+class TestParseSimplePath:
+    """Tests for parse_simple_path pure function."""
+
+    def test_root(self):
+        assert parse_simple_path("$") == ()
+
+    def test_dotted_fields(self):
+        assert parse_simple_path("$.a.b") == ("a", "b")
+
+    def test_index_steps(self):
+        assert parse_simple_path("$.items[0].id") == ("items", 0, "id")
+
+    @pytest.mark.parametrize("path", [
+        "$.items[*].id",
+        "$..id",
+        "$.items[-1]",
+        "$.items[0:2]",
+        "$.a.'b c'",
+        "name",
+    ])
+    def test_complex_paths_not_simple(self, path):
+        assert parse_simple_path(path) is None
+
+
+# =========================================================================
+# CompiledPath
+# =========================================================================
+
+
+class TestCompiledPath:
+    """Tests for CompiledPath evaluation."""
+
+    @pytest.mark.parametrize("path", [
+        "$",
+        "$.name",
+        "$.missing",
+        "$.decision.next_pow_ref",
+        "$.decision.confidence",
+        "$.decision.missing.deeper",
+        "$.items[0].id",
+        "$.items[1]",
+        "$.items[5]",
+        "$.items.id",
+        "$.tags[0]",
+        "$.label[0]",
+        "$.empty[0]",
+        "$.name[0]",
+        "$.items[*].id",
+    ])
+    def test_parity_with_jsonpath_ng(self, path):
+        expected = [m.value for m in jsonpath_parse(path).find(DOC)]
+        assert compile_jsonpath(path).find(DOC) == expected
+
+    def test_simple_path_skips_jsonpath_ng(self):
+        compiled = compile_jsonpath("$.decision.next_pow_ref")
+        assert compiled.is_simple
+        assert compiled._expr is None
+
+    def test_complex_path_uses_jsonpath_ng(self):
+        compiled = compile_jsonpath("$.items[*].id")
+        assert not compiled.is_simple
+        assert compiled.find(DOC) == [1, 2]
+
+    def test_first_returns_none_without_match(self):
+        assert compile_jsonpath("$.missing").first(DOC) is None
+
+    def test_compilation_is_cached(self):
+        assert compile_jsonpath("$.a.b[0]") is compile_jsonpath("$.a.b[0]")
+
+    def test_invalid_path_raises(self):
+        with pytest.raises(TransformError, match="Invalid JSONPath"):
+            compile_jsonpath("$[invalid")
+
+
+# =========================================================================
+# collect_jsonpaths / compile_operation_paths
+# =========================================================================
+
+
+class TestCollectJsonpaths:
+    """Tests for collect_jsonpaths pure function."""
+
+    def test_collects_nested_paths_in_order(self):
+        config = {
+            "field_paths": [
+                {"path": "$.summary", "as": "summary"},
+                {"path": "$.goals", "as": "goals"},
+            ],
+            "merge_strategy": {
+                "mappings": [{"from": "$.a", "to": "$.decision.a"}],
+                "set_fields": [{"path": "$.summary", "value": True}],
+            },
+        }
+        assert collect_jsonpaths(config) == [
+            "$.summary", "$.goals", "$.a", "$.decision.a",
+        ]
+
+    def test_ignores_non_jsonpath_values(self):
+        config = {"target": "routing_decision", "path": "relative/file.yaml"}
+        assert collect_jsonpaths(config) == []
+
+    def test_compile_operation_paths_raises_on_invalid(self):
+        with pytest.raises(TransformError):
+            compile_operation_paths({"fields": [{"path": "$[invalid"}]})
+
+
+class TestLoadTimeValidation:
+    """MechanicalOpsService compiles paths when loading an operation."""
+
+    def _write_op(self, tmp_path, config):
+        op_dir = tmp_path / "mechanical_ops" / "my_op" / "releases" / "1.0.0"
+        op_dir.mkdir(parents=True)
+        (op_dir / "operation.yaml").write_text(yaml.safe_dump({
+            "id": "my_op", "version": "1.0.0", "type": "extractor",
+            "config": config,
+        }))
+
+    def _service(self, tmp_path):
+        class _Loader:
+            config_path = tmp_path
+        return MechanicalOpsService(loader=_Loader())
+
+    def test_compiled_paths_attached(self, tmp_path):
+        self._write_op(tmp_path, {"field_paths": [{"path": "$.summary", "as": "s"}]})
+        op = self._service(tmp_path)._load_operation("my_op", "1.0.0")
+        assert list(op.compiled_paths) == ["$.summary"]
+        assert op.compiled_paths["$.summary"].find({"summary": "x"}) == ["x"]
+
+    def test_invalid_path_fails_load(self, tmp_path):
+        self._write_op(tmp_path, {"field_paths": [{"path": "$[invalid", "as": "s"}]})
+        with pytest.raises(PackageLoaderError, match="my_op"):
+            self._service(tmp_path)._load_operation("my_op", "1.0.0")
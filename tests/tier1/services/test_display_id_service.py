@@ -1,7 +1,7 @@
 """Tests for WS-ID-002: Display ID Service — minting and prefix resolution.
 
-Tests parse_display_id(), resolve_display_id(), and mint_display_id()
-per ADR-055 Document Identity Standard.
+Tests parse_display_id(), resolve_display_id(), mint_display_id() and
+reserve_display_ids() per ADR-055 Document Identity Standard.
 
 No runtime, no DB (uses mocks), no LLM.
 """
@@ -16,6 +16,7 @@ from app.domain.services.display_id_service import (
     parse_display_id,
     resolve_display_id,
     mint_display_id,
+    reserve_display_ids,
 )
 
 
@@ -192,3 +193,61 @@ class TestMintDisplayId:
         db = _mock_db_for_mint("INT", None)
         result = await mint_display_id(db, self.SPACE_ID, "intent_packet")
         assert result.startswith("INT-"), f"Expected INT- prefix, got {result}"
+
+
+# ============================================================================
+# reserve_display_ids tests (mock db)
+# ============================================================================
+
+def _mock_db_for_reserve(rows):
+    """Create a mock db session returning (doc_type_id, prefix, max_num) rows."""
+    mock_result = MagicMock()
+    mock_result.all.return_value = rows
+    db = AsyncMock()
+    db.execute.return_value = mock_result
+    return db
+
+
+class TestReserveDisplayIds:
+    """Reserve display_ids for several doc types in one query."""
+
+    SPACE_ID = UUID("00000000-0000-0000-0000-000000000001")
+
+    @pytest.mark.asyncio
+    async def test_first_reservation_starts_at_001(self):
+        db = _mock_db_for_reserve([("work_package", "WP", 0)])
+        result = await reserve_display_ids(db, self.SPACE_ID, {"work_package": 3})
+        assert result == {"work_package": ["WP-001", "WP-002", "WP-003"]}
+
+    @pytest.mark.asyncio
+    async def test_continues_after_current_max(self):
+        db = _mock_db_for_reserve([("work_package", "WP", 7)])
+        result = await reserve_display_ids(db, self.SPACE_ID, {"work_package": 2})
+        assert result == {"work_package": ["WP-008", "WP-009"]}
+
+    @pytest.mark.asyncio
+    async def test_past_999_is_numeric(self):
+        db = _mock_db_for_reserve([("work_package", "WP", 999)])
+        result = await reserve_display_ids(db, self.SPACE_ID, {"work_package": 2})
+        assert result == {"work_package": ["WP-1000", "WP-1001"]}
+
+    @pytest.mark.asyncio
+    async def test_several_types_in_one_query(self):
+        db = _mock_db_for_reserve([("work_package", "WP", 2), ("work_statement", "WS", 0)])
+        result = await reserve_display_ids(
+            db, self.SPACE_ID, {"work_package": 1, "work_statement": 1},
+        )
+        assert result == {"work_package": ["WP-003"], "work_statement": ["WS-001"]}
+        assert db.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_reserve_skips_db(self):
+        db = AsyncMock()
+        assert await reserve_display_ids(db, self.SPACE_ID, {"work_package": 0}) == {}
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_prefix_raises(self):
+        db = _mock_db_for_reserve([])
+        with pytest.raises(ValueError, match="has no display_prefix"):
+            await reserve_display_ids(db, self.SPACE_ID, {"nonexistent_type": 1})
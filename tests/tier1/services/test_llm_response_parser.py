@@ -6,9 +6,12 @@ Tests the parsing strategies for extracting JSON from LLM output.
 
 import json
 
+import pytest
+
 from app.domain.services.llm_response_parser import (
     DirectParseStrategy,
     FuzzyBoundaryStrategy,
+    JsonSpanScanner,
     LLMResponseParser,
     MarkdownFenceStrategy,
 )
@@ -112,6 +115,57 @@ class TestFuzzyBoundaryStrategyArrays:
         assert result == [{"a": 1}, {"b": 2}]
 
 
+# =========================================================================
+# JsonSpanScanner -- single-pass span location
+# =========================================================================
+
+
+def _scan(*chunks):
+    scanner = JsonSpanScanner()
+    for chunk in chunks:
+        scanner.feed(chunk)
+    return scanner.result()
+
+
+class TestJsonSpanScanner:
+    """JsonSpanScanner finds complete JSON values without re-parsing."""
+
+    def test_brackets_inside_strings_ignored(self):
+        assert _scan('Result: {"a": "}] \\\" {["}') == {"a": '}] " {['}
+
+    def test_fenced_span_wins(self):
+        text = 'Use {braces} like [this]. ```json\n{"plan": [1, 2, 3]}\n```'
+        assert _scan(text) == {"plan": [1, 2, 3]}
+
+    def test_falls_back_when_longest_is_not_json(self):
+        assert _scan('{"a": 1} and {not json at all, really}') == {"a": 1}
+
+    def test_stray_bracket_before_json(self):
+        assert _scan('See [note before {"a": 1}') == {"a": 1}
+
+    def test_scalar_without_brackets(self):
+        assert _scan("42") == 42
+
+    def test_no_json_returns_none(self):
+        assert _scan("no structure here") is None
+
+    def test_chunk_boundaries_anywhere(self):
+        """Splitting at every offset (mid-string, mid-escape) gives the same result."""
+        text = 'Here:\n{"k": "a\\"}{", "n": [1, {"x": "]"}]}\nDone'
+        expected = {"k": 'a"}{', "n": [1, {"x": "]"}]}
+        for i in range(len(text)):
+            for j in range(i, len(text)):
+                assert _scan(text[:i], text[i:j], text[j:]) == expected
+
+    def test_top_level_span_parsed_on_close(self):
+        """A completed value is parsed as soon as it closes."""
+        scanner = JsonSpanScanner()
+        scanner.feed('{"a": [1, 2]')
+        assert scanner._parsed == {}
+        scanner.feed('}\nHope this helps')
+        assert list(scanner._parsed.values()) == [{"a": [1, 2]}]
+
+
 # =========================================================================
 # LLMResponseParser integration -- array parsing end-to-end
 # =========================================================================
@@ -163,19 +217,68 @@ class TestParserEdgeCases:
         assert result.success is False
 
     def test_truncated_array_extracts_partial_object(self):
-        """Truncated JSON array: FuzzyBoundary extracts the first complete object.
+        """Truncated JSON array: the first complete object is extracted.
 
         This is by design -- fuzzy parsing does best-effort extraction.
         Truncation should be prevented upstream via adequate max_tokens.
         """
         parser = LLMResponseParser()
         result = parser.parse('[{"ws_id": "WS-001"}, {"ws_id": "WS-00')
-        # FuzzyBoundary finds the first complete {..} and extracts it
+        # The first complete {..} inside the unclosed array is extracted
         assert result.success is True
         assert result.data == {"ws_id": "WS-001"}
 
+    @pytest.mark.parametrize("text", [
+        '{"meta": {"title": "x"}, "sections": [{"id": 1}, {"id":',
+        '[{"a":1},{"b":2}',
+    ])
+    def test_truncated_document_fails(self, text):
+        """A cut-off document fails rather than parsing as an inner fragment."""
+        assert LLMResponseParser().parse(text).success is False
+
+        chunks = [text[i:i + 5] for i in range(0, len(text), 5)]
+        assert _scan(*chunks) is None
+
     def test_completely_invalid_text_fails(self):
         """Text with no JSON structure at all must fail."""
         parser = LLMResponseParser()
         result = parser.parse("This is just plain text with no JSON.")
         assert result.success is False
+
+
+# =========================================================================
+# Candidate ranking -- same document as the previous strategy chain
+# =========================================================================
+
+
+LEGACY_CHAIN = [DirectParseStrategy(), MarkdownFenceStrategy(), FuzzyBoundaryStrategy()]
+
+
+class TestCandidateRanking:
+    """The default parser extracts the document the strategy chain extracted."""
+
+    @pytest.mark.parametrize("text, expected", [
+        (
+            'Plan:\n```json\n{"a": 1}\n```\nFor example {"much": "larger", "object": [1, 2, 3]}',
+            {"a": 1},
+        ),
+        ('text [1, 2] more {"x": {"y": 1}} end', [1, 2]),
+        ('```\n[1]\n```\n```json\n{"b": [2, 3]}\n```', {"b": [2, 3]}),
+    ])
+    def test_matches_strategy_chain(self, text, expected):
+        assert LLMResponseParser().parse(text).data == expected
+        assert LLMResponseParser(LEGACY_CHAIN).parse(text).data == expected
+
+    def test_consecutive_documents_yield_the_first(self):
+        """Two top-level documents: the first complete one, not the longest."""
+        result = LLMResponseParser().parse('{"a":1}\n{"b":2,"c":3}')
+        assert result.success is True
+        assert result.data == {"a": 1}
+
+    def test_inline_backticks_are_not_a_fence(self):
+        assert _scan('Use ```json {"a": 1}``` then [1, 2, 3]') == {"a": 1}
+
+    def test_streamed_fence(self):
+        text = "Sure!\n```json\n" + json.dumps({"items": list(range(50))}) + "\n```"
+        chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+        assert _scan(*chunks) == {"items": list(range(50))}
@@ -10,6 +10,8 @@ import json
 
 from app.domain.services.render_model_pure import (
     resolve_pointer,
+    compile_pointer,
+    resolve_steps,
     compute_schema_bundle_hash,
     collect_component_ids_from_sections,
     flatten_nested_list,
@@ -92,6 +94,28 @@ class TestResolvePointer:
         assert resolve_pointer(data, "/a//b") == 1
 
 
+class TestCompilePointer:
+    """Tests for pre-parsed JSON pointers."""
+
+    def test_empty_pointer_has_no_steps(self):
+        assert compile_pointer("") == ()
+        assert compile_pointer("/") == ()
+
+    def test_numeric_parts_carry_index(self):
+        assert compile_pointer("/items/1/name") == (("items", None), ("1", 1), ("name", None))
+
+    def test_compiled_pointer_is_cached(self):
+        assert compile_pointer("/a/b") is compile_pointer("/a/b")
+
+    def test_resolve_steps_matches_resolve_pointer(self):
+        data = {"items": [{"name": "a"}, {"name": "b"}], "1": "key"}
+        for pointer in ["/items/1/name", "/items/abc", "/1", "/missing/x", ""]:
+            assert resolve_steps(data, compile_pointer(pointer)) == resolve_pointer(data, pointer)
+
+    def test_numeric_key_on_dict_uses_string(self):
+        assert resolve_steps({"0": "zero"}, compile_pointer("/0")) == "zero"
+
+
 # =========================================================================
 # compute_schema_bundle_hash
 # =========================================================================
@@ -0,0 +1,41 @@
+"""Tests for the cost rollup backfill command (ops/scripts/backfill_cost_rollup.py)."""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "ops" / "scripts"))
+from backfill_cost_rollup import main, resolve_range  # noqa: E402
+
+
+class TestResolveRange:
+
+    def test_days_counts_back_from_today(self):
+        assert resolve_range(None, None, 3, today=date(2026, 3, 10)) == (
+            date(2026, 3, 8), date(2026, 3, 10),
+        )
+
+    def test_explicit_dates(self):
+        assert resolve_range("2026-01-01", "2026-01-31", None) == (
+            date(2026, 1, 1), date(2026, 1, 31),
+        )
+
+    def test_no_arguments_is_full_rebuild(self):
+        assert resolve_range(None, None, None) == (None, None)
+
+    def test_days_with_dates_rejected(self):
+        with pytest.raises(ValueError):
+            resolve_range("2026-01-01", None, 7)
+
+    def test_start_after_end_rejected(self):
+        with pytest.raises(ValueError):
+            resolve_range("2026-02-01", "2026-01-01", None)
+
+
+class TestMain:
+
+    def test_invalid_arguments_exit_1(self, capsys):
+        assert main(["--days", "0"]) == 1
+        assert "--days" in capsys.readouterr().err
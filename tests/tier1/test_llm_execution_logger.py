@@ -190,3 +190,64 @@ async def test_get_run_by_correlation_id(logger, repo):
     assert run is not None
     assert run.correlation_id == correlation_id
 
+
+
+async def _start(logger, artifact_type="test"):
+    return await logger.start_run(
+        correlation_id=uuid4(),
+        project_id=None,
+        artifact_type=artifact_type,
+        role="architect",
+        model_provider="anthropic",
+        model_name="claude-sonnet-4-20250514",
+        prompt_id="test",
+        prompt_version="1.0.0",
+        effective_prompt="test",
+    )
+
+
+@pytest.mark.asyncio
+async def test_complete_run_adds_to_daily_cost_rollup(logger, repo):
+    from decimal import Decimal
+
+    first = await _start(logger)
+    second = await _start(logger)
+    await _start(logger)  # still in progress: a call, no usage yet
+
+    await logger.complete_run(
+        first, status="SUCCESS",
+        usage={"input_tokens": 100, "output_tokens": 50}, cost_usd=Decimal("0.25"),
+    )
+    await logger.complete_run(
+        second, status="FAILED",
+        usage={"input_tokens": 10, "output_tokens": 0}, cost_usd=Decimal("0.05"),
+    )
+
+    run = await repo.get_run(first)
+    row = repo.get_cost_daily()[(run.started_at.date(), "test")]
+    assert row["run_count"] == 3
+    assert row["error_count"] == 1
+    assert row["input_tokens"] == 110
+    assert row["output_tokens"] == 50
+    assert row["cost_usd"] == Decimal("0.30")
+
+
+@pytest.mark.asyncio
+async def test_run_counts_as_call_when_started(logger, repo):
+    """A run that fails before complete_run must not vanish from the dashboard."""
+    run_id = await _start(logger)
+    await logger.log_error(run_id, "LLM_CALL", "ERROR", "TIMEOUT", "timed out")
+
+    run = await repo.get_run(run_id)
+    row = repo.get_cost_daily()[(run.started_at.date(), "test")]
+    assert row["run_count"] == 1
+    assert row["cost_usd"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cost_rollup_keys_missing_artifact_type_as_empty(logger, repo):
+    run_id = await _start(logger, artifact_type=None)
+
+    await logger.complete_run(run_id, status="SUCCESS", usage={})
+
+    assert [key[1] for key in repo.get_cost_daily()] == [""]
@@ -0,0 +1,76 @@
+"""Tests for the cold-start import profiler (ops/scripts/profile_startup.py)."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "ops" / "scripts"))
+from profile_startup import (  # noqa: E402
+    build_report,
+    group_by_package,
+    main,
+    parse_importtime,
+    profile_import,
+    total_us,
+)
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     app.core.config
+import time:       300 |        420 |   app.core
+import time:      1000 |       1000 |   sqlalchemy.orm.session
+import time:       500 |       1920 | app.api.main
+some unrelated log line
+import time:        50 |         50 | json
+"""
+
+
+class TestParseImporttime:
+
+    def test_parses_records_and_depth(self):
+        records = parse_importtime(SAMPLE)
+
+        assert [r.module for r in records] == [
+            "app.core.config", "app.core", "sqlalchemy.orm.session", "app.api.main", "json",
+        ]
+        assert [r.depth for r in records] == [2, 1, 1, 0, 0]
+        assert records[3].self_us == 500
+        assert records[3].cumulative_us == 1920
+
+    def test_total_counts_top_level_only(self):
+        assert total_us(parse_importtime(SAMPLE)) == 1970
+
+    def test_group_by_package(self):
+        groups = group_by_package(parse_importtime(SAMPLE), depth=2)
+
+        assert groups == {"sqlalchemy.orm": 1000, "app.api": 500, "app.core": 420, "json": 50}
+        assert list(groups)[0] == "sqlalchemy.orm"
+
+    def test_build_report(self):
+        report = build_report(parse_importtime(SAMPLE), top=2)
+
+        assert report["total_ms"] == 2.0
+        assert report["modules_imported"] == 5
+        assert [row["module"] for row in report["slowest_modules"]] == ["app.api.main", "sqlalchemy.orm.session"]
+        assert len(report["by_package"]) == 2
+
+
+class TestProfileImport:
+
+    def test_profiles_real_import(self):
+        records, _ = profile_import("json")
+
+        assert any(r.module == "json" for r in records)
+
+    def test_main_json_output(self, capsys):
+        assert main(["--module", "json", "--json"]) == 0
+
+        report = json.loads(capsys.readouterr().out)
+        assert report["modules_imported"] > 0
+
+    def test_main_enforces_budget(self, capsys):
+        assert main(["--module", "json", "--max-seconds", "0"]) == 1
+        assert "exceeds budget" in capsys.readouterr().err
+
+    def test_main_reports_import_failure(self, capsys):
+        assert main(["--module", "no_such_module_xyz"]) == 2
@@ -0,0 +1,40 @@
+"""Tests for the CI config validation entry point (ops/scripts/validate_config.py)."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "ops" / "scripts"))
+from validate_config import format_report, main  # noqa: E402
+
+from app.api.services.config_validator import ValidationReport, ValidationTiming  # noqa: E402
+
+
+class TestFormatReport:
+
+    def test_lists_findings_and_slowest_release_first(self):
+        report = ValidationReport(valid=True)
+        report.add_error("ROLE_NOT_FOUND", "[a] Referenced role not found")
+        timing = ValidationTiming(
+            total_seconds=0.5, workers=2, references_resolved=3, package_cache_hits=0,
+            releases={"a:1.0.0": 0.01, "b:1.0.0": 0.2},
+        )
+
+        lines = format_report(report, timing)
+
+        assert lines[0].startswith("ERROR    ROLE_NOT_FOUND")
+        releases = [line for line in lines if line.startswith(("a:", "b:"))]
+        assert releases[0].startswith("b:1.0.0")
+        assert "2 releases in 500.0ms (2 workers, 3 shared references resolved)" in lines
+        assert lines[-1] == "FAILED: 1 errors, 0 warnings"
+
+
+class TestMain:
+
+    def test_json_report_and_exit_code(self, capsys):
+        exit_code = main(["--json"])
+
+        data = json.loads(capsys.readouterr().out)
+        assert exit_code == (0 if data["valid"] else 1)
+        assert data["timing"]["workers"] == 1
+        assert data["timing"]["releases"]
@@ -4,6 +4,8 @@ Tests the 3 extracted pure functions:
 1. unwrap_raw_envelope
 2. inject_execution_id_into_lineage
 3. build_children_event_payload
+
+and the bulk upsert statement builder (build_child_upsert).
 """
 
 import importlib
@@ -21,6 +23,7 @@ _spec.loader.exec_module(_mod)
 unwrap_raw_envelope = _mod.unwrap_raw_envelope
 inject_execution_id_into_lineage = _mod.inject_execution_id_into_lineage
 build_children_event_payload = _mod.build_children_event_payload
+build_child_upsert = _mod.build_child_upsert
 
 
 # ===================================================================
@@ -177,3 +180,53 @@ class TestBuildChildrenEventPayload:
             spawned_ids=set(),
         )
         assert result == {"created": [], "updated": [], "superseded": []}
+
+
+# ===================================================================
+# 4. build_child_upsert
+# ===================================================================
+
+def _child_row(instance_id):
+    from uuid import uuid4
+    return {
+        "space_type": "project",
+        "space_id": uuid4(),
+        "doc_type_id": "work_package",
+        "title": f"WP {instance_id}",
+        "content": {"work_package_id": instance_id},
+        "revision_hash": "0" * 64,
+        "version": 1,
+        "is_latest": True,
+        "status": "draft",
+        "created_by": None,
+        "parent_document_id": uuid4(),
+        "instance_id": instance_id,
+        "display_id": "WP-001",
+    }
+
+
+class TestBuildChildUpsert:
+    def _sql(self, rows):
+        from sqlalchemy.dialects import postgresql
+        return str(build_child_upsert(rows).compile(dialect=postgresql.dialect()))
+
+    def test_single_statement_for_all_rows(self):
+        sql = self._sql([_child_row("alpha"), _child_row("beta")])
+        assert sql.count("INSERT INTO documents") == 1
+        assert "instance_id_m1" in sql
+
+    def test_conflict_target_is_latest_child_instance(self):
+        sql = self._sql([_child_row("alpha")])
+        assert (
+            "ON CONFLICT (parent_document_id, doc_type_id, instance_id) WHERE is_latest = true"
+            in sql
+        )
+
+    def test_update_bumps_version_and_keeps_display_id(self):
+        sql = self._sql([_child_row("alpha")])
+        update = sql.split("DO UPDATE SET", 1)[1]
+        assert "version = (documents.version +" in update
+        assert "content = excluded.content" in update
+        assert "revision_hash = excluded.revision_hash" in update
+        assert "updated_at = now()" in update
+        assert "display_id" not in update
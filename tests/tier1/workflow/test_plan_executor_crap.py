@@ -15,6 +15,8 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+from app.config.package_loader import PackageLoaderError, PackageNotFoundError
+
 
 # ---------------------------------------------------------------------------
 # Stubs (avoid circular imports by not importing real classes)
@@ -70,6 +72,7 @@ class FakeState:
     ):
         self.execution_id = execution_id
         self.workflow_id = workflow_id
+        self.workflow_version = None
         self.current_node_id = current_node_id
         self.status = status
         self.project_id = project_id or str(uuid4())
@@ -615,3 +618,40 @@ class TestExecuteStep:
         await executor.execute_step(state.execution_id)
 
         executor._load_pgc_answers_for_qa.assert_not_called()
+
+
+# ====================================================================
+# Mechanical operation lookup falls back to the inline implementation
+# ====================================================================
+
+
+class TestOperationFallback:
+    """A missing or invalid operation takes the inline path, not an abort."""
+
+    @pytest.mark.asyncio
+    async def test_missing_operation_pins_inline(self, executor):
+        executor._ops_service.get_compiled_operation.side_effect = PackageNotFoundError(
+            "No active version for operation: discovery_invariant_pinner"
+        )
+        executor._pin_invariants_to_known_constraints = MagicMock(return_value={"pinned": True})
+        state = FakeState(context_state={"pgc_invariants": [{"id": "inv-1"}]})
+
+        result = await executor._pin_invariants_via_operation({"doc": 1}, state)
+
+        assert result == {"pinned": True}
+
+    @pytest.mark.asyncio
+    async def test_invalid_operation_filters_inline(self, executor):
+        executor._ops_service.get_compiled_operation.side_effect = PackageLoaderError("bad config")
+        executor._filter_excluded_topics = MagicMock(return_value={"filtered": True})
+        state = FakeState(context_state={"pgc_invariants": [{"id": "inv-1"}]})
+
+        result = await executor._filter_excluded_via_operation({"doc": 1}, state)
+
+        assert result == {"filtered": True}
+
+    def test_unrelated_errors_still_raise(self, executor):
+        executor._ops_service.get_compiled_operation.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            executor._find_operation("discovery_exclusion_filter")
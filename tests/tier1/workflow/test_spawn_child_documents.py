@@ -4,8 +4,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
-# All tests that create new child documents need mint_display_id mocked
-# since _upsert_child_document now calls it (WS-ID-003 / ADR-055).
+# The per-child fallback mints one display_id per new child (WS-ID-003 / ADR-055).
 _MOCK_MINT = patch(
     "app.domain.services.display_id_service.mint_display_id",
     new_callable=AsyncMock,
@@ -13,6 +12,35 @@ _MOCK_MINT = patch(
 )
 
 
+def _reserve(db, space_id, counts):
+    return {
+        doc_type_id: [f"WP-{i:03d}" for i in range(1, n + 1)]
+        for doc_type_id, n in counts.items()
+    }
+
+
+# The bulk upsert reserves all new display_ids at once.
+_MOCK_RESERVE = patch(
+    "app.domain.services.display_id_service.reserve_display_ids",
+    new_callable=AsyncMock,
+    side_effect=_reserve,
+)
+
+
+def _capture_upsert():
+    """Record the rows passed to build_child_upsert, still building the statement."""
+    from app.domain.workflow.child_document_helpers import build_child_upsert
+
+    return patch(
+        "app.domain.workflow.child_document_helpers.build_child_upsert",
+        wraps=build_child_upsert,
+    )
+
+
+def _upserted_rows(mock_build):
+    return [row for call in mock_build.call_args_list for row in call.args[0]]
+
+
 # Minimal DocumentWorkflowState stub
 class FakeState:
     def __init__(self, document_type="implementation_plan", project_id=None, execution_id=None):
@@ -23,23 +51,23 @@ class FakeState:
         self.workflow_id = "implementation_plan"
 
 
-# Minimal Document stub
-class FakeDocument:
-    def __init__(self, wp_id, version=1, is_latest=True, lifecycle_state="complete"):
-        self.id = uuid4()
-        self.content = {"work_package_id": wp_id}
-        self.title = f"Work Package: {wp_id}"
-        self.version = version
-        self.is_latest = is_latest
-        self.lifecycle_state = lifecycle_state
-        self.doc_type_id = "work_package"
-        self.instance_id = wp_id
-
-    def update_revision_hash(self):
-        pass
-
-    def mark_stale(self):
-        self.lifecycle_state = "stale"
+# Existing children are real (transient) Documents: the bulk upsert syncs
+# their loaded attributes with set_committed_value.
+def FakeDocument(wp_id, version=1, is_latest=True, lifecycle_state="complete"):
+    from app.api.models.document import Document
+
+    return Document(
+        id=uuid4(),
+        space_type="project",
+        doc_type_id="work_package",
+        instance_id=wp_id,
+        display_id="WP-001",
+        title=f"Work Package: {wp_id}",
+        content={"work_package_id": wp_id},
+        version=version,
+        is_latest=is_latest,
+        lifecycle_state=lifecycle_state,
+    )
 
 
 def _make_child_specs(wp_ids):
@@ -94,6 +122,7 @@ def executor():
     PlanExecutor = mod.PlanExecutor
 
     db = AsyncMock()
+    db.begin_nested = MagicMock()  # async context manager (savepoint)
     persistence = AsyncMock()
     pe = PlanExecutor.__new__(PlanExecutor)
     pe._db_session = db
@@ -116,15 +145,21 @@ class TestSpawnChildDocuments:
 
         with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
              patch("app.domain.handlers.registry.get_handler") as mock_handler, \
-             _MOCK_MINT:
+             _MOCK_RESERVE, _capture_upsert() as mock_build:
             mock_handler.return_value.get_child_documents.return_value = specs
 
             await executor._spawn_child_documents(
                 state, {}, parent_id, "Test Plan", execution_id="exec-001"
             )
 
-        # Should have called db_session.add twice (2 new children)
-        assert executor._db_session.add.call_count == 2
+        # Both children written by one upsert statement, none added one by one
+        assert mock_build.call_count == 1
+        rows = _upserted_rows(mock_build)
+        assert [r["instance_id"] for r in rows] == ["alpha", "beta"]
+        assert [r["display_id"] for r in rows] == ["WP-001", "WP-002"]
+        assert all(r["parent_document_id"] == parent_id for r in rows)
+        assert all(r["revision_hash"] for r in rows)
+        executor._db_session.add.assert_not_called()
         await_commit = executor._db_session.commit
         assert await_commit.called
 
@@ -141,17 +176,16 @@ class TestSpawnChildDocuments:
 
         with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
              patch("app.domain.handlers.registry.get_handler") as mock_handler, \
-             _MOCK_MINT:
+             _MOCK_RESERVE, _capture_upsert() as mock_build:
             mock_handler.return_value.get_child_documents.return_value = specs
 
             await executor._spawn_child_documents(
                 state, {}, parent_id, "Test Plan", execution_id="exec-injected"
             )
 
-        # Check the content passed to Document constructor
-        add_call = executor._db_session.add.call_args
-        created_doc = add_call[0][0]
-        assert created_doc.content["_lineage"]["parent_execution_id"] == "exec-injected"
+        # Check the content written by the upsert
+        created_row = _upserted_rows(mock_build)[0]
+        assert created_row["content"]["_lineage"]["parent_execution_id"] == "exec-injected"
 
     @pytest.mark.asyncio
     async def test_updates_existing_child_instead_of_duplicating(self, executor):
@@ -168,20 +202,48 @@ class TestSpawnChildDocuments:
         executor._db_session.execute = AsyncMock(return_value=mock_result)
 
         with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
-             patch("app.domain.handlers.registry.get_handler") as mock_handler:
+             patch("app.domain.handlers.registry.get_handler") as mock_handler, \
+             _MOCK_RESERVE as mock_reserve, _capture_upsert() as mock_build:
             mock_handler.return_value.get_child_documents.return_value = specs
 
             await executor._spawn_child_documents(
                 state, {}, parent_id, "Test Plan", execution_id="exec-002"
             )
 
-        # Should NOT have called add (update in place)
+        # Should NOT have called add (upserted onto the existing row)
         assert executor._db_session.add.call_count == 0
-        # Existing doc should be updated
+        # No new display_id: the existing child keeps its own
+        assert mock_reserve.call_args.args[2] == {}
+        assert _upserted_rows(mock_build)[0]["display_id"] == "WP-001"
+        # Loaded doc reflects the upserted row
         assert existing_doc.content["intent"] == "Updated intent"
         assert existing_doc.version == 2
         assert existing_doc.title == "Work Package: alpha"
 
+    @pytest.mark.asyncio
+    async def test_same_identifier_of_another_type_is_a_new_child(self, executor):
+        """The conflict target includes doc_type_id, so only same-type children match."""
+        state = FakeState()
+        parent_id = uuid4()
+
+        other_type = FakeDocument("alpha", version=3)
+        other_type.doc_type_id = "epic"
+        specs = _make_child_specs(["alpha"])
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [other_type]
+        executor._db_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
+             patch("app.domain.handlers.registry.get_handler") as mock_handler, \
+             _MOCK_RESERVE as mock_reserve, _capture_upsert():
+            mock_handler.return_value.get_child_documents.return_value = specs
+
+            await executor._spawn_child_documents(state, {}, parent_id, "Test Plan")
+
+        assert mock_reserve.call_args.args[2] == {"work_package": 1}
+        assert other_type.version == 3
+
     @pytest.mark.asyncio
     async def test_supersedes_removed_children(self, executor):
         """Drift: children no longer in spec are marked stale."""
@@ -259,7 +321,7 @@ class TestSpawnChildDocuments:
 
         with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
              patch("app.domain.handlers.registry.get_handler") as mock_handler, \
-             _MOCK_MINT:
+             _MOCK_RESERVE as mock_reserve, _capture_upsert() as mock_build:
             mock_handler.return_value.get_child_documents.return_value = specs
 
             await executor._spawn_child_documents(
@@ -271,8 +333,9 @@ class TestSpawnChildDocuments:
         # beta: superseded
         assert existing_beta.is_latest is False
         assert existing_beta.lifecycle_state == "stale"
-        # gamma: created (add called once)
-        assert executor._db_session.add.call_count == 1
+        # alpha and gamma in one upsert; only gamma needed a display_id
+        assert [r["instance_id"] for r in _upserted_rows(mock_build)] == ["alpha", "gamma"]
+        assert mock_reserve.call_args.args[2] == {"work_package": 1}
         # commit called
         assert executor._db_session.commit.called
 
@@ -298,7 +361,7 @@ class TestSpawnChildDocuments:
         try:
             with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
                  patch("app.domain.handlers.registry.get_handler") as mock_handler, \
-                 _MOCK_MINT:
+                 _MOCK_RESERVE:
                 mock_handler.return_value.get_child_documents.return_value = specs
 
                 await executor._spawn_child_documents(
@@ -369,7 +432,7 @@ class TestSpawnChildDocuments:
 
         with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
              patch("app.domain.handlers.registry.get_handler") as mock_handler, \
-             _MOCK_MINT:
+             _MOCK_RESERVE:
             mock_handler.return_value.get_child_documents.return_value = _make_child_specs(["alpha"])
 
             await executor._spawn_child_documents(
@@ -382,3 +445,79 @@ class TestSpawnChildDocuments:
         assert "work_packages" in received_data
         assert received_data["work_packages"][0]["work_package_id"] == "alpha"
         assert "raw" not in received_data
+
+    @pytest.mark.asyncio
+    async def test_repeated_identifier_upserted_once(self, executor):
+        """A repeated identifier is written once, with its last spec."""
+        state = FakeState()
+        parent_id = uuid4()
+        specs = _make_child_specs(["alpha", "alpha"])
+        specs[1]["title"] = "Second alpha"
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        executor._db_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
+             patch("app.domain.handlers.registry.get_handler") as mock_handler, \
+             _MOCK_RESERVE, _capture_upsert() as mock_build:
+            mock_handler.return_value.get_child_documents.return_value = specs
+
+            await executor._spawn_child_documents(state, {}, parent_id, "Test Plan")
+
+        rows = _upserted_rows(mock_build)
+        assert len(rows) == 1
+        assert rows[0]["title"] == "Second alpha"
+
+    @pytest.mark.asyncio
+    async def test_large_plan_is_chunked(self, executor):
+        """More children than CHILD_UPSERT_BATCH_SIZE are split across statements."""
+        from app.domain.workflow.child_document_helpers import CHILD_UPSERT_BATCH_SIZE
+
+        state = FakeState()
+        parent_id = uuid4()
+        specs = _make_child_specs([f"wp_{i}" for i in range(CHILD_UPSERT_BATCH_SIZE + 1)])
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        executor._db_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
+             patch("app.domain.handlers.registry.get_handler") as mock_handler, \
+             _MOCK_RESERVE, _capture_upsert() as mock_build:
+            mock_handler.return_value.get_child_documents.return_value = specs
+
+            await executor._spawn_child_documents(state, {}, parent_id, "Test Plan")
+
+        assert [len(call.args[0]) for call in mock_build.call_args_list] == [
+            CHILD_UPSERT_BATCH_SIZE, 1,
+        ]
+        # Display ids are unique across chunks
+        assert len({r["display_id"] for r in _upserted_rows(mock_build)}) == len(specs)
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_child_upsert_on_failure(self, executor):
+        """If the bulk upsert fails, children are upserted one at a time."""
+        state = FakeState()
+        parent_id = uuid4()
+        existing_alpha = FakeDocument("alpha")
+        specs = _make_child_specs(["alpha", "gamma"])
+
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [existing_alpha]
+        executor._db_session.execute = AsyncMock(return_value=mock_result)
+
+        with patch("app.domain.handlers.registry.handler_exists", return_value=True), \
+             patch("app.domain.handlers.registry.get_handler") as mock_handler, \
+             patch(
+                 "app.domain.services.display_id_service.reserve_display_ids",
+                 new_callable=AsyncMock,
+                 side_effect=ValueError("Document type 'work_package' has no display_prefix."),
+             ), _MOCK_MINT:
+            mock_handler.return_value.get_child_documents.return_value = specs
+
+            await executor._spawn_child_documents(state, {}, parent_id, "Test Plan")
+
+        assert existing_alpha.version == 2
+        assert executor._db_session.add.call_count == 1
+        assert executor._db_session.commit.called
@@ -26,10 +26,12 @@ from app.domain.workflow.state_mapping import (  # noqa: E402
     derive_timestamps,
     parse_json_field,
     row_dict_to_state,
+    row_dict_to_summary,
 )
 from app.domain.workflow.document_workflow_state import (  # noqa: E402
     DocumentWorkflowState,
     DocumentWorkflowStatus,
+    ExecutionSummary,
     NodeExecution,
 )
 
@@ -195,6 +197,7 @@ class TestRowDictToState:
         assert state.project_id == "proj-123"
         assert state.document_type == "project_discovery"
         assert state.workflow_id == "wf-disc-1"
+        assert state.workflow_version is None
         assert state.status == DocumentWorkflowStatus.RUNNING
         assert state.node_history == []
         assert state.retry_counts == {}
@@ -247,6 +250,11 @@ class TestRowDictToState:
         state = row_dict_to_state(minimal_row)
         assert state.workflow_id == "unknown"
 
+    def test_workflow_version_carried(self, minimal_row):
+        minimal_row["workflow_version"] = "2.0.0"
+        state = row_dict_to_state(minimal_row)
+        assert state.workflow_version == "2.0.0"
+
     def test_null_status_defaults_to_running(self, minimal_row):
         minimal_row["status"] = None
         state = row_dict_to_state(minimal_row)
@@ -292,3 +300,68 @@ class TestRowDictToState:
         minimal_row["pending_user_input_schema_ref"] = "pgc_questions.v1"
         state = row_dict_to_state(minimal_row)
         assert state.pending_user_input_schema_ref == "pgc_questions.v1"
+
+
+# ---------------------------------------------------------------------------
+# row_dict_to_summary
+# ---------------------------------------------------------------------------
+
+
+class TestRowDictToSummary:
+    @pytest.fixture
+    def summary_row(self):
+        return {
+            "execution_id": "exec-1",
+            "document_id": "proj-1",
+            "document_type": "project_discovery",
+            "workflow_id": "pd_v1",
+            "current_node_id": "generate",
+            "status": "paused",
+            "terminal_outcome": None,
+            "pending_user_input": True,
+            "step_count": 3,
+            "first_timestamp": "2026-01-01T10:00:00",
+            "last_timestamp": "2026-01-01T10:05:00",
+        }
+
+    def test_returns_execution_summary(self, summary_row):
+        summary = row_dict_to_summary(summary_row)
+        assert isinstance(summary, ExecutionSummary)
+        assert summary.execution_id == "exec-1"
+        assert summary.project_id == "proj-1"
+        assert summary.status == DocumentWorkflowStatus.PAUSED
+        assert summary.pending_user_input is True
+        assert summary.step_count == 3
+
+    def test_timestamps_from_first_and_last_log_entries(self, summary_row):
+        summary = row_dict_to_summary(summary_row)
+        assert summary.created_at == datetime(2026, 1, 1, 10, 0, 0)
+        assert summary.updated_at == datetime(2026, 1, 1, 10, 5, 0)
+
+    def test_empty_log_defaults(self, summary_row):
+        summary_row.update(step_count=None, first_timestamp=None, last_timestamp=None)
+        summary = row_dict_to_summary(summary_row)
+        assert summary.step_count == 0
+        assert summary.created_at == summary.updated_at
+
+    def test_missing_status_defaults_to_running(self, summary_row):
+        summary_row["status"] = None
+        assert row_dict_to_summary(summary_row).status == DocumentWorkflowStatus.RUNNING
+
+    def test_matches_full_state_summary(self, summary_row):
+        """The projected summary serializes like a summary of the full state."""
+        state = row_dict_to_state({
+            **summary_row,
+            "execution_log": [
+                {"node_id": f"n{i}", "outcome": "success",
+                 "timestamp": ts, "metadata": {}}
+                for i, ts in enumerate([
+                    summary_row["first_timestamp"],
+                    "2026-01-01T10:02:00",
+                    summary_row["last_timestamp"],
+                ])
+            ],
+        })
+        assert row_dict_to_summary(summary_row).to_dict() == (
+            ExecutionSummary.from_state(state).to_dict()
+        )
@@ -0,0 +1,71 @@
+"""Tests for TaskNodeExecutor context packing (compact serialization + budget)."""
+
+import json
+import os
+import sys
+import types
+
+# Stub the workflow package to avoid circular import through __init__.py
+if "app.domain.workflow" not in sys.modules:
+    _stub = types.ModuleType("app.domain.workflow")
+    _stub.__path__ = [os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "app", "domain", "workflow"
+    )]
+    _stub.__package__ = "app.domain.workflow"
+    sys.modules["app.domain.workflow"] = _stub
+
+from app.domain.workflow.nodes.task import TaskNodeExecutor  # noqa: E402
+from app.domain.workflow.nodes.base import DocumentWorkflowContext  # noqa: E402
+from app.llm.context_packer import ContextPacker  # noqa: E402
+from app.llm.token_estimator import TokenEstimator, heuristic_token_count  # noqa: E402
+
+
+def _executor() -> TaskNodeExecutor:
+    return TaskNodeExecutor(
+        llm_service=None,
+        prompt_loader=None,
+        context_packer=ContextPacker(TokenEstimator(counter=heuristic_token_count)),
+    )
+
+
+def _context(**kwargs) -> DocumentWorkflowContext:
+    return DocumentWorkflowContext(project_id="proj-1", document_type="doc", **kwargs)
+
+
+class TestContextPacking:
+
+    def test_documents_serialized_compactly(self):
+        ctx = _context(input_documents={"project_discovery": {"summary": "S", "goals": ["g"]}})
+        messages, stats = _executor()._build_messages_with_stats("Generate", ctx)
+        content = messages[0]["content"]
+        assert '{"summary":"S","goals":["g"]}' in content
+        assert "\n  " not in content
+        assert stats.tokens_saved == 0
+
+    def test_context_state_serialized_compactly(self):
+        ctx = _context(context_state={"project_type": "greenfield"})
+        messages = _executor()._build_messages("Generate", ctx)
+        assert '{"project_type":"greenfield"}' in messages[0]["content"]
+
+    def test_budget_omits_fields_from_largest_document(self):
+        ctx = _context(
+            input_documents={
+                "project_discovery": {"summary": "S", "appendix": "detail " * 2000},
+            },
+            document_content={"draft": {"title": "T"}},
+        )
+        messages, stats = _executor()._build_messages_with_stats(
+            "Generate", ctx, budget_tokens=200,
+        )
+        content = messages[0]["content"]
+        assert stats.omitted_fields == ["input:project_discovery.appendix"]
+        assert '"summary":"S"' in content
+        assert '{"title":"T"}' in content
+        assert stats.budget_tokens == 200
+
+    def test_no_budget_keeps_everything(self):
+        doc = {"summary": "S", "appendix": "detail " * 2000}
+        ctx = _context(input_documents={"project_discovery": doc})
+        messages, stats = _executor()._build_messages_with_stats("Generate", ctx)
+        assert stats.omitted_fields == []
+        assert json.dumps(doc, separators=(",", ":")) in messages[0]["content"]
@@ -0,0 +1,82 @@
+"""Tests for KeywordIndex.
+
+The index must score and break ties exactly like the set-based
+jaccard_similarity and keyword_overlap_ratio it replaces in the rules.
+"""
+
+import random
+
+from app.domain.workflow.validation.keyword_index import KeywordIndex
+from app.domain.workflow.validation.rules import (
+    extract_keywords,
+    jaccard_similarity,
+    keyword_overlap_ratio,
+)
+
+VOCABULARY = [f"term{i}" for i in range(30)]
+
+
+def _random_sets(rng, count):
+    return [set(rng.sample(VOCABULARY, rng.randint(0, 8))) for _ in range(count)]
+
+
+class TestBestCoverage:
+    """Tests for KeywordIndex.best_coverage."""
+
+    def test_matches_set_overlap_ratio(self):
+        rng = random.Random(7)
+        sources = _random_sets(rng, 40)
+        index = KeywordIndex(sources)
+        for query in _random_sets(rng, 200):
+            expected_ratio, expected_position = 0.0, None
+            for position, source in enumerate(sources):
+                ratio = keyword_overlap_ratio(source, query)
+                if ratio > expected_ratio:
+                    expected_ratio, expected_position = ratio, position
+            assert index.best_coverage(query) == (expected_ratio, expected_position)
+
+    def test_first_source_wins_ties(self):
+        index = KeywordIndex([{"user", "auth"}, {"auth", "user", "extra"}])
+        assert index.best_coverage({"user", "auth"}) == (1.0, 0)
+
+    def test_no_shared_keywords(self):
+        index = KeywordIndex([{"payment"}])
+        assert index.best_coverage({"user"}) == (0.0, None)
+        assert index.best_coverage(set()) == (0.0, None)
+
+    def test_unknown_keywords_count_toward_ratio(self):
+        index = KeywordIndex([{"user", "auth"}])
+        assert index.best_coverage({"user", "auth", "unseen", "other"}) == (0.5, 0)
+
+
+class TestSimilar:
+    """Tests for KeywordIndex.similar."""
+
+    def test_matches_set_jaccard(self):
+        rng = random.Random(11)
+        items = _random_sets(rng, 40)
+        index = KeywordIndex(items)
+        for query in _random_sets(rng, 200):
+            expected = [
+                (position, jaccard_similarity(query, item))
+                for position, item in enumerate(items)
+                if jaccard_similarity(query, item) > 0.5
+            ]
+            assert index.similar(query, 0.5) == expected
+
+    def test_threshold_is_exclusive(self):
+        index = KeywordIndex([{"user", "system", "database"}])
+        assert index.similar({"user", "auth", "system"}, 0.5) == []
+        assert index.similar({"user", "system", "database"}, 0.5) == [(0, 1.0)]
+
+    def test_empty_query(self):
+        assert KeywordIndex([{"user"}]).similar(set(), 0.5) == []
+
+
+class TestKeywordCache:
+    """extract_keywords results are cached but callers get their own set."""
+
+    def test_returned_set_is_a_copy(self):
+        first = extract_keywords("Users authenticate with passwords")
+        first.add("mutated")
+        assert "mutated" not in extract_keywords("Users authenticate with passwords")
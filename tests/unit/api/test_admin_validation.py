@@ -11,10 +11,12 @@ from fastapi.testclient import TestClient
 from app.api.main import app
 from app.api.services.config_validator import (
     ConfigValidator,
+    ReferenceIndex,
     ValidationReport,
     ValidationSeverity,
     reset_config_validator,
 )
+from app.config.package_loader import PackageLoader, VersionNotFoundError
 
 
 @pytest.fixture(autouse=True)
@@ -313,6 +315,126 @@ artifacts:
         assert validator._validate_ref_format("prompt:template:analyst:1.0.0", "role") is False
 
 
+VALID_MANIFEST = """
+doc_type_id: test
+display_name: Test
+version: 1.0.0
+authority_level: constructive
+creation_mode: llm_generated
+artifacts:
+  task_prompt: prompts/task.md
+"""
+
+
+class CountingLoader:
+    """Loader stand-in that counts shared-artifact lookups."""
+
+    def __init__(self, roles=()):
+        self.roles = set(roles)
+        self.calls = []
+
+    def get_role(self, role_id, version):
+        self.calls.append(("role", role_id, version))
+        if role_id not in self.roles:
+            raise VersionNotFoundError(role_id)
+
+    def get_template(self, template_id, version):
+        self.calls.append(("template", template_id, version))
+        raise VersionNotFoundError(template_id)
+
+    def list_pgc(self):
+        self.calls.append(("pgc",))
+        return ["test.v1"]
+
+
+class TestValidationUnits:
+    """Tests for cached package rules, the reference index and parallel runs."""
+
+    def test_package_rules_cached_until_files_change(self, tmp_path):
+        (tmp_path / "package.yaml").write_text(VALID_MANIFEST)
+        (tmp_path / "prompts").mkdir()
+        (tmp_path / "prompts" / "task.md").write_text("# Task")
+        validator = ConfigValidator()
+
+        assert validator.validate_package(tmp_path).valid is True
+        assert validator.validate_package(tmp_path).valid is True
+        assert validator._package_checks.stats().hits == 1
+
+        (tmp_path / "prompts" / "task.md").unlink()
+        report = validator.validate_package(tmp_path)
+        assert [e.rule_id for e in report.errors] == ["ARTIFACT_FILE_MISSING"]
+
+    def test_cached_report_is_not_shared(self, tmp_path):
+        (tmp_path / "package.yaml").write_text("doc_type_id: test\n")
+        validator = ConfigValidator()
+
+        first = validator.validate_package(tmp_path)
+        first.errors[0].message = "changed"
+        first.errors.clear()
+
+        second = validator.validate_package(tmp_path)
+        assert second.errors
+        assert all(e.message != "changed" for e in second.errors)
+
+    def test_reference_index_resolves_each_ref_once(self, tmp_path):
+        loader = CountingLoader(roles={"analyst"})
+        validator = ConfigValidator(loader)
+        references = ReferenceIndex(loader)
+        manifest = VALID_MANIFEST.replace(
+            "artifacts:",
+            "role_prompt_ref: prompt:role:analyst:1.0.0\n"
+            "template_ref: prompt:template:missing:1.0.0\nartifacts:",
+        )
+        for name in ("a", "b", "c"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "package.yaml").write_text(manifest)
+            report = validator.validate_package(tmp_path / name, references)
+            assert [e.rule_id for e in report.errors] == ["ARTIFACT_FILE_MISSING", "TEMPLATE_NOT_FOUND"]
+
+        assert sorted(loader.calls) == [
+            ("role", "analyst", "1.0.0"),
+            ("template", "missing", "1.0.0"),
+        ]
+        assert len(references) == 2
+
+    def test_pgc_fragment_checked_through_index(self, tmp_path):
+        loader = CountingLoader()
+        manifest = VALID_MANIFEST.replace("constructive", "descriptive")
+        (tmp_path / "package.yaml").write_text(manifest)
+        assert "PGC_REQUIRED" not in [
+            e.rule_id for e in ConfigValidator(loader).validate_package(tmp_path).errors
+        ]
+
+        (tmp_path / "package.yaml").write_text(manifest.replace("doc_type_id: test", "doc_type_id: other"))
+        assert "PGC_REQUIRED" in [
+            e.rule_id for e in ConfigValidator(loader).validate_package(tmp_path).errors
+        ]
+
+    def test_worker_pool_matches_in_process(self):
+        serial, serial_timing = ConfigValidator(PackageLoader()).validate_config(max_workers=1)
+        pooled, pooled_timing = ConfigValidator(PackageLoader()).validate_config(max_workers=2)
+
+        def findings(report):
+            return [(e.rule_id, e.message) for e in report.errors + report.warnings]
+
+        assert findings(pooled) == findings(serial)
+        assert pooled.valid == serial.valid
+        assert pooled_timing.workers == 2
+        assert set(pooled_timing.releases) == set(serial_timing.releases)
+
+    def test_all_active_reports_activation_findings_only(self):
+        validator = ConfigValidator(PackageLoader())
+        full, _ = validator.validate_config(max_workers=1)
+        activation = validator.validate_all_active_packages(max_workers=1)
+
+        activation_rules = {"PACKAGE_NOT_FOUND", "VERSION_NOT_FOUND", "REQUIRED_INPUT_NOT_ACTIVE",
+                            "ROLE_NOT_FOUND", "TEMPLATE_NOT_FOUND"}
+        assert {e.rule_id for e in activation.errors} <= activation_rules
+        assert [e.message for e in activation.errors] == [
+            e.message for e in full.errors if e.rule_id in activation_rules
+        ]
+
+
 class TestPackageValidationEndpoint:
     """Tests for package validation endpoint."""
 
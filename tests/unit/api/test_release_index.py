@@ -0,0 +1,228 @@
+"""
+Tests for the release index (release history, version commits, rollback targets).
+
+Each test works on a throwaway git repository with a minimal combine-config.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.api.services.git_service import GitService
+from app.api.services.release_index import ReleaseIndex
+from app.api.services.release_service import ReleaseService
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "ops" / "scripts"))
+from rebuild_release_index import main as rebuild_main  # noqa: E402
+
+
+def git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def write_release(repo: Path, doc_type_id: str, version: str, body: str = "x") -> None:
+    release = repo / "combine-config" / "document_types" / doc_type_id / "releases" / version
+    release.mkdir(parents=True, exist_ok=True)
+    (release / "package.yaml").write_text(f"version: {version}\nbody: {body}\n")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.name", "Test")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    write_release(tmp_path, "doc", "1.0.0")
+    write_release(tmp_path, "doc", "1.1.0")
+    write_release(tmp_path, "other", "2.0.0")
+    active = tmp_path / "combine-config" / "_active"
+    active.mkdir(parents=True)
+    (active / "active_releases.json").write_text(
+        json.dumps({"document_types": {"doc": "1.0.0", "other": "2.0.0"}})
+    )
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "baseline")
+    return tmp_path
+
+
+@pytest.fixture
+def git_service(repo):
+    return GitService(repo_path=repo)
+
+
+def activate(git_service: GitService, version: str, message=None) -> None:
+    git_service.update_active_release("doc", version, user_name="tester", commit_message=message)
+
+
+class TestHistory:
+
+    def test_activation_and_rollback_events(self, git_service):
+        activate(git_service, "1.1.0")
+        activate(git_service, "1.0.0", message="Rollback doc from 1.1.0 to 1.0.0")
+
+        history = git_service.release_index.history("doc")
+
+        assert [(e.event, e.version, e.previous_version) for e in history] == [
+            ("rolled_back", "1.0.0", "1.1.0"),
+            ("activated", "1.1.0", "1.0.0"),
+            ("activated", "1.0.0", None),
+        ]
+        assert history[0].message == "Rollback doc from 1.1.0 to 1.0.0"
+        assert history[0].commit_hash == git(git_service.repo_path, "rev-parse", "HEAD")
+
+    def test_limit_and_all_doc_types(self, git_service):
+        activate(git_service, "1.1.0")
+
+        history = git_service.release_index.history(limit=2)
+
+        assert [(e.doc_type_id, e.version) for e in history] == [
+            ("doc", "1.1.0"), ("other", "2.0.0"),
+        ]
+
+    def test_deactivation(self, repo, git_service):
+        active = repo / "combine-config" / "_active" / "active_releases.json"
+        active.write_text(json.dumps({"document_types": {"doc": "1.0.0"}}))
+        git(repo, "commit", "-q", "-am", "drop other")
+
+        entry = git_service.release_index.history("other")[0]
+
+        assert (entry.event, entry.version) == ("deactivated", "2.0.0")
+        assert git_service.release_index.active_version("other") is None
+
+
+class TestVersions:
+
+    def test_version_commit_and_content_hash(self, repo, git_service):
+        write_release(repo, "doc", "1.1.0", body="changed")
+        git(repo, "commit", "-q", "-am", "edit 1.1.0")
+
+        entry = git_service.release_index.version_commit("doc", "1.1.0")
+
+        assert entry.commit_hash == git(repo, "rev-parse", "HEAD")
+        assert entry.message == "edit 1.1.0"
+        assert entry.content_hash == git(
+            repo, "rev-parse", "HEAD:combine-config/document_types/doc/releases/1.1.0"
+        )
+        assert git_service.release_index.version_commit("doc", "9.9.9") is None
+
+    def test_rollback_targets_most_recent_first(self, repo, git_service):
+        write_release(repo, "doc", "1.2.0")
+        git(repo, "add", "-A")
+        git(repo, "commit", "-q", "-m", "add 1.2.0")
+        activate(git_service, "1.1.0")
+        activate(git_service, "1.2.0")
+
+        index = git_service.release_index
+
+        assert index.rollback_targets("doc") == ["1.1.0", "1.0.0"]
+        assert index.was_released("doc", "1.1.0") is True
+        assert index.was_released("doc", "1.2.0") is True
+        assert index.was_released("other", "1.0.0") is False
+
+
+class TestMaintenance:
+
+    def test_commit_appends_without_rescanning(self, git_service):
+        index = git_service.release_index
+        index.refresh()
+        index._rewrite = MagicMock(side_effect=AssertionError("full rebuild"))
+        lines_before = index.path.read_text().count("\n")
+
+        activate(git_service, "1.1.0")
+
+        assert index.active_version("doc") == "1.1.0"
+        # One activation event plus the head marker
+        assert index.path.read_text().count("\n") == lines_before + 2
+
+    def test_query_without_new_commits_skips_git(self, git_service):
+        index = git_service.release_index
+        index.refresh()
+        git_service._run_git = MagicMock(side_effect=AssertionError("git called"))
+
+        assert index.refresh() == 0
+        assert index.active_version("doc") == "1.0.0"
+
+    def test_out_of_band_commit_is_picked_up(self, repo, git_service):
+        index = git_service.release_index
+        index.refresh()
+        active = repo / "combine-config" / "_active" / "active_releases.json"
+        active.write_text(json.dumps({"document_types": {"doc": "1.1.0", "other": "2.0.0"}}))
+        git(repo, "commit", "-q", "-am", "manual activation")
+
+        assert index.active_version("doc") == "1.1.0"
+
+    def test_rewritten_history_rebuilds(self, repo, git_service):
+        activate(git_service, "1.1.0")
+        index = git_service.release_index
+        assert index.active_version("doc") == "1.1.0"
+
+        git(repo, "reset", "-q", "--hard", "HEAD~1")
+
+        assert index.active_version("doc") == "1.0.0"
+        assert [e.version for e in index.history("doc")] == ["1.0.0"]
+
+    def test_second_instance_loads_index_file(self, git_service):
+        activate(git_service, "1.1.0")
+        expected = git_service.release_index.history()
+
+        other = ReleaseIndex(git_service)
+        other._scan = MagicMock(side_effect=AssertionError("git scanned"))
+
+        assert other.history() == expected
+
+    def test_rebuild_matches_incremental(self, git_service):
+        activate(git_service, "1.1.0")
+        activate(git_service, "1.0.0", message="Rollback doc")
+        incremental = git_service.release_index.path.read_text()
+
+        git_service.release_index.rebuild()
+
+        rebuilt = git_service.release_index.path.read_text()
+
+        def events(text):
+            return [line for line in text.splitlines() if '"head"' not in line]
+
+        assert events(rebuilt) == events(incremental)
+
+    def test_rebuild_cli(self, repo, capsys):
+        exit_code = rebuild_main(["--repo-path", str(repo)])
+
+        assert exit_code == 0
+        assert "release_index.jsonl: 5 entries" in capsys.readouterr().out
+
+
+class TestReleaseService:
+
+    @pytest.fixture
+    def service(self, git_service):
+        loader = MagicMock()
+        loader.get_active_releases.return_value.document_types = {"doc": "1.1.0"}
+        return ReleaseService(git_service=git_service, validator=MagicMock(), loader=loader)
+
+    def test_history_and_version_commit_from_index(self, git_service, service):
+        activate(git_service, "1.1.0")
+
+        history = service.get_release_history(doc_type_id="doc")
+        commit = service._get_version_commit("doc", "1.0.0")
+
+        assert [(e.action, e.version) for e in history] == [
+            ("activated", "1.1.0"), ("activated", "1.0.0"),
+        ]
+        assert commit["message"] == "baseline"
+
+    def test_previously_active_version_is_immutable(self, git_service, service):
+        activate(git_service, "1.1.0")
+
+        assert service.check_immutability("doc", "1.1.0") is True
+        assert service.check_immutability("doc", "1.0.0") is True
+        assert service.get_rollback_targets("doc") == ["1.0.0"]
+
+    def test_never_active_version_is_editable(self, service):
+        assert service.check_immutability("doc", "1.1.0") is True  # active pointer
+        assert service.check_immutability("doc", "1.2.0") is False
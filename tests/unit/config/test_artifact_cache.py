@@ -0,0 +1,157 @@
+"""
+Tests for the bounded artifact cache behind PackageLoader.
+"""
+
+import os
+
+from app.config.artifact_cache import ArtifactCache, ConfigSnapshot
+
+
+def _release(root, name, text="content"):
+    path = root / name
+    path.mkdir(parents=True)
+    (path / "artifact.txt").write_text(text, encoding="utf-8")
+    return path
+
+
+def _edit(path, text):
+    path.write_text(text, encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+
+class TestLru:
+    def test_hit_and_miss_counted(self, tmp_path):
+        cache = ArtifactCache("role")
+        assert cache.get("a:1") is None
+        cache.put("a:1", "A", _release(tmp_path, "a"))
+
+        assert cache.get("a:1") == "A"
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.bytes == len("content")
+
+    def test_evicts_least_recently_used_by_count(self, tmp_path):
+        cache = ArtifactCache("role", max_entries=2)
+        cache.put("a", "A", _release(tmp_path, "a"))
+        cache.put("b", "B", _release(tmp_path, "b"))
+        cache.get("a")
+        cache.put("c", "C", _release(tmp_path, "c"))
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats().evictions == 1
+
+    def test_evicts_by_bytes(self, tmp_path):
+        cache = ArtifactCache("role", max_bytes=15)
+        cache.put("a", "A", _release(tmp_path, "a", "x" * 10))
+        cache.put("b", "B", _release(tmp_path, "b", "y" * 10))
+
+        assert len(cache) == 1
+        assert "b" in cache
+        assert cache.stats().bytes == 10
+
+    def test_oversized_entry_is_kept(self, tmp_path):
+        cache = ArtifactCache("role", max_bytes=5)
+        cache.put("a", "A", _release(tmp_path, "a", "x" * 10))
+
+        assert cache.get("a") == "A"
+
+    def test_clear_counts_invalidations(self, tmp_path):
+        cache = ArtifactCache("role")
+        cache.put("a", "A", _release(tmp_path, "a"))
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats().invalidations == 1
+        assert cache.stats().bytes == 0
+
+
+class TestRevalidate:
+    def test_drops_only_changed_entries(self, tmp_path):
+        dropped = []
+        cache = ArtifactCache("role", on_invalidate=dropped.append)
+        a = _release(tmp_path, "a")
+        cache.put("a", "A", a)
+        cache.put("b", "B", _release(tmp_path, "b"))
+
+        _edit(a / "artifact.txt", "changed")
+
+        assert cache.revalidate() == ["a"]
+        assert dropped == ["a"]
+        assert "b" in cache
+
+    def test_identical_content_is_kept(self, tmp_path):
+        cache = ArtifactCache("role")
+        a = _release(tmp_path, "a")
+        cache.put("a", "A", a)
+
+        _edit(a / "artifact.txt", "content")
+
+        assert cache.revalidate() == []
+        assert cache.get("a") == "A"
+
+    def test_added_file_counts_as_change(self, tmp_path):
+        cache = ArtifactCache("role")
+        a = _release(tmp_path, "a")
+        cache.put("a", "A", a)
+
+        (a / "meta.yaml").write_text("name: a\n", encoding="utf-8")
+
+        assert cache.revalidate() == ["a"]
+
+    def test_changed_paths_limit_the_check(self, tmp_path):
+        cache = ArtifactCache("role")
+        a = _release(tmp_path, "a")
+        cache.put("a", "A", a)
+        _edit(a / "artifact.txt", "changed")
+
+        assert cache.revalidate([str(tmp_path / "b" / "artifact.txt")]) == []
+        assert cache.revalidate([str(a / "artifact.txt")]) == ["a"]
+
+
+class TestTtl:
+    def test_expired_entry_rechecked_on_get(self, tmp_path):
+        now = [0.0]
+        cache = ArtifactCache("role", ttl_seconds=10, clock=lambda: now[0])
+        a = _release(tmp_path, "a")
+        cache.put("a", "A", a)
+        _edit(a / "artifact.txt", "changed")
+
+        assert cache.get("a") == "A"
+        now[0] = 10
+        assert cache.get("a") is None
+        assert cache.stats().invalidations == 1
+
+    def test_unchanged_entry_survives_ttl(self, tmp_path):
+        now = [0.0]
+        cache = ArtifactCache("role", ttl_seconds=10, clock=lambda: now[0])
+        cache.put("a", "A", _release(tmp_path, "a"))
+
+        now[0] = 100
+        assert cache.get("a") == "A"
+
+
+class TestConfigSnapshot:
+    def test_reports_modified_added_and_removed(self, tmp_path):
+        a = _release(tmp_path, "a")
+        b = _release(tmp_path, "b")
+        snapshot = ConfigSnapshot(tmp_path)
+
+        _edit(a / "artifact.txt", "changed")
+        (b / "artifact.txt").unlink()
+        (tmp_path / "new.txt").write_text("new", encoding="utf-8")
+
+        assert snapshot.refresh() == {
+            str(a / "artifact.txt"),
+            str(b / "artifact.txt"),
+            str(tmp_path / "new.txt"),
+        }
+        assert snapshot.refresh() == set()
+
+    def test_ignores_dot_paths(self, tmp_path):
+        snapshot = ConfigSnapshot(tmp_path)
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "index").write_text("x", encoding="utf-8")
+
+        assert snapshot.refresh() == set()
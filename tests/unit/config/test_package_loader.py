@@ -215,13 +215,112 @@ class TestCaching:
 
         assert package1 is package2
 
-    def test_invalidate_cache(self, loader):
-        """Cache invalidation should clear all caches."""
+    def test_invalidate_cache_keeps_unchanged_artifacts(self, loader):
+        """Invalidation with no config changes keeps the cache and generation."""
         package1 = loader.get_document_type("project_discovery")
+        generation = loader.generation
         loader.invalidate_cache()
         package2 = loader.get_document_type("project_discovery")
 
+        assert package1 is package2
+        assert loader.generation == generation
+
+    def test_clear_cache(self, loader):
+        """clear_cache drops everything regardless of changes."""
+        package1 = loader.get_document_type("project_discovery")
+        generation = loader.generation
+        loader.clear_cache()
+        package2 = loader.get_document_type("project_discovery")
+
         assert package1 is not package2
+        assert loader.generation == generation + 1
+
+    def test_cache_stats(self, loader):
+        """Hits and misses are counted per artifact kind."""
+        loader.get_document_type("project_discovery")
+        loader.get_document_type("project_discovery")
+
+        stats = loader.cache_stats()
+        assert stats["package"]["misses"] == 1
+        assert stats["package"]["hits"] == 1
+        assert stats["package"]["entries"] == 1
+        assert stats["package"]["bytes"] > 0
+        assert set(stats) == {"package", "role", "template", "task", "pgc", "schema"}
+
+
+class TestFineGrainedInvalidation:
+    """Only artifacts whose files changed are reloaded."""
+
+    @pytest.fixture
+    def config_copy(self, tmp_path):
+        import shutil
+        target = tmp_path / "combine-config"
+        shutil.copytree(CONFIG_PATH, target)
+        return target
+
+    @staticmethod
+    def _touch(path, text=None):
+        import os
+        if text is not None:
+            path.write_text(text, encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+
+    def test_edit_drops_only_changed_artifact(self, config_copy):
+        loader = PackageLoader(config_copy)
+        discovery = loader.get_document_type("project_discovery")
+        role = loader.get_role("technical_architect")
+        generation = loader.generation
+
+        role_dir = config_copy / "prompts" / "roles" / "technical_architect" / "releases" / role.version
+        prompt = role_dir / "role.prompt.txt"
+        self._touch(prompt, prompt.read_text(encoding="utf-8") + "\nEdited.\n")
+        loader.invalidate_cache()
+
+        assert loader.get_document_type("project_discovery") is discovery
+        reloaded = loader.get_role("technical_architect")
+        assert reloaded is not role
+        assert reloaded.content.endswith("Edited.\n")
+        assert loader.generation > generation
+
+    def test_touch_without_edit_keeps_artifact(self, config_copy):
+        loader = PackageLoader(config_copy)
+        role = loader.get_role("technical_architect")
+        generation = loader.generation
+
+        role_dir = config_copy / "prompts" / "roles" / "technical_architect" / "releases" / role.version
+        self._touch(role_dir / "role.prompt.txt")
+        loader.invalidate_cache()
+
+        assert loader.get_role("technical_architect") is role
+        assert loader.generation == generation
+
+    def test_unbacked_change_bumps_generation(self, config_copy):
+        """Files no cached artifact covers (e.g. mechanical ops) still bump the generation."""
+        loader = PackageLoader(config_copy)
+        discovery = loader.get_document_type("project_discovery")
+        generation = loader.generation
+
+        (config_copy / "mechanical_ops" / "new_op.yaml").write_text("x: 1\n", encoding="utf-8")
+        loader.invalidate_cache()
+
+        assert loader.get_document_type("project_discovery") is discovery
+        assert loader.generation == generation + 1
+
+    def test_ttl_rechecks_files_without_invalidate(self, config_copy):
+        now = [0.0]
+        loader = PackageLoader(config_copy, ttl_seconds=30)
+        for cache in loader._caches:
+            cache._clock = lambda: now[0]
+        role = loader.get_role("technical_architect")
+
+        role_dir = config_copy / "prompts" / "roles" / "technical_architect" / "releases" / role.version
+        prompt = role_dir / "role.prompt.txt"
+        self._touch(prompt, "Replaced.\n")
+
+        assert loader.get_role("technical_architect") is role  # within TTL
+        now[0] = 31
+        assert loader.get_role("technical_architect").content == "Replaced.\n"
 
 
 class TestListOperations: